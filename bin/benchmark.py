@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, Path(__file__).resolve().parents[1].joinpath('lib').as_posix())
+import _venv  # This will activate the venv, if it exists and is not already active
+
+import json
+import logging
+import os
+import tracemalloc
+from contextlib import redirect_stdout
+from functools import partial
+from subprocess import check_call, DEVNULL
+from tempfile import TemporaryDirectory
+from timeit import Timer
+from typing import Callable
+
+from nier.cli import ArgParser
+from nier.diff import unified_byte_line_diff
+from nier.flat_codecs import decode_savefile, encode_savefile
+from nier.save_file import GameData
+from nier.synthetic import random_game_data
+from nier.utils import colored, to_hex_and_str
+
+from multi_save_diff import count_changes
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BASELINE = PROJECT_ROOT.joinpath('benchmark_baseline.json')
+BENCHMARKS = {}
+log = logging.getLogger(__name__)
+
+
+def parser():
+    parser = ArgParser(description='Benchmark parse, build, diff, and render hot paths using synthetic save data')
+    parser.add_argument('names', nargs='*', help='Specific benchmarks to run (default: all); one of: {}'.format(', '.join(BENCHMARKS)))
+    parser.add_argument('--baseline', '-b', metavar='PATH', default=DEFAULT_BASELINE, help='Baseline results file to compare against (default: %(default)s)')
+    parser.add_argument('--save', '-S', action='store_true', help='Save the results as the new baseline')
+    parser.add_argument('--threshold', '-t', type=float, default=1.25, help='Ratio of result/baseline above which a result is considered a regression (default: %(default)s)')
+    parser.add_argument('--repeat', '-r', type=int, default=5, help='Number of timing repetitions per benchmark (default: %(default)s)')
+    parser.add_argument('--files', '-f', type=int, default=10, help='Number of synthetic GAMEDATA files to generate (default: %(default)s)')
+    parser.add_argument('--seed', '-s', type=int, default=0, help='Random seed for synthetic data (default: %(default)s)')
+    parser.add_argument('--json', '-j', action='store_true', help='Print results as JSON instead of a table')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
+    return parser
+
+
+def main():
+    args = parser().parse_args()
+    if unknown := set(args.names).difference(BENCHMARKS):
+        raise ValueError(f'Unknown benchmark(s): {", ".join(sorted(unknown))}')
+    log_fmt = '%(asctime)s %(levelname)s %(name)s %(lineno)d %(message)s' if args.verbose else '%(message)s'
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format=log_fmt)
+    if not args.verbose:
+        logging.getLogger('nier').setLevel(logging.WARNING)  # Prevent log messages from being emitted in timed loops
+
+    baseline_path = Path(args.baseline).expanduser()
+    baseline = json.loads(baseline_path.read_text('utf-8')) if baseline_path.exists() else {}
+    with TemporaryDirectory() as tmp_dir:
+        fixtures = Fixtures(Path(tmp_dir), args.files, args.seed)
+        results = {name: run_benchmark(BENCHMARKS[name](fixtures), args.repeat) for name in args.names or BENCHMARKS}
+
+    regressions = print_results(results, baseline, args.threshold, args.json)
+    if args.save:
+        log.info(f'Saving baseline to {baseline_path.as_posix()}')
+        baseline_path.write_text(json.dumps(baseline | results, indent=4, sort_keys=True), 'utf-8')
+    elif regressions:
+        log.error(f'Found {len(regressions)} regression(s) compared to baseline: {", ".join(regressions)}')
+        sys.exit(1)
+
+
+class Fixtures:
+    def __init__(self, tmp_dir: Path, count: int, seed: int):
+        log.info(f'Generating {count} synthetic GAMEDATA files')
+        self.tmp_dir = tmp_dir
+        self.paths = []
+        self.game_data = []
+        for i in range(max(count, 2)):
+            game_data = random_game_data(f'{seed}-{i}')
+            path = tmp_dir.joinpath(f'GAMEDATA_2021-05-01-{i}')
+            path.write_bytes(game_data._data)
+            self.paths.append(path)
+            self.game_data.append(game_data)
+
+        self.devnull = open(os.devnull, 'w', encoding='utf-8')  # noqa
+
+
+def benchmark(func: Callable[[Fixtures], Callable]):
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def _quiet(func: Callable, fixtures: Fixtures):
+    def quiet():
+        with redirect_stdout(fixtures.devnull):
+            func()
+    return quiet
+
+
+@benchmark
+def game_data_load(fixtures: Fixtures):
+    return partial(GameData.load, fixtures.paths[0])
+
+
+@benchmark
+def flat_decode_slot(fixtures: Fixtures):
+    return partial(decode_savefile, fixtures.game_data[0].slots[0]._data)
+
+
+@benchmark
+def flat_encode_slot(fixtures: Fixtures):
+    return partial(encode_savefile, decode_savefile(fixtures.game_data[0].slots[0]._data))
+
+
+@benchmark
+def save_file_copy(fixtures: Fixtures):
+    return fixtures.game_data[0].slots[0].copy
+
+
+@benchmark
+def save_file_copy_and_edit(fixtures: Fixtures):
+    slot = fixtures.game_data[0].slots[0]
+
+    def copy_and_edit():
+        copy = slot.copy()
+        copy.inventory['Lugworm'] = 10
+        copy.garden.set_water(2)
+
+    return copy_and_edit
+
+
+@benchmark
+def game_data_save(fixtures: Fixtures):
+    game_data = fixtures.game_data[0]
+    path = fixtures.tmp_dir.joinpath('saved', 'GAMEDATA')
+    path.parent.mkdir(exist_ok=True)
+    return partial(game_data.save, path, backup=False)
+
+
+@benchmark
+def constructed_diff(fixtures: Fixtures):
+    a, b = fixtures.game_data[:2]
+    return _quiet(partial(a.diff, b, max_len=1), fixtures)
+
+
+@benchmark
+def unified_byte_line_diff_slot(fixtures: Fixtures):
+    a, b = (gd.slots[0]._data for gd in fixtures.game_data[:2])
+    return _quiet(partial(unified_byte_line_diff, a, b, struct=repr, per_line=8), fixtures)
+
+
+@benchmark
+def find_number(fixtures: Fixtures):
+    return _quiet(partial(fixtures.game_data[0].slots[0].find_number, 1234567), fixtures)
+
+
+@benchmark
+def count_changes_files(fixtures: Fixtures):
+    save_data = {path: (gd.header, max(gd.slots)) for path, gd in zip(fixtures.paths, fixtures.game_data)}
+    return _quiet(partial(count_changes, save_data, show_names=True), fixtures)
+
+
+@benchmark
+def to_hex_and_str_slot(fixtures: Fixtures):
+    data = fixtures.game_data[0].slots[0]._data
+
+    def render():
+        for offset in range(0, len(data), 40):
+            to_hex_and_str(f'0x{offset:04X}:', data[offset: offset + 40], fill=40, struct=repr)
+
+    return render
+
+
+@benchmark
+def startup_import_save_file(fixtures: Fixtures):
+    env = {**os.environ, 'PYTHONPATH': PROJECT_ROOT.joinpath('lib').as_posix()}
+    return partial(check_call, [sys.executable, '-c', 'import nier.save_file'], env=env)
+
+
+@benchmark
+def startup_view_info_quick(fixtures: Fixtures):
+    cmd = [sys.executable, PROJECT_ROOT.joinpath('bin', 'nier_editor.py').as_posix(), 'view', 'info', '--quick']
+    return partial(check_call, cmd + ['-p', fixtures.paths[0].as_posix()], stdout=DEVNULL)
+
+
+@benchmark
+def startup_view_info(fixtures: Fixtures):
+    cmd = [sys.executable, PROJECT_ROOT.joinpath('bin', 'nier_editor.py').as_posix(), 'view', 'info']
+    return partial(check_call, cmd + ['-p', fixtures.paths[0].as_posix()], stdout=DEVNULL)
+
+
+def run_benchmark(func: Callable, repeat: int) -> dict[str, float]:
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeat, number)]
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'min': min(times), 'mean': sum(times) / len(times), 'peak': peak, 'number': number}
+
+
+def print_results(results: dict, baseline: dict, threshold: float, as_json: bool = False) -> list[str]:
+    regressions = []
+    ratios = {}
+    for name, result in results.items():
+        if base := baseline.get(name):
+            ratios[name] = (result['min'] / base['min'], result['peak'] / base['peak'] if base['peak'] else 1)
+            if any(ratio > threshold for ratio in ratios[name]):
+                regressions.append(name)
+
+    if as_json:
+        ratio_keys = ('time_ratio', 'peak_ratio')
+        output = {name: result | dict(zip(ratio_keys, ratios.get(name, ()))) for name, result in results.items()}
+        print(json.dumps(output, indent=4, sort_keys=True))
+        return regressions
+
+    name_width = max(map(len, results))
+    print(f'{"Benchmark":<{name_width}s}  {"Min (ms)":>10s}  {"Mean (ms)":>10s}  {"Peak (KiB)":>10s}  {"vs Baseline":>15s}')
+    for name, result in results.items():
+        if name in ratios:
+            time_ratio, peak_ratio = ratios[name]
+            color = 1 if name in regressions else 2 if time_ratio < 1 / threshold else None
+            compared = colored(f'{time_ratio:6.2f}x / {peak_ratio:5.2f}x', color)
+        else:
+            compared = f'{"N/A":>15s}'
+        ms_min, ms_mean, kib = result['min'] * 1000, result['mean'] * 1000, result['peak'] / 1024
+        print(f'{name:<{name_width}s}  {ms_min:>10.3f}  {ms_mean:>10.3f}  {kib:>10.1f}  {compared}')
+    return regressions
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, Path(__file__).resolve().parents[1].joinpath('lib').as_posix())
+import _venv  # This will activate the venv, if it exists and is not already active
+
+import logging
+
+from nier.cli import ArgParser
+from nier.codegen import DEFAULT_PATH, write_codecs, load_codecs, verify_codecs
+
+log = logging.getLogger(__name__)
+
+
+def parser():
+    parser = ArgParser(description='Generate / verify flat struct-based codecs for the save file structs')
+
+    gen_parser = parser.add_subparser('action', 'generate', 'Generate the flat codecs module')
+    gen_parser.add_argument('--output', '-o', metavar='PATH', default=DEFAULT_PATH, help='Output path (default: %(default)s)')
+    gen_parser.add_argument('--verify', '-V', type=int, default=10, help='Number of synthetic GAMEDATA files to verify the codecs against before writing them (default: %(default)s)')
+
+    verify_parser = parser.add_subparser('action', 'verify', 'Verify that the generated codecs are byte-identical to construct')
+    verify_parser.add_argument('paths', nargs='*', help='GAMEDATA files to verify against (default: synthetic files)')
+    verify_parser.add_argument('--samples', '-n', type=int, default=10, help='Number of synthetic GAMEDATA files to generate if no paths are provided (default: %(default)s)')
+    verify_parser.add_argument('--seed', '-s', type=int, default=0, help='Random seed for synthetic data and mutations (default: %(default)s)')
+
+    for _parser in (gen_parser, verify_parser):
+        _parser.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
+    return parser
+
+
+def main():
+    args = parser().parse_args()
+    log_fmt = '%(asctime)s %(levelname)s %(name)s %(lineno)d %(message)s' if args.verbose else '%(message)s'
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format=log_fmt)
+
+    if args.action == 'generate':
+        write_codecs(args.output, args.verify)
+    elif args.action == 'verify':
+        samples = [Path(path).expanduser().read_bytes() for path in args.paths] or args.samples
+        verify_codecs(load_codecs(), samples, args.seed)
+    else:
+        raise ValueError(f'Unexpected action={args.action!r}')
+
+
+if __name__ == '__main__':
+    main()
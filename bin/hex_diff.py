@@ -7,14 +7,18 @@ sys.path.insert(0, Path(__file__).resolve().parents[1].joinpath('lib').as_posix(
 import _venv  # This will activate the venv, if it exists and is not already active
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from io import BytesIO
-from struct import unpack_from, error as StructError
+from functools import partial
+from struct import unpack_from
+from typing import Iterator
 
 from nier.cli import ArgParser, get_path
 from nier.utils import colored
 
 log = logging.getLogger(__name__)
+CHUNK_SIZE = 5000  # Number of unique lines to unpack per task
 
 FORMATS = {
     # '?': ('bool', 1),
@@ -26,9 +30,10 @@ FORMATS = {
 
 def parser():
     parser = ArgParser(description='View the diff between lines of data stored as hex')
-    parser.add_argument('file', help='Path to the file from which hex lines should be read')
+    parser.add_argument('files', nargs='+', help='Paths to files from which hex lines should be read')
     parser.add_argument('--offset', '-o', type=int, default=0, help='Offset from the beginning of the data in bytes to start struct matching')
     parser.add_argument('--endian', '-e', choices=('big', 'little', 'native'), help='Interpret values with the given endianness')
+    parser.add_argument('--workers', '-w', type=int, help='Number of worker processes to use (default: cpu count)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
     return parser
 
@@ -38,25 +43,46 @@ def main():
     log_fmt = '%(asctime)s %(levelname)s %(name)s %(lineno)d %(message)s' if args.verbose else '%(message)s'
     logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format=log_fmt)
 
-    path = Path(args.file).expanduser().resolve()
-    data = (''.join(line.split()) for line in path.read_text('utf-8').splitlines())
-
-    unpacked_lines = {}
-    for line in data:
-        bio = BytesIO()
-        for i in range(0, len(line), 2):
-            bio.write(bytes.fromhex(line[i: i + 2]))
-
-        unpacked = view_unpacked(bio.getvalue(), offset=args.offset, endian=args.endian)
-        unpacked_lines[unpacked.pop('hex')] = unpacked
-
+    render = partial(render_lines, offset=args.offset, endian=args.endian)
+    paths = [Path(path).expanduser().resolve() for path in args.files]
+    workers = args.workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as executor:
+        # All tasks are submitted before any results are consumed, so every file is processed in parallel
+        results = [(path, executor.map(render, iter_chunks(path))) for path in paths]
+        for i, (path, rendered) in enumerate(results):
+            if len(paths) > 1:
+                print(colored(f'{"#" * 40} {path.as_posix()} {"#" * 40}', 11), end='\n\n' if i else '\n')
+            print_rendered(list(rendered))
+
+
+def iter_chunks(path: Path) -> Iterator[list[bytes]]:
+    """:return: Generator that yields lists of up to :data:`CHUNK_SIZE` unique decoded lines from the given file"""
+    with path.open('r', encoding='utf-8') as f:
+        lines = list(dict.fromkeys(map(bytes.fromhex, f)))  # fromhex ignores whitespace; duplicates are only shown once
+    for i in range(0, len(lines), CHUNK_SIZE):
+        yield lines[i: i + CHUNK_SIZE]
+
+
+def render_lines(lines: list[bytes], offset: int = 0, endian: str = None) -> dict[str, str]:
+    """:return: Mapping of {data type: rendered lines} for the given decoded lines"""
+    rendered = {name: [] for name, _ in FORMATS.values()}
+    for data in lines:
+        unpacked = view_unpacked(data, offset=offset, endian=endian, binary=False)
+        line = unpacked.pop('hex')
+        for data_type, values in unpacked.items():
+            rendered[data_type].append(f'{line}: {values}')
+    return {data_type: '\n'.join(values) for data_type, values in rendered.items()}
+
+
+def print_rendered(chunks: list[dict[str, str]]):
     bar = '=' * 50
     for i, data_type in enumerate(sorted(f[0] for f in FORMATS.values())):
         if i:
             print()
         print(colored(f'{bar} {data_type} {bar}', 14))
-        for line, unpacked in unpacked_lines.items():
-            print(f'{line}: {unpacked[data_type]}')
+        for chunk in chunks:
+            if rendered := chunk[data_type]:
+                print(rendered)
 
 
 class Endian(Enum):
@@ -70,20 +96,22 @@ class Endian(Enum):
         return cls._member_map_.get(value.upper() if isinstance(value, str) else value)
 
 
-def view_unpacked(data: bytes, *, split: int = 4, sep: str = ' ', offset: int = 0, endian: Endian = None):
-    endian = Endian(endian or '@')
-    unpacked = {'bin': sep.join(map('{:08b}'.format, data)), 'hex': data.hex(sep, split)}
+def view_unpacked(
+    data: bytes, *, split: int = 4, sep: str = ' ', offset: int = 0, endian: Endian = None, binary: bool = True
+):
+    byte_order = Endian(endian or '@').value
+    unpacked = {'hex': data.hex(sep, split)}
+    if binary:
+        unpacked['bin'] = sep.join(map(_BIN_STRS.__getitem__, data))
     for fc, (name, width) in FORMATS.items():
-        fmt = endian.value + fc
-        from_struct = []
-        for i in range(offset, len(data), width):
-            try:
-                from_struct.extend(unpack_from(fmt, data, i))
-            except StructError:
-                pass
-        unpacked[name] = from_struct
+        # Each value is unpacked with a single call; a trailing partial value is skipped
+        count = max(len(data) - offset, 0) // width
+        unpacked[name] = list(unpack_from(f'{byte_order}{count}{fc}', data, offset)) if count else []
     return unpacked
 
 
+_BIN_STRS = tuple(map('{:08b}'.format, range(256)))
+
+
 if __name__ == '__main__':
     main()
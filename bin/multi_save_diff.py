@@ -11,7 +11,9 @@ from collections import defaultdict
 from io import StringIO
 
 from nier.cli import ArgParser, get_steam_dir
-from nier.save_file import GameData, Header, SaveFile
+from nier.compression import COMPRESSED_SUFFIXES
+from nier.profiling import profiled, phase, count
+from nier.save_file import GameData, GameDataHeader, SaveFile
 from nier.utils import colored, collapsed_ranges_str
 
 log = logging.getLogger(__name__)
@@ -38,6 +40,9 @@ def parser():
     for _parser in (count_parser, diff_parser):
         _parser.add_argument('--dir', '-d', metavar='PATH', help='Directory containing GAMEDATA files saved by save_watcher')
         _parser.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
+        profile_group = _parser.add_argument_group('Profiling Options')
+        profile_group.add_argument('--profile', nargs='?', const='table', choices=('table', 'json'), help='Print a summary of time spent in each phase to stderr (default format: table)')
+        profile_group.add_argument('--profile_stats', metavar='PATH', help='Run cProfile and save stats to the given path for use with pstats')
     parser.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
     return parser
 
@@ -47,38 +52,41 @@ def main():
     log_fmt = '%(asctime)s %(levelname)s %(name)s %(lineno)d %(message)s' if args.verbose else '%(message)s'
     logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format=log_fmt)
 
-    action = args.action
-    if action == 'count':
-        count_changes(load_data(args.dir), args.unknowns, args.show_names)
-    elif action == 'diff':
-        save_data = load_data(args.dir)
-        multi_diff(args.location, args.field, save_data, getattr(args, 'global'))
-    else:
-        raise ValueError(f'Unexpected {action=}')
+    with profiled(args.profile, args.profile_stats):
+        action = args.action
+        if action == 'count':
+            count_changes(load_data(args.dir), args.unknowns, args.show_names)
+        elif action == 'diff':
+            save_data = load_data(args.dir)
+            multi_diff(args.location, args.field, save_data, getattr(args, 'global'))
+        else:
+            raise ValueError(f'Unexpected {action=}')
 
 
-def load_data(save_dir: str = None) -> dict[Path, tuple[Header, SaveFile]]:
+def load_data(save_dir: str = None) -> dict[Path, tuple[GameDataHeader, SaveFile]]:
     save_dir = Path(save_dir).expanduser().resolve() if save_dir else get_steam_dir()
     pat = 'GAMEDATA_[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]-[0-9]'
     save_data = {}
-    for pat in (pat, pat + '[0-9]'):
-        for path in save_dir.glob(pat):
+    for pat in (pat + suffix for pat in (pat, pat + '[0-9]') for suffix in ('', *COMPRESSED_SUFFIXES)):
+        for path in save_dir.glob(pat):  # Compressed backups are decompressed by GameData.load
             gd = GameData.load(path)
             save_data[path] = (gd.header, max(gd.slots))
     return save_data
 
 
 def count_changes(
-    save_data: dict[Path, tuple[Header, SaveFile]], only_unknowns: bool = False, show_names: bool = False
+    save_data: dict[Path, tuple[GameDataHeader, SaveFile]], only_unknowns: bool = False, show_names: bool = False
 ):
     header_fields = defaultdict(lambda: defaultdict(list))
     slot_fields = defaultdict(lambda: defaultdict(list))
-    for path, (header, slot) in save_data.items():
-        # print(f'{path.name}: {header}, {slot}')
-        for field, value in header.raw_items():
-            header_fields[field][value].append(path)
-        for field, value in slot.raw_items():
-            slot_fields[field][value].append(path)
+    with phase('diff'):
+        for path, (header, slot) in save_data.items():
+            # print(f'{path.name}: {header}, {slot}')
+            for field, value in header.raw_items(sparse=True):  # Hashing all-zero fields is O(1)
+                header_fields[field][value].append(path)
+            for field, value in slot.raw_items(sparse=True):
+                slot_fields[field][value].append(path)
+            count('diff_bytes_compared', len(header._data) + len(slot._data))
 
     print(f'Total file count: {len(save_data)}')
     for label, field_dict in {'Header': header_fields, 'Save file slot': slot_fields}.items():
@@ -92,7 +100,7 @@ def count_changes(
 
 
 def multi_diff(
-    location: str, field: str, save_data: dict[Path, tuple[Header, SaveFile]], global_highlights: bool = False
+    location: str, field: str, save_data: dict[Path, tuple[GameDataHeader, SaveFile]], global_highlights: bool = False
 ):
     name_val_map = {
         path.name: (header if location == 'header' else slot).raw(field) for path, (header, slot) in save_data.items()
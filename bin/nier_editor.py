@@ -6,16 +6,20 @@ from pathlib import Path
 sys.path.insert(0, Path(__file__).resolve().parents[1].joinpath('lib').as_posix())
 import _venv  # This will activate the venv, if it exists and is not already active
 
-import json
 import logging
+import os
+from contextlib import redirect_stdout, redirect_stderr
 from datetime import datetime
+from functools import partial
+from io import StringIO
 
 from nier.cli import ArgParser, get_path
 from nier.constants import FERTILIZER_ALIASES
-from nier.save_file import GameData
+from nier.profiling import profiled
+from nier.quick_info import quick_info
+from nier.save_file import GameData, SaveFile, ITEM_QUANTITY_LIMITS
 from nier.utils import colored
 
-ITEM_SECTIONS = ('recovery', 'cultivation', 'fishing', 'raw_materials')
 SLOTS = (1, 2, 3, 4, 5, 6, 7)
 log = logging.getLogger(__name__)
 
@@ -55,9 +59,41 @@ def parser():
     bulk_edit.add_argument('name_quantity_map', metavar='JSON', help='A JSON dict of {"name": quantity} for items to add')
     _parsers.append(bulk_edit)
 
+    plan_garden = edit_parser.add_subparser('item', 'garden_plan', 'Plant the seeds that maximize a target item per hour')
+    plan_garden.add_argument('target', nargs='+', help='Item(s) to maximize, such as "Gold Moonflower Seed" or "Gold Moonflower"; use NAME=WEIGHT to weight multiple items')
+    plan_garden.add_argument('--model', '-m', metavar='PATH', required=True, help='JSON or YAML file containing GrowthModel parameters (growth_hours, speed_factor, base_yield, water_bonus, bounty_factor, seed_return, flowering_factor)')
+    plan_garden.add_argument('--horizon', '-H', type=float, default=72, help='Number of real-time hours to plan for (default: %(default)s)')
+    plan_garden.add_argument('--dry_run', '-D', action='store_true', help='Print the plan without planting anything')
+    plan_garden.add_argument('--replant_ready', '-R', action='store_true', help='Allow planting over plants that are ready but not harvested yet, which discards their harvest (default: leave them alone)')
+    _parsers.append(plan_garden)
+
+    batch_edit = edit_parser.add_subparser('item', 'batch', 'Apply a JSON/YAML spec of edits to many save files/slots')
+    batch_edit.add_argument('spec', help='Path to a JSON or YAML edit spec file (see nier.bulk_edit for the format)')
+    batch_edit.add_argument('--workers', '-w', type=int, help='Number of worker processes to use (default: cpu count)')
+    batch_edit.add_argument('--no_backup', '-B', dest='backup', action='store_false', help='Do not save backups of the original files')
+    batch_edit.add_argument('--dry_run', '-D', action='store_true', help='Validate and apply all edits without saving any changes')
+    batch_edit.add_argument('--fsync', '-f', choices=('none', 'file', 'full'), default='file', help='When to fsync: none, file (before replacing each file), or full (also each directory after replacing files) (default: %(default)s)')
+    batch_edit.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
+    _add_profile_args(batch_edit)
+
+    transplant = edit_parser.add_subparser('item', 'transplant', 'Copy a save slot from another file without parsing either file')
+    transplant.add_argument('src_path', help='Path of the save file to copy a slot from')
+    transplant.add_argument('src_slot', type=int, choices=SLOTS, help='Save slot to copy')
+    transplant.add_argument('dst_slot', type=int, choices=SLOTS, help='Save slot to overwrite in the file specified via --path')
+    transplant.add_argument('--path', '-p', help='Save file path to modify')
+    transplant.add_argument('--in_place', '-i', action='store_true', help='Modify the file in place instead of replacing it')
+    transplant.add_argument('--no_backup', '-B', dest='backup', action='store_false', help='Do not save a backup of the original file')
+    transplant.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
+    _add_profile_args(transplant)
+
     view_info = view_parser.add_subparser('item', 'info')
+    view_info.add_argument('--quick', '-q', action='store_true', help='Only read the summary fields for each slot instead of parsing the full file')
     _parsers.append(view_info)
 
+    view_find = view_parser.add_subparser('item', 'find', 'Find fields that contain the given number in any binary format')
+    view_find.add_argument('value', type=_number, help='The int or float value to find')
+    _parsers.append(view_find)
+
     view_attr = view_parser.add_subparser('item', 'attrs', 'View SaveFile attributes')
     view_header = view_parser.add_subparser('item', 'header', 'View GameData header attributes')
     _parsers.append(view_attr)
@@ -77,6 +113,8 @@ def parser():
         if _parser is not view_header:
             _parser.add_argument('--slot', '-s', type=int, choices=SLOTS, help='Save slot to load/modify')
         _parser.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
+        _add_daemon_args(_parser)
+        _add_profile_args(_parser)
 
     # endregion
     # region Diff Options
@@ -92,30 +130,85 @@ def parser():
     diff_slots.add_argument('--path', '-p', help='Save file path')
     diff_slots.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
 
-    for _parser in (diff_files, diff_slots):
+    diff_series = diff_parser.add_subparser('item', 'series', 'View the difference between each consecutive pair of save files in a directory')
+    diff_series.add_argument('dir', help='Directory containing save files, such as backups saved by save_watcher')
+    diff_series.add_argument('--pattern', '-P', default='GAMEDATA*', help='Glob pattern for save file names to include (default: %(default)s)')
+    diff_series.add_argument('--slot', '-s', type=int, choices=SLOTS, help='Save slot to compare (default: full file diff)')
+    diff_series.add_argument('--workers', '-w', type=int, help='Number of worker processes to use (default: cpu count)')
+    diff_series.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
+
+    for _parser in (diff_files, diff_slots, diff_series):
         _group = _parser.add_argument_group('Diff Options')
         _group.add_argument('--per_line', '-L', type=int, default=8, help='Number of bytes to print per line (binary data only)')
         _group.add_argument('--binary', '-b', action='store_true', help='Show the binary version, even if a higher level representation is available')
         _fields = _parser.add_argument_group('Field Options').add_mutually_exclusive_group()
         _fields.add_argument('--keys', '-k', nargs='+', help='Specific keys/attributes to include in the diff (default: all)')
         _fields.add_argument('--unknowns', '-u', action='store_true', help='Only show unknown fields in output')
+        if _parser is not diff_series:
+            _add_daemon_args(_parser)
+        _add_profile_args(_parser)
+    # endregion
+    # region Daemon Options
+    daemon_parser = parser.add_subparser('action', 'daemon', 'Manage a daemon that keeps parsed save files in memory to serve view/edit/diff requests')
+    daemon_start = daemon_parser.add_subparser('item', 'start', 'Run the daemon in the foreground until it is stopped')
+    daemon_start.add_argument('--cache_size', '-c', type=int, default=32, help='Maximum number of save files to keep in memory (default: %(default)s)')
+    daemon_stop = daemon_parser.add_subparser('item', 'stop', 'Stop the running daemon')
+    daemon_status = daemon_parser.add_subparser('item', 'status', 'Show the status of the running daemon')
+    for _parser in (daemon_start, daemon_stop, daemon_status):
+        _parser.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
     # endregion
     return parser
 
 
+def _number(value: str):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _add_daemon_args(parser: ArgParser):
+    parser.add_argument('--no_daemon', '-N', action='store_true', help='Load the save file in this process even if the daemon is running')
+
+
+def _add_profile_args(parser: ArgParser):
+    group = parser.add_argument_group('Profiling Options')
+    group.add_argument('--profile', nargs='?', const='table', choices=('table', 'json'), help='Print a summary of time spent in each phase to stderr (default format: table)')
+    group.add_argument('--profile_stats', metavar='PATH', help='Run cProfile and save stats to the given path for use with pstats')
+
+
 def main():
     args = parser().parse_args()
     log_fmt = '%(asctime)s %(levelname)s %(name)s %(lineno)d %(message)s' if args.verbose else '%(message)s'
     logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format=log_fmt)
 
-    if (action := args.action) in {'view', 'edit'}:
-        game_data = GameData.load(get_path(args.path))
-        if action == 'view':
-            view(game_data, args.item, args.slot, args)
-        elif action == 'edit':
-            edit(game_data, args.item, args.slot, args)
+    if args.action == 'daemon':
+        return daemon(args)
+    elif not (getattr(args, 'no_daemon', True) or args.profile or args.profile_stats) and run_via_daemon(args):
+        return
+
+    with profiled(args.profile, args.profile_stats):
+        run(args)
+
+
+def run(args, load=GameData.load):
+    """
+    :param args: Parsed args
+    :param load: Function to use to load a GameData object from a path for view / diff actions
+    """
+    if (action := args.action) == 'view' and args.item == 'info' and args.quick:
+        slots = quick_info(get_path(args.path))
+        print('\n'.join(map(repr, slots if args.slot is None else [slots[args.slot - 1]])))
+    elif action == 'edit' and args.item == 'batch':
+        batch_edit(args)
+    elif action == 'edit' and args.item == 'transplant':
+        transplant_slot(args)
+    elif action == 'view':
+        view(load(get_path(args.path)), args.item, args.slot, args)
+    elif action == 'edit':
+        edit(GameData.load(get_path(args.path)), args.item, args.slot, args)
     elif action == 'diff':
-        diff(args.item, args)
+        diff(args.item, args, load)
     else:
         raise ValueError(f'Unexpected action={args.action!r}')
 
@@ -133,7 +226,7 @@ def view(game_data: GameData, item: str, slot_num: int, args):
     elif item == 'items':
         if len(slots) > 1:
             raise ValueError('--slot is required for viewing items')
-        slots[0].pprint(keys=set(ITEM_SECTIONS))
+        slots[0].pprint(keys=set(ITEM_QUANTITY_LIMITS))
     elif item in {'attrs', 'header'}:
         if item == 'attrs' and len(slots) > 1:
             raise ValueError('--slot is required for viewing attributes')
@@ -149,6 +242,8 @@ def view(game_data: GameData, item: str, slot_num: int, args):
         )
     elif item == 'info':
         print(game_data)
+    elif item == 'find':
+        (game_data if slot_num is None else slots[0]).find_number(args.value)
     else:
         raise ValueError(f'Unexpected {item=} to view')
 
@@ -163,35 +258,25 @@ def edit(game_data: GameData, item: str, slot_num: int, args):
         slot.garden.update(args.time, args.hours, fertilizer, args.water, plots=args.plots, **kwargs)
         log.info('Updated garden:')
         slot.garden.show()
+    elif item == 'garden_plan':
+        from nier.garden import GrowthModel
+        from nier.garden_planner import plan_garden
+
+        target = {name: float(weight or 1) for name, _, weight in (t.partition('=') for t in args.target)}
+        model = GrowthModel.load(args.model)
+        plan = plan_garden(slot, target, model, args.horizon, replant_ready=args.replant_ready)
+        plan.show()
+        if args.dry_run:
+            return
+        plan.apply(slot)
+        log.info('Updated garden:')
+        slot.garden.show()
     elif item == 'items':
-        item_name, quantity = args.name, args.quantity
-        if not 0 <= quantity <= 99:
-            raise ValueError(f'Invalid {quantity=} - must be between 0 and 99')
-
-        for section in ITEM_SECTIONS:
-            if item_name in slot[section]:
-                if section == 'recovery' and quantity > 10:
-                    raise ValueError(f'Invalid {quantity=} - must be between 0 and 10')
-                old = slot[section][item_name]
-                log.info(f'Setting quantity for item={item_name} {old} => {quantity} in {section=}')
-                slot._parsed[section][item_name] = quantity
-                break
-        else:
-            raise ValueError(f'Could not find item={item_name!r} in {ITEM_SECTIONS=}')
+        slot.inventory.set_quantities({args.name: args.quantity})
     elif item == 'items_bulk':
-        for item_name, quantity in json.loads(args.name_quantity_map).items():
-            if not 0 <= quantity <= 99:
-                raise ValueError(f'Invalid {quantity=} - must be between 0 and 99')
-            for section in ITEM_SECTIONS:
-                if item_name in slot[section]:
-                    if section == 'recovery' and quantity > 10:
-                        raise ValueError(f'Invalid {quantity=} - must be between 0 and 10')
-                    old = slot[section][item_name]
-                    log.info(f'Setting quantity for item={item_name} {old} => {quantity} in {section=}')
-                    slot._parsed[section][item_name] = quantity
-                    break
-            else:
-                raise ValueError(f'Could not find item={item_name!r} in {ITEM_SECTIONS=}')
+        import json
+
+        slot.inventory.set_quantities(json.loads(args.name_quantity_map))
     else:
         raise ValueError(f'Unexpected {item=} to edit')
 
@@ -199,15 +284,34 @@ def edit(game_data: GameData, item: str, slot_num: int, args):
     game_data.save()
 
 
-def diff(item: str, args):
-    if item == 'files':
-        obj_a, obj_b = GameData.load(get_path(args.paths[0])), GameData.load(get_path(args.paths[1]))
+def batch_edit(args):
+    from nier.bulk_edit import load_spec, apply_edits
+
+    results = apply_edits(load_spec(args.spec), args.workers, args.backup, args.dry_run, args.fsync)
+    if args.dry_run:
+        for result in results:
+            log.info(f'Would save {result.path.as_posix()} with changes to slots: {", ".join(map(str, result.slots))}')
+
+
+def transplant_slot(args):
+    from nier.transplant import transplant
+
+    src_path, dst_path = get_path(args.src_path), get_path(args.path)
+    transplant(src_path, args.src_slot, dst_path, args.dst_slot, in_place=args.in_place, backup=args.backup)
+    log.info(f'Copied slot {args.src_slot} from {src_path.as_posix()} to slot {args.dst_slot} in {dst_path.as_posix()}')
+
+
+def diff(item: str, args, load=GameData.load):
+    if item == 'series':
+        return diff_series(args)
+    elif item == 'files':
+        obj_a, obj_b = load(get_path(args.paths[0])), load(get_path(args.paths[1]))
         if args.slot1 or args.slot2:
             if not (args.slot1 and args.slot2):
                 raise ValueError('Either both --slot1/-s1 and --slot2/-s2 must be provided, or neither may be provided')
             obj_a, obj_b = obj_a[args.slot1 - 1], obj_b[args.slot2 - 1]
     elif item == 'saves':
-        game_data = GameData.load(get_path(args.path))
+        game_data = load(get_path(args.path))
         obj_a, obj_b = game_data[args.slots[0] - 1], game_data[args.slots[1] - 1]
     else:
         raise ValueError(f'Unexpected {item=} to compare')
@@ -220,5 +324,108 @@ def diff(item: str, args):
     obj_a.diff(obj_b, per_line=args.per_line, byte_diff=args.binary, keys=keys, max_len=1)
 
 
+def diff_series(args):
+    from nier.series import snapshot_paths, diff_series as _diff_series  # Imports multiprocessing; only needed here
+
+    if not (paths := snapshot_paths(args.dir, args.pattern)):
+        raise ValueError(f'No files matching pattern={args.pattern!r} were found in dir={args.dir!r}')
+
+    if args.unknowns:
+        keys = {k for k in (SaveFile if args.slot else GameData)._offsets_and_sizes if k.startswith('_unk')}
+    else:
+        keys = set(args.keys) if args.keys else None
+
+    kwargs = {'per_line': args.per_line, 'byte_diff': args.binary, 'keys': keys, 'max_len': 1}
+    for path_a, path_b, diff_str in _diff_series(paths, args.slot, args.workers, **kwargs):
+        print(colored(f'{"=" * 30}  {path_a.name} -> {path_b.name}  {"=" * 30}', 14))
+        print(diff_str or 'No differences', end='' if diff_str else '\n')
+
+
+# region Daemon
+
+
+def daemon(args):
+    from nier.daemon import Daemon, SaveCache, call, is_running
+
+    if args.item != 'start' and not is_running():
+        log.info('The daemon is not running')
+    elif args.item == 'start':
+        server = Daemon(cache=SaveCache(args.cache_size))
+        server.register('cli', partial(_serve_cli, server.cache, parser()))  # The parser is only built once
+        server.serve()
+    elif args.item == 'stop':
+        call('shutdown')
+        log.info('Stopped the daemon')
+    elif args.item == 'status':
+        stats = call('stats')
+        cache = stats['cache']
+        print(f'Daemon pid={stats["pid"]} has been running for {stats["uptime"]:,.1f}s')
+        print(f'Cached files: {cache["size"]}/{cache["max_size"]}, hits={cache["hits"]}, misses={cache["misses"]}')
+        for path in cache['paths']:
+            print(f'  - {path}')
+    else:
+        raise ValueError(f'Unexpected daemon command={args.item!r}')
+
+
+def run_via_daemon(args) -> bool:
+    """
+    Send this command to the daemon, if it is running.
+
+    :return: True if the command was handled by the daemon, False if the daemon is not running
+    """
+    from nier.daemon import call
+
+    try:
+        result = call('cli', {'argv': sys.argv[1:], 'cwd': os.getcwd()})
+    except OSError as e:
+        log.debug(f'Not using the daemon: {e}')
+        return False
+
+    print(result['output'], end='')
+    if error := result['error']:
+        sys.exit(error)
+    return True
+
+
+def _serve_cli(cache, arg_parser: ArgParser, argv: list[str], cwd: str) -> dict[str, str]:
+    """Daemon handler that runs a view / edit / diff command, using the cache for view / diff commands"""
+    output = StringIO()
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            args = arg_parser.parse_args(argv)
+    except SystemExit as e:  # Help was requested, or the args were invalid; argparse already printed the message
+        if e.code:
+            return {'output': '', 'error': output.getvalue().strip()}
+        return {'output': output.getvalue(), 'error': None}
+
+    handler = logging.StreamHandler(output)
+    if args.verbose:
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s %(lineno)d %(message)s'))
+    else:
+        handler.setLevel(logging.INFO)
+
+    root = logging.getLogger()
+    root.addHandler(handler)
+    orig_cwd, orig_level = os.getcwd(), root.level
+    root.setLevel(min(orig_level, logging.DEBUG if args.verbose else logging.INFO))
+    error = None
+    try:
+        os.chdir(cwd)
+        with redirect_stdout(output):
+            run(args, cache.get)
+    except Exception as e:
+        log.debug(f'Error handling {argv=}:', exc_info=True)
+        error = f'{type(e).__name__}: {e}'
+    finally:
+        os.chdir(orig_cwd)
+        root.setLevel(orig_level)
+        root.removeHandler(handler)
+
+    return {'output': output.getvalue(), 'error': error}
+
+
+# endregion
+
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, Path(__file__).resolve().parents[1].joinpath('lib').as_posix())
+import _venv  # This will activate the venv, if it exists and is not already active
+
+import logging
+from collections import Counter
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from nier.cli import ArgParser
+from nier.roundtrip import PROPERTIES, build_corpus, corpus_paths, run_checks
+from nier.utils import colored
+
+log = logging.getLogger(__name__)
+
+
+def parser():
+    parser = ArgParser(description='Generate a GAMEDATA fixture corpus / run property-based round-trip and checksum checks')
+
+    corpus_parser = parser.add_subparser('action', 'corpus', 'Generate a corpus of synthetic GAMEDATA files')
+    corpus_parser.add_argument('directory', help='Output directory')
+    corpus_parser.add_argument('--count', '-n', type=int, default=100, help='Number of GAMEDATA files to generate (default: %(default)s)')
+    corpus_parser.add_argument('--seed', '-s', default='0', help='Random seed for synthetic data (default: %(default)s)')
+
+    run_parser = parser.add_subparser('action', 'run', 'Check round-trip / checksum properties for GAMEDATA files')
+    run_parser.add_argument('paths', nargs='*', help='GAMEDATA files to check (default: a temporary synthetic corpus)')
+    run_parser.add_argument('--corpus', '-c', metavar='PATH', help='Directory containing a corpus generated by the corpus action')
+    run_parser.add_argument('--count', '-n', type=int, default=20, help='Number of GAMEDATA files to generate if no paths or corpus are provided (default: %(default)s)')
+    run_parser.add_argument('--properties', '-p', nargs='+', choices=PROPERTIES, help='Specific properties to check (default: all)')
+    run_parser.add_argument('--iterations', '-i', type=int, default=1, help='Number of times to check each property per file, with a different random seed each time (default: %(default)s)')
+    run_parser.add_argument('--seed', '-s', default='0', help='Random seed for synthetic data and random edits (default: %(default)s)')
+
+    for _parser in (corpus_parser, run_parser):
+        _parser.add_argument('--workers', '-w', type=int, help='Number of worker processes to use (default: cpu count)')
+        _parser.add_argument('--verbose', '-v', action='store_true', help='Increase logging verbosity')
+    return parser
+
+
+def main():
+    args = parser().parse_args()
+    log_fmt = '%(asctime)s %(levelname)s %(name)s %(lineno)d %(message)s' if args.verbose else '%(message)s'
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format=log_fmt)
+
+    if args.action == 'corpus':
+        build_corpus(args.directory, args.count, args.seed, args.workers)
+    elif args.action == 'run':
+        if not args.verbose:
+            logging.getLogger('nier.codegen').setLevel(logging.WARNING)  # verify_codecs logs a summary for each file
+        if args.paths or args.corpus:
+            run(args, list(args.paths) + (corpus_paths(args.corpus) if args.corpus else []))
+        else:
+            with TemporaryDirectory() as tmp_dir:
+                run(args, build_corpus(tmp_dir, args.count, args.seed, args.workers))
+    else:
+        raise ValueError(f'Unexpected action={args.action!r}')
+
+
+def run(args, paths: list[Path]):
+    start = perf_counter()
+    files = checks = size = 0
+    times, failed = Counter(), Counter()
+    for result in run_checks(paths, args.properties, args.seed, args.iterations, args.workers):
+        files += 1
+        checks += result.checks
+        size += result.size
+        times.update(result.times)
+        for failure in result.failures:
+            failed[failure.property] += 1
+            location = f'{result.path.as_posix()} [{failure.property} #{failure.iteration}]'
+            print(colored(f'FAILED: {location}: {failure.error}', 9), flush=True)
+
+    elapsed = perf_counter() - start
+    print(f'\n{"Property":<20s}  {"Time (s)":>10s}  Failures')
+    for name, seconds in times.items():
+        print(f'{name:<20s}  {seconds:>10.3f}  {colored(failed[name], 9 if failed[name] else 2)}')
+
+    mb = size / 1048576
+    print(
+        f'\nChecked {files:,d} files ({mb:,.1f} MB) with {checks:,d} checks in {elapsed:,.2f}s'
+        f' ({files / elapsed:,.1f} files/s, {mb / elapsed:,.1f} MB/s); failures: {sum(failed.values()):,d}'
+    )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,12 +7,18 @@ sys.path.insert(0, Path(__file__).resolve().parents[1].joinpath('lib').as_posix(
 import _venv  # This will activate the venv, if it exists and is not already active
 
 import logging
+from datetime import timedelta
 from hashlib import sha256
+from typing import TYPE_CHECKING, Sequence
 
 from watchdog.observers import Observer
 
 from nier.cli import ArgParser, get_path
-from nier.utils import unique_path
+from nier.compression import CODECS, write_compressed
+from nier.retention import RetentionPolicy, Compactor, apply_retention, next_snapshot_path
+
+if TYPE_CHECKING:
+    from nier.change_feed import SnapshotRing, Sink
 
 log = logging.getLogger(__name__)
 
@@ -21,6 +27,22 @@ def parser():
     parser = ArgParser(description='Nier Replicant ver.1.22474487139... Save File Watcher')
     parser.add_argument('--path', '-p', help='Save file path to watch')
     parser.add_argument('--backups', '-b', metavar='PATH', help='Path to the directory in which backups should be saved (default: same dir as save files)')
+    parser.add_argument('--compress', '-z', metavar='CODEC', choices=('auto', *CODECS), help='Compress backups with the given codec (auto: the codec with the best ratio among fast codecs, measured on the first backup); zstd is only available if the zstandard package is installed')
+
+    feed_group = parser.add_argument_group('Change Feed Options')
+    feed_group.add_argument('--feed', '-f', metavar='TARGET', action='append', help='Emit field-level changes for each save to the given target: - for stdout, unix:PATH for a Unix socket, or a JSONL file path (may be specified multiple times)')
+    feed_group.add_argument('--ring_size', '-n', type=int, default=10, help='Number of parsed snapshots to keep in memory when --feed is used (default: %(default)s)')
+    feed_fields = feed_group.add_mutually_exclusive_group()
+    feed_fields.add_argument('--keys', '-k', nargs='+', help='Specific keys/attributes to include in the feed (default: all)')
+    feed_fields.add_argument('--unknowns', '-u', action='store_true', help='Only include unknown fields in the feed')
+
+    retention_group = parser.add_argument_group('Retention Options', 'Snapshots outside of the retention policy are compacted into per-date compressed archives in an "archive" subdirectory')
+    retention_group.add_argument('--keep_all', metavar='HOURS', type=float, help='Keep every backup from the last HOURS hours, and enable the retention policy')
+    retention_group.add_argument('--keep_hourly', metavar='HOURS', type=float, default=24, help='Keep the newest backup from each hour for backups from the last HOURS hours (default: %(default)s)')
+    retention_group.add_argument('--keep_daily', metavar='DAYS', type=float, help='Keep the newest backup from each day for backups from the last DAYS days (default: forever)')
+    retention_group.add_argument('--discard', action='store_true', help='Delete backups that are not retained instead of archiving them')
+    retention_group.add_argument('--compact_interval', metavar='MINUTES', type=float, default=60, help='Minimum number of minutes between applications of the retention policy (default: %(default)s)')
+    retention_group.add_argument('--compact_now', action='store_true', help='Apply the retention policy once and exit, without watching for changes')
     parser.add_argument('--verbose', '-v', action='count', default=0, help='Increase logging verbosity')
     return parser
 
@@ -39,19 +61,57 @@ def main():
         log.debug(f'Creating backup_dir={backup_dir.as_posix()}')
         backup_dir.mkdir(parents=True)
 
-    FSEventHandler(path, backup_dir).run()
+    if args.keep_all is not None:
+        daily = timedelta(days=args.keep_daily) if args.keep_daily is not None else None
+        policy = RetentionPolicy(timedelta(hours=args.keep_all), timedelta(hours=args.keep_hourly), daily)
+        kwargs = {'stem': path.stem, 'suffix': path.suffix, 'discard': args.discard}
+        if args.compact_now:
+            apply_retention(backup_dir, policy, **kwargs)
+            return
+        compactor = Compactor(backup_dir, policy, timedelta(minutes=args.compact_interval), **kwargs)
+    elif args.compact_now:
+        raise ValueError('--keep_all is required to use --compact_now')
+    else:
+        compactor = None
+
+    if args.feed:
+        from nier.change_feed import SnapshotRing, open_sink
+
+        ring = SnapshotRing(args.ring_size, args.keys, args.unknowns)
+        sinks = [open_sink(target) for target in args.feed]
+    else:
+        ring, sinks = None, ()
+
+    FSEventHandler(path, backup_dir, ring, sinks, compactor, args.compress).run()
 
 
 class FSEventHandler:
-    def __init__(self, path: Path, backup_dir: Path):
+    def __init__(
+        self,
+        path: Path,
+        backup_dir: Path,
+        ring: 'SnapshotRing' = None,
+        sinks: Sequence['Sink'] = (),
+        compactor: Compactor = None,
+        codec: str = None,
+    ):
         self.path = path
         self.backup_dir = backup_dir
         self.observer = Observer()
         self.observer.schedule(self, path.parent.as_posix())
         self.last_hash = None
+        self.ring = ring
+        self.sinks = sinks
+        self.compactor = compactor
+        self.codec = codec
 
     def run(self):
         log.info(f'Watching {self.path.as_posix()} with observer={self.observer}')
+        if self.ring is not None and self.path.exists() and (data := self.path.read_bytes()):
+            self.last_hash = sha256(data).hexdigest()
+            self.emit_changes(data)  # The initial snapshot; there is nothing to compare it to yet
+        if self.compactor:
+            self.compactor.maybe_run()
         self.observer.start()
         try:
             while True:
@@ -59,6 +119,11 @@ class FSEventHandler:
         except KeyboardInterrupt:
             self.observer.stop()
             self.observer.join()
+        finally:
+            for sink in self.sinks:
+                sink.close()
+            if self.compactor:
+                self.compactor.join()
 
     def dispatch(self, event):
         what = 'directory' if event.is_directory else 'file'
@@ -81,12 +146,29 @@ class FSEventHandler:
         if data_hash != self.last_hash:
             log.debug(f'Data changed - old={self.last_hash} new={data_hash}')
             self.last_hash = data_hash
-            dest_path = unique_path(self.backup_dir, self.path.stem, self.path.suffix)
-            log.info(f'Saving backup to {dest_path.as_posix()}')
-            dest_path.write_bytes(data)
+            dest_path = next_snapshot_path(self.backup_dir, self.path.stem, self.path.suffix)
+            if self.codec:
+                dest_path = write_compressed(dest_path, data, self.codec, 'none')
+            else:
+                dest_path.write_bytes(data)
+            log.info(f'Saved backup to {dest_path.as_posix()}')
+            if self.ring is not None:
+                self.emit_changes(data)
+            if self.compactor:
+                self.compactor.maybe_run()
         else:
             log.log(11, f'There were no changes to {self.path.as_posix()} - sha256={data_hash}')
 
+    def emit_changes(self, data: bytes):
+        try:
+            changes = self.ring.add(data)
+        except Exception as e:  # The game may still have been writing the file
+            log.warning(f'Unable to parse {self.path.as_posix()} for the change feed: {e}')
+            return
+        log.log(11, f'Found {len(changes)} changed fields')
+        for sink in self.sinks:
+            sink.write(changes)
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,122 @@
+"""
+Asyncio API for loading and saving many GAMEDATA files, such as from network-mounted storage where the latency of each
+file access dominates.
+
+File reads and writes run in a thread pool executor, as does parsing, so the event loop is never blocked.  Parsing holds
+the GIL, but reads do not, so with a concurrency window of N files, up to N reads are in flight while earlier files are
+being parsed.
+
+Example::
+
+    async for game_data in iter_archive('~/save_backups', concurrency=16):
+        print(game_data)
+
+:author: Doug Skrypa
+"""
+
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import TYPE_CHECKING, Union, Iterable, AsyncIterator, Optional, TypeVar
+
+from .save_file import GameData, SaveFile, _read_bytes
+
+if TYPE_CHECKING:
+    from .save_file import Constructed
+
+__all__ = ['aload', 'aload_many', 'iter_archive', 'asave', 'DEFAULT_CONCURRENCY']
+log = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+C = TypeVar('C', GameData, SaveFile)
+
+
+async def aload(path: Union[str, Path], cls: type[C] = GameData, executor: Executor = None) -> C:
+    """
+    :param path: The path of a GAMEDATA file (or a single save slot file, if ``cls`` is :class:`SaveFile`)
+    :param cls: :class:`GameData` or :class:`SaveFile`
+    :param executor: The executor to use for reading and parsing (default: the event loop's default executor)
+    :return: The loaded object
+    """
+    loop = asyncio.get_running_loop()
+    path = Path(path).expanduser()
+    log.debug(f'Loading {cls.__name__} from path={path.as_posix()}')
+    data = await loop.run_in_executor(executor, _read_bytes, path)
+    return await loop.run_in_executor(executor, cls, data, -1 if issubclass(cls, SaveFile) else path)
+
+
+async def iter_archive(
+    source: Union[str, Path, Iterable[Union[str, Path]]],
+    pattern: str = 'GAMEDATA*',
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+    executor: Executor = None,
+) -> AsyncIterator[GameData]:
+    """
+    Load many GAMEDATA files, with at most ``concurrency`` files being read / parsed at once.
+
+    :param source: A directory containing GAMEDATA files (such as save_watcher backups), or an iterable of file paths
+    :param pattern: Glob pattern that file names must match when a directory is provided
+    :param concurrency: The maximum number of files to read / parse at once
+    :param ordered: Yield files in the same order as the paths (in natural sort order for a directory).  If False,
+      files are yielded as soon as they are loaded.
+    :param executor: The executor to use for listing, reading, and parsing (default: the event loop's default executor)
+    :return: Async generator that yields :class:`GameData` objects
+    """
+    if concurrency < 1:
+        raise ValueError(f'Invalid {concurrency=} - must be at least 1')
+    if isinstance(source, (str, Path)):
+        from .series import snapshot_paths
+
+        paths = await asyncio.get_running_loop().run_in_executor(executor, snapshot_paths, source, pattern)
+    else:
+        paths = source
+
+    pending = deque() if ordered else set()
+    try:
+        for path in paths:
+            if len(pending) >= concurrency:
+                yield await _next_done(pending)
+            task = asyncio.ensure_future(aload(path, GameData, executor))
+            if ordered:
+                pending.append(task)
+            else:
+                pending.add(task)
+        while pending:
+            yield await _next_done(pending)
+    finally:
+        for task in pending:  # Only non-empty if an error occurred or the consumer stopped iterating early
+            if task.done():
+                if not task.cancelled():
+                    task.exception()  # Prevents "exception was never retrieved" warnings
+            else:
+                task.cancel()
+
+
+async def _next_done(pending: Union[deque, set]):
+    if isinstance(pending, deque):
+        return await pending.popleft()
+    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    task = done.pop()
+    pending.remove(task)
+    return task.result()
+
+
+async def aload_many(
+    paths: Iterable[Union[str, Path]], concurrency: int = DEFAULT_CONCURRENCY, executor: Executor = None
+) -> list[GameData]:
+    """:return: List of :class:`GameData` objects for the given paths, in the same order"""
+    return [gd async for gd in iter_archive(paths, concurrency=concurrency, executor=executor)]
+
+
+async def asave(obj: 'Constructed', *args, executor: Optional[Executor] = None, **kwargs):
+    """
+    Call ``obj.save(*args, **kwargs)`` in the executor.
+
+    :param obj: A :class:`GameData` or :class:`SaveFile` object
+    :param executor: The executor to use (default: the event loop's default executor)
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, lambda: obj.save(*args, **kwargs))
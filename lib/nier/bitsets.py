@@ -0,0 +1,211 @@
+"""
+Integer-backed bitsets for bit flag fields (learned words, unlocked tutorials, and item / quest new/viewed states).
+
+Bit ``i`` of a field is bit ``i`` of its raw bytes interpreted as a little-endian integer, which matches how the
+``BitsSwapped(BitStruct(...))`` structs for these fields are parsed.  Name <-> bit lookup tables are built once per
+field from the same constants that are used for the structs, so membership tests, set / clear, popcount, and set algebra
+are integer operations, and no per-flag Container of bools needs to be parsed or cleaned.
+
+:author: Doug Skrypa
+"""
+
+import logging
+import math
+from typing import Union, Iterable, Iterator, Optional, Sequence
+
+from .constants import WORDS, TUTORIALS, QUESTS_VIEWED, KEY_ITEMS, RECOVERY, FERTILIZERS, SEEDS, CULTIVATED, BAIT, FISH
+from .constants import RAW_MATERIALS
+
+__all__ = ['FlagLabels', 'FlagSet', 'FLAG_FIELDS']
+log = logging.getLogger(__name__)
+
+Flags = Union['FlagSet', Iterable[str], str, int]
+
+
+class FlagLabels:
+    """
+    Name <-> bit lookup tables for a bit flag field.  Placeholder names for unidentified bits (names that start with
+    ``_``, such as ``_quest_0``) can be looked up, but they are excluded from :attr:`.named_mask`, so they are not
+    included when iterating over, counting, setting, or clearing all flags.
+
+    :param names: The name for each bit, in bit order, with empty / None values for bits that do not have a name
+    :param size: The size of the field in bytes
+    """
+
+    def __init__(self, names: Sequence[Optional[str]], size: int):
+        if len(names) > size * 8:
+            raise ValueError(f'{size=} does not contain enough bits to fit {len(names)} names')
+        self.size = size
+        self.names = tuple(name or None for name in names) + (None,) * (size * 8 - len(names))
+        self.bits = {name: i for i, name in enumerate(self.names) if name}
+        self.named_mask = sum(1 << i for name, i in self.bits.items() if not name.startswith('_'))
+        self.full_mask = (1 << (size * 8)) - 1
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[size={self.size}, names={len(self.bits)}]>'
+
+    def mask(self, names: Union[Iterable[str], str]) -> int:
+        """:return: An int with the bits set for the given name(s)"""
+        if isinstance(names, str):
+            names = (names,)
+        mask = 0
+        for name in names:
+            try:
+                mask |= 1 << self.bits[name]
+            except KeyError:
+                raise ValueError(f'Invalid flag {name=}') from None
+        return mask
+
+    @classmethod
+    def sparse(cls, names: Sequence[str], byte_width: int = 0) -> 'FlagLabels':
+        """Labels for a field defined via :func:`SparseBitFlagEnum<.constructs.utils.SparseBitFlagEnum>`"""
+        return cls(names, byte_width or math.ceil(len(names) / 8))
+
+    @classmethod
+    def sections(cls, sections: Iterable[Sequence[str]], unknowns: Sequence[int]) -> 'FlagLabels':
+        """Labels for a field defined via :func:`BitStructLE<.constructs.utils.BitStructLE>` with one bit per name"""
+        names = []
+        for unknown, section in zip(unknowns, sections):
+            names.extend(section)
+            names.extend([None] * unknown)
+        return cls(names, math.ceil(len(names) / 8))
+
+
+FLAG_FIELDS = {  # {SaveFile field: labels}; for viewed states fields, a set bit indicates that the item is new
+    'words': FlagLabels.sparse(WORDS),
+    'tutorials': FlagLabels.sparse(TUTORIALS),
+    'quest_viewed_states': FlagLabels.sparse(QUESTS_VIEWED, 11),
+    'key_item_viewed_states': FlagLabels.sparse(KEY_ITEMS, 10),
+    'recovery_viewed_states': FlagLabels.sections(RECOVERY.values(), (18, 2, 1, 6)),
+    'cultivation_viewed_states': FlagLabels.sections(([], FERTILIZERS, SEEDS, CULTIVATED), (1, 2, 5, 5)),
+    'fishing_viewed_states': FlagLabels.sections(([], BAIT, FISH), (5, 7, 2)),
+    'raw_materials_viewed_states': FlagLabels.sections(
+        ([], *RAW_MATERIALS.values()), (3, 3, 4, 5, 4, 1, 5, 1, 3, 0)
+    ),
+}
+
+
+class FlagSet:
+    """
+    A set of flags backed by an int.  Iteration and ``len`` only consider named bits (excluding placeholders), and ``in``
+    only considers labeled bits, but other bits are preserved by every operation except :meth:`.__invert__`, so
+    converting back to bytes does not lose any data.
+
+    :param labels: The :class:`FlagLabels` for the field that this set represents
+    :param flags: An int, another FlagSet, or flag name(s) to set
+    """
+
+    __slots__ = ('labels', 'value')
+
+    def __init__(self, labels: FlagLabels, flags: Flags = 0):
+        self.labels = labels
+        self.value = self._value(flags)
+
+    @classmethod
+    def from_bytes(cls, labels: FlagLabels, data: bytes) -> 'FlagSet':
+        if len(data) != labels.size:
+            raise ValueError(f'Invalid data for {labels} - expected {labels.size} bytes, but found {len(data)}')
+        return cls(labels, int.from_bytes(data, 'little'))
+
+    def to_bytes(self) -> bytes:
+        return self.value.to_bytes(self.labels.size, 'little')
+
+    def _value(self, flags: Flags) -> int:
+        if isinstance(flags, int):
+            if flags & ~self.labels.full_mask or flags < 0:
+                raise ValueError(f'Invalid flags={flags:#x} for {self.labels}')
+            return flags
+        elif isinstance(flags, FlagSet):
+            return flags.value
+        return self.labels.mask(flags)
+
+    def _new(self, value: int) -> 'FlagSet':
+        flag_set = self.__class__.__new__(self.__class__)
+        flag_set.labels = self.labels
+        flag_set.value = value
+        return flag_set
+
+    # region Container Methods
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[{len(self)}/{len(self.labels.bits)}, value={self.value:#x}]>'
+
+    def __contains__(self, name: str) -> bool:
+        try:
+            return bool(self.value >> self.labels.bits[name] & 1)
+        except KeyError:
+            return False
+
+    def __iter__(self) -> Iterator[str]:
+        names, value = self.labels.names, self.value & self.labels.named_mask
+        while value:
+            low = value & -value
+            yield names[low.bit_length() - 1]
+            value ^= low
+
+    def __len__(self) -> int:
+        return bin(self.value & self.labels.named_mask).count('1')  # int.bit_count requires Python 3.10
+
+    def __bool__(self) -> bool:
+        return bool(self.value & self.labels.named_mask)
+
+    def __eq__(self, other: Flags) -> bool:
+        try:
+            return self.value == self._value(other)
+        except (ValueError, TypeError):
+            return NotImplemented
+
+    __hash__ = None  # Mutable, so not hashable; use the int value (.value) as a key instead
+
+    # endregion
+
+    # region Set Algebra
+
+    def __or__(self, other: Flags) -> 'FlagSet':
+        return self._new(self.value | self._value(other))
+
+    def __and__(self, other: Flags) -> 'FlagSet':
+        return self._new(self.value & self._value(other))
+
+    def __sub__(self, other: Flags) -> 'FlagSet':
+        return self._new(self.value & ~self._value(other))
+
+    def __xor__(self, other: Flags) -> 'FlagSet':
+        return self._new(self.value ^ self._value(other))
+
+    def __invert__(self) -> 'FlagSet':
+        """:return: A FlagSet with every named flag that is not set in this one (unnamed bits are cleared)"""
+        return self._new(~self.value & self.labels.named_mask)
+
+    __ror__, __rand__, __rxor__ = __or__, __and__, __xor__
+
+    def __le__(self, other: Flags) -> bool:
+        return self.value & ~self._value(other) == 0
+
+    def __ge__(self, other: Flags) -> bool:
+        return self._value(other) & ~self.value == 0
+
+    issubset, issuperset = __le__, __ge__
+
+    def isdisjoint(self, other: Flags) -> bool:
+        return not self.value & self._value(other)
+
+    # endregion
+
+    # region Set / Clear
+
+    def add(self, *names: str):
+        self.value |= self.labels.mask(names)
+
+    def discard(self, *names: str):
+        self.value &= ~self.labels.mask(names)
+
+    def set_all(self):
+        """Set every named flag (unnamed bits are not modified)"""
+        self.value |= self.labels.named_mask
+
+    def clear(self):
+        """Clear every named flag (unnamed bits are not modified)"""
+        self.value &= ~self.labels.named_mask
+
+    # endregion
@@ -0,0 +1,307 @@
+"""
+Batch edits for many GAMEDATA files and save slots, defined by a JSON or YAML spec.
+
+Example spec (YAML)::
+
+    edits:
+      - paths: [~/test_saves/*/GAMEDATA]   # Paths / glob patterns; relative paths are relative to the spec file
+        slots: [1, 2, 3]                   # Save slots to modify (default: all)
+        items: {Lugworm: 10, Pumpkin Seed: 5}
+        garden: {hours: 24, fertilizer: Speed, water: 2, only_planted: true}
+        fields: {money: 100000}
+        update_save_time: true             # Whether each modified slot's save_time should be set to now (default)
+
+Every edit is validated before any file is loaded, and the new content for every file is built and staged in a temp
+file in the same directory before any original file is replaced.  If any file fails, all staged files are discarded
+and no files are modified.  If replacing an original file fails, the remaining staged files are discarded, and files
+that were already replaced are restored from their backups.  Files are processed in parallel, and each modified file is
+backed up once, regardless of how many edits apply to it.
+
+:author: Doug Skrypa
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, Future
+from contextlib import suppress
+from datetime import datetime
+from glob import glob
+from pathlib import Path
+from typing import Union, Optional, Any, NamedTuple
+
+from .constants import FERTILIZER, FERTILIZER_ALIASES
+from .constructs.layouts import struct_layout
+from .save_file import GameData, SaveFile, Inventory, FSYNC_MODES, _backup_file, _stage_bytes, _fsync_dir
+
+__all__ = ['load_spec', 'plan_edits', 'apply_edits', 'EditResult']
+log = logging.getLogger(__name__)
+
+SLOT_NUMS = range(1, 8)
+GROUP_KEYS = {'paths', 'slots', 'items', 'garden', 'fields', 'update_save_time'}
+GARDEN_KEYS = {'time', 'hours', 'fertilizer', 'water', 'plots', 'only_planted', 'only_unfertilized'}
+Plan = dict[Path, list[tuple[tuple[int, ...], dict[str, Any]]]]  # {path: [(slot nums, edit group), ...]}
+
+
+class EditResult(NamedTuple):
+    path: Path
+    slots: tuple[int, ...]
+    backup: Optional[Path]
+
+
+def load_spec(path: Union[str, Path]) -> dict[str, Any]:
+    """
+    :param path: Path to a JSON or YAML (``.yaml`` / ``.yml``) edit spec file
+    :return: The loaded spec, with a ``base_dir`` key for resolving relative paths
+    """
+    path = Path(path).expanduser().resolve()
+    if path.suffix.lower() in {'.yaml', '.yml'}:
+        import yaml
+
+        spec = yaml.safe_load(path.read_text('utf-8'))
+    else:
+        spec = json.loads(path.read_text('utf-8'))
+    if not isinstance(spec, dict):
+        raise ValueError(f'Invalid edit spec in {path.as_posix()} - expected a mapping with an "edits" list')
+    return spec | {'base_dir': spec.get('base_dir', path.parent)}
+
+
+# region Validation
+
+
+def plan_edits(spec: dict[str, Any]) -> Plan:
+    """
+    Validate the given spec, and group its edits by file.
+
+    :param spec: An edit spec, as returned by :func:`load_spec`
+    :return: Mapping of {path: [(slot nums, normalized edit group), ...]}, with edit groups in the order they were defined
+    :raises: :class:`ValueError` if any part of the spec is invalid
+    """
+    if not isinstance(groups := spec.get('edits'), list) or not groups:
+        raise ValueError('Invalid edit spec - "edits" must be a non-empty list')
+
+    base_dir = Path(spec.get('base_dir') or '.')
+    plan = {}
+    for i, group in enumerate(groups):
+        try:
+            paths, slots, group = _normalize_group(group, base_dir)
+        except ValueError as e:
+            raise ValueError(f'Invalid edit group #{i}: {e}') from None
+        for path in paths:
+            plan.setdefault(path, []).append((slots, group))
+
+    return plan
+
+
+def _normalize_group(group: dict[str, Any], base_dir: Path) -> tuple[list[Path], tuple[int, ...], dict[str, Any]]:
+    if not isinstance(group, dict):
+        raise ValueError(f'expected a mapping, but found {group!r}')
+    elif bad := set(group).difference(GROUP_KEYS):
+        raise ValueError(f'unexpected keys: {", ".join(sorted(bad))}')
+
+    paths = _resolve_paths(group.get('paths'), base_dir)
+    slots = tuple(group.get('slots') or SLOT_NUMS)
+    if bad := [s for s in slots if s not in SLOT_NUMS]:
+        raise ValueError(f'invalid slots={bad} - slots must be between 1 and 7')
+
+    items = group.get('items') or {}
+    Inventory.validate_quantities(items)
+
+    fields = group.get('fields') or {}
+    slot_fields = struct_layout('Savefile')
+    if bad := [key for key in fields if key not in slot_fields or key.startswith('_') or key == 'checksum']:
+        raise ValueError(f'invalid fields={bad}')
+    if isinstance(save_time := fields.get('save_time'), str):
+        fields = fields | {'save_time': datetime.fromisoformat(save_time)}
+
+    garden = _normalize_garden(group.get('garden') or {})
+    if not (items or fields or garden):
+        raise ValueError('no items, garden, or fields edits were specified')
+
+    edits = {'items': items, 'garden': garden, 'fields': fields, 'update_save_time': group.get('update_save_time', True)}
+    return paths, slots, edits
+
+
+def _resolve_paths(paths: Union[str, list[str], None], base_dir: Path) -> list[Path]:
+    if not paths:
+        raise ValueError('at least one path is required')
+    elif isinstance(paths, str):
+        paths = [paths]
+
+    resolved = []
+    for path in paths:
+        path = base_dir.joinpath(Path(path).expanduser())
+        if not (matches := sorted(Path(p) for p in glob(path.as_posix()) if os.path.isfile(p))):
+            raise ValueError(f'no files found matching path={path.as_posix()}')
+        resolved.extend(p.resolve() for p in matches)
+    return resolved
+
+
+def _normalize_garden(garden: dict[str, Any]) -> dict[str, Any]:
+    if bad := set(garden).difference(GARDEN_KEYS):
+        raise ValueError(f'unexpected garden keys: {", ".join(sorted(bad))}')
+
+    garden = dict(garden)
+    if (dt := garden.pop('time', None)) is not None:
+        if garden.get('hours'):
+            raise ValueError('garden time and hours are mutually exclusive')
+        garden['dt'] = datetime.fromisoformat(dt) if isinstance(dt, str) else dt
+    if (fertilizer := garden.get('fertilizer')) is not None:
+        if not isinstance(fertilizer, (str, int)) or isinstance(fertilizer, bool):
+            raise ValueError(f'invalid garden {fertilizer=} - expected a name or an index')
+        fertilizer = FERTILIZER_ALIASES.get(fertilizer, fertilizer)
+        if fertilizer not in FERTILIZER and fertilizer not in range(len(FERTILIZER)):
+            raise ValueError(f'invalid garden {fertilizer=}')
+        garden['fertilizer'] = fertilizer
+    if garden.get('water') not in (None, 1, 2):
+        raise ValueError(f'invalid garden water={garden["water"]!r} - must be 1 or 2')
+    if bad := [p for p in garden.get('plots') or () if p not in range(15)]:
+        raise ValueError(f'invalid garden plots={bad} - plots must be between 0 and 14')
+    return garden
+
+
+# endregion
+
+# region Apply Edits
+
+
+def apply_edits(
+    spec: dict[str, Any], workers: int = None, backup: bool = True, dry_run: bool = False, fsync: str = 'file'
+) -> list[EditResult]:
+    """
+    Apply all of the edits in the given spec.  Edits are validated, applied, and staged in parallel, and original files
+    are only replaced after every file was staged successfully.  If replacing any file fails, then the remaining staged
+    files are discarded, and files that were already replaced are restored from their backups.
+
+    :param spec: An edit spec, as returned by :func:`load_spec`
+    :param workers: Number of worker processes to use (default: cpu count; 1 to process files in this process)
+    :param backup: Whether a backup of each original file should be saved
+    :param dry_run: Validate and apply all edits, and build each file, but do not write anything
+    :param fsync: The fsync mode to use; see :meth:`GameData.save<.save_file.GameData.save>`
+    :return: List of results, one per file, in sorted path order
+    :raises: :class:`ValueError` if any file could not be staged or replaced; the message lists any modified files that
+      could not be restored (which is only possible when ``backup`` is False or restoring a backup failed)
+    """
+    if fsync not in FSYNC_MODES:
+        raise ValueError(f'Invalid {fsync=} - expected one of {FSYNC_MODES}')
+    plan = plan_edits(spec)
+    log.info(f'Applying edits to {len(plan)} file(s)')
+    staged = _stage_all(plan, workers, dry_run, fsync)
+    if dry_run:
+        return [EditResult(path, _slot_nums(plan[path]), None) for path in staged]
+
+    results = []
+    for path, tmp_path in staged.items():
+        bkp_path = None
+        try:
+            bkp_path = _backup_file(path) if backup else None
+            os.replace(tmp_path, path)
+        except BaseException as e:
+            _roll_back(staged, results, bkp_path)
+            if not isinstance(e, Exception):
+                raise
+            raise ValueError(f'Unable to replace {path.as_posix()} - {_roll_back_summary(results)}') from e
+        results.append(EditResult(path, _slot_nums(plan[path]), bkp_path))
+    if fsync == 'full':
+        for dir_path in {path.parent for path in staged}:
+            _fsync_dir(dir_path)
+    log.info(f'Saved {len(results)} file(s)')
+    return results
+
+
+def _roll_back(staged: dict[Path, Optional[Path]], results: list[EditResult], failed_bkp_path: Optional[Path]):
+    """
+    Discard every staged temp file that was not committed, and restore committed files from their backups.  Results
+    for files that could not be restored are kept in the given list; results for restored files are removed from it.
+    """
+    for tmp_path in filter(None, staged.values()):
+        with suppress(OSError):
+            tmp_path.unlink()  # Committed temp files were already renamed
+    if failed_bkp_path is not None:  # The original file was not replaced, so its new backup is not needed
+        with suppress(OSError):
+            failed_bkp_path.unlink()
+
+    for result in results[:]:
+        if result.backup is None:
+            log.error(f'Unable to restore {result.path.as_posix()} - it was modified and no backup was saved')
+            continue
+        try:
+            os.replace(result.backup, result.path)
+        except OSError as e:
+            log.error(f'Unable to restore {result.path.as_posix()} from {result.backup.as_posix()}: {e}')
+        else:
+            log.info(f'Restored {result.path.as_posix()} from {result.backup.as_posix()}')
+            results.remove(result)
+
+
+def _roll_back_summary(not_restored: list[EditResult]) -> str:
+    if not not_restored:
+        return 'all modified files were restored'
+    paths = ', '.join(result.path.as_posix() for result in not_restored)
+    return f'{len(not_restored)} file(s) were modified and could not be restored: {paths}'
+
+
+def _stage_all(plan: Plan, workers: Optional[int], dry_run: bool, fsync: str) -> dict[Path, Optional[Path]]:
+    paths = sorted(plan)
+    if (workers := workers or os.cpu_count() or 1) == 1:
+        futures = {path: _completed(_stage, path, plan[path], dry_run, fsync) for path in paths}
+    else:
+        with ProcessPoolExecutor(min(workers, len(paths))) as executor:
+            futures = {path: executor.submit(_stage, path, plan[path], dry_run, fsync) for path in paths}
+
+    staged, errors = {}, []
+    for path, future in futures.items():
+        if (exc := future.exception()) is not None:
+            errors.append((path, exc))
+        else:
+            staged[path] = future.result()
+
+    if errors:
+        for tmp_path in filter(None, staged.values()):
+            with suppress(OSError):
+                tmp_path.unlink()
+        for path, exc in errors:
+            log.error(f'Error editing {path.as_posix()}: {exc}')
+        path, exc = errors[0]
+        raise ValueError(f'Unable to edit {len(errors)} file(s) - no files were modified') from exc
+
+    return staged
+
+
+def _completed(func, *args) -> Future:
+    future = Future()
+    try:
+        future.set_result(func(*args))
+    except Exception as e:  # noqa
+        future.set_exception(e)
+    return future
+
+
+def _stage(
+    path: Path, groups: list[tuple[tuple[int, ...], dict[str, Any]]], dry_run: bool, fsync: str
+) -> Optional[Path]:
+    game_data = GameData.load(path)
+    for slot_nums, edits in groups:
+        for num in slot_nums:
+            _apply(game_data.slots[num - 1], edits)
+
+    data = game_data._construct.build(game_data._build())
+    return None if dry_run else _stage_bytes(path, data, fsync)
+
+
+def _apply(slot: SaveFile, edits: dict[str, Any]):
+    if items := edits['items']:
+        slot.inventory.update(items)
+    if garden := edits['garden']:
+        slot.garden.update(**garden)
+    for key, value in edits['fields'].items():
+        slot[key] = value
+    if edits['update_save_time']:
+        slot['save_time'] = datetime.now().replace(microsecond=0)
+
+
+def _slot_nums(groups: list[tuple[tuple[int, ...], dict[str, Any]]]) -> tuple[int, ...]:
+    return tuple(sorted({num for slot_nums, _ in groups for num in slot_nums}))
+
+
+# endregion
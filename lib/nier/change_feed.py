@@ -0,0 +1,289 @@
+"""
+Live field-level change feed for a series of GAMEDATA snapshots, such as each save that is detected by save_watcher.
+
+The last N parsed snapshots are kept in a :class:`SnapshotRing`.  When a snapshot is added, it is compared with the
+previous one using the same raw byte comparisons as :meth:`Constructed.diff<.save_file.Constructed.diff>`, so only the
+fields whose bytes changed are decoded.  Changes to dict / list values are reported per changed leaf value, and changes
+to bytes values (such as unknown fields) are reported per run of changed bytes.
+
+Changes may be written to stdout, to a JSONL file, or to any number of clients connected to a Unix socket.
+
+:author: Doug Skrypa
+"""
+
+import json
+import logging
+import socket
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from threading import Thread, Lock
+from typing import Union, Optional, Iterator, Collection, Any, NamedTuple
+
+from .save_file import GameData, Constructed
+from .utils import colored
+
+__all__ = ['FieldChange', 'SnapshotRing', 'diff_snapshots', 'StreamSink', 'JsonlSink', 'SocketSink', 'open_sink']
+log = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64  # Bytes values are compared in chunks of this size before finding the specific bytes that changed
+
+
+class FieldChange(NamedTuple):
+    time: datetime
+    slot: Optional[int]  # 1-7, or None for header fields
+    field: str  # The top-level field, followed by the keys of nested values, separated by ``.``
+    old: Any
+    new: Any
+    offset: Optional[int] = None  # The offset of the changed bytes in the field, for bytes values
+
+    def __str__(self) -> str:
+        location = 'header' if self.slot is None else f'slot {self.slot}'
+        field = self.field if self.offset is None else f'{self.field}+0x{self.offset:X}'
+        old, new = (v.hex(' ') if isinstance(v, bytes) else v for v in (self.old, self.new))
+        return f'[{self.time:%H:%M:%S}] {location} {colored(field, 14)}: {colored(old, 1)} -> {colored(new, 2)}'
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            'time': self.time.isoformat(),
+            'slot': self.slot,
+            'field': self.field,
+            'offset': self.offset,
+            'old': _jsonable(self.old),
+            'new': _jsonable(self.new),
+        }
+
+
+class SnapshotRing:
+    """
+    Keeps the last ``size`` parsed snapshots in memory.
+
+    :param size: The maximum number of snapshots to keep
+    :param keys: Specific top-level fields to include in changes (default: all)
+    :param unknowns: Only include unknown fields in changes
+    """
+
+    def __init__(self, size: int = 10, keys: Collection[str] = None, unknowns: bool = False):
+        if size < 1:
+            raise ValueError(f'Invalid {size=} - must be at least 1')
+        self.keys = set(keys) if keys else None
+        self.unknowns = unknowns
+        self._snapshots = deque(maxlen=size)  # [(time, GameData)]
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def __getitem__(self, index: int) -> tuple[datetime, GameData]:
+        """:return: The (time, GameData) for the given snapshot, where -1 is the most recent one"""
+        return self._snapshots[index]
+
+    def __iter__(self) -> Iterator[tuple[datetime, GameData]]:
+        return iter(self._snapshots)
+
+    def add(self, data: Union[bytes, GameData], time: datetime = None) -> list[FieldChange]:
+        """
+        :param data: The content of a GAMEDATA file, or a parsed :class:`GameData<.save_file.GameData>`
+        :param time: The time of the snapshot (default: now)
+        :return: The changes since the previous snapshot (empty for the first snapshot)
+        """
+        game_data = data if isinstance(data, GameData) else GameData(data)
+        time = time or datetime.now()
+        changes = self.changes(-1, game_data, time) if self._snapshots else []
+        self._snapshots.append((time, game_data))
+        return changes
+
+    def changes(
+        self, old: Union[int, GameData], new: Union[int, GameData] = -1, time: datetime = None
+    ) -> list[FieldChange]:
+        """
+        :param old: The index of a snapshot in this ring, or a :class:`GameData<.save_file.GameData>` object
+        :param new: The index of a snapshot in this ring, or a :class:`GameData<.save_file.GameData>` object
+        :param time: The time to use for changes (default: the time of the ``new`` snapshot if it is in this ring)
+        :return: The changes between the given snapshots
+        """
+        if isinstance(old, int):
+            old = self._snapshots[old][1]
+        if isinstance(new, int):
+            time, new = time or self._snapshots[new][0], self._snapshots[new][1]
+        return list(diff_snapshots(old, new, time or datetime.now(), self.keys, self.unknowns))
+
+    def history(self, field: str, slot: int = None) -> list[tuple[datetime, Any]]:
+        """
+        :param field: A top-level field
+        :param slot: The save slot (1-7) containing the field, or None for header fields
+        :return: The (time, value) of the field in each snapshot in this ring
+        """
+        return [(time, (gd.header if slot is None else gd.slots[slot - 1])[field]) for time, gd in self._snapshots]
+
+
+def diff_snapshots(
+    old: GameData, new: GameData, time: datetime, keys: Collection[str] = None, unknowns: bool = False
+) -> Iterator[FieldChange]:
+    """:return: Generator that yields the changes between the given snapshots"""
+    yield from _diff_obj(old.header, new.header, None, time, keys, unknowns)
+    for old_slot, new_slot in zip(old.slots, new.slots):
+        if old_slot._data != new_slot._data:
+            yield from _diff_obj(old_slot, new_slot, new_slot._num, time, keys, unknowns)
+
+
+def _diff_obj(
+    old: Constructed, new: Constructed, slot: Optional[int], time: datetime, keys: Collection[str], unknowns: bool
+) -> Iterator[FieldChange]:
+    for key, old_raw in old.raw_items(sparse=True):
+        if (keys and key not in keys) or (unknowns and not key.startswith('_unk')):
+            continue
+        if (new_raw := new.raw(key, sparse=True)) == old_raw:
+            continue
+        old_val, new_val = old[key], new[key]
+        if isinstance(old_val, bytes):
+            for offset, old_bytes, new_bytes in _byte_changes(bytes(old_raw), bytes(new_raw)):
+                yield FieldChange(time, slot, key, old_bytes, new_bytes, offset)
+        else:
+            for path, old_leaf, new_leaf in _nested_changes(old_val, new_val):
+                yield FieldChange(time, slot, '.'.join((key, *path)), old_leaf, new_leaf)
+
+
+def _nested_changes(old, new, path: tuple[str, ...] = ()) -> Iterator[tuple[tuple[str, ...], Any, Any]]:
+    """:return: Generator that yields (path, old value, new value) for each changed leaf value in a dict / list"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        items = ((key, old.get(key), new.get(key)) for key in {**old, **new})
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        items = zip(range(len(old)), old, new)
+    else:
+        yield path, old, new
+        return
+    for key, old_val, new_val in items:
+        if old_val != new_val:
+            yield from _nested_changes(old_val, new_val, (*path, str(key)))
+
+
+def _byte_changes(old: bytes, new: bytes) -> Iterator[tuple[int, bytes, bytes]]:
+    """:return: Generator that yields (offset, old bytes, new bytes) for each run of changed bytes"""
+    start = None
+    for chunk in range(0, len(old), CHUNK_SIZE):
+        end = chunk + CHUNK_SIZE
+        if old[chunk:end] == new[chunk:end]:
+            if start is not None:
+                yield start, old[start:chunk], new[start:chunk]
+                start = None
+            continue
+        for i in range(chunk, min(end, len(old))):
+            if old[i] != new[i]:
+                if start is None:
+                    start = i
+            elif start is not None:
+                yield start, old[start:i], new[start:i]
+                start = None
+    if start is not None:
+        yield start, old[start:], new[start:]
+
+
+def _jsonable(value):
+    if isinstance(value, bytes):
+        return value.hex()
+    elif isinstance(value, datetime):
+        return value.isoformat()
+    elif isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+# region Sinks
+
+
+class StreamSink:
+    """Prints a human-readable line for each change to stdout"""
+
+    def write(self, changes: list[FieldChange]):
+        for change in changes:
+            print(change, flush=True)
+
+    def close(self):
+        pass
+
+
+class JsonlSink:
+    """Appends one JSON object per change to the given file"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self._f = self.path.open('a', encoding='utf-8')
+
+    def write(self, changes: list[FieldChange]):
+        for change in changes:
+            self._f.write(json.dumps(change.to_json(), default=str) + '\n')
+        self._f.flush()
+
+    def close(self):
+        self._f.close()
+
+
+class SocketSink:
+    """
+    Listens on the given Unix socket path, and sends one JSON object per change (one per line) to every connected
+    client.  Clients that disconnect are dropped.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        if self.path.exists() or self.path.is_symlink():
+            self.path.unlink()
+        self._clients = []
+        self._lock = Lock()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(self.path.as_posix())
+        self._sock.listen()
+        Thread(target=self._accept, daemon=True).start()
+        log.info(f'Sending changes to clients connected to {self.path.as_posix()}')
+
+    def _accept(self):
+        while True:
+            try:
+                client, _ = self._sock.accept()
+            except OSError:  # The socket was closed
+                return
+            log.debug('Change feed client connected')
+            with self._lock:
+                self._clients.append(client)
+
+    def write(self, changes: list[FieldChange]):
+        data = ''.join(json.dumps(change.to_json(), default=str) + '\n' for change in changes).encode('utf-8')
+        with self._lock:
+            for client in self._clients[:]:
+                try:
+                    client.sendall(data)
+                except OSError:
+                    log.debug('Change feed client disconnected')
+                    self._clients.remove(client)
+                    client.close()
+
+    def close(self):
+        self._sock.close()
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+Sink = Union[StreamSink, JsonlSink, SocketSink]
+
+
+def open_sink(target: str) -> Sink:
+    """
+    :param target: ``-`` for stdout, ``unix:PATH`` for a Unix socket, or the path of a JSONL file
+    :return: The sink for the given target
+    """
+    if target == '-':
+        return StreamSink()
+    elif target.startswith('unix:'):
+        return SocketSink(target[5:])
+    return JsonlSink(target)
+
+
+# endregion
@@ -0,0 +1,377 @@
+"""
+Generates a standalone module with flat :mod:`struct`-based codecs for the Savefile and Header structs by walking the
+live construct trees, and verifies that the generated codecs are byte-identical to construct.
+
+The generated codecs decode to a flat dict of ``{dotted path: raw value}``, where each path mirrors the location of the
+corresponding value in the (pre-adapter) construct parse results.  Contiguous runs of fixed-width fields are handled by
+one precompiled :class:`struct.Struct` each, and bit flag fields are handled by generated bit unpackers / packers.
+
+:author: Doug Skrypa
+"""
+
+import logging
+from pathlib import Path
+from random import Random
+from types import ModuleType
+from typing import Iterator, Iterable, NamedTuple, Union, Optional, Any
+
+from construct import Construct, Struct, Sequence, Array, RawCopy, FormatField, Bytes, StringEncoded, BitsInteger
+from construct import Transformed, Subconstruct, Flag
+from construct.core import swapbitsinbytes, bytes2bits
+
+from . import constructs
+from .constructs.adapters import Checksum
+from .constructs.layouts import _source_hash
+
+__all__ = ['generate_source', 'load_codecs', 'verify_codecs', 'write_codecs', 'CODEC_STRUCTS', 'DEFAULT_PATH']
+log = logging.getLogger(__name__)
+
+CODEC_STRUCTS = {'header': 'Header', 'savefile': 'Savefile'}  # {codec name: construct name}
+DEFAULT_PATH = Path(__file__).resolve().parent.joinpath('flat_codecs.py')
+FlatValue = Union[int, float, bool, bytes]
+
+
+class Field(NamedTuple):
+    path: str
+    offset: int
+    fmt: str
+    kind: str  # One of: num, bytes, str, checksum
+    checksum: Optional[tuple[int, int]] = None  # (start, end) offsets of the range to sum
+
+
+class BitField(NamedTuple):
+    path: str
+    bit: int
+    kind: str  # One of: flag (bool), bit (int), bytes (one byte per bit, as parsed by Bytes in a bitwise struct)
+    width: int = 1
+
+
+class BitRegion(NamedTuple):
+    offset: int
+    size: int
+    fields: list[BitField]
+
+
+# region Construct Tree Walking
+
+
+def flatten(con: Construct, offset: int = 0, path: tuple[str, ...] = ()) -> Iterator[Union[Field, BitRegion]]:
+    """
+    :param con: A fixed-size construct
+    :param offset: The offset of the given construct
+    :param path: The path of the given construct in parse results
+    :return: Generator that yields a :class:`Field` for each byte-aligned leaf and a :class:`BitRegion` for each
+      bit-swapped BitStruct, in order
+    """
+    if isinstance(con, Struct):
+        for subcon in con.subcons:
+            yield from flatten(subcon, offset, path + (_path_part(subcon.name),))
+            offset += subcon.sizeof()
+    elif isinstance(con, Sequence):
+        for i, subcon in enumerate(con.subcons):
+            yield from flatten(subcon, offset, path + (str(i),))
+            offset += subcon.sizeof()
+    elif isinstance(con, Array):
+        size = con.subcon.sizeof()
+        for i in range(con.count):
+            yield from flatten(con.subcon, offset + i * size, path + (str(i),))
+    elif isinstance(con, RawCopy):
+        yield from flatten(con.subcon, offset, path + ('value',))
+    elif isinstance(con, Checksum):
+        start = offset - con._seek
+        yield Field('.'.join(path), offset, 'I', 'checksum', (start, start + con._read))
+    elif isinstance(con, FormatField):
+        yield Field('.'.join(path), offset, con.fmtstr[1:], 'num')
+    elif isinstance(con, Bytes):
+        yield Field('.'.join(path), offset, f'{con.length}s', 'bytes')
+    elif isinstance(con, StringEncoded):
+        yield Field('.'.join(path), offset, f'{con.sizeof()}s', 'str')
+    elif _is_swapped_bit_struct(con):
+        yield BitRegion(offset, con.sizeof(), list(_flatten_bits(con.subcon.subcon, 0, path)))
+    elif isinstance(con, Subconstruct) and not isinstance(con, Transformed):  # Renamed, adapters, validators, etc.
+        yield from flatten(con.subcon, offset, path)
+    else:
+        raise ValueError(f'Unsupported construct={con!r} at path={".".join(path)!r}')
+
+
+def _flatten_bits(con: Construct, bit: int, path: tuple[str, ...]) -> Iterator[BitField]:
+    if isinstance(con, Struct):
+        for subcon in con.subcons:
+            yield from _flatten_bits(subcon, bit, path + (_path_part(subcon.name),))
+            bit += subcon.sizeof()
+    elif isinstance(con, Array):
+        for i in range(con.count):
+            yield from _flatten_bits(con.subcon, bit + i, path + (str(i),))
+    elif con is Flag:
+        yield BitField('.'.join(path), bit, 'flag')
+    elif isinstance(con, BitsInteger) and con.length == 1:
+        yield BitField('.'.join(path), bit, 'bit')
+    elif isinstance(con, Bytes):
+        yield BitField('.'.join(path), bit, 'bytes', con.length)
+    elif isinstance(con, Subconstruct):
+        yield from _flatten_bits(con.subcon, bit, path)
+    else:
+        raise ValueError(f'Unsupported bitwise construct={con!r} at path={".".join(path)!r}')
+
+
+def _is_swapped_bit_struct(con: Construct) -> bool:
+    return (
+        isinstance(con, Transformed)
+        and con.decodefunc is swapbitsinbytes
+        and isinstance(con.subcon, Transformed)
+        and con.subcon.decodefunc is bytes2bits
+    )
+
+
+def _codecs_source_hash() -> str:
+    return _source_hash(exclude=('layouts.py', '__main__.py'))
+
+
+def _path_part(name: str) -> str:
+    if not name or '.' in name:
+        raise ValueError(f'Invalid field {name=} - names must be non-empty and may not contain "."')
+    return name
+
+
+def _runs(parts: Iterable[Union[Field, BitRegion]]) -> Iterator[Union[list[Field], BitRegion]]:
+    run = []
+    for part in parts:
+        if isinstance(part, BitRegion):
+            if run:
+                yield run
+                run = []
+            yield part
+        else:
+            run.append(part)
+    if run:
+        yield run
+
+
+# endregion
+
+# region Code Generation
+
+
+def generate_source() -> str:
+    """:return: The source code for the flat codecs module"""
+    lines = [
+        '"""',
+        'Flat struct-based codecs for NieR Replicant save file structs.',
+        '',
+        'Generated by :mod:`nier.codegen` from the structs in :mod:`nier.constructs` - do not edit this file manually.',
+        'Regenerate it via ``bin/flat_codecs.py generate`` after changing the structs.',
+        '',
+        'Values are decoded to a flat dict of ``{dotted path: raw value}`` without applying any construct adapters.',
+        'Stored checksums are not validated when decoding; they are re-calculated when encoding.',
+        '"""',
+        '',
+        'from operator import itemgetter',
+        'from struct import Struct',
+        '',
+        f'__all__ = {[f"{verb}_{name}" for name in CODEC_STRUCTS for verb in ("decode", "encode")]!r}',
+        '',
+        f'SOURCE_HASH = {_codecs_source_hash()!r}',
+    ]
+    for name, construct_name in CODEC_STRUCTS.items():
+        lines.append(f'{name.upper()}_SIZE = {getattr(constructs, construct_name).sizeof()}')
+
+    lines += [
+        '',
+        '',
+        'def _unpack_bits(n, width):',
+        '    return bytes(n >> i & 1 for i in range(width))',
+        '',
+        '',
+        'def _pack_bits(bits):',
+        '    return sum((b & 1) << i for i, b in enumerate(bits))',
+    ]
+
+    for name, construct_name in CODEC_STRUCTS.items():
+        lines.extend(('', ''))
+        lines.extend(_generate_codec(name, getattr(constructs, construct_name)))
+
+    return '\n'.join(lines) + '\n'
+
+
+def _generate_codec(name: str, con: Construct) -> list[str]:
+    prefix = f'_{name.upper()}'
+    consts, decode, encode, checksums = [], [], [], []
+    for i, run in enumerate(_runs(flatten(con))):
+        if isinstance(run, BitRegion):
+            start, end = run.offset, run.offset + run.size
+            decode.append(f"    n = int.from_bytes(data[offset + {start}:offset + {end}], 'little')")
+            for field in run.fields:
+                shifted = f'n >> {field.bit}' if field.bit else 'n'
+                if field.kind == 'bytes':
+                    value = f'_unpack_bits({shifted}, {field.width})'
+                else:
+                    value = f'{shifted} & 1 == 1' if field.kind == 'flag' else f'{shifted} & 1'
+                decode.append(f'    out[{field.path!r}] = {value}')
+            encode.append(f'    buf[{start}:{end}] = (')
+            for j, field in enumerate(run.fields):
+                bit = f' << {field.bit}' if field.bit else ''
+                value = f'_pack_bits(values[{field.path!r}])' if field.kind == 'bytes' else f'(values[{field.path!r}] & 1)'
+                encode.append(f'        {"| " if j else ""}{value}{bit}')
+            encode.append(f"    ).to_bytes({run.size}, 'little')")
+        else:
+            fmt = '<' + ''.join(field.fmt for field in run)
+            keys = tuple(field.path for field in run)
+            getter = f'itemgetter(*{keys!r})' if len(keys) > 1 else f'lambda values: (values[{keys[0]!r}],)'
+            consts.append(f'{prefix}_RUN_{i} = Struct({fmt!r})')
+            consts.append(f'{prefix}_KEYS_{i} = {keys!r}')
+            consts.append(f'{prefix}_GET_{i} = {getter}')
+            decode.append(f'    out.update(zip({prefix}_KEYS_{i}, {prefix}_RUN_{i}.unpack_from(data, offset + {run[0].offset})))')
+            encode.append(f'    {prefix}_RUN_{i}.pack_into(buf, {run[0].offset}, *{prefix}_GET_{i}(values))')
+            checksums.extend(field for field in run if field.kind == 'checksum')
+
+    for field in checksums:
+        start, end = field.checksum
+        encode.append(f"    buf[{field.offset}:{field.offset + 4}] = sum(buf[{start}:{end}]).to_bytes(4, 'little')")
+
+    return [
+        *consts,
+        '',
+        '',
+        f'def decode_{name}(data, offset=0):',
+        f'    """Decode the {con.sizeof():,d} byte {name} struct that starts at the given offset in data"""',
+        '    out = {}',
+        *decode,
+        '    return out',
+        '',
+        '',
+        f'def encode_{name}(values):',
+        f'    """Encode the given flat dict of {name} values, and re-calculate its checksum"""',
+        f'    buf = bytearray({name.upper()}_SIZE)',
+        *encode,
+        '    return bytes(buf)',
+    ]
+
+
+def write_codecs(path: Union[str, Path] = DEFAULT_PATH, verify: int = 10) -> Path:
+    """
+    :param path: The path to which the generated module should be written
+    :param verify: Number of synthetic GAMEDATA files to verify the generated codecs against before writing them
+    :return: The path that was written
+    """
+    source = generate_source()
+    if verify:
+        verify_codecs(load_codecs(source), verify)
+
+    path = Path(path).expanduser()
+    log.info(f'Writing {len(source.splitlines()):,d} lines to {path.as_posix()}')
+    path.write_text(source, 'utf-8', newline='\n')
+    return path
+
+
+def load_codecs(source: str = None) -> ModuleType:
+    """
+    :param source: The source code of a flat codecs module (default: the existing generated module)
+    :return: The flat codecs module
+    """
+    if source is None:
+        from . import flat_codecs
+
+        if flat_codecs.SOURCE_HASH != _codecs_source_hash():
+            log.warning('The generated flat codecs are out of date - the struct sources changed since they were generated')
+        return flat_codecs
+
+    module = ModuleType('nier.flat_codecs')
+    exec(compile(source, DEFAULT_PATH.as_posix(), 'exec'), module.__dict__)
+    return module
+
+
+# endregion
+
+# region Verification
+
+
+def verify_codecs(codecs: ModuleType, samples: Union[int, Iterable[bytes]] = 10, seed: Any = 0) -> dict[str, int]:
+    """
+    Verifies that the given flat codecs are byte-identical to construct.  For each Header / Savefile in each sample:
+
+    - Flat encoding the flat decoded values must reproduce construct's build output exactly
+    - Every decoded value that construct also parses as a plain int / float / bool / bytes value must be equal
+    - After randomizing the unknown bytes and bit flags, the flat encoded data (with its re-calculated checksum) must be
+      parsed by construct without errors, and construct must build identical data from it
+
+    :param codecs: The flat codecs module to verify
+    :param samples: A number of synthetic GAMEDATA files to generate, or the content of GAMEDATA files to use
+    :param seed: Seed for the random number generator used for synthetic data and mutations
+    :return: Mapping of {counter name: count}
+    """
+    from .save_file import GameData
+    from .synthetic import random_game_data
+
+    rng = Random(seed)
+    if isinstance(samples, int):
+        samples = (random_game_data(f'{seed}-{i}')._data for i in range(samples))
+
+    counts = {'structs': 0, 'values': 0, 'compared': 0}
+    for data in samples:
+        game_data = GameData(data)
+        for name, construct_name in CODEC_STRUCTS.items():
+            objs = game_data.slots if name == 'savefile' else (game_data.header,)
+            for obj in objs:
+                _verify_struct(codecs, name, getattr(constructs, construct_name), obj._data, rng, counts)
+
+    log.info('Verified {structs:,d} structs; compared {compared:,d} / {values:,d} decoded values'.format(**counts))
+    return counts
+
+
+def _verify_struct(codecs: ModuleType, name: str, con: Construct, data: bytes, rng: Random, counts: dict[str, int]):
+    decode, encode = getattr(codecs, f'decode_{name}'), getattr(codecs, f'encode_{name}')
+    parsed = con.parse(data)
+    expected = con.build(parsed)
+    decoded = decode(data)
+    if (encoded := encode(decoded)) != expected:
+        raise ValueError(f'Flat {name} encoding does not match construct @ offset={_first_diff(encoded, expected)}')
+
+    for path, value in decoded.items():
+        if (con_value := _parsed_value(parsed, path)) is not None:
+            if not _values_match(value, con_value):
+                raise ValueError(f'Flat {name} decoded {value=} != construct value={con_value!r} for {path=}')
+            counts['compared'] += 1
+    counts['values'] += len(decoded)
+
+    checksums = set()
+    for field in flatten(con):
+        if isinstance(field, BitRegion):
+            for bit_field in field.fields:
+                if bit_field.kind == 'bytes':
+                    decoded[bit_field.path] = bytes(rng.choices((0, 1), k=bit_field.width))
+                else:
+                    decoded[bit_field.path] = rng.random() < 0.5 if bit_field.kind == 'flag' else rng.randrange(2)
+        elif field.kind == 'bytes':
+            decoded[field.path] = rng.randbytes(int(field.fmt[:-1]))
+        elif field.kind == 'checksum':
+            checksums.add(field.path)
+
+    mutated = encode(decoded)
+    if (rebuilt := con.build(con.parse(mutated))) != mutated:
+        raise ValueError(f'Mutated flat {name} encoding does not match construct @ offset={_first_diff(mutated, rebuilt)}')
+    redecoded = decode(mutated)
+    if changed := [path for path, value in decoded.items() if path not in checksums and redecoded[path] != value]:
+        raise ValueError(f'Mutated flat {name} values were not preserved for paths: {", ".join(changed)}')
+    counts['structs'] += 1
+
+
+def _parsed_value(parsed, path: str) -> Optional[FlatValue]:
+    node = parsed
+    for part in path.split('.'):
+        try:
+            node = node[int(part)] if isinstance(node, list) else node[part]
+        except (KeyError, TypeError, IndexError, ValueError):
+            return None
+    # Skip values that were transformed by an adapter (enums, strings, datetimes, etc)
+    return node if isinstance(node, (int, float, bytes)) else None
+
+
+def _values_match(value: FlatValue, con_value: FlatValue) -> bool:
+    return value == con_value or (value != value and con_value != con_value)  # NaN != NaN
+
+
+def _first_diff(a: bytes, b: bytes) -> int:
+    return next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+
+
+# endregion
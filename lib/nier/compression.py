@@ -0,0 +1,193 @@
+"""
+Compression for GAMEDATA backups.
+
+Save files are mostly zeros, so backups compress extremely well.  Compressed files are identified by their magic bytes
+rather than by their names, so :func:`decompress` (which is used when loading any save file) transparently handles both
+compressed and uncompressed content.  Supported codecs are gzip and lzma, plus zstd if the ``zstandard`` package is
+installed.
+
+:author: Doug Skrypa
+"""
+
+import gzip
+import logging
+import lzma
+import os
+import shutil
+from contextlib import suppress
+from pathlib import Path
+from secrets import token_hex
+from time import perf_counter
+from typing import Union, Callable, BinaryIO, NamedTuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+__all__ = [
+    'Codec', 'CODECS', 'COMPRESSED_SUFFIXES', 'get_codec', 'pick_codec', 'decompress', 'write_compressed',
+    'copy_compressed', 'strip_compressed_suffix', 'is_compressed', 'MAGIC_SIZE',
+]
+log = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+MIN_THROUGHPUT = 20 * 1024 * 1024  # bytes/s; slower codecs are not considered by pick_codec
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+class Codec(NamedTuple):
+    name: str
+    suffix: str
+    magic: bytes
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+    open: Callable[[BinaryIO], BinaryIO]  # Wraps a binary file opened for writing
+
+
+def _zstd_codec() -> Codec:
+    return Codec(
+        'zstd',
+        '.zst',
+        ZSTD_MAGIC,
+        zstandard.ZstdCompressor(level=3).compress,
+        lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data),
+        lambda f: zstandard.ZstdCompressor(level=3).stream_writer(f, closefd=False),
+    )
+
+
+CODECS = {
+    'gzip': Codec(
+        'gzip',
+        '.gz',
+        b'\x1f\x8b',
+        lambda data: gzip.compress(data, 6, mtime=0),
+        gzip.decompress,
+        lambda f: gzip.GzipFile(fileobj=f, mode='wb', compresslevel=6, mtime=0),
+    ),
+    'lzma': Codec(
+        'lzma',
+        '.xz',
+        b'\xfd7zXZ\x00',
+        lambda data: lzma.compress(data, preset=0),
+        lzma.decompress,
+        lambda f: lzma.LZMAFile(f, 'wb', preset=0),
+    ),
+}
+if zstandard is not None:
+    CODECS['zstd'] = _zstd_codec()
+
+COMPRESSED_SUFFIXES = ('.gz', '.xz', '.zst')  # All suffixes, even if the codec is not available, for name matching
+_MAGICS = (*(codec.magic for codec in CODECS.values()), ZSTD_MAGIC)
+MAGIC_SIZE = max(map(len, _MAGICS))  # The number of leading bytes that must be read for is_compressed
+
+
+def strip_compressed_suffix(name: str) -> str:
+    """:return: The given file name without its compression suffix, if it has one"""
+    for suffix in COMPRESSED_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def get_codec(name: str, sample: bytes = None) -> Codec:
+    """
+    :param name: A codec name, or ``auto`` to use :func:`pick_codec`
+    :param sample: Sample data to use for ``auto`` (default: an empty save file)
+    :return: The :class:`Codec` with the given name
+    """
+    if name == 'auto':
+        return pick_codec(sample)
+    try:
+        return CODECS[name]
+    except KeyError:
+        hint = ' (the zstandard package is not installed)' if name == 'zstd' else ''
+        raise ValueError(f'Invalid codec={name!r}{hint} - expected one of: auto, {", ".join(CODECS)}') from None
+
+
+def pick_codec(sample: bytes = None) -> Codec:
+    """
+    Measures the speed and output size of each available codec for the given sample, and returns the one with the
+    smallest output among those whose throughput is at least :data:`MIN_THROUGHPUT`.  The result is cached after the
+    first call.
+
+    :param sample: Sample data to compress (default: an empty save file)
+    :return: The :class:`Codec` that should be used
+    """
+    try:
+        return pick_codec._cached
+    except AttributeError:
+        pass
+    if sample is None:
+        from .save_file import GameData
+
+        sample = GameData.empty()._data
+
+    results = []
+    for codec in CODECS.values():
+        start = perf_counter()
+        size = len(codec.compress(sample))
+        elapsed = perf_counter() - start
+        throughput = len(sample) / elapsed if elapsed else float('inf')
+        log.debug(f'{codec.name}: {len(sample):,d} => {size:,d} bytes @ {throughput / 1048576:,.1f} MB/s')
+        results.append((throughput >= MIN_THROUGHPUT, -size, throughput, codec))
+
+    pick_codec._cached = codec = max(results, key=lambda r: r[:3])[-1]
+    log.debug(f'Picked codec={codec.name}')
+    return codec
+
+
+def is_compressed(data: bytes) -> bool:
+    """:return: True if the given data (or its first :data:`MAGIC_SIZE` bytes) starts with a known codec's magic bytes"""
+    return data.startswith(_MAGICS)
+
+
+def decompress(data: bytes) -> bytes:
+    """:return: The decompressed content, if the given data is compressed with a supported codec, otherwise the data"""
+    for codec in CODECS.values():
+        if data.startswith(codec.magic):
+            return codec.decompress(data)
+    if data.startswith(ZSTD_MAGIC):
+        raise ValueError('Unable to decompress zstd data - the zstandard package is not installed')
+    return data
+
+
+def write_compressed(path: Union[str, Path], data: bytes, codec: Union[str, Codec], fsync: str = 'file') -> Path:
+    """
+    Compress the given data while writing it to a temp file, which then replaces the given path.
+
+    :param path: The output path.  The codec's suffix is appended if the path does not already end with it.
+    :param data: The data to compress
+    :param codec: A :class:`Codec` or codec name
+    :param fsync: The fsync mode; see :meth:`GameData.save<.save_file.GameData.save>`
+    :return: The path that was written
+    """
+    if isinstance(codec, str):
+        codec = get_codec(codec, data)
+    path = Path(path).expanduser()
+    if path.suffix != codec.suffix:
+        path = path.with_name(path.name + codec.suffix)
+
+    tmp_path = path.with_name(f'.{path.name}.{token_hex(4)}.tmp')
+    view = memoryview(data)
+    try:
+        with tmp_path.open('xb') as f:
+            with codec.open(f) as cf:
+                for offset in range(0, len(view), CHUNK_SIZE):
+                    cf.write(view[offset:offset + CHUNK_SIZE])
+            if fsync != 'none':
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            tmp_path.unlink()
+        raise
+    return path
+
+
+def copy_compressed(src: Path, dst: Path, codec: Union[str, Codec]) -> Path:
+    """Compress the given file to the given destination, which gets the codec's suffix; see :func:`write_compressed`"""
+    dst = write_compressed(dst, src.read_bytes(), codec, 'none')
+    shutil.copystat(src, dst)
+    return dst
@@ -11,4 +11,15 @@ equipped words, fishing records, item new/viewed states, and more.
 :author: Doug Skrypa
 """
 
-from .game_data import Savefile, Gamedata, Plot, Header
+from importlib import import_module
+
+__all__ = ['Savefile', 'Gamedata', 'Plot', 'Header']
+
+
+def __getattr__(name: str):
+    # The construct library is only imported and the structs are only built when they are first needed, since that is
+    # slow relative to the run time of commands that do not need to parse anything.
+    if name in __all__:
+        globals()[name] = value = getattr(import_module('.game_data', __name__), name)
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -13,6 +13,7 @@ from construct import Struct, Adapter, BitStruct, Flag, BitsSwapped, Subconstruc
 from construct import Int8ul, Int32ul, Int16ul
 
 from ..constants import SWORDS_1H, SWORDS_2H, SPEARS
+from ..profiling import count
 
 log = logging.getLogger(__name__)
 __all__ = ['DateTime', 'Checksum', 'Weapon', 'Quests']
@@ -46,6 +47,7 @@ class Checksum(Subconstruct):  # noqa
         self._read = read  # Number of bytes from the backwards seek position to read / include in the sum
 
     def _get_checksum(self, stream: BytesIO):
+        count('checksums')
         pos = stream.tell()
         stream.seek(pos - self._seek)
         checksum = sum(stream.read(self._read))
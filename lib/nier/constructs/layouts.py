@@ -0,0 +1,113 @@
+"""
+Field layouts (offsets and sizes) and checksum ranges derived from the structs in this package.  They are cached on
+disk, keyed by a hash of the source of ``constants.py`` and this package, so they can be used without importing the
+construct library or building any structs.
+
+:author: Doug Skrypa
+"""
+
+import logging
+import os
+import pickle
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Collection
+
+__all__ = ['struct_layout', 'struct_size', 'struct_checksum', 'CACHED_STRUCTS']
+log = logging.getLogger(__name__)
+
+CACHED_STRUCTS = (
+    'Gamedata', 'Header', 'Savefile', 'Plot',
+    'Recovery', 'Cultivation', 'Fishing', 'RawMaterials', 'KeyItems', 'Documents', 'Maps', 'Weapons',
+)
+
+
+def struct_layout(name: str) -> dict[str, tuple[int, int]]:
+    """
+    :param name: The name of a struct in :data:`CACHED_STRUCTS`
+    :return: Mapping of {field name: (offset, size)} for each top-level field in the given struct, in order
+    """
+    return _load_layouts()[0][name]
+
+
+def struct_size(name: str) -> int:
+    """
+    :param name: The name of a struct in :data:`CACHED_STRUCTS`
+    :return: The total size of the given struct in bytes
+    """
+    offset, size = next(reversed(struct_layout(name).values()))
+    return offset + size
+
+
+def struct_checksum(name: str) -> tuple[int, int]:
+    """
+    :param name: The name of a struct in :data:`CACHED_STRUCTS` that contains a ``checksum`` field
+    :return: Tuple of (seek, read) from the struct's :class:`Checksum<.adapters.Checksum>` field, i.e., the number of
+      bytes before the checksum where the summed range starts, and the number of bytes in that range
+    """
+    try:
+        return _load_layouts()[1][name]
+    except KeyError:
+        raise ValueError(f'Invalid struct={name!r} - it does not contain a checksum field') from None
+
+
+Layouts = tuple[dict[str, dict[str, tuple[int, int]]], dict[str, tuple[int, int]]]  # (layouts, checksums)
+
+
+def _load_layouts() -> Layouts:
+    try:
+        return _load_layouts._cached
+    except AttributeError:
+        pass
+
+    path = _cache_dir().joinpath(f'layouts_{_source_hash()}.pickle')
+    try:
+        layouts = pickle.loads(path.read_bytes())
+    except Exception as e:  # Missing, truncated, or corrupt files may raise almost anything while unpickling
+        log.debug(f'Building struct layouts - cache file does not exist or is invalid: {path.as_posix()} ({e})')
+        layouts = _build_layouts()
+        _save_layouts(path, layouts)
+
+    _load_layouts._cached = layouts
+    return layouts
+
+
+def _build_layouts() -> Layouts:
+    from . import game_data
+    from .adapters import Checksum
+
+    layouts, checksums = {}, {}
+    for name in CACHED_STRUCTS:
+        layouts[name] = layout = {}
+        offset = 0
+        for subcon in getattr(game_data, name).subcons:
+            size = subcon.sizeof()
+            layout[subcon.name] = (offset, size)
+            offset += size
+            if isinstance(subcon.subcon, Checksum):
+                checksums[name] = (subcon.subcon._seek, subcon.subcon._read)
+    return layouts, checksums
+
+
+def _save_layouts(path: Path, layouts: Layouts):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile('wb', dir=path.parent, prefix=path.name, delete=False) as f:
+            f.write(pickle.dumps(layouts, pickle.HIGHEST_PROTOCOL))
+        os.replace(f.name, path)
+    except OSError as e:
+        log.debug(f'Unable to save struct layout cache to {path.as_posix()}: {e}')
+
+
+def _source_hash(exclude: Collection[str] = ()) -> str:
+    pkg_dir = Path(__file__).resolve().parent
+    source_hash = sha256()
+    for path in (pkg_dir.parent.joinpath('constants.py'), *sorted(pkg_dir.glob('*.py'))):
+        if path.name not in exclude:
+            source_hash.update(path.read_bytes())
+    return source_hash.hexdigest()[:16]
+
+
+def _cache_dir() -> Path:
+    return Path(os.environ.get('XDG_CACHE_HOME') or '~/.cache').expanduser().joinpath('nier_replicant')
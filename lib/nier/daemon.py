@@ -0,0 +1,372 @@
+"""
+Long-running daemon that keeps parsed :class:`GameData<.save_file.GameData>` objects in memory, and serves JSON-RPC 2.0
+requests over a Unix socket.
+
+Requests and responses are newline-delimited JSON objects.  Each connection handles one request, and is closed after
+the response is sent (or if the request is not received within :data:`REQUEST_TIMEOUT` seconds), so a stuck or idle
+client cannot block other requests.
+Cached files are re-validated on every access by comparing their size / mtime / inode with the values from when they
+were loaded, so a stale object is never served.  If watchdog is installed, cached files are also watched, and entries
+are evicted as soon as their files are modified, so that the memory used by stale entries is released promptly.
+
+Requests are handled sequentially, so handlers may safely modify global state, such as redirecting stdout.
+
+:author: Doug Skrypa
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from typing import Union, Optional, Callable, Any, NamedTuple
+
+from .save_file import GameData
+
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+__all__ = ['SaveCache', 'Daemon', 'DaemonError', 'call', 'is_running', 'default_socket_path']
+log = logging.getLogger(__name__)
+
+Handler = Callable[..., Any]
+REQUEST_TIMEOUT = 5  # Seconds to wait for a client to send its request after connecting
+
+
+class DaemonError(Exception):
+    """Raised by :func:`call` when the daemon returns an error response"""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(code, message, data)
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def __str__(self) -> str:
+        return f'[{self.code}] {self.message}'
+
+
+# region Cache
+
+
+class _StatSig(NamedTuple):
+    mtime_ns: int
+    size: int
+    ino: int
+
+    @classmethod
+    def for_path(cls, path: Path) -> '_StatSig':
+        stat = path.stat()
+        return cls(stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class _Entry(NamedTuple):
+    sig: _StatSig
+    game_data: GameData
+
+
+class SaveCache:
+    """
+    LRU cache of parsed :class:`GameData<.save_file.GameData>` objects, keyed by resolved path.
+
+    Objects returned by :meth:`.get` are shared between callers, so they must not be modified.  Use :meth:`.load` to
+    obtain an object that may be modified and saved.
+
+    :param max_size: The maximum number of files to keep in memory
+    :param watch: Whether watchdog (if installed) should be used to evict entries when their files are modified
+    """
+
+    def __init__(self, max_size: int = 32, watch: bool = True):
+        if max_size < 1:
+            raise ValueError(f'Invalid {max_size=} - must be at least 1')
+        self.max_size = max_size
+        self.hits = self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._watched = {}  # {dir: watch}
+        self._observer = None
+        if watch and Observer is not None:
+            self._observer = Observer()
+            self._observer.start()
+        elif watch:
+            log.debug('watchdog is not installed - cached files will only be checked when they are accessed')
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[{len(self)}/{self.max_size}, hits={self.hits}, misses={self.misses}]>'
+
+    def get(self, path: Union[str, Path]) -> GameData:
+        """:return: The cached :class:`GameData` for the given path, which is loaded if it is not cached or is stale"""
+        path = Path(path).expanduser().resolve()
+        sig = _StatSig.for_path(path)
+        with self._lock:
+            if (entry := self._entries.get(path)) and entry.sig == sig:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry.game_data
+
+        self.misses += 1
+        game_data = GameData.load(path)
+        if _StatSig.for_path(path) != sig:  # It was modified while being read; don't cache a possibly torn read
+            return game_data
+
+        with self._lock:
+            self._entries[path] = _Entry(sig, game_data)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                log.debug(f'Evicted least recently used path={evicted.as_posix()}')
+        self._watch(path.parent)
+        return game_data
+
+    @staticmethod
+    def load(path: Union[str, Path]) -> GameData:
+        """:return: A new :class:`GameData` for the given path that is not shared with any other caller"""
+        return GameData.load(Path(path).expanduser().resolve())
+
+    def invalidate(self, path: Union[str, Path] = None) -> int:
+        """
+        :param path: The path to evict from the cache (default: all paths)
+        :return: The number of entries that were evicted
+        """
+        with self._lock:
+            if path is None:
+                evicted = len(self._entries)
+                self._entries.clear()
+                return evicted
+            return int(self._entries.pop(Path(path).expanduser().resolve(), None) is not None)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            paths = [path.as_posix() for path in self._entries]
+        return {
+            'size': len(paths),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'watching': self._observer is not None,
+            'paths': paths,
+        }
+
+    def close(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def _watch(self, dir_path: Path):
+        if self._observer is None or dir_path in self._watched:
+            return
+        try:
+            self._watched[dir_path] = self._observer.schedule(self, dir_path.as_posix())
+        except OSError as e:
+            log.debug(f'Unable to watch {dir_path.as_posix()}: {e}')
+            self._watched[dir_path] = None
+
+    def dispatch(self, event):
+        """Called by the watchdog observer for file system events in directories that contain cached files"""
+        if event.is_directory:
+            return
+        for attr in ('src_path', 'dest_path'):
+            if (path := getattr(event, attr, None)) and self.invalidate(path):
+                log.debug(f'Evicted path={path} due to {event.event_type} event')
+
+
+# endregion
+
+# region Server
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: '_Server'
+    timeout = REQUEST_TIMEOUT
+
+    def handle(self):
+        try:
+            line = self.rfile.readline()
+        except OSError as e:  # Including timeouts
+            log.debug(f'Closing connection without a request: {e}')
+            return
+        if line.strip() and (response := self.server.daemon.handle(line)) is not None:
+            try:
+                self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+                self.wfile.flush()
+            except OSError as e:
+                log.debug(f'Unable to send response: {e}')
+
+
+class _Server(socketserver.UnixStreamServer):
+    def __init__(self, path: str, daemon: 'Daemon'):
+        self.daemon = daemon
+        super().__init__(path, _RequestHandler)
+
+
+class Daemon:
+    """
+    JSON-RPC 2.0 server for save file requests.
+
+    Built-in methods: ``ping``, ``stats``, ``invalidate`` (optional param: ``path``), and ``shutdown``.  Additional
+    methods may be registered via :meth:`.register`.  Handlers are called with the request's params as keyword
+    arguments (or positional arguments, if params is a list), and their return values must be JSON-serializable.
+
+    :param socket_path: The path of the Unix socket to listen on (default: :func:`default_socket_path`)
+    :param cache: The :class:`SaveCache` to use (default: a new cache with default settings)
+    """
+
+    def __init__(self, socket_path: Union[str, Path] = None, cache: SaveCache = None):
+        self.socket_path = Path(socket_path).expanduser() if socket_path else default_socket_path()
+        self.cache = cache or SaveCache()
+        self.started = None
+        self._stop = False
+        self._methods = {
+            'ping': lambda: 'pong',
+            'stats': self.stats,
+            'invalidate': self.cache.invalidate,
+            'shutdown': self.shutdown,
+        }
+
+    def register(self, name: str, handler: Handler):
+        self._methods[name] = handler
+
+    def stats(self) -> dict[str, Any]:
+        return {'pid': os.getpid(), 'uptime': monotonic() - self.started, 'cache': self.cache.stats()}
+
+    def shutdown(self) -> bool:
+        self._stop = True
+        return True
+
+    def serve(self):
+        """Listen for requests until the ``shutdown`` method is called or a KeyboardInterrupt is received"""
+        if is_running(self.socket_path):
+            raise RuntimeError(f'The daemon is already running with socket_path={self.socket_path.as_posix()}')
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists() or self.socket_path.is_symlink():
+            log.debug(f'Removing stale socket: {self.socket_path.as_posix()}')
+            self.socket_path.unlink()
+
+        orig_umask = os.umask(0o177)  # The socket is created with 0o600 permissions, so other users can't connect
+        try:
+            server = _Server(self.socket_path.as_posix(), self)
+        finally:
+            os.umask(orig_umask)
+        server.timeout = 0.5
+        try:
+            self.started = monotonic()
+            log.info(f'Listening on {self.socket_path.as_posix()} (pid={os.getpid()})')
+            while not self._stop:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.cache.close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+            log.info('Daemon stopped')
+
+    def handle(self, line: bytes) -> Optional[dict[str, Any]]:
+        """
+        :param line: A serialized JSON-RPC request
+        :return: The response, or None if the request was a notification
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return _error(None, -32700, f'Parse error: {e}')
+        if not isinstance(request, dict) or not isinstance(method := request.get('method'), str):
+            return _error(request.get('id') if isinstance(request, dict) else None, -32600, 'Invalid Request')
+
+        req_id = request.get('id')
+        try:
+            handler = self._methods[method]
+        except KeyError:
+            return _error(req_id, -32601, f'Method not found: {method}')
+
+        params = request.get('params') or {}
+        start = monotonic()
+        try:
+            result = handler(*params) if isinstance(params, list) else handler(**params)
+        except TypeError as e:
+            log.debug(f'Invalid params for {method=}: {e}')
+            response = _error(req_id, -32602, f'Invalid params: {e}')
+        except (Exception, SystemExit) as e:  # A handler calling sys.exit should not stop the daemon
+            log.debug(f'Error handling {method=}:', exc_info=True)
+            response = _error(req_id, -32000, f'{type(e).__name__}: {e}')
+        else:
+            response = {'jsonrpc': '2.0', 'result': result, 'id': req_id}
+        log.debug(f'Handled {method=} in {(monotonic() - start) * 1000:,.3f} ms')
+        return None if 'id' not in request else response
+
+
+def _error(req_id, code: int, message: str) -> dict[str, Any]:
+    return {'jsonrpc': '2.0', 'error': {'code': code, 'message': message}, 'id': req_id}
+
+
+# endregion
+
+# region Client
+
+
+def call(
+    method: str,
+    params: Union[dict[str, Any], list, None] = None,
+    socket_path: Union[str, Path] = None,
+    timeout: float = None,
+) -> Any:
+    """
+    Send a request to the daemon and wait for the response.
+
+    :param method: The name of the method to call
+    :param params: The params for the method
+    :param socket_path: The path of the daemon's socket (default: :func:`default_socket_path`)
+    :param timeout: Socket timeout in seconds (default: no timeout)
+    :return: The result returned by the daemon
+    """
+    socket_path = Path(socket_path).expanduser() if socket_path else default_socket_path()
+    request = {'jsonrpc': '2.0', 'method': method, 'params': params or {}, 'id': 1}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path.as_posix())
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError(f'The daemon closed the connection without responding to {method=}')
+    response = json.loads(line)
+    if error := response.get('error'):
+        raise DaemonError(error.get('code'), error.get('message'), error.get('data'))
+    return response['result']
+
+
+def is_running(socket_path: Union[str, Path] = None) -> bool:
+    """:return: True if a daemon is listening on the given socket, False otherwise"""
+    socket_path = Path(socket_path).expanduser() if socket_path else default_socket_path()
+    if not hasattr(socket, 'AF_UNIX') or not socket_path.exists():
+        return False
+    try:
+        return call('ping', socket_path=socket_path, timeout=1) == 'pong'
+    except (OSError, ValueError, DaemonError):
+        return False
+
+
+def default_socket_path() -> Path:
+    """:return: A per-user socket path in ``$XDG_RUNTIME_DIR`` if it is set, otherwise in the cache dir"""
+    if runtime_dir := os.environ.get('XDG_RUNTIME_DIR'):
+        return Path(runtime_dir).joinpath('nier_replicant', 'daemon.sock')
+
+    from .constructs.layouts import _cache_dir
+
+    return _cache_dir().joinpath('daemon.sock')
+
+
+# endregion
@@ -6,7 +6,6 @@ Object and binary data diff utilities
 
 import math
 from collections import deque
-from difflib import SequenceMatcher, unified_diff
 
 from .utils import colored, to_hex_and_str, pseudo_json, pseudo_json_rows
 
@@ -14,6 +13,8 @@ DIFF_TAG_OUTPUT_MAP = {'equal': (' ', None), 'delete': ('-', 1), 'insert': ('+',
 
 
 def pseudo_json_diff(a, b, lines: bool, line_term: str = ''):
+    from difflib import unified_diff
+
     func = pseudo_json_rows if lines else pseudo_json
     a, b = func(a).splitlines(), func(b).splitlines()
     for i, line in enumerate(unified_diff(a, b, n=2, lineterm=colored(f' {line_term}', 7))):
@@ -39,6 +40,8 @@ def unified_byte_diff(
     line_diff: bool = False,
     **kwargs
 ):
+    from difflib import SequenceMatcher
+
     print_func = _print_line_diff if line_diff else _print_grouped_diff
     offset_fmt = '{{}} 0x{{:0{}X}}:'.format(len(hex(max(len(a), len(b)))) - 2).format
     av, bv = memoryview(a), memoryview(b)
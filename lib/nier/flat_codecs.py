@@ -0,0 +1,2456 @@
+"""
+Flat struct-based codecs for NieR Replicant save file structs.
+
+Generated by :mod:`nier.codegen` from the structs in :mod:`nier.constructs` - do not edit this file manually.
+Regenerate it via ``bin/flat_codecs.py generate`` after changing the structs.
+
+Values are decoded to a flat dict of ``{dotted path: raw value}`` without applying any construct adapters.
+Stored checksums are not validated when decoding; they are re-calculated when encoding.
+"""
+
+from operator import itemgetter
+from struct import Struct
+
+__all__ = ['decode_header', 'encode_header', 'decode_savefile', 'encode_savefile']
+
+SOURCE_HASH = 'a08ec1850b0769f6'
+HEADER_SIZE = 33120
+SAVEFILE_SIZE = 37472
+
+
+def _unpack_bits(n, width):
+    return bytes(n >> i & 1 for i in range(width))
+
+
+def _pack_bits(bits):
+    return sum((b & 1) << i for i, b in enumerate(bits))
+
+
+_HEADER_RUN_0 = Struct('<4s')
+_HEADER_KEYS_0 = ('_unk1',)
+_HEADER_GET_0 = lambda values: (values['_unk1'],)
+_HEADER_RUN_2 = Struct('<32s16s24s28s24s28s84s48s128s4s32684sI8s')
+_HEADER_KEYS_2 = ('d_name', '_unk3', '_unk4', '_unk5a', '_unk5b', '_unk5c', '_unk5d', '_unk5e', '_unk5f', '_unk5g', '_unk6', 'checksum', '_end')
+_HEADER_GET_2 = itemgetter(*('d_name', '_unk3', '_unk4', '_unk5a', '_unk5b', '_unk5c', '_unk5d', '_unk5e', '_unk5f', '_unk5g', '_unk6', 'checksum', '_end'))
+
+
+def decode_header(data, offset=0):
+    """Decode the 33,120 byte header struct that starts at the given offset in data"""
+    out = {}
+    out.update(zip(_HEADER_KEYS_0, _HEADER_RUN_0.unpack_from(data, offset + 0)))
+    n = int.from_bytes(data[offset + 4:offset + 8], 'little')
+    out['endings.A'] = n & 1 == 1
+    out['endings.B'] = n >> 1 & 1 == 1
+    out['endings.C'] = n >> 2 & 1 == 1
+    out['endings.D'] = n >> 3 & 1 == 1
+    out['endings.E'] = n >> 4 & 1 == 1
+    out['endings._unk_5'] = n >> 5 & 1 == 1
+    out['endings._unk_6'] = n >> 6 & 1 == 1
+    out['endings._unk_7'] = n >> 7 & 1 == 1
+    out['endings._unk_8'] = n >> 8 & 1 == 1
+    out['endings._unk_9'] = n >> 9 & 1 == 1
+    out['endings._unk_10'] = n >> 10 & 1 == 1
+    out['endings._unk_11'] = n >> 11 & 1 == 1
+    out['endings._unk_12'] = n >> 12 & 1 == 1
+    out['endings._unk_13'] = n >> 13 & 1 == 1
+    out['endings._unk_14'] = n >> 14 & 1 == 1
+    out['endings._unk_15'] = n >> 15 & 1 == 1
+    out['endings._unk_16'] = n >> 16 & 1 == 1
+    out['endings._unk_17'] = n >> 17 & 1 == 1
+    out['endings._unk_18'] = n >> 18 & 1 == 1
+    out['endings._unk_19'] = n >> 19 & 1 == 1
+    out['endings._unk_20'] = n >> 20 & 1 == 1
+    out['endings._unk_21'] = n >> 21 & 1 == 1
+    out['endings._unk_22'] = n >> 22 & 1 == 1
+    out['endings._unk_23'] = n >> 23 & 1 == 1
+    out['endings._unk_24'] = n >> 24 & 1 == 1
+    out['endings._unk_25'] = n >> 25 & 1 == 1
+    out['endings._unk_26'] = n >> 26 & 1 == 1
+    out['endings._unk_27'] = n >> 27 & 1 == 1
+    out['endings._unk_28'] = n >> 28 & 1 == 1
+    out['endings._unk_29'] = n >> 29 & 1 == 1
+    out['endings._unk_30'] = n >> 30 & 1 == 1
+    out['endings._unk_31'] = n >> 31 & 1 == 1
+    out.update(zip(_HEADER_KEYS_2, _HEADER_RUN_2.unpack_from(data, offset + 8)))
+    return out
+
+
+def encode_header(values):
+    """Encode the given flat dict of header values, and re-calculate its checksum"""
+    buf = bytearray(HEADER_SIZE)
+    _HEADER_RUN_0.pack_into(buf, 0, *_HEADER_GET_0(values))
+    buf[4:8] = (
+        (values['endings.A'] & 1)
+        | (values['endings.B'] & 1) << 1
+        | (values['endings.C'] & 1) << 2
+        | (values['endings.D'] & 1) << 3
+        | (values['endings.E'] & 1) << 4
+        | (values['endings._unk_5'] & 1) << 5
+        | (values['endings._unk_6'] & 1) << 6
+        | (values['endings._unk_7'] & 1) << 7
+        | (values['endings._unk_8'] & 1) << 8
+        | (values['endings._unk_9'] & 1) << 9
+        | (values['endings._unk_10'] & 1) << 10
+        | (values['endings._unk_11'] & 1) << 11
+        | (values['endings._unk_12'] & 1) << 12
+        | (values['endings._unk_13'] & 1) << 13
+        | (values['endings._unk_14'] & 1) << 14
+        | (values['endings._unk_15'] & 1) << 15
+        | (values['endings._unk_16'] & 1) << 16
+        | (values['endings._unk_17'] & 1) << 17
+        | (values['endings._unk_18'] & 1) << 18
+        | (values['endings._unk_19'] & 1) << 19
+        | (values['endings._unk_20'] & 1) << 20
+        | (values['endings._unk_21'] & 1) << 21
+        | (values['endings._unk_22'] & 1) << 22
+        | (values['endings._unk_23'] & 1) << 23
+        | (values['endings._unk_24'] & 1) << 24
+        | (values['endings._unk_25'] & 1) << 25
+        | (values['endings._unk_26'] & 1) << 26
+        | (values['endings._unk_27'] & 1) << 27
+        | (values['endings._unk_28'] & 1) << 28
+        | (values['endings._unk_29'] & 1) << 29
+        | (values['endings._unk_30'] & 1) << 30
+        | (values['endings._unk_31'] & 1) << 31
+    ).to_bytes(4, 'little')
+    _HEADER_RUN_2.pack_into(buf, 8, *_HEADER_GET_2(values))
+    buf[33108:33112] = sum(buf[0:424]).to_bytes(4, 'little')
+    return bytes(buf)
+
+
+_SAVEFILE_RUN_0 = Struct('<L32sLL32slllfffllll12sLLLLLL8sLLLL12slBBB18sBBBBBBBB2sB1sB7sBBB2sBBBBBBBBBBBBBBBBBBBB5sBBBBBBBBBBBBBBBBBBBB10sBBB7sBBBBBBBBBBBBBBB5sBBBB3sBBBBBBBBBBB4sBBBBBBBBB5sBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB4sBBBBBBBBBBBBBBBBBBBBBBBBB1sBBBBBBBBBB5sBBBBBBB1sBB3sBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB176sBBBBBBBBBBBBBBBBBBBBBBBB168sBBBBBBBBBBBBBBBBBBBBBBBB40s32s32s32s')
+_SAVEFILE_KEYS_0 = ('corruptness', 'map', 'spawn', 'character', 'name', 'health', 'health_kaine', 'health_emil', 'magic', 'magic_kaine', 'magic_emil', 'level', 'level_kaine', 'level_emil', 'xp', '_unk4', 'order_kaine', 'order_emil', 'active_weapon', 'selected_sword_1h', 'selected_sword_2h', 'selected_spear', '_unk5', 'left_bumper', 'right_bumper', 'left_trigger', 'right_trigger', '_unk6', 'money', 'recovery.Medicinal Herb', 'recovery.Health Salve', 'recovery.Recovery Potion', 'recovery._unk0', 'recovery.Strength Drop', 'recovery.Strength Capsule', 'recovery.Magic Drop', 'recovery.Magic Capsule', 'recovery.Defense Drop', 'recovery.Defense Capsule', 'recovery.Spirit Drop', 'recovery.Spirit Capsule', 'recovery._unk1', 'recovery.Antidotal Weed', 'recovery._unk2', 'recovery.Smelling Salts', '_unk7', 'cultivation.Speed Fertilizer', 'cultivation.Flowering Fertilizer', 'cultivation.Bounty Fertilizer', 'cultivation._unk0', 'cultivation.Pumpkin Seed', 'cultivation.Watermelon Seed', 'cultivation.Melon Seed', 'cultivation.Gourd Seed', 'cultivation.Tomato Seed', 'cultivation.Eggplant Seed', 'cultivation.Bell Pepper Seed', 'cultivation.Bean Seed', 'cultivation.Wheat Seedling', 'cultivation.Rice Plant Seedling', 'cultivation.Dahlia Bulb', 'cultivation.Tulip Bulb', 'cultivation.Freesia Bulb', 'cultivation.Red Moonflower Seed', 'cultivation.Gold Moonflower Seed', 'cultivation.Peach Moonflower Seed', 'cultivation.Pink Moonflower Seed', 'cultivation.Blue Moonflower Seed', 'cultivation.Indigo Moonflower Seed', 'cultivation.White Moonflower Seed', 'cultivation._unk1', 'cultivation.Pumpkin', 'cultivation.Watermelon', 'cultivation.Melon', 'cultivation.Gourd', 'cultivation.Tomato', 'cultivation.Eggplant', 'cultivation.Bell Pepper', 'cultivation.Beans', 'cultivation.Wheat', 'cultivation.Rice', 'cultivation.Dahlia', 'cultivation.Tulip', 'cultivation.Freesia', 'cultivation.Red Moonflower', 'cultivation.Gold Moonflower', 'cultivation.Peach Moonflower', 'cultivation.Pink Moonflower', 'cultivation.Blue Moonflower', 'cultivation.Indigo Moonflower', 'cultivation.White Moonflower', '_unk8', 'fishing.Lugworm', 'fishing.Earthworm', 'fishing.Lure', 'fishing._unk0', 'fishing.Sardine', 'fishing.Carp', 'fishing.Blowfish', 'fishing.Bream', 'fishing.Shark', 'fishing.Blue Marlin', 'fishing.Dunkleosteus', 'fishing.Rainbow Trout', 'fishing.Black Bass', 'fishing.Giant Catfish', 'fishing.Royal Fish', 'fishing.Hyneria', 'fishing.Sandfish', 'fishing.Rhizodont', 'fishing.Shaman Fish', '_unk9', 'raw_materials.Aquatic Plant', 'raw_materials.Deadwood', 'raw_materials.Rusty Bucket', 'raw_materials.Empty Can', 'raw_materials._unk0', 'raw_materials.Gold Ore', 'raw_materials.Silver Ore', 'raw_materials.Copper Ore', 'raw_materials.Iron Ore', 'raw_materials.Crystal', 'raw_materials.Pyrite', 'raw_materials.Moldavite', 'raw_materials.Meteorite', 'raw_materials.Amber', 'raw_materials.Fluorite', 'raw_materials.Clay', 'raw_materials._unk1', 'raw_materials.Berries', 'raw_materials.Royal Fern', 'raw_materials.Tree Branch', 'raw_materials.Log', 'raw_materials.Natural Rubber', 'raw_materials.Ivy', 'raw_materials.Lichen', 'raw_materials.Mushroom', 'raw_materials.Sap', 'raw_materials._unk2', 'raw_materials.Mutton', 'raw_materials.Boar Meat', 'raw_materials.Wool', 'raw_materials.Boar Hide', 'raw_materials.Wolf Hide', 'raw_materials.Wolf Fang', 'raw_materials.Giant Spider Silk', 'raw_materials.Bat Fang', 'raw_materials.Bat Wing', 'raw_materials.Goat Meat', 'raw_materials.Goat Hide', 'raw_materials.Venison', 'raw_materials.Rainbow Spider Silk', 'raw_materials.Boar Liver', 'raw_materials.Scorpion Claw', 'raw_materials.Scorpion Tail', 'raw_materials.Dented Metal Board', 'raw_materials.Stripped Bolt', 'raw_materials.Broken Lens', 'raw_materials.Severed Cable', 'raw_materials.Broken Arm', 'raw_materials.Broken Antenna', 'raw_materials.Broken Motor', 'raw_materials.Broken Battery', 'raw_materials.Mysterious Switch', 'raw_materials.Large Gear', 'raw_materials.Titanium Alloy', 'raw_materials.Memory Alloy', 'raw_materials.Rusted Clump', 'raw_materials.Machine Oil', 'raw_materials._unk3', 'raw_materials.Forlorn Necklace', 'raw_materials.Twisted Ring', 'raw_materials.Broken Earring', 'raw_materials.Pretty Choker', 'raw_materials.Metal Piercing', 'raw_materials.Subdued Bracelet', 'raw_materials.Technical Guide', 'raw_materials.Grubby Book', 'raw_materials.Thick Dictionary', 'raw_materials.Closed Book', 'raw_materials.Used Coloring Book', 'raw_materials.Old Schoolbook', 'raw_materials.Dirty Bag', 'raw_materials.Flashy Hat', 'raw_materials.Leather Gloves', 'raw_materials.Silk Handkerchief', 'raw_materials.Leather Boots', 'raw_materials.Complex Machine', 'raw_materials.Elaborate Machine', 'raw_materials.Simple Machine', 'raw_materials.Stopped Clock', 'raw_materials.Broken Wristwatch', 'raw_materials.Rusty Kitchen Knife', 'raw_materials.Broken Saw', 'raw_materials.Dented Metal Bat', 'raw_materials._unk4', 'raw_materials.Shell', 'raw_materials.Gastropod', 'raw_materials.Bivalve', 'raw_materials.Seaweed', 'raw_materials.Empty Bottle', 'raw_materials.Driftwood', 'raw_materials.Pearl', 'raw_materials.Black Pearl', 'raw_materials.Crab', 'raw_materials.Starfish', 'raw_materials._unk5', 'raw_materials.Sea Turtle Egg', 'raw_materials.Broken Pottery', 'raw_materials.Desert Rose', 'raw_materials.Giant Egg', 'raw_materials.Damascus Steel', 'raw_materials.Eagle Egg', 'raw_materials.Chicken Egg', 'raw_materials._unk6', 'raw_materials.Mouse Tail', 'raw_materials.Lizard Tail', 'raw_materials._unk7', 'raw_materials.Deer Antler', 'key_items.Moon Key', 'key_items.Star Key', 'key_items.Light Key', 'key_items.Darkness Key', 'key_items.Fine Flour', 'key_items.Coarse Flour', 'key_items.Perfume Bottle', "key_items.Postman's Parcel", "key_items.Lover's Letter", 'key_items.Water Filter', 'key_items.Royal Compass', 'key_items.Vapor Moss', 'key_items.Valley Spider Silk', 'key_items.Animal Guidebook', 'key_items.Ore Guidebook', 'key_items.Plant Guidebook', 'key_items.Red Book', 'key_items.Blue Book', "key_items.Old Lady's Elixir", "key_items.Old Lady's Elixir+", 'key_items.Parcel for The Aerie', 'key_items.Parcel for Seafront', 'key_items.Cookbook', 'key_items.Parcel for Facade', "key_items.Max's Herbs", 'key_items.Drifting Cargo', 'key_items.Drifting Cargo 2', 'key_items.Drifting Cargo 3', 'key_items.Drifting Cargo 4', 'key_items.Old Package', 'key_items.Mermaid Tear', 'key_items.Mandrake Leaf', 'key_items.Energizer', 'key_items.Toad Oil', 'key_items.Sleep-B-Gone', 'key_items.Antidote', 'key_items.Gold Bracelet', 'key_items.Elite Kitchen Knife', 'key_items.Elevator Parts', 'key_items.Dirty Treasure Map', 'key_items.Restored Treasure Map', 'key_items.Jade Hair Ornament', 'key_items.Employee List', 'key_items.Small Safe', 'key_items.Safe Key', 'key_items.Great Tree Root', 'key_items.Eye of Power', 'key_items.Ribbon', "key_items.Yonah's Ribbon", 'key_items.Bronze Key', 'key_items.Brass Key', 'key_items.Boar Tusk', 'key_items.Pressed Freesia', 'key_items.Potted Freesia', 'key_items.Freesia (Delivery)', 'key_items.Pile of Junk', 'key_items.Old Gold Coin', 'key_items.Marked Map', 'key_items.AA Keycard', 'key_items.KA Keycard', 'key_items.SA Keycard', 'key_items.TA Keycard', 'key_items.NA Keycard', 'key_items.HA Keycard', 'key_items.MA Keycard', 'key_items.YA Keycard', 'key_items.RA Keycard', 'key_items.WA Keycard', "key_items.Cultivator's Handbook", 'key_items.Red Bag', 'key_items.Lantern', 'key_items.Empty Lantern', 'key_items.Hold Key', 'key_items.Passageway Key', 'key_items.Goat Key', 'key_items.Lizard Key', 'key_items.Unlocking Procedure Memo', 'key_items.Red Jewel?', 'key_items.Red Flowers', 'key_items.Apples', '_unk10', 'documents.Look at the Sky', "documents.Don't try so hard", 'documents.My Birthday!', 'documents.Love Letter 2/12/3340', 'documents.Love Letter 3/28/3340', 'documents.Love Letter 5/1/3340', 'documents.Letter from the Mayor', "documents.The Postman's Request", "documents.The Postman's Thanks", 'documents.Invitation from a Stranger', 'documents.Grand Re-Opening Notice', 'documents.Wedding Invitation', 'documents.Letter from the King', 'documents.Underground Research Record 1', 'documents.Underground Research Record 2', 'documents.Underground Research Record 3', 'documents.Underground Research Record 4', 'documents.Letter to the Chief', 'documents.Letter to two Brothers Weaponry', 'documents.Letter to Popola', 'documents.Letter to a Faraway Lover', 'documents.Letter from Emil', 'documents.Weapon Upgrade Notice', 'documents.Letter from the Chief of The Aerie', '_unk11', 'maps.World Map', 'maps._unknown_0', 'maps._unknown_1', "maps.NieR's Village Map", 'maps.Lost Shrine Area Map', 'maps.Lost Shrine Map', 'maps.The Aerie Map', 'maps.Seafront Map', 'maps.Desert Map', 'maps.Facade Map', 'maps.Barren Temple Map', 'maps.Junk Heap Area Map', 'maps.Junk Heap Map', 'maps.Manor Map', 'maps.Forest of Myth Map', 'maps.Underground Facility Map', 'maps._unknown_2', "maps.Shadowlord's Castle Map", 'maps._unknown_3', 'maps.Northern Plains Map', 'maps.Southern Plains Map', 'maps.Eastern Road Map', 'maps.Beneath the Forest of Myth Map', 'maps.Toyko Map', '_unk12a1', '_unk12a2', '_unk12a3', '_unk12a4')
+_SAVEFILE_GET_0 = itemgetter(*('corruptness', 'map', 'spawn', 'character', 'name', 'health', 'health_kaine', 'health_emil', 'magic', 'magic_kaine', 'magic_emil', 'level', 'level_kaine', 'level_emil', 'xp', '_unk4', 'order_kaine', 'order_emil', 'active_weapon', 'selected_sword_1h', 'selected_sword_2h', 'selected_spear', '_unk5', 'left_bumper', 'right_bumper', 'left_trigger', 'right_trigger', '_unk6', 'money', 'recovery.Medicinal Herb', 'recovery.Health Salve', 'recovery.Recovery Potion', 'recovery._unk0', 'recovery.Strength Drop', 'recovery.Strength Capsule', 'recovery.Magic Drop', 'recovery.Magic Capsule', 'recovery.Defense Drop', 'recovery.Defense Capsule', 'recovery.Spirit Drop', 'recovery.Spirit Capsule', 'recovery._unk1', 'recovery.Antidotal Weed', 'recovery._unk2', 'recovery.Smelling Salts', '_unk7', 'cultivation.Speed Fertilizer', 'cultivation.Flowering Fertilizer', 'cultivation.Bounty Fertilizer', 'cultivation._unk0', 'cultivation.Pumpkin Seed', 'cultivation.Watermelon Seed', 'cultivation.Melon Seed', 'cultivation.Gourd Seed', 'cultivation.Tomato Seed', 'cultivation.Eggplant Seed', 'cultivation.Bell Pepper Seed', 'cultivation.Bean Seed', 'cultivation.Wheat Seedling', 'cultivation.Rice Plant Seedling', 'cultivation.Dahlia Bulb', 'cultivation.Tulip Bulb', 'cultivation.Freesia Bulb', 'cultivation.Red Moonflower Seed', 'cultivation.Gold Moonflower Seed', 'cultivation.Peach Moonflower Seed', 'cultivation.Pink Moonflower Seed', 'cultivation.Blue Moonflower Seed', 'cultivation.Indigo Moonflower Seed', 'cultivation.White Moonflower Seed', 'cultivation._unk1', 'cultivation.Pumpkin', 'cultivation.Watermelon', 'cultivation.Melon', 'cultivation.Gourd', 'cultivation.Tomato', 'cultivation.Eggplant', 'cultivation.Bell Pepper', 'cultivation.Beans', 'cultivation.Wheat', 'cultivation.Rice', 'cultivation.Dahlia', 'cultivation.Tulip', 'cultivation.Freesia', 'cultivation.Red Moonflower', 'cultivation.Gold Moonflower', 'cultivation.Peach Moonflower', 'cultivation.Pink Moonflower', 'cultivation.Blue Moonflower', 'cultivation.Indigo Moonflower', 'cultivation.White Moonflower', '_unk8', 'fishing.Lugworm', 'fishing.Earthworm', 'fishing.Lure', 'fishing._unk0', 'fishing.Sardine', 'fishing.Carp', 'fishing.Blowfish', 'fishing.Bream', 'fishing.Shark', 'fishing.Blue Marlin', 'fishing.Dunkleosteus', 'fishing.Rainbow Trout', 'fishing.Black Bass', 'fishing.Giant Catfish', 'fishing.Royal Fish', 'fishing.Hyneria', 'fishing.Sandfish', 'fishing.Rhizodont', 'fishing.Shaman Fish', '_unk9', 'raw_materials.Aquatic Plant', 'raw_materials.Deadwood', 'raw_materials.Rusty Bucket', 'raw_materials.Empty Can', 'raw_materials._unk0', 'raw_materials.Gold Ore', 'raw_materials.Silver Ore', 'raw_materials.Copper Ore', 'raw_materials.Iron Ore', 'raw_materials.Crystal', 'raw_materials.Pyrite', 'raw_materials.Moldavite', 'raw_materials.Meteorite', 'raw_materials.Amber', 'raw_materials.Fluorite', 'raw_materials.Clay', 'raw_materials._unk1', 'raw_materials.Berries', 'raw_materials.Royal Fern', 'raw_materials.Tree Branch', 'raw_materials.Log', 'raw_materials.Natural Rubber', 'raw_materials.Ivy', 'raw_materials.Lichen', 'raw_materials.Mushroom', 'raw_materials.Sap', 'raw_materials._unk2', 'raw_materials.Mutton', 'raw_materials.Boar Meat', 'raw_materials.Wool', 'raw_materials.Boar Hide', 'raw_materials.Wolf Hide', 'raw_materials.Wolf Fang', 'raw_materials.Giant Spider Silk', 'raw_materials.Bat Fang', 'raw_materials.Bat Wing', 'raw_materials.Goat Meat', 'raw_materials.Goat Hide', 'raw_materials.Venison', 'raw_materials.Rainbow Spider Silk', 'raw_materials.Boar Liver', 'raw_materials.Scorpion Claw', 'raw_materials.Scorpion Tail', 'raw_materials.Dented Metal Board', 'raw_materials.Stripped Bolt', 'raw_materials.Broken Lens', 'raw_materials.Severed Cable', 'raw_materials.Broken Arm', 'raw_materials.Broken Antenna', 'raw_materials.Broken Motor', 'raw_materials.Broken Battery', 'raw_materials.Mysterious Switch', 'raw_materials.Large Gear', 'raw_materials.Titanium Alloy', 'raw_materials.Memory Alloy', 'raw_materials.Rusted Clump', 'raw_materials.Machine Oil', 'raw_materials._unk3', 'raw_materials.Forlorn Necklace', 'raw_materials.Twisted Ring', 'raw_materials.Broken Earring', 'raw_materials.Pretty Choker', 'raw_materials.Metal Piercing', 'raw_materials.Subdued Bracelet', 'raw_materials.Technical Guide', 'raw_materials.Grubby Book', 'raw_materials.Thick Dictionary', 'raw_materials.Closed Book', 'raw_materials.Used Coloring Book', 'raw_materials.Old Schoolbook', 'raw_materials.Dirty Bag', 'raw_materials.Flashy Hat', 'raw_materials.Leather Gloves', 'raw_materials.Silk Handkerchief', 'raw_materials.Leather Boots', 'raw_materials.Complex Machine', 'raw_materials.Elaborate Machine', 'raw_materials.Simple Machine', 'raw_materials.Stopped Clock', 'raw_materials.Broken Wristwatch', 'raw_materials.Rusty Kitchen Knife', 'raw_materials.Broken Saw', 'raw_materials.Dented Metal Bat', 'raw_materials._unk4', 'raw_materials.Shell', 'raw_materials.Gastropod', 'raw_materials.Bivalve', 'raw_materials.Seaweed', 'raw_materials.Empty Bottle', 'raw_materials.Driftwood', 'raw_materials.Pearl', 'raw_materials.Black Pearl', 'raw_materials.Crab', 'raw_materials.Starfish', 'raw_materials._unk5', 'raw_materials.Sea Turtle Egg', 'raw_materials.Broken Pottery', 'raw_materials.Desert Rose', 'raw_materials.Giant Egg', 'raw_materials.Damascus Steel', 'raw_materials.Eagle Egg', 'raw_materials.Chicken Egg', 'raw_materials._unk6', 'raw_materials.Mouse Tail', 'raw_materials.Lizard Tail', 'raw_materials._unk7', 'raw_materials.Deer Antler', 'key_items.Moon Key', 'key_items.Star Key', 'key_items.Light Key', 'key_items.Darkness Key', 'key_items.Fine Flour', 'key_items.Coarse Flour', 'key_items.Perfume Bottle', "key_items.Postman's Parcel", "key_items.Lover's Letter", 'key_items.Water Filter', 'key_items.Royal Compass', 'key_items.Vapor Moss', 'key_items.Valley Spider Silk', 'key_items.Animal Guidebook', 'key_items.Ore Guidebook', 'key_items.Plant Guidebook', 'key_items.Red Book', 'key_items.Blue Book', "key_items.Old Lady's Elixir", "key_items.Old Lady's Elixir+", 'key_items.Parcel for The Aerie', 'key_items.Parcel for Seafront', 'key_items.Cookbook', 'key_items.Parcel for Facade', "key_items.Max's Herbs", 'key_items.Drifting Cargo', 'key_items.Drifting Cargo 2', 'key_items.Drifting Cargo 3', 'key_items.Drifting Cargo 4', 'key_items.Old Package', 'key_items.Mermaid Tear', 'key_items.Mandrake Leaf', 'key_items.Energizer', 'key_items.Toad Oil', 'key_items.Sleep-B-Gone', 'key_items.Antidote', 'key_items.Gold Bracelet', 'key_items.Elite Kitchen Knife', 'key_items.Elevator Parts', 'key_items.Dirty Treasure Map', 'key_items.Restored Treasure Map', 'key_items.Jade Hair Ornament', 'key_items.Employee List', 'key_items.Small Safe', 'key_items.Safe Key', 'key_items.Great Tree Root', 'key_items.Eye of Power', 'key_items.Ribbon', "key_items.Yonah's Ribbon", 'key_items.Bronze Key', 'key_items.Brass Key', 'key_items.Boar Tusk', 'key_items.Pressed Freesia', 'key_items.Potted Freesia', 'key_items.Freesia (Delivery)', 'key_items.Pile of Junk', 'key_items.Old Gold Coin', 'key_items.Marked Map', 'key_items.AA Keycard', 'key_items.KA Keycard', 'key_items.SA Keycard', 'key_items.TA Keycard', 'key_items.NA Keycard', 'key_items.HA Keycard', 'key_items.MA Keycard', 'key_items.YA Keycard', 'key_items.RA Keycard', 'key_items.WA Keycard', "key_items.Cultivator's Handbook", 'key_items.Red Bag', 'key_items.Lantern', 'key_items.Empty Lantern', 'key_items.Hold Key', 'key_items.Passageway Key', 'key_items.Goat Key', 'key_items.Lizard Key', 'key_items.Unlocking Procedure Memo', 'key_items.Red Jewel?', 'key_items.Red Flowers', 'key_items.Apples', '_unk10', 'documents.Look at the Sky', "documents.Don't try so hard", 'documents.My Birthday!', 'documents.Love Letter 2/12/3340', 'documents.Love Letter 3/28/3340', 'documents.Love Letter 5/1/3340', 'documents.Letter from the Mayor', "documents.The Postman's Request", "documents.The Postman's Thanks", 'documents.Invitation from a Stranger', 'documents.Grand Re-Opening Notice', 'documents.Wedding Invitation', 'documents.Letter from the King', 'documents.Underground Research Record 1', 'documents.Underground Research Record 2', 'documents.Underground Research Record 3', 'documents.Underground Research Record 4', 'documents.Letter to the Chief', 'documents.Letter to two Brothers Weaponry', 'documents.Letter to Popola', 'documents.Letter to a Faraway Lover', 'documents.Letter from Emil', 'documents.Weapon Upgrade Notice', 'documents.Letter from the Chief of The Aerie', '_unk11', 'maps.World Map', 'maps._unknown_0', 'maps._unknown_1', "maps.NieR's Village Map", 'maps.Lost Shrine Area Map', 'maps.Lost Shrine Map', 'maps.The Aerie Map', 'maps.Seafront Map', 'maps.Desert Map', 'maps.Facade Map', 'maps.Barren Temple Map', 'maps.Junk Heap Area Map', 'maps.Junk Heap Map', 'maps.Manor Map', 'maps.Forest of Myth Map', 'maps.Underground Facility Map', 'maps._unknown_2', "maps.Shadowlord's Castle Map", 'maps._unknown_3', 'maps.Northern Plains Map', 'maps.Southern Plains Map', 'maps.Eastern Road Map', 'maps.Beneath the Forest of Myth Map', 'maps.Toyko Map', '_unk12a1', '_unk12a2', '_unk12a3', '_unk12a4'))
+_SAVEFILE_RUN_6 = Struct('<86sd4sBBBBBBBBBBBBBBBBB3sBBBBBBBBBB10sBBBBBBBBBBB1s32s23s137s32s')
+_SAVEFILE_KEYS_6 = ('_unk12b', 'total_play_time', '_unk13', 'weapons.Nameless Blade', 'weapons.Phoenix Dagger', 'weapons.Beastbain', "weapons.Labyrinth's Whisper", "weapons.Fool's Embrace", 'weapons.Ancient Overlord', 'weapons.Rebirth', 'weapons.Earth Wyrms Claw', 'weapons.Nirvana Dagger', 'weapons.Moonrise', 'weapons.Blade of Treachery', 'weapons.Lily Leaf Sword', 'weapons.Faith', 'weapons.Iron Pipe', "weapons.Kainé's Sword", 'weapons.Virtuous Contract', 'weapons.Cruel Oath', 'weapons._unk0', 'weapons.Kusanagi', 'weapons.Phoenix Sword', 'weapons.Beastlord', "weapons.Labyrinth's Song", "weapons.Fool's Lament", 'weapons.Fang of the Twins', 'weapons.Axe of Beheading', 'weapons.Vile Axe', 'weapons.Iron Will', 'weapons.Virtuous Treaty', 'weapons._unk1', 'weapons.Transience', 'weapons.Phoenix Spear', 'weapons.Beastcurse', "weapons.Labyrinth's Shout", "weapons.Fool's Accord", 'weapons.The Devil Queen', 'weapons.Sunrise', 'weapons.Spear of the Usurper', 'weapons.Dragoon Lance', "weapons.Captain's Holy Spear", 'weapons.Virtuous Dignity', '_unk14a', '_maybe_weapon_viewed_states', '_unk14b', '_unk14c', '_unk14d')
+_SAVEFILE_GET_6 = itemgetter(*('_unk12b', 'total_play_time', '_unk13', 'weapons.Nameless Blade', 'weapons.Phoenix Dagger', 'weapons.Beastbain', "weapons.Labyrinth's Whisper", "weapons.Fool's Embrace", 'weapons.Ancient Overlord', 'weapons.Rebirth', 'weapons.Earth Wyrms Claw', 'weapons.Nirvana Dagger', 'weapons.Moonrise', 'weapons.Blade of Treachery', 'weapons.Lily Leaf Sword', 'weapons.Faith', 'weapons.Iron Pipe', "weapons.Kainé's Sword", 'weapons.Virtuous Contract', 'weapons.Cruel Oath', 'weapons._unk0', 'weapons.Kusanagi', 'weapons.Phoenix Sword', 'weapons.Beastlord', "weapons.Labyrinth's Song", "weapons.Fool's Lament", 'weapons.Fang of the Twins', 'weapons.Axe of Beheading', 'weapons.Vile Axe', 'weapons.Iron Will', 'weapons.Virtuous Treaty', 'weapons._unk1', 'weapons.Transience', 'weapons.Phoenix Spear', 'weapons.Beastcurse', "weapons.Labyrinth's Shout", "weapons.Fool's Accord", 'weapons.The Devil Queen', 'weapons.Sunrise', 'weapons.Spear of the Usurper', 'weapons.Dragoon Lance', "weapons.Captain's Holy Spear", 'weapons.Virtuous Dignity', '_unk14a', '_maybe_weapon_viewed_states', '_unk14b', '_unk14c', '_unk14d'))
+_SAVEFILE_RUN_8 = Struct('<100s100sB55sL20s')
+_SAVEFILE_KEYS_8 = ('_unk15a1a1', '_unk15a1a2', 'sheep_kill_count', '_unk15a1b', '_maybe_mission_objective', '_unk15a2b')
+_SAVEFILE_GET_8 = itemgetter(*('_unk15a1a1', '_unk15a1a2', 'sheep_kill_count', '_unk15a1b', '_maybe_mission_objective', '_unk15a2b'))
+_SAVEFILE_RUN_10 = Struct('<21s')
+_SAVEFILE_KEYS_10 = ('_unk15b',)
+_SAVEFILE_GET_10 = lambda values: (values['_unk15b'],)
+_SAVEFILE_RUN_12 = Struct('<16sBBBBBBBBBBBBBBBBBBBBBBBBBBB3sBBBBBBBBBB10sBBBBBBBBBBB13sBBBBBBBBBBBBBBBBBBBBBBBBBBB3sBBBBBBBBBB10sBBBBBBBBBBB17s')
+_SAVEFILE_KEYS_12 = ('_unk16a', 'ability_words_a.Defend', 'ability_words_a.Evade', 'ability_words_a.Dark Blast', 'ability_words_a.Dark Phantasm', 'ability_words_a.Dark Hand', 'ability_words_a.Dark Lance', 'ability_words_a.Dark Whirlwind', 'ability_words_a.Dark Gluttony', 'ability_words_a.Dark Wall', 'ability_words_a.Dark Execution', 'weapon_words_a.Nameless Blade', 'weapon_words_a.Phoenix Dagger', 'weapon_words_a.Beastbain', "weapon_words_a.Labyrinth's Whisper", "weapon_words_a.Fool's Embrace", 'weapon_words_a.Ancient Overlord', 'weapon_words_a.Rebirth', 'weapon_words_a.Earth Wyrms Claw', 'weapon_words_a.Nirvana Dagger', 'weapon_words_a.Moonrise', 'weapon_words_a.Blade of Treachery', 'weapon_words_a.Lily Leaf Sword', 'weapon_words_a.Faith', 'weapon_words_a.Iron Pipe', "weapon_words_a.Kainé's Sword", 'weapon_words_a.Virtuous Contract', 'weapon_words_a.Cruel Oath', 'weapon_words_a._unk0', 'weapon_words_a.Kusanagi', 'weapon_words_a.Phoenix Sword', 'weapon_words_a.Beastlord', "weapon_words_a.Labyrinth's Song", "weapon_words_a.Fool's Lament", 'weapon_words_a.Fang of the Twins', 'weapon_words_a.Axe of Beheading', 'weapon_words_a.Vile Axe', 'weapon_words_a.Iron Will', 'weapon_words_a.Virtuous Treaty', 'weapon_words_a._unk1', 'weapon_words_a.Transience', 'weapon_words_a.Phoenix Spear', 'weapon_words_a.Beastcurse', "weapon_words_a.Labyrinth's Shout", "weapon_words_a.Fool's Accord", 'weapon_words_a.The Devil Queen', 'weapon_words_a.Sunrise', 'weapon_words_a.Spear of the Usurper', 'weapon_words_a.Dragoon Lance', "weapon_words_a.Captain's Holy Spear", 'weapon_words_a.Virtuous Dignity', '_unk16b', 'ability_words_b.Defend', 'ability_words_b.Evade', 'ability_words_b.Dark Blast', 'ability_words_b.Dark Phantasm', 'ability_words_b.Dark Hand', 'ability_words_b.Dark Lance', 'ability_words_b.Dark Whirlwind', 'ability_words_b.Dark Gluttony', 'ability_words_b.Dark Wall', 'ability_words_b.Dark Execution', 'weapon_words_b.Nameless Blade', 'weapon_words_b.Phoenix Dagger', 'weapon_words_b.Beastbain', "weapon_words_b.Labyrinth's Whisper", "weapon_words_b.Fool's Embrace", 'weapon_words_b.Ancient Overlord', 'weapon_words_b.Rebirth', 'weapon_words_b.Earth Wyrms Claw', 'weapon_words_b.Nirvana Dagger', 'weapon_words_b.Moonrise', 'weapon_words_b.Blade of Treachery', 'weapon_words_b.Lily Leaf Sword', 'weapon_words_b.Faith', 'weapon_words_b.Iron Pipe', "weapon_words_b.Kainé's Sword", 'weapon_words_b.Virtuous Contract', 'weapon_words_b.Cruel Oath', 'weapon_words_b._unk0', 'weapon_words_b.Kusanagi', 'weapon_words_b.Phoenix Sword', 'weapon_words_b.Beastlord', "weapon_words_b.Labyrinth's Song", "weapon_words_b.Fool's Lament", 'weapon_words_b.Fang of the Twins', 'weapon_words_b.Axe of Beheading', 'weapon_words_b.Vile Axe', 'weapon_words_b.Iron Will', 'weapon_words_b.Virtuous Treaty', 'weapon_words_b._unk1', 'weapon_words_b.Transience', 'weapon_words_b.Phoenix Spear', 'weapon_words_b.Beastcurse', "weapon_words_b.Labyrinth's Shout", "weapon_words_b.Fool's Accord", 'weapon_words_b.The Devil Queen', 'weapon_words_b.Sunrise', 'weapon_words_b.Spear of the Usurper', 'weapon_words_b.Dragoon Lance', "weapon_words_b.Captain's Holy Spear", 'weapon_words_b.Virtuous Dignity', '_unk16c')
+_SAVEFILE_GET_12 = itemgetter(*('_unk16a', 'ability_words_a.Defend', 'ability_words_a.Evade', 'ability_words_a.Dark Blast', 'ability_words_a.Dark Phantasm', 'ability_words_a.Dark Hand', 'ability_words_a.Dark Lance', 'ability_words_a.Dark Whirlwind', 'ability_words_a.Dark Gluttony', 'ability_words_a.Dark Wall', 'ability_words_a.Dark Execution', 'weapon_words_a.Nameless Blade', 'weapon_words_a.Phoenix Dagger', 'weapon_words_a.Beastbain', "weapon_words_a.Labyrinth's Whisper", "weapon_words_a.Fool's Embrace", 'weapon_words_a.Ancient Overlord', 'weapon_words_a.Rebirth', 'weapon_words_a.Earth Wyrms Claw', 'weapon_words_a.Nirvana Dagger', 'weapon_words_a.Moonrise', 'weapon_words_a.Blade of Treachery', 'weapon_words_a.Lily Leaf Sword', 'weapon_words_a.Faith', 'weapon_words_a.Iron Pipe', "weapon_words_a.Kainé's Sword", 'weapon_words_a.Virtuous Contract', 'weapon_words_a.Cruel Oath', 'weapon_words_a._unk0', 'weapon_words_a.Kusanagi', 'weapon_words_a.Phoenix Sword', 'weapon_words_a.Beastlord', "weapon_words_a.Labyrinth's Song", "weapon_words_a.Fool's Lament", 'weapon_words_a.Fang of the Twins', 'weapon_words_a.Axe of Beheading', 'weapon_words_a.Vile Axe', 'weapon_words_a.Iron Will', 'weapon_words_a.Virtuous Treaty', 'weapon_words_a._unk1', 'weapon_words_a.Transience', 'weapon_words_a.Phoenix Spear', 'weapon_words_a.Beastcurse', "weapon_words_a.Labyrinth's Shout", "weapon_words_a.Fool's Accord", 'weapon_words_a.The Devil Queen', 'weapon_words_a.Sunrise', 'weapon_words_a.Spear of the Usurper', 'weapon_words_a.Dragoon Lance', "weapon_words_a.Captain's Holy Spear", 'weapon_words_a.Virtuous Dignity', '_unk16b', 'ability_words_b.Defend', 'ability_words_b.Evade', 'ability_words_b.Dark Blast', 'ability_words_b.Dark Phantasm', 'ability_words_b.Dark Hand', 'ability_words_b.Dark Lance', 'ability_words_b.Dark Whirlwind', 'ability_words_b.Dark Gluttony', 'ability_words_b.Dark Wall', 'ability_words_b.Dark Execution', 'weapon_words_b.Nameless Blade', 'weapon_words_b.Phoenix Dagger', 'weapon_words_b.Beastbain', "weapon_words_b.Labyrinth's Whisper", "weapon_words_b.Fool's Embrace", 'weapon_words_b.Ancient Overlord', 'weapon_words_b.Rebirth', 'weapon_words_b.Earth Wyrms Claw', 'weapon_words_b.Nirvana Dagger', 'weapon_words_b.Moonrise', 'weapon_words_b.Blade of Treachery', 'weapon_words_b.Lily Leaf Sword', 'weapon_words_b.Faith', 'weapon_words_b.Iron Pipe', "weapon_words_b.Kainé's Sword", 'weapon_words_b.Virtuous Contract', 'weapon_words_b.Cruel Oath', 'weapon_words_b._unk0', 'weapon_words_b.Kusanagi', 'weapon_words_b.Phoenix Sword', 'weapon_words_b.Beastlord', "weapon_words_b.Labyrinth's Song", "weapon_words_b.Fool's Lament", 'weapon_words_b.Fang of the Twins', 'weapon_words_b.Axe of Beheading', 'weapon_words_b.Vile Axe', 'weapon_words_b.Iron Will', 'weapon_words_b.Virtuous Treaty', 'weapon_words_b._unk1', 'weapon_words_b.Transience', 'weapon_words_b.Phoenix Spear', 'weapon_words_b.Beastcurse', "weapon_words_b.Labyrinth's Shout", "weapon_words_b.Fool's Accord", 'weapon_words_b.The Devil Queen', 'weapon_words_b.Sunrise', 'weapon_words_b.Spear of the Usurper', 'weapon_words_b.Dragoon Lance', "weapon_words_b.Captain's Holy Spear", 'weapon_words_b.Virtuous Dignity', '_unk16c'))
+_SAVEFILE_RUN_14 = Struct('<4s16s48sddddddddddddddd72sddddddddddddddd32sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1sLLLfHBBBBB1s168s21sBBBBBBBBBBBBBBB99s29s')
+_SAVEFILE_KEYS_14 = ('_unk17a1a', '_maybe_tutorial_viewed_states', '_unk17a1b', 'fishing_record_sizes.Sardine', 'fishing_record_sizes.Blowfish', 'fishing_record_sizes.Bream', 'fishing_record_sizes.Shark', 'fishing_record_sizes.Blue Marlin', 'fishing_record_sizes.Dunkleosteus', 'fishing_record_sizes.Carp', 'fishing_record_sizes.Rainbow Trout', 'fishing_record_sizes.Black Bass', 'fishing_record_sizes.Giant Catfish', 'fishing_record_sizes.Royal Fish', 'fishing_record_sizes.Hyneria', 'fishing_record_sizes.Sandfish', 'fishing_record_sizes.Rhizodont', 'fishing_record_sizes.Shaman Fish', '_unk17a2', 'fishing_record_weights.Sardine', 'fishing_record_weights.Blowfish', 'fishing_record_weights.Bream', 'fishing_record_weights.Shark', 'fishing_record_weights.Blue Marlin', 'fishing_record_weights.Dunkleosteus', 'fishing_record_weights.Carp', 'fishing_record_weights.Rainbow Trout', 'fishing_record_weights.Black Bass', 'fishing_record_weights.Giant Catfish', 'fishing_record_weights.Royal Fish', 'fishing_record_weights.Hyneria', 'fishing_record_weights.Sandfish', 'fishing_record_weights.Rhizodont', 'fishing_record_weights.Shaman Fish', '_unk17a3', 'garden.0.0.value.seed', 'garden.0.0.value.fertilizer', 'garden.0.0.value.water', 'garden.0.0.value.direction', 'garden.0.0.value.time.year', 'garden.0.0.value.time.month', 'garden.0.0.value.time.day', 'garden.0.0.value.time.hour', 'garden.0.0.value.time.minute', 'garden.0.0.value.time.second', 'garden.0.0.value._pad', 'garden.0.1.value.seed', 'garden.0.1.value.fertilizer', 'garden.0.1.value.water', 'garden.0.1.value.direction', 'garden.0.1.value.time.year', 'garden.0.1.value.time.month', 'garden.0.1.value.time.day', 'garden.0.1.value.time.hour', 'garden.0.1.value.time.minute', 'garden.0.1.value.time.second', 'garden.0.1.value._pad', 'garden.0.2.value.seed', 'garden.0.2.value.fertilizer', 'garden.0.2.value.water', 'garden.0.2.value.direction', 'garden.0.2.value.time.year', 'garden.0.2.value.time.month', 'garden.0.2.value.time.day', 'garden.0.2.value.time.hour', 'garden.0.2.value.time.minute', 'garden.0.2.value.time.second', 'garden.0.2.value._pad', 'garden.0.3.value.seed', 'garden.0.3.value.fertilizer', 'garden.0.3.value.water', 'garden.0.3.value.direction', 'garden.0.3.value.time.year', 'garden.0.3.value.time.month', 'garden.0.3.value.time.day', 'garden.0.3.value.time.hour', 'garden.0.3.value.time.minute', 'garden.0.3.value.time.second', 'garden.0.3.value._pad', 'garden.0.4.value.seed', 'garden.0.4.value.fertilizer', 'garden.0.4.value.water', 'garden.0.4.value.direction', 'garden.0.4.value.time.year', 'garden.0.4.value.time.month', 'garden.0.4.value.time.day', 'garden.0.4.value.time.hour', 'garden.0.4.value.time.minute', 'garden.0.4.value.time.second', 'garden.0.4.value._pad', 'garden.1.0.value.seed', 'garden.1.0.value.fertilizer', 'garden.1.0.value.water', 'garden.1.0.value.direction', 'garden.1.0.value.time.year', 'garden.1.0.value.time.month', 'garden.1.0.value.time.day', 'garden.1.0.value.time.hour', 'garden.1.0.value.time.minute', 'garden.1.0.value.time.second', 'garden.1.0.value._pad', 'garden.1.1.value.seed', 'garden.1.1.value.fertilizer', 'garden.1.1.value.water', 'garden.1.1.value.direction', 'garden.1.1.value.time.year', 'garden.1.1.value.time.month', 'garden.1.1.value.time.day', 'garden.1.1.value.time.hour', 'garden.1.1.value.time.minute', 'garden.1.1.value.time.second', 'garden.1.1.value._pad', 'garden.1.2.value.seed', 'garden.1.2.value.fertilizer', 'garden.1.2.value.water', 'garden.1.2.value.direction', 'garden.1.2.value.time.year', 'garden.1.2.value.time.month', 'garden.1.2.value.time.day', 'garden.1.2.value.time.hour', 'garden.1.2.value.time.minute', 'garden.1.2.value.time.second', 'garden.1.2.value._pad', 'garden.1.3.value.seed', 'garden.1.3.value.fertilizer', 'garden.1.3.value.water', 'garden.1.3.value.direction', 'garden.1.3.value.time.year', 'garden.1.3.value.time.month', 'garden.1.3.value.time.day', 'garden.1.3.value.time.hour', 'garden.1.3.value.time.minute', 'garden.1.3.value.time.second', 'garden.1.3.value._pad', 'garden.1.4.value.seed', 'garden.1.4.value.fertilizer', 'garden.1.4.value.water', 'garden.1.4.value.direction', 'garden.1.4.value.time.year', 'garden.1.4.value.time.month', 'garden.1.4.value.time.day', 'garden.1.4.value.time.hour', 'garden.1.4.value.time.minute', 'garden.1.4.value.time.second', 'garden.1.4.value._pad', 'garden.2.0.value.seed', 'garden.2.0.value.fertilizer', 'garden.2.0.value.water', 'garden.2.0.value.direction', 'garden.2.0.value.time.year', 'garden.2.0.value.time.month', 'garden.2.0.value.time.day', 'garden.2.0.value.time.hour', 'garden.2.0.value.time.minute', 'garden.2.0.value.time.second', 'garden.2.0.value._pad', 'garden.2.1.value.seed', 'garden.2.1.value.fertilizer', 'garden.2.1.value.water', 'garden.2.1.value.direction', 'garden.2.1.value.time.year', 'garden.2.1.value.time.month', 'garden.2.1.value.time.day', 'garden.2.1.value.time.hour', 'garden.2.1.value.time.minute', 'garden.2.1.value.time.second', 'garden.2.1.value._pad', 'garden.2.2.value.seed', 'garden.2.2.value.fertilizer', 'garden.2.2.value.water', 'garden.2.2.value.direction', 'garden.2.2.value.time.year', 'garden.2.2.value.time.month', 'garden.2.2.value.time.day', 'garden.2.2.value.time.hour', 'garden.2.2.value.time.minute', 'garden.2.2.value.time.second', 'garden.2.2.value._pad', 'garden.2.3.value.seed', 'garden.2.3.value.fertilizer', 'garden.2.3.value.water', 'garden.2.3.value.direction', 'garden.2.3.value.time.year', 'garden.2.3.value.time.month', 'garden.2.3.value.time.day', 'garden.2.3.value.time.hour', 'garden.2.3.value.time.minute', 'garden.2.3.value.time.second', 'garden.2.3.value._pad', 'garden.2.4.value.seed', 'garden.2.4.value.fertilizer', 'garden.2.4.value.water', 'garden.2.4.value.direction', 'garden.2.4.value.time.year', 'garden.2.4.value.time.month', 'garden.2.4.value.time.day', 'garden.2.4.value.time.hour', 'garden.2.4.value.time.minute', 'garden.2.4.value.time.second', 'garden.2.4.value._pad', '_unk17b1a', '_unk17b1b', 'fishing_record_states.Sardine', 'fishing_record_states.Blowfish', 'fishing_record_states.Bream', 'fishing_record_states.Shark', 'fishing_record_states.Blue Marlin', 'fishing_record_states.Dunkleosteus', 'fishing_record_states.Carp', 'fishing_record_states.Rainbow Trout', 'fishing_record_states.Black Bass', 'fishing_record_states.Giant Catfish', 'fishing_record_states.Royal Fish', 'fishing_record_states.Hyneria', 'fishing_record_states.Sandfish', 'fishing_record_states.Rhizodont', 'fishing_record_states.Shaman Fish', '_unk17b2a', '_unk17b2b')
+_SAVEFILE_GET_14 = itemgetter(*('_unk17a1a', '_maybe_tutorial_viewed_states', '_unk17a1b', 'fishing_record_sizes.Sardine', 'fishing_record_sizes.Blowfish', 'fishing_record_sizes.Bream', 'fishing_record_sizes.Shark', 'fishing_record_sizes.Blue Marlin', 'fishing_record_sizes.Dunkleosteus', 'fishing_record_sizes.Carp', 'fishing_record_sizes.Rainbow Trout', 'fishing_record_sizes.Black Bass', 'fishing_record_sizes.Giant Catfish', 'fishing_record_sizes.Royal Fish', 'fishing_record_sizes.Hyneria', 'fishing_record_sizes.Sandfish', 'fishing_record_sizes.Rhizodont', 'fishing_record_sizes.Shaman Fish', '_unk17a2', 'fishing_record_weights.Sardine', 'fishing_record_weights.Blowfish', 'fishing_record_weights.Bream', 'fishing_record_weights.Shark', 'fishing_record_weights.Blue Marlin', 'fishing_record_weights.Dunkleosteus', 'fishing_record_weights.Carp', 'fishing_record_weights.Rainbow Trout', 'fishing_record_weights.Black Bass', 'fishing_record_weights.Giant Catfish', 'fishing_record_weights.Royal Fish', 'fishing_record_weights.Hyneria', 'fishing_record_weights.Sandfish', 'fishing_record_weights.Rhizodont', 'fishing_record_weights.Shaman Fish', '_unk17a3', 'garden.0.0.value.seed', 'garden.0.0.value.fertilizer', 'garden.0.0.value.water', 'garden.0.0.value.direction', 'garden.0.0.value.time.year', 'garden.0.0.value.time.month', 'garden.0.0.value.time.day', 'garden.0.0.value.time.hour', 'garden.0.0.value.time.minute', 'garden.0.0.value.time.second', 'garden.0.0.value._pad', 'garden.0.1.value.seed', 'garden.0.1.value.fertilizer', 'garden.0.1.value.water', 'garden.0.1.value.direction', 'garden.0.1.value.time.year', 'garden.0.1.value.time.month', 'garden.0.1.value.time.day', 'garden.0.1.value.time.hour', 'garden.0.1.value.time.minute', 'garden.0.1.value.time.second', 'garden.0.1.value._pad', 'garden.0.2.value.seed', 'garden.0.2.value.fertilizer', 'garden.0.2.value.water', 'garden.0.2.value.direction', 'garden.0.2.value.time.year', 'garden.0.2.value.time.month', 'garden.0.2.value.time.day', 'garden.0.2.value.time.hour', 'garden.0.2.value.time.minute', 'garden.0.2.value.time.second', 'garden.0.2.value._pad', 'garden.0.3.value.seed', 'garden.0.3.value.fertilizer', 'garden.0.3.value.water', 'garden.0.3.value.direction', 'garden.0.3.value.time.year', 'garden.0.3.value.time.month', 'garden.0.3.value.time.day', 'garden.0.3.value.time.hour', 'garden.0.3.value.time.minute', 'garden.0.3.value.time.second', 'garden.0.3.value._pad', 'garden.0.4.value.seed', 'garden.0.4.value.fertilizer', 'garden.0.4.value.water', 'garden.0.4.value.direction', 'garden.0.4.value.time.year', 'garden.0.4.value.time.month', 'garden.0.4.value.time.day', 'garden.0.4.value.time.hour', 'garden.0.4.value.time.minute', 'garden.0.4.value.time.second', 'garden.0.4.value._pad', 'garden.1.0.value.seed', 'garden.1.0.value.fertilizer', 'garden.1.0.value.water', 'garden.1.0.value.direction', 'garden.1.0.value.time.year', 'garden.1.0.value.time.month', 'garden.1.0.value.time.day', 'garden.1.0.value.time.hour', 'garden.1.0.value.time.minute', 'garden.1.0.value.time.second', 'garden.1.0.value._pad', 'garden.1.1.value.seed', 'garden.1.1.value.fertilizer', 'garden.1.1.value.water', 'garden.1.1.value.direction', 'garden.1.1.value.time.year', 'garden.1.1.value.time.month', 'garden.1.1.value.time.day', 'garden.1.1.value.time.hour', 'garden.1.1.value.time.minute', 'garden.1.1.value.time.second', 'garden.1.1.value._pad', 'garden.1.2.value.seed', 'garden.1.2.value.fertilizer', 'garden.1.2.value.water', 'garden.1.2.value.direction', 'garden.1.2.value.time.year', 'garden.1.2.value.time.month', 'garden.1.2.value.time.day', 'garden.1.2.value.time.hour', 'garden.1.2.value.time.minute', 'garden.1.2.value.time.second', 'garden.1.2.value._pad', 'garden.1.3.value.seed', 'garden.1.3.value.fertilizer', 'garden.1.3.value.water', 'garden.1.3.value.direction', 'garden.1.3.value.time.year', 'garden.1.3.value.time.month', 'garden.1.3.value.time.day', 'garden.1.3.value.time.hour', 'garden.1.3.value.time.minute', 'garden.1.3.value.time.second', 'garden.1.3.value._pad', 'garden.1.4.value.seed', 'garden.1.4.value.fertilizer', 'garden.1.4.value.water', 'garden.1.4.value.direction', 'garden.1.4.value.time.year', 'garden.1.4.value.time.month', 'garden.1.4.value.time.day', 'garden.1.4.value.time.hour', 'garden.1.4.value.time.minute', 'garden.1.4.value.time.second', 'garden.1.4.value._pad', 'garden.2.0.value.seed', 'garden.2.0.value.fertilizer', 'garden.2.0.value.water', 'garden.2.0.value.direction', 'garden.2.0.value.time.year', 'garden.2.0.value.time.month', 'garden.2.0.value.time.day', 'garden.2.0.value.time.hour', 'garden.2.0.value.time.minute', 'garden.2.0.value.time.second', 'garden.2.0.value._pad', 'garden.2.1.value.seed', 'garden.2.1.value.fertilizer', 'garden.2.1.value.water', 'garden.2.1.value.direction', 'garden.2.1.value.time.year', 'garden.2.1.value.time.month', 'garden.2.1.value.time.day', 'garden.2.1.value.time.hour', 'garden.2.1.value.time.minute', 'garden.2.1.value.time.second', 'garden.2.1.value._pad', 'garden.2.2.value.seed', 'garden.2.2.value.fertilizer', 'garden.2.2.value.water', 'garden.2.2.value.direction', 'garden.2.2.value.time.year', 'garden.2.2.value.time.month', 'garden.2.2.value.time.day', 'garden.2.2.value.time.hour', 'garden.2.2.value.time.minute', 'garden.2.2.value.time.second', 'garden.2.2.value._pad', 'garden.2.3.value.seed', 'garden.2.3.value.fertilizer', 'garden.2.3.value.water', 'garden.2.3.value.direction', 'garden.2.3.value.time.year', 'garden.2.3.value.time.month', 'garden.2.3.value.time.day', 'garden.2.3.value.time.hour', 'garden.2.3.value.time.minute', 'garden.2.3.value.time.second', 'garden.2.3.value._pad', 'garden.2.4.value.seed', 'garden.2.4.value.fertilizer', 'garden.2.4.value.water', 'garden.2.4.value.direction', 'garden.2.4.value.time.year', 'garden.2.4.value.time.month', 'garden.2.4.value.time.day', 'garden.2.4.value.time.hour', 'garden.2.4.value.time.minute', 'garden.2.4.value.time.second', 'garden.2.4.value._pad', '_unk17b1a', '_unk17b1b', 'fishing_record_states.Sardine', 'fishing_record_states.Blowfish', 'fishing_record_states.Bream', 'fishing_record_states.Shark', 'fishing_record_states.Blue Marlin', 'fishing_record_states.Dunkleosteus', 'fishing_record_states.Carp', 'fishing_record_states.Rainbow Trout', 'fishing_record_states.Black Bass', 'fishing_record_states.Giant Catfish', 'fishing_record_states.Royal Fish', 'fishing_record_states.Hyneria', 'fishing_record_states.Sandfish', 'fishing_record_states.Rhizodont', 'fishing_record_states.Shaman Fish', '_unk17b2a', '_unk17b2b'))
+_SAVEFILE_RUN_16 = Struct('<96s136s8s240s40s68s4s616s32s86sHBBBBBB199s32771sI12s')
+_SAVEFILE_KEYS_16 = ('_unk18a1a', '_unk18a1b', '_unk18a1c', '_unk18a2', '_unk18a3', '_unk18a4a', '_unk18a4b', '_unk18a4c', '_unk18a4d', '_unk18a5', 'save_time.year', 'save_time.month', 'save_time.day', 'save_time.hour', 'save_time.minute', 'save_time.second', '_unk18b0', '_unk18b1', '_unk18b2', 'checksum', '_end')
+_SAVEFILE_GET_16 = itemgetter(*('_unk18a1a', '_unk18a1b', '_unk18a1c', '_unk18a2', '_unk18a3', '_unk18a4a', '_unk18a4b', '_unk18a4c', '_unk18a4d', '_unk18a5', 'save_time.year', 'save_time.month', 'save_time.day', 'save_time.hour', 'save_time.minute', 'save_time.second', '_unk18b0', '_unk18b1', '_unk18b2', 'checksum', '_end'))
+
+
+def decode_savefile(data, offset=0):
+    """Decode the 37,472 byte savefile struct that starts at the given offset in data"""
+    out = {}
+    out.update(zip(_SAVEFILE_KEYS_0, _SAVEFILE_RUN_0.unpack_from(data, offset + 0)))
+    n = int.from_bytes(data[offset + 1056:offset + 1061], 'little')
+    out['recovery_viewed_states.Medicinal Herb'] = n & 1 == 1
+    out['recovery_viewed_states.Health Salve'] = n >> 1 & 1 == 1
+    out['recovery_viewed_states.Recovery Potion'] = n >> 2 & 1 == 1
+    out['recovery_viewed_states._unk0'] = _unpack_bits(n >> 3, 18)
+    out['recovery_viewed_states.Strength Drop'] = n >> 21 & 1 == 1
+    out['recovery_viewed_states.Strength Capsule'] = n >> 22 & 1 == 1
+    out['recovery_viewed_states.Magic Drop'] = n >> 23 & 1 == 1
+    out['recovery_viewed_states.Magic Capsule'] = n >> 24 & 1 == 1
+    out['recovery_viewed_states.Defense Drop'] = n >> 25 & 1 == 1
+    out['recovery_viewed_states.Defense Capsule'] = n >> 26 & 1 == 1
+    out['recovery_viewed_states.Spirit Drop'] = n >> 27 & 1 == 1
+    out['recovery_viewed_states.Spirit Capsule'] = n >> 28 & 1 == 1
+    out['recovery_viewed_states._unk1'] = _unpack_bits(n >> 29, 2)
+    out['recovery_viewed_states.Antidotal Weed'] = n >> 31 & 1 == 1
+    out['recovery_viewed_states._unk2'] = _unpack_bits(n >> 32, 1)
+    out['recovery_viewed_states.Smelling Salts'] = n >> 33 & 1 == 1
+    out['recovery_viewed_states._unk3'] = _unpack_bits(n >> 34, 6)
+    n = int.from_bytes(data[offset + 1061:offset + 1068], 'little')
+    out['cultivation_viewed_states._unk0'] = _unpack_bits(n, 1)
+    out['cultivation_viewed_states.Speed Fertilizer'] = n >> 1 & 1 == 1
+    out['cultivation_viewed_states.Flowering Fertilizer'] = n >> 2 & 1 == 1
+    out['cultivation_viewed_states.Bounty Fertilizer'] = n >> 3 & 1 == 1
+    out['cultivation_viewed_states._unk1'] = _unpack_bits(n >> 4, 2)
+    out['cultivation_viewed_states.Pumpkin Seed'] = n >> 6 & 1 == 1
+    out['cultivation_viewed_states.Watermelon Seed'] = n >> 7 & 1 == 1
+    out['cultivation_viewed_states.Melon Seed'] = n >> 8 & 1 == 1
+    out['cultivation_viewed_states.Gourd Seed'] = n >> 9 & 1 == 1
+    out['cultivation_viewed_states.Tomato Seed'] = n >> 10 & 1 == 1
+    out['cultivation_viewed_states.Eggplant Seed'] = n >> 11 & 1 == 1
+    out['cultivation_viewed_states.Bell Pepper Seed'] = n >> 12 & 1 == 1
+    out['cultivation_viewed_states.Bean Seed'] = n >> 13 & 1 == 1
+    out['cultivation_viewed_states.Wheat Seedling'] = n >> 14 & 1 == 1
+    out['cultivation_viewed_states.Rice Plant Seedling'] = n >> 15 & 1 == 1
+    out['cultivation_viewed_states.Dahlia Bulb'] = n >> 16 & 1 == 1
+    out['cultivation_viewed_states.Tulip Bulb'] = n >> 17 & 1 == 1
+    out['cultivation_viewed_states.Freesia Bulb'] = n >> 18 & 1 == 1
+    out['cultivation_viewed_states.Red Moonflower Seed'] = n >> 19 & 1 == 1
+    out['cultivation_viewed_states.Gold Moonflower Seed'] = n >> 20 & 1 == 1
+    out['cultivation_viewed_states.Peach Moonflower Seed'] = n >> 21 & 1 == 1
+    out['cultivation_viewed_states.Pink Moonflower Seed'] = n >> 22 & 1 == 1
+    out['cultivation_viewed_states.Blue Moonflower Seed'] = n >> 23 & 1 == 1
+    out['cultivation_viewed_states.Indigo Moonflower Seed'] = n >> 24 & 1 == 1
+    out['cultivation_viewed_states.White Moonflower Seed'] = n >> 25 & 1 == 1
+    out['cultivation_viewed_states._unk2'] = _unpack_bits(n >> 26, 5)
+    out['cultivation_viewed_states.Pumpkin'] = n >> 31 & 1 == 1
+    out['cultivation_viewed_states.Watermelon'] = n >> 32 & 1 == 1
+    out['cultivation_viewed_states.Melon'] = n >> 33 & 1 == 1
+    out['cultivation_viewed_states.Gourd'] = n >> 34 & 1 == 1
+    out['cultivation_viewed_states.Tomato'] = n >> 35 & 1 == 1
+    out['cultivation_viewed_states.Eggplant'] = n >> 36 & 1 == 1
+    out['cultivation_viewed_states.Bell Pepper'] = n >> 37 & 1 == 1
+    out['cultivation_viewed_states.Beans'] = n >> 38 & 1 == 1
+    out['cultivation_viewed_states.Wheat'] = n >> 39 & 1 == 1
+    out['cultivation_viewed_states.Rice'] = n >> 40 & 1 == 1
+    out['cultivation_viewed_states.Dahlia'] = n >> 41 & 1 == 1
+    out['cultivation_viewed_states.Tulip'] = n >> 42 & 1 == 1
+    out['cultivation_viewed_states.Freesia'] = n >> 43 & 1 == 1
+    out['cultivation_viewed_states.Red Moonflower'] = n >> 44 & 1 == 1
+    out['cultivation_viewed_states.Gold Moonflower'] = n >> 45 & 1 == 1
+    out['cultivation_viewed_states.Peach Moonflower'] = n >> 46 & 1 == 1
+    out['cultivation_viewed_states.Pink Moonflower'] = n >> 47 & 1 == 1
+    out['cultivation_viewed_states.Blue Moonflower'] = n >> 48 & 1 == 1
+    out['cultivation_viewed_states.Indigo Moonflower'] = n >> 49 & 1 == 1
+    out['cultivation_viewed_states.White Moonflower'] = n >> 50 & 1 == 1
+    out['cultivation_viewed_states._unk3'] = _unpack_bits(n >> 51, 5)
+    n = int.from_bytes(data[offset + 1068:offset + 1072], 'little')
+    out['fishing_viewed_states._unk0'] = _unpack_bits(n, 5)
+    out['fishing_viewed_states.Lugworm'] = n >> 5 & 1 == 1
+    out['fishing_viewed_states.Earthworm'] = n >> 6 & 1 == 1
+    out['fishing_viewed_states.Lure'] = n >> 7 & 1 == 1
+    out['fishing_viewed_states._unk1'] = _unpack_bits(n >> 8, 7)
+    out['fishing_viewed_states.Sardine'] = n >> 15 & 1 == 1
+    out['fishing_viewed_states.Carp'] = n >> 16 & 1 == 1
+    out['fishing_viewed_states.Blowfish'] = n >> 17 & 1 == 1
+    out['fishing_viewed_states.Bream'] = n >> 18 & 1 == 1
+    out['fishing_viewed_states.Shark'] = n >> 19 & 1 == 1
+    out['fishing_viewed_states.Blue Marlin'] = n >> 20 & 1 == 1
+    out['fishing_viewed_states.Dunkleosteus'] = n >> 21 & 1 == 1
+    out['fishing_viewed_states.Rainbow Trout'] = n >> 22 & 1 == 1
+    out['fishing_viewed_states.Black Bass'] = n >> 23 & 1 == 1
+    out['fishing_viewed_states.Giant Catfish'] = n >> 24 & 1 == 1
+    out['fishing_viewed_states.Royal Fish'] = n >> 25 & 1 == 1
+    out['fishing_viewed_states.Hyneria'] = n >> 26 & 1 == 1
+    out['fishing_viewed_states.Sandfish'] = n >> 27 & 1 == 1
+    out['fishing_viewed_states.Rhizodont'] = n >> 28 & 1 == 1
+    out['fishing_viewed_states.Shaman Fish'] = n >> 29 & 1 == 1
+    out['fishing_viewed_states._unk2'] = _unpack_bits(n >> 30, 2)
+    n = int.from_bytes(data[offset + 1072:offset + 1088], 'little')
+    out['raw_materials_viewed_states._unk0'] = _unpack_bits(n, 3)
+    out['raw_materials_viewed_states.Aquatic Plant'] = n >> 3 & 1 == 1
+    out['raw_materials_viewed_states.Deadwood'] = n >> 4 & 1 == 1
+    out['raw_materials_viewed_states.Rusty Bucket'] = n >> 5 & 1 == 1
+    out['raw_materials_viewed_states.Empty Can'] = n >> 6 & 1 == 1
+    out['raw_materials_viewed_states._unk1'] = _unpack_bits(n >> 7, 3)
+    out['raw_materials_viewed_states.Gold Ore'] = n >> 10 & 1 == 1
+    out['raw_materials_viewed_states.Silver Ore'] = n >> 11 & 1 == 1
+    out['raw_materials_viewed_states.Copper Ore'] = n >> 12 & 1 == 1
+    out['raw_materials_viewed_states.Iron Ore'] = n >> 13 & 1 == 1
+    out['raw_materials_viewed_states.Crystal'] = n >> 14 & 1 == 1
+    out['raw_materials_viewed_states.Pyrite'] = n >> 15 & 1 == 1
+    out['raw_materials_viewed_states.Moldavite'] = n >> 16 & 1 == 1
+    out['raw_materials_viewed_states.Meteorite'] = n >> 17 & 1 == 1
+    out['raw_materials_viewed_states.Amber'] = n >> 18 & 1 == 1
+    out['raw_materials_viewed_states.Fluorite'] = n >> 19 & 1 == 1
+    out['raw_materials_viewed_states.Clay'] = n >> 20 & 1 == 1
+    out['raw_materials_viewed_states._unk2'] = _unpack_bits(n >> 21, 4)
+    out['raw_materials_viewed_states.Berries'] = n >> 25 & 1 == 1
+    out['raw_materials_viewed_states.Royal Fern'] = n >> 26 & 1 == 1
+    out['raw_materials_viewed_states.Tree Branch'] = n >> 27 & 1 == 1
+    out['raw_materials_viewed_states.Log'] = n >> 28 & 1 == 1
+    out['raw_materials_viewed_states.Natural Rubber'] = n >> 29 & 1 == 1
+    out['raw_materials_viewed_states.Ivy'] = n >> 30 & 1 == 1
+    out['raw_materials_viewed_states.Lichen'] = n >> 31 & 1 == 1
+    out['raw_materials_viewed_states.Mushroom'] = n >> 32 & 1 == 1
+    out['raw_materials_viewed_states.Sap'] = n >> 33 & 1 == 1
+    out['raw_materials_viewed_states._unk3'] = _unpack_bits(n >> 34, 5)
+    out['raw_materials_viewed_states.Mutton'] = n >> 39 & 1 == 1
+    out['raw_materials_viewed_states.Boar Meat'] = n >> 40 & 1 == 1
+    out['raw_materials_viewed_states.Wool'] = n >> 41 & 1 == 1
+    out['raw_materials_viewed_states.Boar Hide'] = n >> 42 & 1 == 1
+    out['raw_materials_viewed_states.Wolf Hide'] = n >> 43 & 1 == 1
+    out['raw_materials_viewed_states.Wolf Fang'] = n >> 44 & 1 == 1
+    out['raw_materials_viewed_states.Giant Spider Silk'] = n >> 45 & 1 == 1
+    out['raw_materials_viewed_states.Bat Fang'] = n >> 46 & 1 == 1
+    out['raw_materials_viewed_states.Bat Wing'] = n >> 47 & 1 == 1
+    out['raw_materials_viewed_states.Goat Meat'] = n >> 48 & 1 == 1
+    out['raw_materials_viewed_states.Goat Hide'] = n >> 49 & 1 == 1
+    out['raw_materials_viewed_states.Venison'] = n >> 50 & 1 == 1
+    out['raw_materials_viewed_states.Rainbow Spider Silk'] = n >> 51 & 1 == 1
+    out['raw_materials_viewed_states.Boar Liver'] = n >> 52 & 1 == 1
+    out['raw_materials_viewed_states.Scorpion Claw'] = n >> 53 & 1 == 1
+    out['raw_materials_viewed_states.Scorpion Tail'] = n >> 54 & 1 == 1
+    out['raw_materials_viewed_states.Dented Metal Board'] = n >> 55 & 1 == 1
+    out['raw_materials_viewed_states.Stripped Bolt'] = n >> 56 & 1 == 1
+    out['raw_materials_viewed_states.Broken Lens'] = n >> 57 & 1 == 1
+    out['raw_materials_viewed_states.Severed Cable'] = n >> 58 & 1 == 1
+    out['raw_materials_viewed_states.Broken Arm'] = n >> 59 & 1 == 1
+    out['raw_materials_viewed_states.Broken Antenna'] = n >> 60 & 1 == 1
+    out['raw_materials_viewed_states.Broken Motor'] = n >> 61 & 1 == 1
+    out['raw_materials_viewed_states.Broken Battery'] = n >> 62 & 1 == 1
+    out['raw_materials_viewed_states.Mysterious Switch'] = n >> 63 & 1 == 1
+    out['raw_materials_viewed_states.Large Gear'] = n >> 64 & 1 == 1
+    out['raw_materials_viewed_states.Titanium Alloy'] = n >> 65 & 1 == 1
+    out['raw_materials_viewed_states.Memory Alloy'] = n >> 66 & 1 == 1
+    out['raw_materials_viewed_states.Rusted Clump'] = n >> 67 & 1 == 1
+    out['raw_materials_viewed_states.Machine Oil'] = n >> 68 & 1 == 1
+    out['raw_materials_viewed_states._unk4'] = _unpack_bits(n >> 69, 4)
+    out['raw_materials_viewed_states.Forlorn Necklace'] = n >> 73 & 1 == 1
+    out['raw_materials_viewed_states.Twisted Ring'] = n >> 74 & 1 == 1
+    out['raw_materials_viewed_states.Broken Earring'] = n >> 75 & 1 == 1
+    out['raw_materials_viewed_states.Pretty Choker'] = n >> 76 & 1 == 1
+    out['raw_materials_viewed_states.Metal Piercing'] = n >> 77 & 1 == 1
+    out['raw_materials_viewed_states.Subdued Bracelet'] = n >> 78 & 1 == 1
+    out['raw_materials_viewed_states.Technical Guide'] = n >> 79 & 1 == 1
+    out['raw_materials_viewed_states.Grubby Book'] = n >> 80 & 1 == 1
+    out['raw_materials_viewed_states.Thick Dictionary'] = n >> 81 & 1 == 1
+    out['raw_materials_viewed_states.Closed Book'] = n >> 82 & 1 == 1
+    out['raw_materials_viewed_states.Used Coloring Book'] = n >> 83 & 1 == 1
+    out['raw_materials_viewed_states.Old Schoolbook'] = n >> 84 & 1 == 1
+    out['raw_materials_viewed_states.Dirty Bag'] = n >> 85 & 1 == 1
+    out['raw_materials_viewed_states.Flashy Hat'] = n >> 86 & 1 == 1
+    out['raw_materials_viewed_states.Leather Gloves'] = n >> 87 & 1 == 1
+    out['raw_materials_viewed_states.Silk Handkerchief'] = n >> 88 & 1 == 1
+    out['raw_materials_viewed_states.Leather Boots'] = n >> 89 & 1 == 1
+    out['raw_materials_viewed_states.Complex Machine'] = n >> 90 & 1 == 1
+    out['raw_materials_viewed_states.Elaborate Machine'] = n >> 91 & 1 == 1
+    out['raw_materials_viewed_states.Simple Machine'] = n >> 92 & 1 == 1
+    out['raw_materials_viewed_states.Stopped Clock'] = n >> 93 & 1 == 1
+    out['raw_materials_viewed_states.Broken Wristwatch'] = n >> 94 & 1 == 1
+    out['raw_materials_viewed_states.Rusty Kitchen Knife'] = n >> 95 & 1 == 1
+    out['raw_materials_viewed_states.Broken Saw'] = n >> 96 & 1 == 1
+    out['raw_materials_viewed_states.Dented Metal Bat'] = n >> 97 & 1 == 1
+    out['raw_materials_viewed_states._unk5'] = _unpack_bits(n >> 98, 1)
+    out['raw_materials_viewed_states.Shell'] = n >> 99 & 1 == 1
+    out['raw_materials_viewed_states.Gastropod'] = n >> 100 & 1 == 1
+    out['raw_materials_viewed_states.Bivalve'] = n >> 101 & 1 == 1
+    out['raw_materials_viewed_states.Seaweed'] = n >> 102 & 1 == 1
+    out['raw_materials_viewed_states.Empty Bottle'] = n >> 103 & 1 == 1
+    out['raw_materials_viewed_states.Driftwood'] = n >> 104 & 1 == 1
+    out['raw_materials_viewed_states.Pearl'] = n >> 105 & 1 == 1
+    out['raw_materials_viewed_states.Black Pearl'] = n >> 106 & 1 == 1
+    out['raw_materials_viewed_states.Crab'] = n >> 107 & 1 == 1
+    out['raw_materials_viewed_states.Starfish'] = n >> 108 & 1 == 1
+    out['raw_materials_viewed_states._unk6'] = _unpack_bits(n >> 109, 5)
+    out['raw_materials_viewed_states.Sea Turtle Egg'] = n >> 114 & 1 == 1
+    out['raw_materials_viewed_states.Broken Pottery'] = n >> 115 & 1 == 1
+    out['raw_materials_viewed_states.Desert Rose'] = n >> 116 & 1 == 1
+    out['raw_materials_viewed_states.Giant Egg'] = n >> 117 & 1 == 1
+    out['raw_materials_viewed_states.Damascus Steel'] = n >> 118 & 1 == 1
+    out['raw_materials_viewed_states.Eagle Egg'] = n >> 119 & 1 == 1
+    out['raw_materials_viewed_states.Chicken Egg'] = n >> 120 & 1 == 1
+    out['raw_materials_viewed_states._unk7'] = _unpack_bits(n >> 121, 1)
+    out['raw_materials_viewed_states.Mouse Tail'] = n >> 122 & 1 == 1
+    out['raw_materials_viewed_states.Lizard Tail'] = n >> 123 & 1 == 1
+    out['raw_materials_viewed_states._unk8'] = _unpack_bits(n >> 124, 3)
+    out['raw_materials_viewed_states.Deer Antler'] = n >> 127 & 1 == 1
+    n = int.from_bytes(data[offset + 1088:offset + 1098], 'little')
+    out['key_item_viewed_states.Moon Key'] = n & 1 == 1
+    out['key_item_viewed_states.Star Key'] = n >> 1 & 1 == 1
+    out['key_item_viewed_states.Light Key'] = n >> 2 & 1 == 1
+    out['key_item_viewed_states.Darkness Key'] = n >> 3 & 1 == 1
+    out['key_item_viewed_states.Fine Flour'] = n >> 4 & 1 == 1
+    out['key_item_viewed_states.Coarse Flour'] = n >> 5 & 1 == 1
+    out['key_item_viewed_states.Perfume Bottle'] = n >> 6 & 1 == 1
+    out["key_item_viewed_states.Postman's Parcel"] = n >> 7 & 1 == 1
+    out["key_item_viewed_states.Lover's Letter"] = n >> 8 & 1 == 1
+    out['key_item_viewed_states.Water Filter'] = n >> 9 & 1 == 1
+    out['key_item_viewed_states.Royal Compass'] = n >> 10 & 1 == 1
+    out['key_item_viewed_states.Vapor Moss'] = n >> 11 & 1 == 1
+    out['key_item_viewed_states.Valley Spider Silk'] = n >> 12 & 1 == 1
+    out['key_item_viewed_states.Animal Guidebook'] = n >> 13 & 1 == 1
+    out['key_item_viewed_states.Ore Guidebook'] = n >> 14 & 1 == 1
+    out['key_item_viewed_states.Plant Guidebook'] = n >> 15 & 1 == 1
+    out['key_item_viewed_states.Red Book'] = n >> 16 & 1 == 1
+    out['key_item_viewed_states.Blue Book'] = n >> 17 & 1 == 1
+    out["key_item_viewed_states.Old Lady's Elixir"] = n >> 18 & 1 == 1
+    out["key_item_viewed_states.Old Lady's Elixir+"] = n >> 19 & 1 == 1
+    out['key_item_viewed_states.Parcel for The Aerie'] = n >> 20 & 1 == 1
+    out['key_item_viewed_states.Parcel for Seafront'] = n >> 21 & 1 == 1
+    out['key_item_viewed_states.Cookbook'] = n >> 22 & 1 == 1
+    out['key_item_viewed_states.Parcel for Facade'] = n >> 23 & 1 == 1
+    out["key_item_viewed_states.Max's Herbs"] = n >> 24 & 1 == 1
+    out['key_item_viewed_states.Drifting Cargo'] = n >> 25 & 1 == 1
+    out['key_item_viewed_states.Drifting Cargo 2'] = n >> 26 & 1 == 1
+    out['key_item_viewed_states.Drifting Cargo 3'] = n >> 27 & 1 == 1
+    out['key_item_viewed_states.Drifting Cargo 4'] = n >> 28 & 1 == 1
+    out['key_item_viewed_states.Old Package'] = n >> 29 & 1 == 1
+    out['key_item_viewed_states.Mermaid Tear'] = n >> 30 & 1 == 1
+    out['key_item_viewed_states.Mandrake Leaf'] = n >> 31 & 1 == 1
+    out['key_item_viewed_states.Energizer'] = n >> 32 & 1 == 1
+    out['key_item_viewed_states.Toad Oil'] = n >> 33 & 1 == 1
+    out['key_item_viewed_states.Sleep-B-Gone'] = n >> 34 & 1 == 1
+    out['key_item_viewed_states.Antidote'] = n >> 35 & 1 == 1
+    out['key_item_viewed_states.Gold Bracelet'] = n >> 36 & 1 == 1
+    out['key_item_viewed_states.Elite Kitchen Knife'] = n >> 37 & 1 == 1
+    out['key_item_viewed_states.Elevator Parts'] = n >> 38 & 1 == 1
+    out['key_item_viewed_states.Dirty Treasure Map'] = n >> 39 & 1 == 1
+    out['key_item_viewed_states.Restored Treasure Map'] = n >> 40 & 1 == 1
+    out['key_item_viewed_states.Jade Hair Ornament'] = n >> 41 & 1 == 1
+    out['key_item_viewed_states.Employee List'] = n >> 42 & 1 == 1
+    out['key_item_viewed_states.Small Safe'] = n >> 43 & 1 == 1
+    out['key_item_viewed_states.Safe Key'] = n >> 44 & 1 == 1
+    out['key_item_viewed_states.Great Tree Root'] = n >> 45 & 1 == 1
+    out['key_item_viewed_states.Eye of Power'] = n >> 46 & 1 == 1
+    out['key_item_viewed_states.Ribbon'] = n >> 47 & 1 == 1
+    out["key_item_viewed_states.Yonah's Ribbon"] = n >> 48 & 1 == 1
+    out['key_item_viewed_states.Bronze Key'] = n >> 49 & 1 == 1
+    out['key_item_viewed_states.Brass Key'] = n >> 50 & 1 == 1
+    out['key_item_viewed_states.Boar Tusk'] = n >> 51 & 1 == 1
+    out['key_item_viewed_states.Pressed Freesia'] = n >> 52 & 1 == 1
+    out['key_item_viewed_states.Potted Freesia'] = n >> 53 & 1 == 1
+    out['key_item_viewed_states.Freesia (Delivery)'] = n >> 54 & 1 == 1
+    out['key_item_viewed_states.Pile of Junk'] = n >> 55 & 1 == 1
+    out['key_item_viewed_states.Old Gold Coin'] = n >> 56 & 1 == 1
+    out['key_item_viewed_states.Marked Map'] = n >> 57 & 1 == 1
+    out['key_item_viewed_states.AA Keycard'] = n >> 58 & 1 == 1
+    out['key_item_viewed_states.KA Keycard'] = n >> 59 & 1 == 1
+    out['key_item_viewed_states.SA Keycard'] = n >> 60 & 1 == 1
+    out['key_item_viewed_states.TA Keycard'] = n >> 61 & 1 == 1
+    out['key_item_viewed_states.NA Keycard'] = n >> 62 & 1 == 1
+    out['key_item_viewed_states.HA Keycard'] = n >> 63 & 1 == 1
+    out['key_item_viewed_states.MA Keycard'] = n >> 64 & 1 == 1
+    out['key_item_viewed_states.YA Keycard'] = n >> 65 & 1 == 1
+    out['key_item_viewed_states.RA Keycard'] = n >> 66 & 1 == 1
+    out['key_item_viewed_states.WA Keycard'] = n >> 67 & 1 == 1
+    out["key_item_viewed_states.Cultivator's Handbook"] = n >> 68 & 1 == 1
+    out['key_item_viewed_states.Red Bag'] = n >> 69 & 1 == 1
+    out['key_item_viewed_states.Lantern'] = n >> 70 & 1 == 1
+    out['key_item_viewed_states.Empty Lantern'] = n >> 71 & 1 == 1
+    out['key_item_viewed_states.Hold Key'] = n >> 72 & 1 == 1
+    out['key_item_viewed_states.Passageway Key'] = n >> 73 & 1 == 1
+    out['key_item_viewed_states.Goat Key'] = n >> 74 & 1 == 1
+    out['key_item_viewed_states.Lizard Key'] = n >> 75 & 1 == 1
+    out['key_item_viewed_states.Unlocking Procedure Memo'] = n >> 76 & 1 == 1
+    out['key_item_viewed_states.Red Jewel?'] = n >> 77 & 1 == 1
+    out['key_item_viewed_states.Red Flowers'] = n >> 78 & 1 == 1
+    out['key_item_viewed_states.Apples'] = n >> 79 & 1 == 1
+    out.update(zip(_SAVEFILE_KEYS_6, _SAVEFILE_RUN_6.unpack_from(data, offset + 1098)))
+    n = int.from_bytes(data[offset + 1472:offset + 1536], 'little')
+    out['quests._unk_0.0'] = n & 1
+    out['quests._unk_0.1'] = n >> 1 & 1
+    out['quests._unk_0.2'] = n >> 2 & 1
+    out['quests._unk_0.3'] = n >> 3 & 1
+    out['quests._unk_0.4'] = n >> 4 & 1
+    out['quests._unk_0.5'] = n >> 5 & 1
+    out['quests._unk_0.6'] = n >> 6 & 1
+    out['quests._unk_0.7'] = n >> 7 & 1
+    out['quests._unk_0.8'] = n >> 8 & 1
+    out['quests._unk_0.9'] = n >> 9 & 1
+    out['quests._unk_0.10'] = n >> 10 & 1
+    out['quests._unk_0.11'] = n >> 11 & 1
+    out['quests._unk_0.12'] = n >> 12 & 1
+    out['quests._unk_0.13'] = n >> 13 & 1
+    out['quests._unk_0.14'] = n >> 14 & 1
+    out['quests._unk_0.15'] = n >> 15 & 1
+    out['quests._unk_0.16'] = n >> 16 & 1
+    out['quests._unk_0.17'] = n >> 17 & 1
+    out['quests._unk_0.18'] = n >> 18 & 1
+    out['quests._unk_0.19'] = n >> 19 & 1
+    out['quests._unk_0.20'] = n >> 20 & 1
+    out['quests._unk_0.21'] = n >> 21 & 1
+    out['quests._unk_0.22'] = n >> 22 & 1
+    out['quests._unk_0.23'] = n >> 23 & 1
+    out['quests._unk_0.24'] = n >> 24 & 1
+    out['quests._unk_0.25'] = n >> 25 & 1
+    out['quests._unk_0.26'] = n >> 26 & 1
+    out['quests._unk_0.27'] = n >> 27 & 1
+    out['quests.Herbal Remedies.started'] = n >> 28 & 1 == 1
+    out['quests.Herbal Remedies.done'] = n >> 29 & 1 == 1
+    out['quests._unk_1.0'] = n >> 30 & 1
+    out["quests.The Gatekeeper's Errand.started"] = n >> 31 & 1 == 1
+    out["quests.The Gatekeeper's Errand.stages.0"] = n >> 32 & 1
+    out["quests.The Gatekeeper's Errand.done"] = n >> 33 & 1 == 1
+    out['quests._unk_2.0'] = n >> 34 & 1
+    out['quests.The Lost Eggs.started'] = n >> 35 & 1 == 1
+    out['quests.The Lost Eggs.stages.0'] = n >> 36 & 1
+    out['quests.The Lost Eggs.stages.1'] = n >> 37 & 1
+    out['quests.The Lost Eggs.stages.2'] = n >> 38 & 1
+    out['quests.The Lost Eggs.done'] = n >> 39 & 1 == 1
+    out['quests._unk_3.0'] = n >> 40 & 1
+    out['quests.Old-Fashioned Home Cooking.started'] = n >> 41 & 1 == 1
+    out['quests.Old-Fashioned Home Cooking.stages.0'] = n >> 42 & 1
+    out['quests.Old-Fashioned Home Cooking.done'] = n >> 43 & 1 == 1
+    out['quests._unk_4.0'] = n >> 44 & 1
+    out['quests.Shopping List.started'] = n >> 45 & 1 == 1
+    out['quests.Shopping List.stages.0'] = n >> 46 & 1
+    out['quests.Shopping List.done'] = n >> 47 & 1 == 1
+    out['quests._unk_5.0'] = n >> 48 & 1
+    out['quests.Book Smarts.started'] = n >> 49 & 1 == 1
+    out['quests.Book Smarts.stages.0'] = n >> 50 & 1
+    out['quests.Book Smarts.stages.1'] = n >> 51 & 1
+    out['quests.Book Smarts.stages.2'] = n >> 52 & 1
+    out['quests.Book Smarts.done'] = n >> 53 & 1 == 1
+    out['quests._unk_6.0'] = n >> 54 & 1
+    out["quests.The Tavern Keeper's Grandmother.started"] = n >> 55 & 1 == 1
+    out["quests.The Tavern Keeper's Grandmother.stages.0"] = n >> 56 & 1
+    out["quests.The Tavern Keeper's Grandmother.stages.1"] = n >> 57 & 1
+    out["quests.The Tavern Keeper's Grandmother.done"] = n >> 58 & 1 == 1
+    out['quests._unk_7.0'] = n >> 59 & 1
+    out['quests.A Return to Shopping.started'] = n >> 60 & 1 == 1
+    out['quests.A Return to Shopping.stages.0'] = n >> 61 & 1
+    out['quests.A Return to Shopping.done'] = n >> 62 & 1 == 1
+    out['quests._unk_8.0'] = n >> 63 & 1
+    out["quests.Yonah's Cooking.started"] = n >> 64 & 1 == 1
+    out["quests.Yonah's Cooking.done"] = n >> 65 & 1 == 1
+    out['quests._unk_9.0'] = n >> 66 & 1
+    out['quests.Boar Hunt!.started'] = n >> 67 & 1 == 1
+    out['quests.Boar Hunt!.stages.0'] = n >> 68 & 1
+    out['quests.Boar Hunt!.stages.1'] = n >> 69 & 1
+    out['quests.Boar Hunt!.done'] = n >> 70 & 1 == 1
+    out['quests._unk_10.0'] = n >> 71 & 1
+    out['quests.On the Wings of Eagles.started'] = n >> 72 & 1 == 1
+    out['quests.On the Wings of Eagles.stages.0'] = n >> 73 & 1
+    out['quests.On the Wings of Eagles.stages.1'] = n >> 74 & 1
+    out['quests.On the Wings of Eagles.stages.2'] = n >> 75 & 1
+    out['quests.On the Wings of Eagles.done'] = n >> 76 & 1 == 1
+    out['quests._unk_11.0'] = n >> 77 & 1
+    out['quests.Fragile Delivery.started'] = n >> 78 & 1 == 1
+    out['quests.Fragile Delivery.stages.0'] = n >> 79 & 1
+    out['quests.Fragile Delivery.stages.1'] = n >> 80 & 1
+    out['quests.Fragile Delivery.stages.2'] = n >> 81 & 1
+    out['quests.Fragile Delivery.done'] = n >> 82 & 1 == 1
+    out['quests._unk_12.0'] = n >> 83 & 1
+    out['quests.Fragile Delivery 2.started'] = n >> 84 & 1 == 1
+    out['quests.Fragile Delivery 2.stages.0'] = n >> 85 & 1
+    out['quests.Fragile Delivery 2.stages.1'] = n >> 86 & 1
+    out['quests.Fragile Delivery 2.stages.2'] = n >> 87 & 1
+    out['quests.Fragile Delivery 2.done'] = n >> 88 & 1 == 1
+    out['quests._unk_13.0'] = n >> 89 & 1
+    out["quests.The Fisherman's Gambit.started"] = n >> 90 & 1 == 1
+    out["quests.The Fisherman's Gambit.done"] = n >> 91 & 1 == 1
+    out['quests._unk_14.0'] = n >> 92 & 1
+    out["quests.The Fisherman's Gambit, Part 2.started"] = n >> 93 & 1 == 1
+    out["quests.The Fisherman's Gambit, Part 2.done"] = n >> 94 & 1 == 1
+    out['quests._unk_15.0'] = n >> 95 & 1
+    out["quests.The Fisherman's Gambit, Part 3.started"] = n >> 96 & 1 == 1
+    out["quests.The Fisherman's Gambit, Part 3.done"] = n >> 97 & 1 == 1
+    out['quests._unk_16.0'] = n >> 98 & 1
+    out["quests.The Fisherman's Gambit, Part 4.started"] = n >> 99 & 1 == 1
+    out["quests.The Fisherman's Gambit, Part 4.done"] = n >> 100 & 1 == 1
+    out['quests._unk_17.0'] = n >> 101 & 1
+    out["quests.The Fisherman's Gambit, Part 5.started"] = n >> 102 & 1 == 1
+    out["quests.The Fisherman's Gambit, Part 5.done"] = n >> 103 & 1 == 1
+    out['quests._unk_18.0'] = n >> 104 & 1
+    out['quests.The Ballad of the Twins.started'] = n >> 105 & 1 == 1
+    out['quests.The Ballad of the Twins.stages.0'] = n >> 106 & 1
+    out['quests.The Ballad of the Twins.stages.1'] = n >> 107 & 1
+    out['quests.The Ballad of the Twins.stages.2'] = n >> 108 & 1
+    out['quests.The Ballad of the Twins.stages.3'] = n >> 109 & 1
+    out['quests.The Ballad of the Twins.done'] = n >> 110 & 1 == 1
+    out['quests._unk_19.0'] = n >> 111 & 1
+    out['quests.A Dog Astray.started'] = n >> 112 & 1 == 1
+    out['quests.A Dog Astray.stages.0'] = n >> 113 & 1
+    out['quests.A Dog Astray.stages.1'] = n >> 114 & 1
+    out['quests.A Dog Astray.done'] = n >> 115 & 1 == 1
+    out['quests._unk_20.0'] = n >> 116 & 1
+    out['quests.The New Merchant in Town.started'] = n >> 117 & 1 == 1
+    out['quests.The New Merchant in Town.stages.0'] = n >> 118 & 1
+    out['quests.The New Merchant in Town.stages.1'] = n >> 119 & 1
+    out['quests.The New Merchant in Town.stages.2'] = n >> 120 & 1
+    out['quests.The New Merchant in Town.done'] = n >> 121 & 1 == 1
+    out['quests._unk_21.0'] = n >> 122 & 1
+    out['quests._unk_21.1'] = n >> 123 & 1
+    out['quests._unk_21.2'] = n >> 124 & 1
+    out['quests._unk_21.3'] = n >> 125 & 1
+    out['quests._unk_21.4'] = n >> 126 & 1
+    out['quests._unk_21.5'] = n >> 127 & 1
+    out['quests._unk_21.6'] = n >> 128 & 1
+    out['quests._unk_21.7'] = n >> 129 & 1
+    out['quests._unk_21.8'] = n >> 130 & 1
+    out['quests._unk_21.9'] = n >> 131 & 1
+    out["quests.Yonah's Gift.started"] = n >> 132 & 1 == 1
+    out["quests.Yonah's Gift.stages.0"] = n >> 133 & 1
+    out["quests.Yonah's Gift.stages.1"] = n >> 134 & 1
+    out["quests.Yonah's Gift.stages.2"] = n >> 135 & 1
+    out["quests.Yonah's Gift.stages.3"] = n >> 136 & 1
+    out["quests.Yonah's Gift.stages.4"] = n >> 137 & 1
+    out["quests.Yonah's Gift.stages.5"] = n >> 138 & 1
+    out["quests.Yonah's Gift.done"] = n >> 139 & 1 == 1
+    out['quests._unk_22.0'] = n >> 140 & 1
+    out['quests.Letter to a Lover.started'] = n >> 141 & 1 == 1
+    out['quests.Letter to a Lover.stages.0'] = n >> 142 & 1
+    out['quests.Letter to a Lover.stages.1'] = n >> 143 & 1
+    out['quests.Letter to a Lover.done'] = n >> 144 & 1 == 1
+    out['quests._unk_23.0'] = n >> 145 & 1
+    out['quests.A Signature Dish.started'] = n >> 146 & 1 == 1
+    out['quests.A Signature Dish.stages.0'] = n >> 147 & 1
+    out['quests.A Signature Dish.done'] = n >> 148 & 1 == 1
+    out['quests._unk_24.0'] = n >> 149 & 1
+    out['quests.Bon Appetit!.started'] = n >> 150 & 1 == 1
+    out['quests.Bon Appetit!.stages.0'] = n >> 151 & 1
+    out['quests.Bon Appetit!.stages.1'] = n >> 152 & 1
+    out['quests.Bon Appetit!.stages.2'] = n >> 153 & 1
+    out['quests.Bon Appetit!.done'] = n >> 154 & 1 == 1
+    out['quests._unk_25.0'] = n >> 155 & 1
+    out['quests.Fragile Delivery 3.started'] = n >> 156 & 1 == 1
+    out['quests.Fragile Delivery 3.stages.0'] = n >> 157 & 1
+    out['quests.Fragile Delivery 3.stages.1'] = n >> 158 & 1
+    out['quests.Fragile Delivery 3.stages.2'] = n >> 159 & 1
+    out['quests.Fragile Delivery 3.done'] = n >> 160 & 1 == 1
+    out['quests._unk_26.0'] = n >> 161 & 1
+    out['quests.The Tangled Message.started'] = n >> 162 & 1 == 1
+    out['quests.The Tangled Message.stages.0'] = n >> 163 & 1
+    out['quests.The Tangled Message.stages.1'] = n >> 164 & 1
+    out['quests.The Tangled Message.stages.2'] = n >> 165 & 1
+    out['quests.The Tangled Message.stages.3'] = n >> 166 & 1
+    out['quests.The Tangled Message.done'] = n >> 167 & 1 == 1
+    out['quests._unk_27.0'] = n >> 168 & 1
+    out['quests._unk_27.1'] = n >> 169 & 1
+    out['quests._unk_27.2'] = n >> 170 & 1
+    out['quests._unk_27.3'] = n >> 171 & 1
+    out['quests.Item Unknown.started'] = n >> 172 & 1 == 1
+    out['quests.Item Unknown.stages.0'] = n >> 173 & 1
+    out['quests.Item Unknown.done'] = n >> 174 & 1 == 1
+    out['quests._unk_28.0'] = n >> 175 & 1
+    out['quests.The Runaway Son.started'] = n >> 176 & 1 == 1
+    out['quests.The Runaway Son.stages.0'] = n >> 177 & 1
+    out['quests.The Runaway Son.stages.1'] = n >> 178 & 1
+    out['quests.The Runaway Son.stages.2'] = n >> 179 & 1
+    out['quests.The Runaway Son.stages.3'] = n >> 180 & 1
+    out['quests.The Runaway Son.stages.4'] = n >> 181 & 1
+    out['quests.The Runaway Son.stages.5'] = n >> 182 & 1
+    out['quests.The Runaway Son.stages.6'] = n >> 183 & 1
+    out['quests.The Runaway Son.stages.7'] = n >> 184 & 1
+    out['quests.The Runaway Son.stages.8'] = n >> 185 & 1
+    out['quests.The Runaway Son.done'] = n >> 186 & 1 == 1
+    out['quests._unk_29.0'] = n >> 187 & 1
+    out['quests.Apology from a Fool.started'] = n >> 188 & 1 == 1
+    out['quests.Apology from a Fool.stages.0'] = n >> 189 & 1
+    out['quests.Apology from a Fool.stages.1'] = n >> 190 & 1
+    out['quests.Apology from a Fool.stages.2'] = n >> 191 & 1
+    out['quests.Apology from a Fool.done'] = n >> 192 & 1 == 1
+    out['quests._unk_30.0'] = n >> 193 & 1
+    out['quests._unk_30.1'] = n >> 194 & 1
+    out['quests._unk_30.2'] = n >> 195 & 1
+    out['quests._unk_30.3'] = n >> 196 & 1
+    out['quests._unk_30.4'] = n >> 197 & 1
+    out['quests.The Pride of a Lover.started'] = n >> 198 & 1 == 1
+    out['quests.The Pride of a Lover.stages.0'] = n >> 199 & 1
+    out['quests.The Pride of a Lover.done'] = n >> 200 & 1 == 1
+    out['quests._unk_31.0'] = n >> 201 & 1
+    out['quests.The Littlest Hero.started'] = n >> 202 & 1 == 1
+    out['quests.The Littlest Hero.stages.0'] = n >> 203 & 1
+    out['quests.The Littlest Hero.stages.1'] = n >> 204 & 1
+    out['quests.The Littlest Hero.done'] = n >> 205 & 1 == 1
+    out['quests._unk_32.0'] = n >> 206 & 1
+    out['quests.The Missing Girl.started'] = n >> 207 & 1 == 1
+    out['quests.The Missing Girl.stages.0'] = n >> 208 & 1
+    out['quests.The Missing Girl.stages.1'] = n >> 209 & 1
+    out['quests.The Missing Girl.stages.2'] = n >> 210 & 1
+    out['quests.The Missing Girl.done'] = n >> 211 & 1 == 1
+    out['quests._unk_33.0'] = n >> 212 & 1
+    out['quests._unk_33.1'] = n >> 213 & 1
+    out['quests.A Shade Entombed.started'] = n >> 214 & 1 == 1
+    out['quests.A Shade Entombed.stages.0'] = n >> 215 & 1
+    out['quests.A Shade Entombed.stages.1'] = n >> 216 & 1
+    out['quests.A Shade Entombed.done'] = n >> 217 & 1 == 1
+    out['quests._unk_34.0'] = n >> 218 & 1
+    out['quests.The Masterless Lighthouse.started'] = n >> 219 & 1 == 1
+    out['quests.The Masterless Lighthouse.done'] = n >> 220 & 1 == 1
+    out['quests._unk_35.0'] = n >> 221 & 1
+    out['quests.The Scattered Cargo.started'] = n >> 222 & 1 == 1
+    out['quests.The Scattered Cargo.stages.0'] = n >> 223 & 1
+    out['quests.The Scattered Cargo.stages.1'] = n >> 224 & 1
+    out['quests.The Scattered Cargo.stages.2'] = n >> 225 & 1
+    out['quests.The Scattered Cargo.stages.3'] = n >> 226 & 1
+    out['quests.The Scattered Cargo.stages.4'] = n >> 227 & 1
+    out['quests.The Scattered Cargo.stages.5'] = n >> 228 & 1
+    out['quests.The Scattered Cargo.stages.6'] = n >> 229 & 1
+    out['quests.The Scattered Cargo.stages.7'] = n >> 230 & 1
+    out['quests.The Scattered Cargo.stages.8'] = n >> 231 & 1
+    out['quests.The Scattered Cargo.stages.9'] = n >> 232 & 1
+    out['quests.The Scattered Cargo.done'] = n >> 233 & 1 == 1
+    out['quests._unk_36.0'] = n >> 234 & 1
+    out['quests._unk_36.1'] = n >> 235 & 1
+    out['quests.The Strange Fate of the Jewel.started'] = n >> 236 & 1 == 1
+    out['quests.The Strange Fate of the Jewel.stages.0'] = n >> 237 & 1
+    out['quests.The Strange Fate of the Jewel.stages.1'] = n >> 238 & 1
+    out['quests.The Strange Fate of the Jewel.stages.2'] = n >> 239 & 1
+    out['quests.The Strange Fate of the Jewel.stages.3'] = n >> 240 & 1
+    out['quests.The Strange Fate of the Jewel.stages.4'] = n >> 241 & 1
+    out['quests.The Strange Fate of the Jewel.stages.5'] = n >> 242 & 1
+    out['quests.The Strange Fate of the Jewel.stages.6'] = n >> 243 & 1
+    out['quests.The Strange Fate of the Jewel.done'] = n >> 244 & 1 == 1
+    out['quests._unk_37.0'] = n >> 245 & 1
+    out['quests._unk_37.1'] = n >> 246 & 1
+    out['quests._unk_37.2'] = n >> 247 & 1
+    out['quests._unk_37.3'] = n >> 248 & 1
+    out['quests._unk_37.4'] = n >> 249 & 1
+    out['quests._unk_37.5'] = n >> 250 & 1
+    out['quests._unk_37.6'] = n >> 251 & 1
+    out['quests._unk_37.7'] = n >> 252 & 1
+    out['quests._unk_37.8'] = n >> 253 & 1
+    out['quests._unk_37.9'] = n >> 254 & 1
+    out['quests._unk_37.10'] = n >> 255 & 1
+    out['quests._unk_37.11'] = n >> 256 & 1
+    out['quests._unk_37.12'] = n >> 257 & 1
+    out['quests._unk_37.13'] = n >> 258 & 1
+    out['quests._unk_37.14'] = n >> 259 & 1
+    out['quests.Thieves in Training (1).started'] = n >> 260 & 1 == 1
+    out['quests.Thieves in Training (1).stages.0'] = n >> 261 & 1
+    out['quests.Thieves in Training (1).stages.1'] = n >> 262 & 1
+    out['quests.Thieves in Training (1).stages.2'] = n >> 263 & 1
+    out['quests.Thieves in Training (1).stages.3'] = n >> 264 & 1
+    out['quests.Thieves in Training (1).stages.4'] = n >> 265 & 1
+    out['quests.Thieves in Training (1).stages.5'] = n >> 266 & 1
+    out['quests.Thieves in Training (1).stages.6'] = n >> 267 & 1
+    out['quests.Thieves in Training (1).stages.7'] = n >> 268 & 1
+    out['quests.Thieves in Training (1).done'] = n >> 269 & 1 == 1
+    out['quests.Learning a Trade.started'] = n >> 270 & 1 == 1
+    out['quests.Learning a Trade.stages.0'] = n >> 271 & 1
+    out['quests.Learning a Trade.stages.1'] = n >> 272 & 1
+    out['quests.Learning a Trade.stages.2'] = n >> 273 & 1
+    out['quests.Learning a Trade.stages.3'] = n >> 274 & 1
+    out['quests.Learning a Trade.stages.4'] = n >> 275 & 1
+    out['quests.Learning a Trade.stages.5'] = n >> 276 & 1
+    out['quests.Learning a Trade.stages.6'] = n >> 277 & 1
+    out['quests.Learning a Trade.done'] = n >> 278 & 1 == 1
+    out['quests._unk_39.0'] = n >> 279 & 1
+    out['quests._unk_39.1'] = n >> 280 & 1
+    out['quests.A Bridge in Peril.started'] = n >> 281 & 1 == 1
+    out['quests.A Bridge in Peril.stages.0'] = n >> 282 & 1
+    out['quests.A Bridge in Peril.stages.1'] = n >> 283 & 1
+    out['quests.A Bridge in Peril.done'] = n >> 284 & 1 == 1
+    out['quests._unk_40.0'] = n >> 285 & 1
+    out['quests.Master of the Southern Plains.started'] = n >> 286 & 1 == 1
+    out['quests.Master of the Southern Plains.stages.0'] = n >> 287 & 1
+    out['quests.Master of the Southern Plains.stages.1'] = n >> 288 & 1
+    out['quests.Master of the Southern Plains.done'] = n >> 289 & 1 == 1
+    out['quests._unk_41.0'] = n >> 290 & 1
+    out["quests.The Fisherman's Gambit, Part 6.started"] = n >> 291 & 1 == 1
+    out["quests.The Fisherman's Gambit, Part 6.done"] = n >> 292 & 1 == 1
+    out['quests._unk_42.0'] = n >> 293 & 1
+    out["quests.The Fisherman's Gambit, Part 7.started"] = n >> 294 & 1 == 1
+    out["quests.The Fisherman's Gambit, Part 7.done"] = n >> 295 & 1 == 1
+    out['quests._unk_43.0'] = n >> 296 & 1
+    out["quests.The Fisherman's Gambit, Part 8.started"] = n >> 297 & 1 == 1
+    out["quests.The Fisherman's Gambit, Part 8.done"] = n >> 298 & 1 == 1
+    out['quests._unk_44.0'] = n >> 299 & 1
+    out["quests.The Fisherman's Final Gambit.started"] = n >> 300 & 1 == 1
+    out["quests.The Fisherman's Final Gambit.done"] = n >> 301 & 1 == 1
+    out['quests._unk_45.0'] = n >> 302 & 1
+    out['quests.Staying Afloat.started'] = n >> 303 & 1 == 1
+    out['quests.Staying Afloat.stages.0'] = n >> 304 & 1
+    out['quests.Staying Afloat.done'] = n >> 305 & 1 == 1
+    out['quests._unk_46.0'] = n >> 306 & 1
+    out['quests.Contract for a Contractor.started'] = n >> 307 & 1 == 1
+    out['quests.Contract for a Contractor.stages.0'] = n >> 308 & 1
+    out['quests.Contract for a Contractor.done'] = n >> 309 & 1 == 1
+    out['quests._unk_47.0'] = n >> 310 & 1
+    out['quests.The Creaky Waterwheel.started'] = n >> 311 & 1 == 1
+    out['quests.The Creaky Waterwheel.stages.0'] = n >> 312 & 1
+    out['quests.The Creaky Waterwheel.stages.1'] = n >> 313 & 1
+    out['quests.The Creaky Waterwheel.stages.2'] = n >> 314 & 1
+    out['quests.The Creaky Waterwheel.done'] = n >> 315 & 1 == 1
+    out['quests._unk_48.0'] = n >> 316 & 1
+    out['quests.The Faded Fountain.started'] = n >> 317 & 1 == 1
+    out['quests.The Faded Fountain.stages.0'] = n >> 318 & 1
+    out['quests.The Faded Fountain.stages.1'] = n >> 319 & 1
+    out['quests.The Faded Fountain.stages.2'] = n >> 320 & 1
+    out['quests.The Faded Fountain.done'] = n >> 321 & 1 == 1
+    out['quests._unk_49.0'] = n >> 322 & 1
+    out['quests.Bon Appetit! 2.started'] = n >> 323 & 1 == 1
+    out['quests.Bon Appetit! 2.stages.0'] = n >> 324 & 1
+    out['quests.Bon Appetit! 2.done'] = n >> 325 & 1 == 1
+    out['quests._unk_50.0'] = n >> 326 & 1
+    out['quests.Life in the Sands.started'] = n >> 327 & 1 == 1
+    out['quests.Life in the Sands.stages.0'] = n >> 328 & 1
+    out['quests.Life in the Sands.done'] = n >> 329 & 1 == 1
+    out['quests._unk_51.0'] = n >> 330 & 1
+    out["quests.The King's Mask.started"] = n >> 331 & 1 == 1
+    out["quests.The King's Mask.stages.0"] = n >> 332 & 1
+    out["quests.The King's Mask.done"] = n >> 333 & 1 == 1
+    out["quests.A Child's Final Chance.started"] = n >> 334 & 1 == 1
+    out["quests.A Child's Final Chance.stages.0"] = n >> 335 & 1
+    out["quests.A Child's Final Chance.stages.1"] = n >> 336 & 1
+    out["quests.A Child's Final Chance.stages.2"] = n >> 337 & 1
+    out["quests.A Child's Final Chance.stages.3"] = n >> 338 & 1
+    out["quests.A Child's Final Chance.stages.4"] = n >> 339 & 1
+    out["quests.A Child's Final Chance.stages.5"] = n >> 340 & 1
+    out["quests.A Child's Final Chance.stages.6"] = n >> 341 & 1
+    out["quests.A Child's Final Chance.stages.7"] = n >> 342 & 1
+    out["quests.A Child's Final Chance.done"] = n >> 343 & 1 == 1
+    out['quests._unk_53.0'] = n >> 344 & 1
+    out['quests.The Damaged Map.started'] = n >> 345 & 1 == 1
+    out['quests.The Damaged Map.stages.0'] = n >> 346 & 1
+    out['quests.The Damaged Map.stages.1'] = n >> 347 & 1
+    out['quests.The Damaged Map.stages.2'] = n >> 348 & 1
+    out['quests.The Damaged Map.stages.3'] = n >> 349 & 1
+    out['quests.The Damaged Map.stages.4'] = n >> 350 & 1
+    out['quests.The Damaged Map.stages.5'] = n >> 351 & 1
+    out['quests.The Damaged Map.stages.6'] = n >> 352 & 1
+    out['quests.The Damaged Map.stages.7'] = n >> 353 & 1
+    out['quests.The Damaged Map.stages.8'] = n >> 354 & 1
+    out['quests.The Damaged Map.stages.9'] = n >> 355 & 1
+    out['quests.The Damaged Map.stages.10'] = n >> 356 & 1
+    out['quests.The Damaged Map.stages.11'] = n >> 357 & 1
+    out['quests.The Damaged Map.done'] = n >> 358 & 1 == 1
+    out['quests._unk_54.0'] = n >> 359 & 1
+    out['quests.Research Project.started'] = n >> 360 & 1 == 1
+    out['quests.Research Project.stages.0'] = n >> 361 & 1
+    out['quests.Research Project.stages.1'] = n >> 362 & 1
+    out['quests.Research Project.stages.2'] = n >> 363 & 1
+    out['quests.Research Project.stages.3'] = n >> 364 & 1
+    out['quests.Research Project.done'] = n >> 365 & 1 == 1
+    out['quests._unk_55.0'] = n >> 366 & 1
+    out['quests.A Tale of the Study.started'] = n >> 367 & 1 == 1
+    out['quests.A Tale of the Study.stages.0'] = n >> 368 & 1
+    out['quests.A Tale of the Study.stages.1'] = n >> 369 & 1
+    out['quests.A Tale of the Study.done'] = n >> 370 & 1 == 1
+    out['quests._unk_56.0'] = n >> 371 & 1
+    out['quests.The Great Tree.started'] = n >> 372 & 1 == 1
+    out['quests.The Great Tree.stages.0'] = n >> 373 & 1
+    out['quests.The Great Tree.stages.1'] = n >> 374 & 1
+    out['quests.The Great Tree.done'] = n >> 375 & 1 == 1
+    out['quests._unk_57.0'] = n >> 376 & 1
+    out['quests.The Despicable Man.started'] = n >> 377 & 1 == 1
+    out['quests.The Despicable Man.stages.0'] = n >> 378 & 1
+    out['quests.The Despicable Man.stages.1'] = n >> 379 & 1
+    out['quests.The Despicable Man.stages.2'] = n >> 380 & 1
+    out['quests.The Despicable Man.stages.3'] = n >> 381 & 1
+    out['quests.The Despicable Man.stages.4'] = n >> 382 & 1
+    out['quests.The Despicable Man.done'] = n >> 383 & 1 == 1
+    out['quests._unk_58.0'] = n >> 384 & 1
+    out['quests.A Memorable Knife.started'] = n >> 385 & 1 == 1
+    out['quests.A Memorable Knife.stages.0'] = n >> 386 & 1
+    out['quests.A Memorable Knife.stages.1'] = n >> 387 & 1
+    out['quests.A Memorable Knife.done'] = n >> 388 & 1 == 1
+    out['quests._unk_59.0'] = n >> 389 & 1
+    out['quests._unk_59.1'] = n >> 390 & 1
+    out['quests.The Shade Army.started'] = n >> 391 & 1 == 1
+    out['quests.The Shade Army.stages.0'] = n >> 392 & 1
+    out['quests.The Shade Army.stages.1'] = n >> 393 & 1
+    out['quests.The Shade Army.stages.2'] = n >> 394 & 1
+    out['quests.The Shade Army.stages.3'] = n >> 395 & 1
+    out['quests.The Shade Army.stages.4'] = n >> 396 & 1
+    out['quests.The Shade Army.done'] = n >> 397 & 1 == 1
+    out['quests._unk_60.0'] = n >> 398 & 1
+    out['quests.A City Reborn.started'] = n >> 399 & 1 == 1
+    out['quests.A City Reborn.done'] = n >> 400 & 1 == 1
+    out['quests._unk_61.0'] = n >> 401 & 1
+    out['quests.Nightmares and Dust.started'] = n >> 402 & 1 == 1
+    out['quests.Nightmares and Dust.stages.0'] = n >> 403 & 1
+    out['quests.Nightmares and Dust.stages.1'] = n >> 404 & 1
+    out['quests.Nightmares and Dust.done'] = n >> 405 & 1 == 1
+    out['quests._unk_62.0'] = n >> 406 & 1
+    out['quests.Disturbing the Sleep of Kings.started'] = n >> 407 & 1 == 1
+    out['quests.Disturbing the Sleep of Kings.stages.0'] = n >> 408 & 1
+    out['quests.Disturbing the Sleep of Kings.stages.1'] = n >> 409 & 1
+    out['quests.Disturbing the Sleep of Kings.done'] = n >> 410 & 1 == 1
+    out['quests._unk_63.0'] = n >> 411 & 1
+    out['quests.Shadows of the Desert.started'] = n >> 412 & 1 == 1
+    out['quests.Shadows of the Desert.stages.0'] = n >> 413 & 1
+    out['quests.Shadows of the Desert.stages.1'] = n >> 414 & 1
+    out['quests.Shadows of the Desert.stages.2'] = n >> 415 & 1
+    out['quests.Shadows of the Desert.done'] = n >> 416 & 1 == 1
+    out['quests._unk_64.0'] = n >> 417 & 1
+    out['quests.Search for the Shade.started'] = n >> 418 & 1 == 1
+    out['quests.Search for the Shade.stages.0'] = n >> 419 & 1
+    out['quests.Search for the Shade.stages.1'] = n >> 420 & 1
+    out['quests.Search for the Shade.stages.2'] = n >> 421 & 1
+    out['quests.Search for the Shade.stages.3'] = n >> 422 & 1
+    out['quests.Search for the Shade.stages.4'] = n >> 423 & 1
+    out['quests.Search for the Shade.stages.5'] = n >> 424 & 1
+    out['quests.Search for the Shade.stages.6'] = n >> 425 & 1
+    out['quests.Search for the Shade.stages.7'] = n >> 426 & 1
+    out['quests.Search for the Shade.done'] = n >> 427 & 1 == 1
+    out['quests._unk_65.0'] = n >> 428 & 1
+    out['quests.Freesia.started'] = n >> 429 & 1 == 1
+    out['quests.Freesia.stages.0'] = n >> 430 & 1
+    out['quests.Freesia.stages.1'] = n >> 431 & 1
+    out['quests.Freesia.stages.2'] = n >> 432 & 1
+    out['quests.Freesia.done'] = n >> 433 & 1 == 1
+    out['quests._unk_66.0'] = n >> 434 & 1
+    out['quests._unk_66.1'] = n >> 435 & 1
+    out['quests.The Magical Stone.started'] = n >> 436 & 1 == 1
+    out['quests.The Magical Stone.stages.0'] = n >> 437 & 1
+    out['quests.The Magical Stone.stages.1'] = n >> 438 & 1
+    out['quests.The Magical Stone.stages.2'] = n >> 439 & 1
+    out['quests.The Magical Stone.stages.3'] = n >> 440 & 1
+    out['quests.The Magical Stone.done'] = n >> 441 & 1 == 1
+    out['quests._unk_67.0'] = n >> 442 & 1
+    out['quests._unk_67.1'] = n >> 443 & 1
+    out['quests._unk_67.2'] = n >> 444 & 1
+    out['quests._unk_67.3'] = n >> 445 & 1
+    out['quests._unk_67.4'] = n >> 446 & 1
+    out['quests._unk_67.5'] = n >> 447 & 1
+    out['quests._unk_67.6'] = n >> 448 & 1
+    out['quests._unk_67.7'] = n >> 449 & 1
+    out['quests._unk_67.8'] = n >> 450 & 1
+    out['quests._unk_67.9'] = n >> 451 & 1
+    out['quests._unk_67.10'] = n >> 452 & 1
+    out['quests._unk_67.11'] = n >> 453 & 1
+    out['quests._unk_67.12'] = n >> 454 & 1
+    out['quests._unk_67.13'] = n >> 455 & 1
+    out['quests._unk_67.14'] = n >> 456 & 1
+    out['quests._unk_67.15'] = n >> 457 & 1
+    out['quests._unk_67.16'] = n >> 458 & 1
+    out['quests._unk_67.17'] = n >> 459 & 1
+    out['quests._unk_67.18'] = n >> 460 & 1
+    out['quests._unk_67.19'] = n >> 461 & 1
+    out['quests._unk_67.20'] = n >> 462 & 1
+    out['quests._unk_67.21'] = n >> 463 & 1
+    out['quests._unk_67.22'] = n >> 464 & 1
+    out['quests._unk_67.23'] = n >> 465 & 1
+    out['quests._unk_67.24'] = n >> 466 & 1
+    out['quests._unk_67.25'] = n >> 467 & 1
+    out['quests._unk_67.26'] = n >> 468 & 1
+    out['quests._unk_67.27'] = n >> 469 & 1
+    out['quests._unk_67.28'] = n >> 470 & 1
+    out['quests._unk_67.29'] = n >> 471 & 1
+    out['quests._unk_67.30'] = n >> 472 & 1
+    out["quests.The Postman's Request.started"] = n >> 473 & 1 == 1
+    out["quests.The Postman's Request.done"] = n >> 474 & 1 == 1
+    out['quests._unk_68.0'] = n >> 475 & 1
+    out['quests._unk_68.1'] = n >> 476 & 1
+    out["quests.The Lighthouse Lady's Wrath.started"] = n >> 477 & 1 == 1
+    out["quests.The Lighthouse Lady's Wrath.stages.0"] = n >> 478 & 1
+    out["quests.The Lighthouse Lady's Wrath.stages.1"] = n >> 479 & 1
+    out["quests.The Lighthouse Lady's Wrath.stages.2"] = n >> 480 & 1
+    out["quests.The Lighthouse Lady's Wrath.stages.3"] = n >> 481 & 1
+    out["quests.The Lighthouse Lady's Wrath.stages.4"] = n >> 482 & 1
+    out["quests.The Lighthouse Lady's Wrath.stages.5"] = n >> 483 & 1
+    out["quests.The Lighthouse Lady's Wrath.stages.6"] = n >> 484 & 1
+    out["quests.The Lighthouse Lady's Wrath.stages.7"] = n >> 485 & 1
+    out["quests.The Lighthouse Lady's Wrath.stages.8"] = n >> 486 & 1
+    out["quests.The Lighthouse Lady's Wrath.done"] = n >> 487 & 1 == 1
+    out['quests._unk_69.0'] = n >> 488 & 1
+    out['quests.Closure.started'] = n >> 489 & 1 == 1
+    out['quests.Closure.done'] = n >> 490 & 1 == 1
+    out['quests._unk_70.0'] = n >> 491 & 1
+    out['quests._unk_70.1'] = n >> 492 & 1
+    out['quests._unk_70.2'] = n >> 493 & 1
+    out['quests._unk_70.3'] = n >> 494 & 1
+    out['quests._unk_70.4'] = n >> 495 & 1
+    out['quests._unk_70.5'] = n >> 496 & 1
+    out['quests._unk_70.6'] = n >> 497 & 1
+    out['quests._unk_70.7'] = n >> 498 & 1
+    out['quests._unk_70.8'] = n >> 499 & 1
+    out['quests._unk_70.9'] = n >> 500 & 1
+    out['quests._unk_70.10'] = n >> 501 & 1
+    out['quests._unk_70.11'] = n >> 502 & 1
+    out['quests._unk_70.12'] = n >> 503 & 1
+    out['quests.Thieves in Training (2).started'] = n >> 504 & 1 == 1
+    out['quests.Thieves in Training (2).done'] = n >> 505 & 1 == 1
+    out['quests._unk_71.0'] = n >> 506 & 1
+    out['quests._unk_71.1'] = n >> 507 & 1
+    out['quests._unk_71.2'] = n >> 508 & 1
+    out['quests._unk_71.3'] = n >> 509 & 1
+    out['quests._unk_71.4'] = n >> 510 & 1
+    out['quests._unk_71.5'] = n >> 511 & 1
+    out.update(zip(_SAVEFILE_KEYS_8, _SAVEFILE_RUN_8.unpack_from(data, offset + 1536)))
+    n = int.from_bytes(data[offset + 1816:offset + 1827], 'little')
+    out['quest_viewed_states._quest_0'] = n & 1 == 1
+    out['quest_viewed_states._quest_1'] = n >> 1 & 1 == 1
+    out['quest_viewed_states._quest_2'] = n >> 2 & 1 == 1
+    out['quest_viewed_states._quest_3'] = n >> 3 & 1 == 1
+    out['quest_viewed_states._quest_4'] = n >> 4 & 1 == 1
+    out['quest_viewed_states.Herbal Remedies'] = n >> 5 & 1 == 1
+    out["quest_viewed_states.The Gatekeeper's Errand"] = n >> 6 & 1 == 1
+    out['quest_viewed_states.The Lost Eggs'] = n >> 7 & 1 == 1
+    out['quest_viewed_states.Old-Fashioned Home Cooking'] = n >> 8 & 1 == 1
+    out['quest_viewed_states.Shopping List'] = n >> 9 & 1 == 1
+    out['quest_viewed_states.Book Smarts'] = n >> 10 & 1 == 1
+    out['quest_viewed_states._quest_11'] = n >> 11 & 1 == 1
+    out['quest_viewed_states._quest_12'] = n >> 12 & 1 == 1
+    out['quest_viewed_states._quest_13'] = n >> 13 & 1 == 1
+    out["quest_viewed_states.Yonah's Cooking"] = n >> 14 & 1 == 1
+    out['quest_viewed_states._quest_15'] = n >> 15 & 1 == 1
+    out['quest_viewed_states._quest_16'] = n >> 16 & 1 == 1
+    out['quest_viewed_states._quest_17'] = n >> 17 & 1 == 1
+    out['quest_viewed_states._quest_18'] = n >> 18 & 1 == 1
+    out['quest_viewed_states._quest_19'] = n >> 19 & 1 == 1
+    out["quest_viewed_states.The Fisherman's Gambit"] = n >> 20 & 1 == 1
+    out["quest_viewed_states.The Fisherman's Gambit, Part 2"] = n >> 21 & 1 == 1
+    out['quest_viewed_states._quest_22'] = n >> 22 & 1 == 1
+    out['quest_viewed_states._quest_23'] = n >> 23 & 1 == 1
+    out['quest_viewed_states._quest_24'] = n >> 24 & 1 == 1
+    out['quest_viewed_states._quest_25'] = n >> 25 & 1 == 1
+    out['quest_viewed_states._quest_26'] = n >> 26 & 1 == 1
+    out['quest_viewed_states._quest_27'] = n >> 27 & 1 == 1
+    out["quest_viewed_states.The Postman's Request"] = n >> 28 & 1 == 1
+    out['quest_viewed_states._quest_29'] = n >> 29 & 1 == 1
+    out['quest_viewed_states.Closure'] = n >> 30 & 1 == 1
+    out['quest_viewed_states._quest_31'] = n >> 31 & 1 == 1
+    out['quest_viewed_states._quest_32'] = n >> 32 & 1 == 1
+    out["quest_viewed_states.Yonah's Gift"] = n >> 33 & 1 == 1
+    out['quest_viewed_states._quest_34'] = n >> 34 & 1 == 1
+    out['quest_viewed_states.A Signature Dish'] = n >> 35 & 1 == 1
+    out['quest_viewed_states._quest_36'] = n >> 36 & 1 == 1
+    out['quest_viewed_states._quest_37'] = n >> 37 & 1 == 1
+    out['quest_viewed_states.The Tangled Message'] = n >> 38 & 1 == 1
+    out['quest_viewed_states.Item Unknown'] = n >> 39 & 1 == 1
+    out['quest_viewed_states._quest_40'] = n >> 40 & 1 == 1
+    out['quest_viewed_states.Apology from a Fool'] = n >> 41 & 1 == 1
+    out['quest_viewed_states.The Pride of a Lover'] = n >> 42 & 1 == 1
+    out['quest_viewed_states._quest_43'] = n >> 43 & 1 == 1
+    out['quest_viewed_states.The Missing Girl'] = n >> 44 & 1 == 1
+    out['quest_viewed_states._quest_45'] = n >> 45 & 1 == 1
+    out['quest_viewed_states._quest_46'] = n >> 46 & 1 == 1
+    out['quest_viewed_states._quest_47'] = n >> 47 & 1 == 1
+    out['quest_viewed_states._quest_48'] = n >> 48 & 1 == 1
+    out['quest_viewed_states.Thieves in Training'] = n >> 49 & 1 == 1
+    out['quest_viewed_states._quest_50'] = n >> 50 & 1 == 1
+    out['quest_viewed_states._quest_51'] = n >> 51 & 1 == 1
+    out['quest_viewed_states._quest_52'] = n >> 52 & 1 == 1
+    out["quest_viewed_states.The Fisherman's Gambit, Part 6"] = n >> 53 & 1 == 1
+    out['quest_viewed_states._quest_54'] = n >> 54 & 1 == 1
+    out['quest_viewed_states._quest_55'] = n >> 55 & 1 == 1
+    out["quest_viewed_states.The Fisherman's Final Gambit"] = n >> 56 & 1 == 1
+    out['quest_viewed_states._quest_57'] = n >> 57 & 1 == 1
+    out['quest_viewed_states._quest_58'] = n >> 58 & 1 == 1
+    out['quest_viewed_states._quest_59'] = n >> 59 & 1 == 1
+    out['quest_viewed_states._quest_60'] = n >> 60 & 1 == 1
+    out['quest_viewed_states.Bon Appetit! 2'] = n >> 61 & 1 == 1
+    out['quest_viewed_states._quest_62'] = n >> 62 & 1 == 1
+    out["quest_viewed_states.The King's Mask"] = n >> 63 & 1 == 1
+    out['quest_viewed_states._quest_64'] = n >> 64 & 1 == 1
+    out['quest_viewed_states._quest_65'] = n >> 65 & 1 == 1
+    out['quest_viewed_states._quest_66'] = n >> 66 & 1 == 1
+    out['quest_viewed_states.Research Project'] = n >> 67 & 1 == 1
+    out['quest_viewed_states.A Tale of the Study'] = n >> 68 & 1 == 1
+    out['quest_viewed_states._quest_69'] = n >> 69 & 1 == 1
+    out['quest_viewed_states._quest_70'] = n >> 70 & 1 == 1
+    out['quest_viewed_states._quest_71'] = n >> 71 & 1 == 1
+    out['quest_viewed_states._quest_72'] = n >> 72 & 1 == 1
+    out['quest_viewed_states._quest_73'] = n >> 73 & 1 == 1
+    out['quest_viewed_states._quest_74'] = n >> 74 & 1 == 1
+    out['quest_viewed_states.Disturbing the Sleep of Kings'] = n >> 75 & 1 == 1
+    out['quest_viewed_states._quest_76'] = n >> 76 & 1 == 1
+    out['quest_viewed_states._quest_77'] = n >> 77 & 1 == 1
+    out['quest_viewed_states._quest_78'] = n >> 78 & 1 == 1
+    out['quest_viewed_states._quest_79'] = n >> 79 & 1 == 1
+    out['quest_viewed_states._quest_80'] = n >> 80 & 1 == 1
+    out['quest_viewed_states._quest_81'] = n >> 81 & 1 == 1
+    out['quest_viewed_states.The Promised Gift'] = n >> 82 & 1 == 1
+    out['quest_viewed_states._quest_83'] = n >> 83 & 1 == 1
+    out['quest_viewed_states._quest_84'] = n >> 84 & 1 == 1
+    out['quest_viewed_states._quest_85'] = n >> 85 & 1 == 1
+    out['quest_viewed_states._quest_86'] = n >> 86 & 1 == 1
+    out['quest_viewed_states._quest_87'] = n >> 87 & 1 == 1
+    out.update(zip(_SAVEFILE_KEYS_10, _SAVEFILE_RUN_10.unpack_from(data, offset + 1827)))
+    n = int.from_bytes(data[offset + 1848:offset + 1864], 'little')
+    out['words.Pah'] = n & 1 == 1
+    out['words.Paha'] = n >> 1 & 1 == 1
+    out['words.Pahi'] = n >> 2 & 1 == 1
+    out['words.Paho'] = n >> 3 & 1 == 1
+    out['words.Pahu'] = n >> 4 & 1 == 1
+    out['words.Pahal'] = n >> 5 & 1 == 1
+    out['words.Pahil'] = n >> 6 & 1 == 1
+    out['words.Pahol'] = n >> 7 & 1 == 1
+    out['words.Pahul'] = n >> 8 & 1 == 1
+    out['words.Pahuloth'] = n >> 9 & 1 == 1
+    out['words.Var'] = n >> 10 & 1 == 1
+    out['words.Vara'] = n >> 11 & 1 == 1
+    out['words.Vari'] = n >> 12 & 1 == 1
+    out['words.Varo'] = n >> 13 & 1 == 1
+    out['words.Varu'] = n >> 14 & 1 == 1
+    out['words.Varal'] = n >> 15 & 1 == 1
+    out['words.Varil'] = n >> 16 & 1 == 1
+    out['words.Varol'] = n >> 17 & 1 == 1
+    out['words.Varul'] = n >> 18 & 1 == 1
+    out['words.Varuloth'] = n >> 19 & 1 == 1
+    out['words.Geb'] = n >> 20 & 1 == 1
+    out['words.Geba'] = n >> 21 & 1 == 1
+    out['words.Gebi'] = n >> 22 & 1 == 1
+    out['words.Gebo'] = n >> 23 & 1 == 1
+    out['words.Gebu'] = n >> 24 & 1 == 1
+    out['words.Gebal'] = n >> 25 & 1 == 1
+    out['words.Gebil'] = n >> 26 & 1 == 1
+    out['words.Gebol'] = n >> 27 & 1 == 1
+    out['words.Gebul'] = n >> 28 & 1 == 1
+    out['words.Gebuloth'] = n >> 29 & 1 == 1
+    out['words.Ul'] = n >> 30 & 1 == 1
+    out['words.Ula'] = n >> 31 & 1 == 1
+    out['words.Uli'] = n >> 32 & 1 == 1
+    out['words.Ulo'] = n >> 33 & 1 == 1
+    out['words.Ulu'] = n >> 34 & 1 == 1
+    out['words.Ulal'] = n >> 35 & 1 == 1
+    out['words.Ulil'] = n >> 36 & 1 == 1
+    out['words.Ulol'] = n >> 37 & 1 == 1
+    out['words.Ulul'] = n >> 38 & 1 == 1
+    out['words.Ululoth'] = n >> 39 & 1 == 1
+    out['words.Hod'] = n >> 40 & 1 == 1
+    out['words.Hoda'] = n >> 41 & 1 == 1
+    out['words.Hodi'] = n >> 42 & 1 == 1
+    out['words.Hodo'] = n >> 43 & 1 == 1
+    out['words.Hodu'] = n >> 44 & 1 == 1
+    out['words.Hodal'] = n >> 45 & 1 == 1
+    out['words.Hodil'] = n >> 46 & 1 == 1
+    out['words.Hodol'] = n >> 47 & 1 == 1
+    out['words.Hodul'] = n >> 48 & 1 == 1
+    out['words.Hoduloth'] = n >> 49 & 1 == 1
+    out['words.Bes'] = n >> 50 & 1 == 1
+    out['words.Besa'] = n >> 51 & 1 == 1
+    out['words.Besi'] = n >> 52 & 1 == 1
+    out['words.Beso'] = n >> 53 & 1 == 1
+    out['words.Besu'] = n >> 54 & 1 == 1
+    out['words.Besal'] = n >> 55 & 1 == 1
+    out['words.Besil'] = n >> 56 & 1 == 1
+    out['words.Besol'] = n >> 57 & 1 == 1
+    out['words.Besul'] = n >> 58 & 1 == 1
+    out['words.Besuloth'] = n >> 59 & 1 == 1
+    out['words._word_60'] = n >> 60 & 1 == 1
+    out['words._word_61'] = n >> 61 & 1 == 1
+    out['words._word_62'] = n >> 62 & 1 == 1
+    out['words._word_63'] = n >> 63 & 1 == 1
+    out['words.Lug'] = n >> 64 & 1 == 1
+    out['words.Lugir'] = n >> 65 & 1 == 1
+    out['words.Luges'] = n >> 66 & 1 == 1
+    out['words.Lugka'] = n >> 67 & 1 == 1
+    out['words.Lugza'] = n >> 68 & 1 == 1
+    out['words.Lugira'] = n >> 69 & 1 == 1
+    out['words.Lugesra'] = n >> 70 & 1 == 1
+    out['words.Lugkarr'] = n >> 71 & 1 == 1
+    out['words.Lugzarr'] = n >> 72 & 1 == 1
+    out['words.Lugzarken'] = n >> 73 & 1 == 1
+    out['words.Ot'] = n >> 74 & 1 == 1
+    out['words.Otir'] = n >> 75 & 1 == 1
+    out['words.Otes'] = n >> 76 & 1 == 1
+    out['words.Otka'] = n >> 77 & 1 == 1
+    out['words.Otza'] = n >> 78 & 1 == 1
+    out['words.Otira'] = n >> 79 & 1 == 1
+    out['words.Otesra'] = n >> 80 & 1 == 1
+    out['words.Otkarr'] = n >> 81 & 1 == 1
+    out['words.Otzarr'] = n >> 82 & 1 == 1
+    out['words.Otzarken'] = n >> 83 & 1 == 1
+    out['words.Mah'] = n >> 84 & 1 == 1
+    out['words.Mahir'] = n >> 85 & 1 == 1
+    out['words.Mahes'] = n >> 86 & 1 == 1
+    out['words.Mahka'] = n >> 87 & 1 == 1
+    out['words.Mahza'] = n >> 88 & 1 == 1
+    out['words.Mahira'] = n >> 89 & 1 == 1
+    out['words.Mahesra'] = n >> 90 & 1 == 1
+    out['words.Mahkarr'] = n >> 91 & 1 == 1
+    out['words.Mahzarr'] = n >> 92 & 1 == 1
+    out['words.Mahzarken'] = n >> 93 & 1 == 1
+    out['words.Ashur'] = n >> 94 & 1 == 1
+    out['words.Ashurir'] = n >> 95 & 1 == 1
+    out['words.Ashures'] = n >> 96 & 1 == 1
+    out['words.Ashurka'] = n >> 97 & 1 == 1
+    out['words.Ashurza'] = n >> 98 & 1 == 1
+    out['words.Ashurira'] = n >> 99 & 1 == 1
+    out['words.Ashuresra'] = n >> 100 & 1 == 1
+    out['words.Ashurkarr'] = n >> 101 & 1 == 1
+    out['words.Ashurzarr'] = n >> 102 & 1 == 1
+    out['words.Ashurzarken'] = n >> 103 & 1 == 1
+    out['words.Kon'] = n >> 104 & 1 == 1
+    out['words.Konir'] = n >> 105 & 1 == 1
+    out['words.Kones'] = n >> 106 & 1 == 1
+    out['words.Konka'] = n >> 107 & 1 == 1
+    out['words.Konza'] = n >> 108 & 1 == 1
+    out['words.Konira'] = n >> 109 & 1 == 1
+    out['words.Konesra'] = n >> 110 & 1 == 1
+    out['words.Konkarr'] = n >> 111 & 1 == 1
+    out['words.Konzarr'] = n >> 112 & 1 == 1
+    out['words.Konzarken'] = n >> 113 & 1 == 1
+    out['words.Sol'] = n >> 114 & 1 == 1
+    out['words.Solir'] = n >> 115 & 1 == 1
+    out['words.Soles'] = n >> 116 & 1 == 1
+    out['words.Solka'] = n >> 117 & 1 == 1
+    out['words.Solza'] = n >> 118 & 1 == 1
+    out['words.Solira'] = n >> 119 & 1 == 1
+    out['words.Solesra'] = n >> 120 & 1 == 1
+    out['words.Solkarr'] = n >> 121 & 1 == 1
+    out['words.Solzarr'] = n >> 122 & 1 == 1
+    out['words.Solzarken'] = n >> 123 & 1 == 1
+    out['words.Ashurfarra'] = n >> 124 & 1 == 1
+    out['words._word_125'] = n >> 125 & 1 == 1
+    out['words._word_126'] = n >> 126 & 1 == 1
+    out['words._word_127'] = n >> 127 & 1 == 1
+    out.update(zip(_SAVEFILE_KEYS_12, _SAVEFILE_RUN_12.unpack_from(data, offset + 1864)))
+    n = int.from_bytes(data[offset + 2032:offset + 2044], 'little')
+    out['tutorials.Controls'] = n & 1 == 1
+    out['tutorials.Combos'] = n >> 1 & 1 == 1
+    out['tutorials.Dark Blast'] = n >> 2 & 1 == 1
+    out['tutorials.Dark Phantasm'] = n >> 3 & 1 == 1
+    out['tutorials.Dark Hand'] = n >> 4 & 1 == 1
+    out['tutorials.Dark Lance'] = n >> 5 & 1 == 1
+    out['tutorials.Dark Whirlwind'] = n >> 6 & 1 == 1
+    out['tutorials.Dark Gluttony'] = n >> 7 & 1 == 1
+    out['tutorials.Dark Wall'] = n >> 8 & 1 == 1
+    out['tutorials.Dark Execution'] = n >> 9 & 1 == 1
+    out['tutorials.Maps'] = n >> 10 & 1 == 1
+    out['tutorials.Interactions'] = n >> 11 & 1 == 1
+    out['tutorials.Attack Gauges'] = n >> 12 & 1 == 1
+    out['tutorials.Saving'] = n >> 13 & 1 == 1
+    out['tutorials.Quests'] = n >> 14 & 1 == 1
+    out['tutorials.Weapon Types'] = n >> 15 & 1 == 1
+    out['tutorials.Cultivating Plants'] = n >> 16 & 1 == 1
+    out['tutorials.Forging Weapons'] = n >> 17 & 1 == 1
+    out['tutorials.Shops'] = n >> 18 & 1 == 1
+    out['tutorials.Mine Carts'] = n >> 19 & 1 == 1
+    out['tutorials.Switching Magic and Abilities'] = n >> 20 & 1 == 1
+    out['tutorials.Fishing'] = n >> 21 & 1 == 1
+    out['tutorials.Viewing Letters'] = n >> 22 & 1 == 1
+    out['tutorials.Changing Weapons'] = n >> 23 & 1 == 1
+    out['tutorials.Moving Boxes'] = n >> 24 & 1 == 1
+    out['tutorials._tutorial_25'] = n >> 25 & 1 == 1
+    out['tutorials.Charging'] = n >> 26 & 1 == 1
+    out['tutorials._tutorial_27'] = n >> 27 & 1 == 1
+    out['tutorials.Skull Cracker'] = n >> 28 & 1 == 1
+    out['tutorials.Deflecting'] = n >> 29 & 1 == 1
+    out['tutorials._tutorial_30'] = n >> 30 & 1 == 1
+    out['tutorials._tutorial_31'] = n >> 31 & 1 == 1
+    out['tutorials._tutorial_32'] = n >> 32 & 1 == 1
+    out['tutorials.Sidestepping'] = n >> 33 & 1 == 1
+    out['tutorials.Sidestep Attacks'] = n >> 34 & 1 == 1
+    out['tutorials.Combo and Magic Charging'] = n >> 35 & 1 == 1
+    out['tutorials.Magic Resistance'] = n >> 36 & 1 == 1
+    out['tutorials.Cancels'] = n >> 37 & 1 == 1
+    out['tutorials._tutorial_38'] = n >> 38 & 1 == 1
+    out['tutorials._tutorial_39'] = n >> 39 & 1 == 1
+    out['tutorials.Guard Breaks'] = n >> 40 & 1 == 1
+    out['tutorials.Heavy Attack Guard Breaks'] = n >> 41 & 1 == 1
+    out['tutorials.Earning Money'] = n >> 42 & 1 == 1
+    out['tutorials.Fishing Tip'] = n >> 43 & 1 == 1
+    out['tutorials.Fishing Tip 2'] = n >> 44 & 1 == 1
+    out['tutorials.Fishing Tip 3'] = n >> 45 & 1 == 1
+    out['tutorials.Fishing Tip 4'] = n >> 46 & 1 == 1
+    out['tutorials.Fishing Tip 5'] = n >> 47 & 1 == 1
+    out['tutorials.Armored Enemies'] = n >> 48 & 1 == 1
+    out['tutorials.Controlling Boars'] = n >> 49 & 1 == 1
+    out['tutorials.Bombs'] = n >> 50 & 1 == 1
+    out['tutorials.Breakable Boxes'] = n >> 51 & 1 == 1
+    out['tutorials.Breakable Barriers'] = n >> 52 & 1 == 1
+    out['tutorials.Gathering Items'] = n >> 53 & 1 == 1
+    out['tutorials.Hidden Items'] = n >> 54 & 1 == 1
+    out['tutorials.Words'] = n >> 55 & 1 == 1
+    out['tutorials.Ordering Allies'] = n >> 56 & 1 == 1
+    out['tutorials.Ordering Animals'] = n >> 57 & 1 == 1
+    out['tutorials.Item and Equipment Shortcuts'] = n >> 58 & 1 == 1
+    out['tutorials.Wall Kicks'] = n >> 59 & 1 == 1
+    out['tutorials.Combo Basics'] = n >> 60 & 1 == 1
+    out['tutorials.Deflecting Enemy Magic'] = n >> 61 & 1 == 1
+    out['tutorials.Fighting Magic Resistant Enemies'] = n >> 62 & 1 == 1
+    out['tutorials.Fighting Wolves'] = n >> 63 & 1 == 1
+    out['tutorials.Stronger Dark Blasts'] = n >> 64 & 1 == 1
+    out['tutorials.Harvests'] = n >> 65 & 1 == 1
+    out['tutorials.Rare Items'] = n >> 66 & 1 == 1
+    out['tutorials._tutorial_67'] = n >> 67 & 1 == 1
+    out['tutorials.Collecting Materials'] = n >> 68 & 1 == 1
+    out['tutorials.Absorbing Blood'] = n >> 69 & 1 == 1
+    out['tutorials.Magical Collisions'] = n >> 70 & 1 == 1
+    out['tutorials.Ending B'] = n >> 71 & 1 == 1
+    out['tutorials.Ending C'] = n >> 72 & 1 == 1
+    out['tutorials.Ending D'] = n >> 73 & 1 == 1
+    out['tutorials.Evading'] = n >> 74 & 1 == 1
+    out['tutorials.Double Jump'] = n >> 75 & 1 == 1
+    out['tutorials._tutorial_76'] = n >> 76 & 1 == 1
+    out['tutorials.Weapon Quick Switching'] = n >> 77 & 1 == 1
+    out['tutorials.Finishing Blow'] = n >> 78 & 1 == 1
+    out['tutorials.Magic or Ability Quick Switching'] = n >> 79 & 1 == 1
+    out['tutorials.Lock On'] = n >> 80 & 1 == 1
+    out['tutorials._tutorial_81'] = n >> 81 & 1 == 1
+    out['tutorials._tutorial_82'] = n >> 82 & 1 == 1
+    out['tutorials.Poison'] = n >> 83 & 1 == 1
+    out['tutorials._tutorial_84'] = n >> 84 & 1 == 1
+    out['tutorials._tutorial_85'] = n >> 85 & 1 == 1
+    out['tutorials._tutorial_86'] = n >> 86 & 1 == 1
+    out['tutorials._tutorial_87'] = n >> 87 & 1 == 1
+    out['tutorials._tutorial_88'] = n >> 88 & 1 == 1
+    out['tutorials._tutorial_89'] = n >> 89 & 1 == 1
+    out['tutorials._tutorial_90'] = n >> 90 & 1 == 1
+    out['tutorials._tutorial_91'] = n >> 91 & 1 == 1
+    out['tutorials._tutorial_92'] = n >> 92 & 1 == 1
+    out['tutorials._tutorial_93'] = n >> 93 & 1 == 1
+    out['tutorials._tutorial_94'] = n >> 94 & 1 == 1
+    out['tutorials._tutorial_95'] = n >> 95 & 1 == 1
+    out.update(zip(_SAVEFILE_KEYS_14, _SAVEFILE_RUN_14.unpack_from(data, offset + 2044)))
+    n = int.from_bytes(data[offset + 3148:offset + 3152], 'little')
+    out['quests_b._unk_0.0'] = n & 1
+    out['quests_b._unk_0.1'] = n >> 1 & 1
+    out['quests_b._unk_0.2'] = n >> 2 & 1
+    out['quests_b.The Promised Gift.started'] = n >> 3 & 1 == 1
+    out['quests_b.The Promised Gift.stages.0'] = n >> 4 & 1
+    out['quests_b.The Promised Gift.stages.1'] = n >> 5 & 1
+    out['quests_b.The Promised Gift.stages.2'] = n >> 6 & 1
+    out['quests_b.The Promised Gift.stages.3'] = n >> 7 & 1
+    out['quests_b.The Promised Gift.stages.4'] = n >> 8 & 1
+    out['quests_b.The Promised Gift.done'] = n >> 9 & 1 == 1
+    out['quests_b._unk_1.0'] = n >> 10 & 1
+    out['quests_b._unk_1.1'] = n >> 11 & 1
+    out['quests_b._unk_1.2'] = n >> 12 & 1
+    out['quests_b._unk_1.3'] = n >> 13 & 1
+    out['quests_b._unk_1.4'] = n >> 14 & 1
+    out['quests_b._unk_1.5'] = n >> 15 & 1
+    out['quests_b._unk_1.6'] = n >> 16 & 1
+    out['quests_b._unk_1.7'] = n >> 17 & 1
+    out['quests_b._unk_1.8'] = n >> 18 & 1
+    out['quests_b._unk_1.9'] = n >> 19 & 1
+    out['quests_b._unk_1.10'] = n >> 20 & 1
+    out['quests_b._unk_1.11'] = n >> 21 & 1
+    out['quests_b._unk_1.12'] = n >> 22 & 1
+    out['quests_b._unk_1.13'] = n >> 23 & 1
+    out['quests_b._unk_1.14'] = n >> 24 & 1
+    out['quests_b._unk_1.15'] = n >> 25 & 1
+    out['quests_b._unk_1.16'] = n >> 26 & 1
+    out['quests_b._unk_1.17'] = n >> 27 & 1
+    out['quests_b._unk_1.18'] = n >> 28 & 1
+    out['quests_b._unk_1.19'] = n >> 29 & 1
+    out['quests_b._unk_1.20'] = n >> 30 & 1
+    out['quests_b._unk_1.21'] = n >> 31 & 1
+    out.update(zip(_SAVEFILE_KEYS_16, _SAVEFILE_RUN_16.unpack_from(data, offset + 3152)))
+    return out
+
+
+def encode_savefile(values):
+    """Encode the given flat dict of savefile values, and re-calculate its checksum"""
+    buf = bytearray(SAVEFILE_SIZE)
+    _SAVEFILE_RUN_0.pack_into(buf, 0, *_SAVEFILE_GET_0(values))
+    buf[1056:1061] = (
+        (values['recovery_viewed_states.Medicinal Herb'] & 1)
+        | (values['recovery_viewed_states.Health Salve'] & 1) << 1
+        | (values['recovery_viewed_states.Recovery Potion'] & 1) << 2
+        | _pack_bits(values['recovery_viewed_states._unk0']) << 3
+        | (values['recovery_viewed_states.Strength Drop'] & 1) << 21
+        | (values['recovery_viewed_states.Strength Capsule'] & 1) << 22
+        | (values['recovery_viewed_states.Magic Drop'] & 1) << 23
+        | (values['recovery_viewed_states.Magic Capsule'] & 1) << 24
+        | (values['recovery_viewed_states.Defense Drop'] & 1) << 25
+        | (values['recovery_viewed_states.Defense Capsule'] & 1) << 26
+        | (values['recovery_viewed_states.Spirit Drop'] & 1) << 27
+        | (values['recovery_viewed_states.Spirit Capsule'] & 1) << 28
+        | _pack_bits(values['recovery_viewed_states._unk1']) << 29
+        | (values['recovery_viewed_states.Antidotal Weed'] & 1) << 31
+        | _pack_bits(values['recovery_viewed_states._unk2']) << 32
+        | (values['recovery_viewed_states.Smelling Salts'] & 1) << 33
+        | _pack_bits(values['recovery_viewed_states._unk3']) << 34
+    ).to_bytes(5, 'little')
+    buf[1061:1068] = (
+        _pack_bits(values['cultivation_viewed_states._unk0'])
+        | (values['cultivation_viewed_states.Speed Fertilizer'] & 1) << 1
+        | (values['cultivation_viewed_states.Flowering Fertilizer'] & 1) << 2
+        | (values['cultivation_viewed_states.Bounty Fertilizer'] & 1) << 3
+        | _pack_bits(values['cultivation_viewed_states._unk1']) << 4
+        | (values['cultivation_viewed_states.Pumpkin Seed'] & 1) << 6
+        | (values['cultivation_viewed_states.Watermelon Seed'] & 1) << 7
+        | (values['cultivation_viewed_states.Melon Seed'] & 1) << 8
+        | (values['cultivation_viewed_states.Gourd Seed'] & 1) << 9
+        | (values['cultivation_viewed_states.Tomato Seed'] & 1) << 10
+        | (values['cultivation_viewed_states.Eggplant Seed'] & 1) << 11
+        | (values['cultivation_viewed_states.Bell Pepper Seed'] & 1) << 12
+        | (values['cultivation_viewed_states.Bean Seed'] & 1) << 13
+        | (values['cultivation_viewed_states.Wheat Seedling'] & 1) << 14
+        | (values['cultivation_viewed_states.Rice Plant Seedling'] & 1) << 15
+        | (values['cultivation_viewed_states.Dahlia Bulb'] & 1) << 16
+        | (values['cultivation_viewed_states.Tulip Bulb'] & 1) << 17
+        | (values['cultivation_viewed_states.Freesia Bulb'] & 1) << 18
+        | (values['cultivation_viewed_states.Red Moonflower Seed'] & 1) << 19
+        | (values['cultivation_viewed_states.Gold Moonflower Seed'] & 1) << 20
+        | (values['cultivation_viewed_states.Peach Moonflower Seed'] & 1) << 21
+        | (values['cultivation_viewed_states.Pink Moonflower Seed'] & 1) << 22
+        | (values['cultivation_viewed_states.Blue Moonflower Seed'] & 1) << 23
+        | (values['cultivation_viewed_states.Indigo Moonflower Seed'] & 1) << 24
+        | (values['cultivation_viewed_states.White Moonflower Seed'] & 1) << 25
+        | _pack_bits(values['cultivation_viewed_states._unk2']) << 26
+        | (values['cultivation_viewed_states.Pumpkin'] & 1) << 31
+        | (values['cultivation_viewed_states.Watermelon'] & 1) << 32
+        | (values['cultivation_viewed_states.Melon'] & 1) << 33
+        | (values['cultivation_viewed_states.Gourd'] & 1) << 34
+        | (values['cultivation_viewed_states.Tomato'] & 1) << 35
+        | (values['cultivation_viewed_states.Eggplant'] & 1) << 36
+        | (values['cultivation_viewed_states.Bell Pepper'] & 1) << 37
+        | (values['cultivation_viewed_states.Beans'] & 1) << 38
+        | (values['cultivation_viewed_states.Wheat'] & 1) << 39
+        | (values['cultivation_viewed_states.Rice'] & 1) << 40
+        | (values['cultivation_viewed_states.Dahlia'] & 1) << 41
+        | (values['cultivation_viewed_states.Tulip'] & 1) << 42
+        | (values['cultivation_viewed_states.Freesia'] & 1) << 43
+        | (values['cultivation_viewed_states.Red Moonflower'] & 1) << 44
+        | (values['cultivation_viewed_states.Gold Moonflower'] & 1) << 45
+        | (values['cultivation_viewed_states.Peach Moonflower'] & 1) << 46
+        | (values['cultivation_viewed_states.Pink Moonflower'] & 1) << 47
+        | (values['cultivation_viewed_states.Blue Moonflower'] & 1) << 48
+        | (values['cultivation_viewed_states.Indigo Moonflower'] & 1) << 49
+        | (values['cultivation_viewed_states.White Moonflower'] & 1) << 50
+        | _pack_bits(values['cultivation_viewed_states._unk3']) << 51
+    ).to_bytes(7, 'little')
+    buf[1068:1072] = (
+        _pack_bits(values['fishing_viewed_states._unk0'])
+        | (values['fishing_viewed_states.Lugworm'] & 1) << 5
+        | (values['fishing_viewed_states.Earthworm'] & 1) << 6
+        | (values['fishing_viewed_states.Lure'] & 1) << 7
+        | _pack_bits(values['fishing_viewed_states._unk1']) << 8
+        | (values['fishing_viewed_states.Sardine'] & 1) << 15
+        | (values['fishing_viewed_states.Carp'] & 1) << 16
+        | (values['fishing_viewed_states.Blowfish'] & 1) << 17
+        | (values['fishing_viewed_states.Bream'] & 1) << 18
+        | (values['fishing_viewed_states.Shark'] & 1) << 19
+        | (values['fishing_viewed_states.Blue Marlin'] & 1) << 20
+        | (values['fishing_viewed_states.Dunkleosteus'] & 1) << 21
+        | (values['fishing_viewed_states.Rainbow Trout'] & 1) << 22
+        | (values['fishing_viewed_states.Black Bass'] & 1) << 23
+        | (values['fishing_viewed_states.Giant Catfish'] & 1) << 24
+        | (values['fishing_viewed_states.Royal Fish'] & 1) << 25
+        | (values['fishing_viewed_states.Hyneria'] & 1) << 26
+        | (values['fishing_viewed_states.Sandfish'] & 1) << 27
+        | (values['fishing_viewed_states.Rhizodont'] & 1) << 28
+        | (values['fishing_viewed_states.Shaman Fish'] & 1) << 29
+        | _pack_bits(values['fishing_viewed_states._unk2']) << 30
+    ).to_bytes(4, 'little')
+    buf[1072:1088] = (
+        _pack_bits(values['raw_materials_viewed_states._unk0'])
+        | (values['raw_materials_viewed_states.Aquatic Plant'] & 1) << 3
+        | (values['raw_materials_viewed_states.Deadwood'] & 1) << 4
+        | (values['raw_materials_viewed_states.Rusty Bucket'] & 1) << 5
+        | (values['raw_materials_viewed_states.Empty Can'] & 1) << 6
+        | _pack_bits(values['raw_materials_viewed_states._unk1']) << 7
+        | (values['raw_materials_viewed_states.Gold Ore'] & 1) << 10
+        | (values['raw_materials_viewed_states.Silver Ore'] & 1) << 11
+        | (values['raw_materials_viewed_states.Copper Ore'] & 1) << 12
+        | (values['raw_materials_viewed_states.Iron Ore'] & 1) << 13
+        | (values['raw_materials_viewed_states.Crystal'] & 1) << 14
+        | (values['raw_materials_viewed_states.Pyrite'] & 1) << 15
+        | (values['raw_materials_viewed_states.Moldavite'] & 1) << 16
+        | (values['raw_materials_viewed_states.Meteorite'] & 1) << 17
+        | (values['raw_materials_viewed_states.Amber'] & 1) << 18
+        | (values['raw_materials_viewed_states.Fluorite'] & 1) << 19
+        | (values['raw_materials_viewed_states.Clay'] & 1) << 20
+        | _pack_bits(values['raw_materials_viewed_states._unk2']) << 21
+        | (values['raw_materials_viewed_states.Berries'] & 1) << 25
+        | (values['raw_materials_viewed_states.Royal Fern'] & 1) << 26
+        | (values['raw_materials_viewed_states.Tree Branch'] & 1) << 27
+        | (values['raw_materials_viewed_states.Log'] & 1) << 28
+        | (values['raw_materials_viewed_states.Natural Rubber'] & 1) << 29
+        | (values['raw_materials_viewed_states.Ivy'] & 1) << 30
+        | (values['raw_materials_viewed_states.Lichen'] & 1) << 31
+        | (values['raw_materials_viewed_states.Mushroom'] & 1) << 32
+        | (values['raw_materials_viewed_states.Sap'] & 1) << 33
+        | _pack_bits(values['raw_materials_viewed_states._unk3']) << 34
+        | (values['raw_materials_viewed_states.Mutton'] & 1) << 39
+        | (values['raw_materials_viewed_states.Boar Meat'] & 1) << 40
+        | (values['raw_materials_viewed_states.Wool'] & 1) << 41
+        | (values['raw_materials_viewed_states.Boar Hide'] & 1) << 42
+        | (values['raw_materials_viewed_states.Wolf Hide'] & 1) << 43
+        | (values['raw_materials_viewed_states.Wolf Fang'] & 1) << 44
+        | (values['raw_materials_viewed_states.Giant Spider Silk'] & 1) << 45
+        | (values['raw_materials_viewed_states.Bat Fang'] & 1) << 46
+        | (values['raw_materials_viewed_states.Bat Wing'] & 1) << 47
+        | (values['raw_materials_viewed_states.Goat Meat'] & 1) << 48
+        | (values['raw_materials_viewed_states.Goat Hide'] & 1) << 49
+        | (values['raw_materials_viewed_states.Venison'] & 1) << 50
+        | (values['raw_materials_viewed_states.Rainbow Spider Silk'] & 1) << 51
+        | (values['raw_materials_viewed_states.Boar Liver'] & 1) << 52
+        | (values['raw_materials_viewed_states.Scorpion Claw'] & 1) << 53
+        | (values['raw_materials_viewed_states.Scorpion Tail'] & 1) << 54
+        | (values['raw_materials_viewed_states.Dented Metal Board'] & 1) << 55
+        | (values['raw_materials_viewed_states.Stripped Bolt'] & 1) << 56
+        | (values['raw_materials_viewed_states.Broken Lens'] & 1) << 57
+        | (values['raw_materials_viewed_states.Severed Cable'] & 1) << 58
+        | (values['raw_materials_viewed_states.Broken Arm'] & 1) << 59
+        | (values['raw_materials_viewed_states.Broken Antenna'] & 1) << 60
+        | (values['raw_materials_viewed_states.Broken Motor'] & 1) << 61
+        | (values['raw_materials_viewed_states.Broken Battery'] & 1) << 62
+        | (values['raw_materials_viewed_states.Mysterious Switch'] & 1) << 63
+        | (values['raw_materials_viewed_states.Large Gear'] & 1) << 64
+        | (values['raw_materials_viewed_states.Titanium Alloy'] & 1) << 65
+        | (values['raw_materials_viewed_states.Memory Alloy'] & 1) << 66
+        | (values['raw_materials_viewed_states.Rusted Clump'] & 1) << 67
+        | (values['raw_materials_viewed_states.Machine Oil'] & 1) << 68
+        | _pack_bits(values['raw_materials_viewed_states._unk4']) << 69
+        | (values['raw_materials_viewed_states.Forlorn Necklace'] & 1) << 73
+        | (values['raw_materials_viewed_states.Twisted Ring'] & 1) << 74
+        | (values['raw_materials_viewed_states.Broken Earring'] & 1) << 75
+        | (values['raw_materials_viewed_states.Pretty Choker'] & 1) << 76
+        | (values['raw_materials_viewed_states.Metal Piercing'] & 1) << 77
+        | (values['raw_materials_viewed_states.Subdued Bracelet'] & 1) << 78
+        | (values['raw_materials_viewed_states.Technical Guide'] & 1) << 79
+        | (values['raw_materials_viewed_states.Grubby Book'] & 1) << 80
+        | (values['raw_materials_viewed_states.Thick Dictionary'] & 1) << 81
+        | (values['raw_materials_viewed_states.Closed Book'] & 1) << 82
+        | (values['raw_materials_viewed_states.Used Coloring Book'] & 1) << 83
+        | (values['raw_materials_viewed_states.Old Schoolbook'] & 1) << 84
+        | (values['raw_materials_viewed_states.Dirty Bag'] & 1) << 85
+        | (values['raw_materials_viewed_states.Flashy Hat'] & 1) << 86
+        | (values['raw_materials_viewed_states.Leather Gloves'] & 1) << 87
+        | (values['raw_materials_viewed_states.Silk Handkerchief'] & 1) << 88
+        | (values['raw_materials_viewed_states.Leather Boots'] & 1) << 89
+        | (values['raw_materials_viewed_states.Complex Machine'] & 1) << 90
+        | (values['raw_materials_viewed_states.Elaborate Machine'] & 1) << 91
+        | (values['raw_materials_viewed_states.Simple Machine'] & 1) << 92
+        | (values['raw_materials_viewed_states.Stopped Clock'] & 1) << 93
+        | (values['raw_materials_viewed_states.Broken Wristwatch'] & 1) << 94
+        | (values['raw_materials_viewed_states.Rusty Kitchen Knife'] & 1) << 95
+        | (values['raw_materials_viewed_states.Broken Saw'] & 1) << 96
+        | (values['raw_materials_viewed_states.Dented Metal Bat'] & 1) << 97
+        | _pack_bits(values['raw_materials_viewed_states._unk5']) << 98
+        | (values['raw_materials_viewed_states.Shell'] & 1) << 99
+        | (values['raw_materials_viewed_states.Gastropod'] & 1) << 100
+        | (values['raw_materials_viewed_states.Bivalve'] & 1) << 101
+        | (values['raw_materials_viewed_states.Seaweed'] & 1) << 102
+        | (values['raw_materials_viewed_states.Empty Bottle'] & 1) << 103
+        | (values['raw_materials_viewed_states.Driftwood'] & 1) << 104
+        | (values['raw_materials_viewed_states.Pearl'] & 1) << 105
+        | (values['raw_materials_viewed_states.Black Pearl'] & 1) << 106
+        | (values['raw_materials_viewed_states.Crab'] & 1) << 107
+        | (values['raw_materials_viewed_states.Starfish'] & 1) << 108
+        | _pack_bits(values['raw_materials_viewed_states._unk6']) << 109
+        | (values['raw_materials_viewed_states.Sea Turtle Egg'] & 1) << 114
+        | (values['raw_materials_viewed_states.Broken Pottery'] & 1) << 115
+        | (values['raw_materials_viewed_states.Desert Rose'] & 1) << 116
+        | (values['raw_materials_viewed_states.Giant Egg'] & 1) << 117
+        | (values['raw_materials_viewed_states.Damascus Steel'] & 1) << 118
+        | (values['raw_materials_viewed_states.Eagle Egg'] & 1) << 119
+        | (values['raw_materials_viewed_states.Chicken Egg'] & 1) << 120
+        | _pack_bits(values['raw_materials_viewed_states._unk7']) << 121
+        | (values['raw_materials_viewed_states.Mouse Tail'] & 1) << 122
+        | (values['raw_materials_viewed_states.Lizard Tail'] & 1) << 123
+        | _pack_bits(values['raw_materials_viewed_states._unk8']) << 124
+        | (values['raw_materials_viewed_states.Deer Antler'] & 1) << 127
+    ).to_bytes(16, 'little')
+    buf[1088:1098] = (
+        (values['key_item_viewed_states.Moon Key'] & 1)
+        | (values['key_item_viewed_states.Star Key'] & 1) << 1
+        | (values['key_item_viewed_states.Light Key'] & 1) << 2
+        | (values['key_item_viewed_states.Darkness Key'] & 1) << 3
+        | (values['key_item_viewed_states.Fine Flour'] & 1) << 4
+        | (values['key_item_viewed_states.Coarse Flour'] & 1) << 5
+        | (values['key_item_viewed_states.Perfume Bottle'] & 1) << 6
+        | (values["key_item_viewed_states.Postman's Parcel"] & 1) << 7
+        | (values["key_item_viewed_states.Lover's Letter"] & 1) << 8
+        | (values['key_item_viewed_states.Water Filter'] & 1) << 9
+        | (values['key_item_viewed_states.Royal Compass'] & 1) << 10
+        | (values['key_item_viewed_states.Vapor Moss'] & 1) << 11
+        | (values['key_item_viewed_states.Valley Spider Silk'] & 1) << 12
+        | (values['key_item_viewed_states.Animal Guidebook'] & 1) << 13
+        | (values['key_item_viewed_states.Ore Guidebook'] & 1) << 14
+        | (values['key_item_viewed_states.Plant Guidebook'] & 1) << 15
+        | (values['key_item_viewed_states.Red Book'] & 1) << 16
+        | (values['key_item_viewed_states.Blue Book'] & 1) << 17
+        | (values["key_item_viewed_states.Old Lady's Elixir"] & 1) << 18
+        | (values["key_item_viewed_states.Old Lady's Elixir+"] & 1) << 19
+        | (values['key_item_viewed_states.Parcel for The Aerie'] & 1) << 20
+        | (values['key_item_viewed_states.Parcel for Seafront'] & 1) << 21
+        | (values['key_item_viewed_states.Cookbook'] & 1) << 22
+        | (values['key_item_viewed_states.Parcel for Facade'] & 1) << 23
+        | (values["key_item_viewed_states.Max's Herbs"] & 1) << 24
+        | (values['key_item_viewed_states.Drifting Cargo'] & 1) << 25
+        | (values['key_item_viewed_states.Drifting Cargo 2'] & 1) << 26
+        | (values['key_item_viewed_states.Drifting Cargo 3'] & 1) << 27
+        | (values['key_item_viewed_states.Drifting Cargo 4'] & 1) << 28
+        | (values['key_item_viewed_states.Old Package'] & 1) << 29
+        | (values['key_item_viewed_states.Mermaid Tear'] & 1) << 30
+        | (values['key_item_viewed_states.Mandrake Leaf'] & 1) << 31
+        | (values['key_item_viewed_states.Energizer'] & 1) << 32
+        | (values['key_item_viewed_states.Toad Oil'] & 1) << 33
+        | (values['key_item_viewed_states.Sleep-B-Gone'] & 1) << 34
+        | (values['key_item_viewed_states.Antidote'] & 1) << 35
+        | (values['key_item_viewed_states.Gold Bracelet'] & 1) << 36
+        | (values['key_item_viewed_states.Elite Kitchen Knife'] & 1) << 37
+        | (values['key_item_viewed_states.Elevator Parts'] & 1) << 38
+        | (values['key_item_viewed_states.Dirty Treasure Map'] & 1) << 39
+        | (values['key_item_viewed_states.Restored Treasure Map'] & 1) << 40
+        | (values['key_item_viewed_states.Jade Hair Ornament'] & 1) << 41
+        | (values['key_item_viewed_states.Employee List'] & 1) << 42
+        | (values['key_item_viewed_states.Small Safe'] & 1) << 43
+        | (values['key_item_viewed_states.Safe Key'] & 1) << 44
+        | (values['key_item_viewed_states.Great Tree Root'] & 1) << 45
+        | (values['key_item_viewed_states.Eye of Power'] & 1) << 46
+        | (values['key_item_viewed_states.Ribbon'] & 1) << 47
+        | (values["key_item_viewed_states.Yonah's Ribbon"] & 1) << 48
+        | (values['key_item_viewed_states.Bronze Key'] & 1) << 49
+        | (values['key_item_viewed_states.Brass Key'] & 1) << 50
+        | (values['key_item_viewed_states.Boar Tusk'] & 1) << 51
+        | (values['key_item_viewed_states.Pressed Freesia'] & 1) << 52
+        | (values['key_item_viewed_states.Potted Freesia'] & 1) << 53
+        | (values['key_item_viewed_states.Freesia (Delivery)'] & 1) << 54
+        | (values['key_item_viewed_states.Pile of Junk'] & 1) << 55
+        | (values['key_item_viewed_states.Old Gold Coin'] & 1) << 56
+        | (values['key_item_viewed_states.Marked Map'] & 1) << 57
+        | (values['key_item_viewed_states.AA Keycard'] & 1) << 58
+        | (values['key_item_viewed_states.KA Keycard'] & 1) << 59
+        | (values['key_item_viewed_states.SA Keycard'] & 1) << 60
+        | (values['key_item_viewed_states.TA Keycard'] & 1) << 61
+        | (values['key_item_viewed_states.NA Keycard'] & 1) << 62
+        | (values['key_item_viewed_states.HA Keycard'] & 1) << 63
+        | (values['key_item_viewed_states.MA Keycard'] & 1) << 64
+        | (values['key_item_viewed_states.YA Keycard'] & 1) << 65
+        | (values['key_item_viewed_states.RA Keycard'] & 1) << 66
+        | (values['key_item_viewed_states.WA Keycard'] & 1) << 67
+        | (values["key_item_viewed_states.Cultivator's Handbook"] & 1) << 68
+        | (values['key_item_viewed_states.Red Bag'] & 1) << 69
+        | (values['key_item_viewed_states.Lantern'] & 1) << 70
+        | (values['key_item_viewed_states.Empty Lantern'] & 1) << 71
+        | (values['key_item_viewed_states.Hold Key'] & 1) << 72
+        | (values['key_item_viewed_states.Passageway Key'] & 1) << 73
+        | (values['key_item_viewed_states.Goat Key'] & 1) << 74
+        | (values['key_item_viewed_states.Lizard Key'] & 1) << 75
+        | (values['key_item_viewed_states.Unlocking Procedure Memo'] & 1) << 76
+        | (values['key_item_viewed_states.Red Jewel?'] & 1) << 77
+        | (values['key_item_viewed_states.Red Flowers'] & 1) << 78
+        | (values['key_item_viewed_states.Apples'] & 1) << 79
+    ).to_bytes(10, 'little')
+    _SAVEFILE_RUN_6.pack_into(buf, 1098, *_SAVEFILE_GET_6(values))
+    buf[1472:1536] = (
+        (values['quests._unk_0.0'] & 1)
+        | (values['quests._unk_0.1'] & 1) << 1
+        | (values['quests._unk_0.2'] & 1) << 2
+        | (values['quests._unk_0.3'] & 1) << 3
+        | (values['quests._unk_0.4'] & 1) << 4
+        | (values['quests._unk_0.5'] & 1) << 5
+        | (values['quests._unk_0.6'] & 1) << 6
+        | (values['quests._unk_0.7'] & 1) << 7
+        | (values['quests._unk_0.8'] & 1) << 8
+        | (values['quests._unk_0.9'] & 1) << 9
+        | (values['quests._unk_0.10'] & 1) << 10
+        | (values['quests._unk_0.11'] & 1) << 11
+        | (values['quests._unk_0.12'] & 1) << 12
+        | (values['quests._unk_0.13'] & 1) << 13
+        | (values['quests._unk_0.14'] & 1) << 14
+        | (values['quests._unk_0.15'] & 1) << 15
+        | (values['quests._unk_0.16'] & 1) << 16
+        | (values['quests._unk_0.17'] & 1) << 17
+        | (values['quests._unk_0.18'] & 1) << 18
+        | (values['quests._unk_0.19'] & 1) << 19
+        | (values['quests._unk_0.20'] & 1) << 20
+        | (values['quests._unk_0.21'] & 1) << 21
+        | (values['quests._unk_0.22'] & 1) << 22
+        | (values['quests._unk_0.23'] & 1) << 23
+        | (values['quests._unk_0.24'] & 1) << 24
+        | (values['quests._unk_0.25'] & 1) << 25
+        | (values['quests._unk_0.26'] & 1) << 26
+        | (values['quests._unk_0.27'] & 1) << 27
+        | (values['quests.Herbal Remedies.started'] & 1) << 28
+        | (values['quests.Herbal Remedies.done'] & 1) << 29
+        | (values['quests._unk_1.0'] & 1) << 30
+        | (values["quests.The Gatekeeper's Errand.started"] & 1) << 31
+        | (values["quests.The Gatekeeper's Errand.stages.0"] & 1) << 32
+        | (values["quests.The Gatekeeper's Errand.done"] & 1) << 33
+        | (values['quests._unk_2.0'] & 1) << 34
+        | (values['quests.The Lost Eggs.started'] & 1) << 35
+        | (values['quests.The Lost Eggs.stages.0'] & 1) << 36
+        | (values['quests.The Lost Eggs.stages.1'] & 1) << 37
+        | (values['quests.The Lost Eggs.stages.2'] & 1) << 38
+        | (values['quests.The Lost Eggs.done'] & 1) << 39
+        | (values['quests._unk_3.0'] & 1) << 40
+        | (values['quests.Old-Fashioned Home Cooking.started'] & 1) << 41
+        | (values['quests.Old-Fashioned Home Cooking.stages.0'] & 1) << 42
+        | (values['quests.Old-Fashioned Home Cooking.done'] & 1) << 43
+        | (values['quests._unk_4.0'] & 1) << 44
+        | (values['quests.Shopping List.started'] & 1) << 45
+        | (values['quests.Shopping List.stages.0'] & 1) << 46
+        | (values['quests.Shopping List.done'] & 1) << 47
+        | (values['quests._unk_5.0'] & 1) << 48
+        | (values['quests.Book Smarts.started'] & 1) << 49
+        | (values['quests.Book Smarts.stages.0'] & 1) << 50
+        | (values['quests.Book Smarts.stages.1'] & 1) << 51
+        | (values['quests.Book Smarts.stages.2'] & 1) << 52
+        | (values['quests.Book Smarts.done'] & 1) << 53
+        | (values['quests._unk_6.0'] & 1) << 54
+        | (values["quests.The Tavern Keeper's Grandmother.started"] & 1) << 55
+        | (values["quests.The Tavern Keeper's Grandmother.stages.0"] & 1) << 56
+        | (values["quests.The Tavern Keeper's Grandmother.stages.1"] & 1) << 57
+        | (values["quests.The Tavern Keeper's Grandmother.done"] & 1) << 58
+        | (values['quests._unk_7.0'] & 1) << 59
+        | (values['quests.A Return to Shopping.started'] & 1) << 60
+        | (values['quests.A Return to Shopping.stages.0'] & 1) << 61
+        | (values['quests.A Return to Shopping.done'] & 1) << 62
+        | (values['quests._unk_8.0'] & 1) << 63
+        | (values["quests.Yonah's Cooking.started"] & 1) << 64
+        | (values["quests.Yonah's Cooking.done"] & 1) << 65
+        | (values['quests._unk_9.0'] & 1) << 66
+        | (values['quests.Boar Hunt!.started'] & 1) << 67
+        | (values['quests.Boar Hunt!.stages.0'] & 1) << 68
+        | (values['quests.Boar Hunt!.stages.1'] & 1) << 69
+        | (values['quests.Boar Hunt!.done'] & 1) << 70
+        | (values['quests._unk_10.0'] & 1) << 71
+        | (values['quests.On the Wings of Eagles.started'] & 1) << 72
+        | (values['quests.On the Wings of Eagles.stages.0'] & 1) << 73
+        | (values['quests.On the Wings of Eagles.stages.1'] & 1) << 74
+        | (values['quests.On the Wings of Eagles.stages.2'] & 1) << 75
+        | (values['quests.On the Wings of Eagles.done'] & 1) << 76
+        | (values['quests._unk_11.0'] & 1) << 77
+        | (values['quests.Fragile Delivery.started'] & 1) << 78
+        | (values['quests.Fragile Delivery.stages.0'] & 1) << 79
+        | (values['quests.Fragile Delivery.stages.1'] & 1) << 80
+        | (values['quests.Fragile Delivery.stages.2'] & 1) << 81
+        | (values['quests.Fragile Delivery.done'] & 1) << 82
+        | (values['quests._unk_12.0'] & 1) << 83
+        | (values['quests.Fragile Delivery 2.started'] & 1) << 84
+        | (values['quests.Fragile Delivery 2.stages.0'] & 1) << 85
+        | (values['quests.Fragile Delivery 2.stages.1'] & 1) << 86
+        | (values['quests.Fragile Delivery 2.stages.2'] & 1) << 87
+        | (values['quests.Fragile Delivery 2.done'] & 1) << 88
+        | (values['quests._unk_13.0'] & 1) << 89
+        | (values["quests.The Fisherman's Gambit.started"] & 1) << 90
+        | (values["quests.The Fisherman's Gambit.done"] & 1) << 91
+        | (values['quests._unk_14.0'] & 1) << 92
+        | (values["quests.The Fisherman's Gambit, Part 2.started"] & 1) << 93
+        | (values["quests.The Fisherman's Gambit, Part 2.done"] & 1) << 94
+        | (values['quests._unk_15.0'] & 1) << 95
+        | (values["quests.The Fisherman's Gambit, Part 3.started"] & 1) << 96
+        | (values["quests.The Fisherman's Gambit, Part 3.done"] & 1) << 97
+        | (values['quests._unk_16.0'] & 1) << 98
+        | (values["quests.The Fisherman's Gambit, Part 4.started"] & 1) << 99
+        | (values["quests.The Fisherman's Gambit, Part 4.done"] & 1) << 100
+        | (values['quests._unk_17.0'] & 1) << 101
+        | (values["quests.The Fisherman's Gambit, Part 5.started"] & 1) << 102
+        | (values["quests.The Fisherman's Gambit, Part 5.done"] & 1) << 103
+        | (values['quests._unk_18.0'] & 1) << 104
+        | (values['quests.The Ballad of the Twins.started'] & 1) << 105
+        | (values['quests.The Ballad of the Twins.stages.0'] & 1) << 106
+        | (values['quests.The Ballad of the Twins.stages.1'] & 1) << 107
+        | (values['quests.The Ballad of the Twins.stages.2'] & 1) << 108
+        | (values['quests.The Ballad of the Twins.stages.3'] & 1) << 109
+        | (values['quests.The Ballad of the Twins.done'] & 1) << 110
+        | (values['quests._unk_19.0'] & 1) << 111
+        | (values['quests.A Dog Astray.started'] & 1) << 112
+        | (values['quests.A Dog Astray.stages.0'] & 1) << 113
+        | (values['quests.A Dog Astray.stages.1'] & 1) << 114
+        | (values['quests.A Dog Astray.done'] & 1) << 115
+        | (values['quests._unk_20.0'] & 1) << 116
+        | (values['quests.The New Merchant in Town.started'] & 1) << 117
+        | (values['quests.The New Merchant in Town.stages.0'] & 1) << 118
+        | (values['quests.The New Merchant in Town.stages.1'] & 1) << 119
+        | (values['quests.The New Merchant in Town.stages.2'] & 1) << 120
+        | (values['quests.The New Merchant in Town.done'] & 1) << 121
+        | (values['quests._unk_21.0'] & 1) << 122
+        | (values['quests._unk_21.1'] & 1) << 123
+        | (values['quests._unk_21.2'] & 1) << 124
+        | (values['quests._unk_21.3'] & 1) << 125
+        | (values['quests._unk_21.4'] & 1) << 126
+        | (values['quests._unk_21.5'] & 1) << 127
+        | (values['quests._unk_21.6'] & 1) << 128
+        | (values['quests._unk_21.7'] & 1) << 129
+        | (values['quests._unk_21.8'] & 1) << 130
+        | (values['quests._unk_21.9'] & 1) << 131
+        | (values["quests.Yonah's Gift.started"] & 1) << 132
+        | (values["quests.Yonah's Gift.stages.0"] & 1) << 133
+        | (values["quests.Yonah's Gift.stages.1"] & 1) << 134
+        | (values["quests.Yonah's Gift.stages.2"] & 1) << 135
+        | (values["quests.Yonah's Gift.stages.3"] & 1) << 136
+        | (values["quests.Yonah's Gift.stages.4"] & 1) << 137
+        | (values["quests.Yonah's Gift.stages.5"] & 1) << 138
+        | (values["quests.Yonah's Gift.done"] & 1) << 139
+        | (values['quests._unk_22.0'] & 1) << 140
+        | (values['quests.Letter to a Lover.started'] & 1) << 141
+        | (values['quests.Letter to a Lover.stages.0'] & 1) << 142
+        | (values['quests.Letter to a Lover.stages.1'] & 1) << 143
+        | (values['quests.Letter to a Lover.done'] & 1) << 144
+        | (values['quests._unk_23.0'] & 1) << 145
+        | (values['quests.A Signature Dish.started'] & 1) << 146
+        | (values['quests.A Signature Dish.stages.0'] & 1) << 147
+        | (values['quests.A Signature Dish.done'] & 1) << 148
+        | (values['quests._unk_24.0'] & 1) << 149
+        | (values['quests.Bon Appetit!.started'] & 1) << 150
+        | (values['quests.Bon Appetit!.stages.0'] & 1) << 151
+        | (values['quests.Bon Appetit!.stages.1'] & 1) << 152
+        | (values['quests.Bon Appetit!.stages.2'] & 1) << 153
+        | (values['quests.Bon Appetit!.done'] & 1) << 154
+        | (values['quests._unk_25.0'] & 1) << 155
+        | (values['quests.Fragile Delivery 3.started'] & 1) << 156
+        | (values['quests.Fragile Delivery 3.stages.0'] & 1) << 157
+        | (values['quests.Fragile Delivery 3.stages.1'] & 1) << 158
+        | (values['quests.Fragile Delivery 3.stages.2'] & 1) << 159
+        | (values['quests.Fragile Delivery 3.done'] & 1) << 160
+        | (values['quests._unk_26.0'] & 1) << 161
+        | (values['quests.The Tangled Message.started'] & 1) << 162
+        | (values['quests.The Tangled Message.stages.0'] & 1) << 163
+        | (values['quests.The Tangled Message.stages.1'] & 1) << 164
+        | (values['quests.The Tangled Message.stages.2'] & 1) << 165
+        | (values['quests.The Tangled Message.stages.3'] & 1) << 166
+        | (values['quests.The Tangled Message.done'] & 1) << 167
+        | (values['quests._unk_27.0'] & 1) << 168
+        | (values['quests._unk_27.1'] & 1) << 169
+        | (values['quests._unk_27.2'] & 1) << 170
+        | (values['quests._unk_27.3'] & 1) << 171
+        | (values['quests.Item Unknown.started'] & 1) << 172
+        | (values['quests.Item Unknown.stages.0'] & 1) << 173
+        | (values['quests.Item Unknown.done'] & 1) << 174
+        | (values['quests._unk_28.0'] & 1) << 175
+        | (values['quests.The Runaway Son.started'] & 1) << 176
+        | (values['quests.The Runaway Son.stages.0'] & 1) << 177
+        | (values['quests.The Runaway Son.stages.1'] & 1) << 178
+        | (values['quests.The Runaway Son.stages.2'] & 1) << 179
+        | (values['quests.The Runaway Son.stages.3'] & 1) << 180
+        | (values['quests.The Runaway Son.stages.4'] & 1) << 181
+        | (values['quests.The Runaway Son.stages.5'] & 1) << 182
+        | (values['quests.The Runaway Son.stages.6'] & 1) << 183
+        | (values['quests.The Runaway Son.stages.7'] & 1) << 184
+        | (values['quests.The Runaway Son.stages.8'] & 1) << 185
+        | (values['quests.The Runaway Son.done'] & 1) << 186
+        | (values['quests._unk_29.0'] & 1) << 187
+        | (values['quests.Apology from a Fool.started'] & 1) << 188
+        | (values['quests.Apology from a Fool.stages.0'] & 1) << 189
+        | (values['quests.Apology from a Fool.stages.1'] & 1) << 190
+        | (values['quests.Apology from a Fool.stages.2'] & 1) << 191
+        | (values['quests.Apology from a Fool.done'] & 1) << 192
+        | (values['quests._unk_30.0'] & 1) << 193
+        | (values['quests._unk_30.1'] & 1) << 194
+        | (values['quests._unk_30.2'] & 1) << 195
+        | (values['quests._unk_30.3'] & 1) << 196
+        | (values['quests._unk_30.4'] & 1) << 197
+        | (values['quests.The Pride of a Lover.started'] & 1) << 198
+        | (values['quests.The Pride of a Lover.stages.0'] & 1) << 199
+        | (values['quests.The Pride of a Lover.done'] & 1) << 200
+        | (values['quests._unk_31.0'] & 1) << 201
+        | (values['quests.The Littlest Hero.started'] & 1) << 202
+        | (values['quests.The Littlest Hero.stages.0'] & 1) << 203
+        | (values['quests.The Littlest Hero.stages.1'] & 1) << 204
+        | (values['quests.The Littlest Hero.done'] & 1) << 205
+        | (values['quests._unk_32.0'] & 1) << 206
+        | (values['quests.The Missing Girl.started'] & 1) << 207
+        | (values['quests.The Missing Girl.stages.0'] & 1) << 208
+        | (values['quests.The Missing Girl.stages.1'] & 1) << 209
+        | (values['quests.The Missing Girl.stages.2'] & 1) << 210
+        | (values['quests.The Missing Girl.done'] & 1) << 211
+        | (values['quests._unk_33.0'] & 1) << 212
+        | (values['quests._unk_33.1'] & 1) << 213
+        | (values['quests.A Shade Entombed.started'] & 1) << 214
+        | (values['quests.A Shade Entombed.stages.0'] & 1) << 215
+        | (values['quests.A Shade Entombed.stages.1'] & 1) << 216
+        | (values['quests.A Shade Entombed.done'] & 1) << 217
+        | (values['quests._unk_34.0'] & 1) << 218
+        | (values['quests.The Masterless Lighthouse.started'] & 1) << 219
+        | (values['quests.The Masterless Lighthouse.done'] & 1) << 220
+        | (values['quests._unk_35.0'] & 1) << 221
+        | (values['quests.The Scattered Cargo.started'] & 1) << 222
+        | (values['quests.The Scattered Cargo.stages.0'] & 1) << 223
+        | (values['quests.The Scattered Cargo.stages.1'] & 1) << 224
+        | (values['quests.The Scattered Cargo.stages.2'] & 1) << 225
+        | (values['quests.The Scattered Cargo.stages.3'] & 1) << 226
+        | (values['quests.The Scattered Cargo.stages.4'] & 1) << 227
+        | (values['quests.The Scattered Cargo.stages.5'] & 1) << 228
+        | (values['quests.The Scattered Cargo.stages.6'] & 1) << 229
+        | (values['quests.The Scattered Cargo.stages.7'] & 1) << 230
+        | (values['quests.The Scattered Cargo.stages.8'] & 1) << 231
+        | (values['quests.The Scattered Cargo.stages.9'] & 1) << 232
+        | (values['quests.The Scattered Cargo.done'] & 1) << 233
+        | (values['quests._unk_36.0'] & 1) << 234
+        | (values['quests._unk_36.1'] & 1) << 235
+        | (values['quests.The Strange Fate of the Jewel.started'] & 1) << 236
+        | (values['quests.The Strange Fate of the Jewel.stages.0'] & 1) << 237
+        | (values['quests.The Strange Fate of the Jewel.stages.1'] & 1) << 238
+        | (values['quests.The Strange Fate of the Jewel.stages.2'] & 1) << 239
+        | (values['quests.The Strange Fate of the Jewel.stages.3'] & 1) << 240
+        | (values['quests.The Strange Fate of the Jewel.stages.4'] & 1) << 241
+        | (values['quests.The Strange Fate of the Jewel.stages.5'] & 1) << 242
+        | (values['quests.The Strange Fate of the Jewel.stages.6'] & 1) << 243
+        | (values['quests.The Strange Fate of the Jewel.done'] & 1) << 244
+        | (values['quests._unk_37.0'] & 1) << 245
+        | (values['quests._unk_37.1'] & 1) << 246
+        | (values['quests._unk_37.2'] & 1) << 247
+        | (values['quests._unk_37.3'] & 1) << 248
+        | (values['quests._unk_37.4'] & 1) << 249
+        | (values['quests._unk_37.5'] & 1) << 250
+        | (values['quests._unk_37.6'] & 1) << 251
+        | (values['quests._unk_37.7'] & 1) << 252
+        | (values['quests._unk_37.8'] & 1) << 253
+        | (values['quests._unk_37.9'] & 1) << 254
+        | (values['quests._unk_37.10'] & 1) << 255
+        | (values['quests._unk_37.11'] & 1) << 256
+        | (values['quests._unk_37.12'] & 1) << 257
+        | (values['quests._unk_37.13'] & 1) << 258
+        | (values['quests._unk_37.14'] & 1) << 259
+        | (values['quests.Thieves in Training (1).started'] & 1) << 260
+        | (values['quests.Thieves in Training (1).stages.0'] & 1) << 261
+        | (values['quests.Thieves in Training (1).stages.1'] & 1) << 262
+        | (values['quests.Thieves in Training (1).stages.2'] & 1) << 263
+        | (values['quests.Thieves in Training (1).stages.3'] & 1) << 264
+        | (values['quests.Thieves in Training (1).stages.4'] & 1) << 265
+        | (values['quests.Thieves in Training (1).stages.5'] & 1) << 266
+        | (values['quests.Thieves in Training (1).stages.6'] & 1) << 267
+        | (values['quests.Thieves in Training (1).stages.7'] & 1) << 268
+        | (values['quests.Thieves in Training (1).done'] & 1) << 269
+        | (values['quests.Learning a Trade.started'] & 1) << 270
+        | (values['quests.Learning a Trade.stages.0'] & 1) << 271
+        | (values['quests.Learning a Trade.stages.1'] & 1) << 272
+        | (values['quests.Learning a Trade.stages.2'] & 1) << 273
+        | (values['quests.Learning a Trade.stages.3'] & 1) << 274
+        | (values['quests.Learning a Trade.stages.4'] & 1) << 275
+        | (values['quests.Learning a Trade.stages.5'] & 1) << 276
+        | (values['quests.Learning a Trade.stages.6'] & 1) << 277
+        | (values['quests.Learning a Trade.done'] & 1) << 278
+        | (values['quests._unk_39.0'] & 1) << 279
+        | (values['quests._unk_39.1'] & 1) << 280
+        | (values['quests.A Bridge in Peril.started'] & 1) << 281
+        | (values['quests.A Bridge in Peril.stages.0'] & 1) << 282
+        | (values['quests.A Bridge in Peril.stages.1'] & 1) << 283
+        | (values['quests.A Bridge in Peril.done'] & 1) << 284
+        | (values['quests._unk_40.0'] & 1) << 285
+        | (values['quests.Master of the Southern Plains.started'] & 1) << 286
+        | (values['quests.Master of the Southern Plains.stages.0'] & 1) << 287
+        | (values['quests.Master of the Southern Plains.stages.1'] & 1) << 288
+        | (values['quests.Master of the Southern Plains.done'] & 1) << 289
+        | (values['quests._unk_41.0'] & 1) << 290
+        | (values["quests.The Fisherman's Gambit, Part 6.started"] & 1) << 291
+        | (values["quests.The Fisherman's Gambit, Part 6.done"] & 1) << 292
+        | (values['quests._unk_42.0'] & 1) << 293
+        | (values["quests.The Fisherman's Gambit, Part 7.started"] & 1) << 294
+        | (values["quests.The Fisherman's Gambit, Part 7.done"] & 1) << 295
+        | (values['quests._unk_43.0'] & 1) << 296
+        | (values["quests.The Fisherman's Gambit, Part 8.started"] & 1) << 297
+        | (values["quests.The Fisherman's Gambit, Part 8.done"] & 1) << 298
+        | (values['quests._unk_44.0'] & 1) << 299
+        | (values["quests.The Fisherman's Final Gambit.started"] & 1) << 300
+        | (values["quests.The Fisherman's Final Gambit.done"] & 1) << 301
+        | (values['quests._unk_45.0'] & 1) << 302
+        | (values['quests.Staying Afloat.started'] & 1) << 303
+        | (values['quests.Staying Afloat.stages.0'] & 1) << 304
+        | (values['quests.Staying Afloat.done'] & 1) << 305
+        | (values['quests._unk_46.0'] & 1) << 306
+        | (values['quests.Contract for a Contractor.started'] & 1) << 307
+        | (values['quests.Contract for a Contractor.stages.0'] & 1) << 308
+        | (values['quests.Contract for a Contractor.done'] & 1) << 309
+        | (values['quests._unk_47.0'] & 1) << 310
+        | (values['quests.The Creaky Waterwheel.started'] & 1) << 311
+        | (values['quests.The Creaky Waterwheel.stages.0'] & 1) << 312
+        | (values['quests.The Creaky Waterwheel.stages.1'] & 1) << 313
+        | (values['quests.The Creaky Waterwheel.stages.2'] & 1) << 314
+        | (values['quests.The Creaky Waterwheel.done'] & 1) << 315
+        | (values['quests._unk_48.0'] & 1) << 316
+        | (values['quests.The Faded Fountain.started'] & 1) << 317
+        | (values['quests.The Faded Fountain.stages.0'] & 1) << 318
+        | (values['quests.The Faded Fountain.stages.1'] & 1) << 319
+        | (values['quests.The Faded Fountain.stages.2'] & 1) << 320
+        | (values['quests.The Faded Fountain.done'] & 1) << 321
+        | (values['quests._unk_49.0'] & 1) << 322
+        | (values['quests.Bon Appetit! 2.started'] & 1) << 323
+        | (values['quests.Bon Appetit! 2.stages.0'] & 1) << 324
+        | (values['quests.Bon Appetit! 2.done'] & 1) << 325
+        | (values['quests._unk_50.0'] & 1) << 326
+        | (values['quests.Life in the Sands.started'] & 1) << 327
+        | (values['quests.Life in the Sands.stages.0'] & 1) << 328
+        | (values['quests.Life in the Sands.done'] & 1) << 329
+        | (values['quests._unk_51.0'] & 1) << 330
+        | (values["quests.The King's Mask.started"] & 1) << 331
+        | (values["quests.The King's Mask.stages.0"] & 1) << 332
+        | (values["quests.The King's Mask.done"] & 1) << 333
+        | (values["quests.A Child's Final Chance.started"] & 1) << 334
+        | (values["quests.A Child's Final Chance.stages.0"] & 1) << 335
+        | (values["quests.A Child's Final Chance.stages.1"] & 1) << 336
+        | (values["quests.A Child's Final Chance.stages.2"] & 1) << 337
+        | (values["quests.A Child's Final Chance.stages.3"] & 1) << 338
+        | (values["quests.A Child's Final Chance.stages.4"] & 1) << 339
+        | (values["quests.A Child's Final Chance.stages.5"] & 1) << 340
+        | (values["quests.A Child's Final Chance.stages.6"] & 1) << 341
+        | (values["quests.A Child's Final Chance.stages.7"] & 1) << 342
+        | (values["quests.A Child's Final Chance.done"] & 1) << 343
+        | (values['quests._unk_53.0'] & 1) << 344
+        | (values['quests.The Damaged Map.started'] & 1) << 345
+        | (values['quests.The Damaged Map.stages.0'] & 1) << 346
+        | (values['quests.The Damaged Map.stages.1'] & 1) << 347
+        | (values['quests.The Damaged Map.stages.2'] & 1) << 348
+        | (values['quests.The Damaged Map.stages.3'] & 1) << 349
+        | (values['quests.The Damaged Map.stages.4'] & 1) << 350
+        | (values['quests.The Damaged Map.stages.5'] & 1) << 351
+        | (values['quests.The Damaged Map.stages.6'] & 1) << 352
+        | (values['quests.The Damaged Map.stages.7'] & 1) << 353
+        | (values['quests.The Damaged Map.stages.8'] & 1) << 354
+        | (values['quests.The Damaged Map.stages.9'] & 1) << 355
+        | (values['quests.The Damaged Map.stages.10'] & 1) << 356
+        | (values['quests.The Damaged Map.stages.11'] & 1) << 357
+        | (values['quests.The Damaged Map.done'] & 1) << 358
+        | (values['quests._unk_54.0'] & 1) << 359
+        | (values['quests.Research Project.started'] & 1) << 360
+        | (values['quests.Research Project.stages.0'] & 1) << 361
+        | (values['quests.Research Project.stages.1'] & 1) << 362
+        | (values['quests.Research Project.stages.2'] & 1) << 363
+        | (values['quests.Research Project.stages.3'] & 1) << 364
+        | (values['quests.Research Project.done'] & 1) << 365
+        | (values['quests._unk_55.0'] & 1) << 366
+        | (values['quests.A Tale of the Study.started'] & 1) << 367
+        | (values['quests.A Tale of the Study.stages.0'] & 1) << 368
+        | (values['quests.A Tale of the Study.stages.1'] & 1) << 369
+        | (values['quests.A Tale of the Study.done'] & 1) << 370
+        | (values['quests._unk_56.0'] & 1) << 371
+        | (values['quests.The Great Tree.started'] & 1) << 372
+        | (values['quests.The Great Tree.stages.0'] & 1) << 373
+        | (values['quests.The Great Tree.stages.1'] & 1) << 374
+        | (values['quests.The Great Tree.done'] & 1) << 375
+        | (values['quests._unk_57.0'] & 1) << 376
+        | (values['quests.The Despicable Man.started'] & 1) << 377
+        | (values['quests.The Despicable Man.stages.0'] & 1) << 378
+        | (values['quests.The Despicable Man.stages.1'] & 1) << 379
+        | (values['quests.The Despicable Man.stages.2'] & 1) << 380
+        | (values['quests.The Despicable Man.stages.3'] & 1) << 381
+        | (values['quests.The Despicable Man.stages.4'] & 1) << 382
+        | (values['quests.The Despicable Man.done'] & 1) << 383
+        | (values['quests._unk_58.0'] & 1) << 384
+        | (values['quests.A Memorable Knife.started'] & 1) << 385
+        | (values['quests.A Memorable Knife.stages.0'] & 1) << 386
+        | (values['quests.A Memorable Knife.stages.1'] & 1) << 387
+        | (values['quests.A Memorable Knife.done'] & 1) << 388
+        | (values['quests._unk_59.0'] & 1) << 389
+        | (values['quests._unk_59.1'] & 1) << 390
+        | (values['quests.The Shade Army.started'] & 1) << 391
+        | (values['quests.The Shade Army.stages.0'] & 1) << 392
+        | (values['quests.The Shade Army.stages.1'] & 1) << 393
+        | (values['quests.The Shade Army.stages.2'] & 1) << 394
+        | (values['quests.The Shade Army.stages.3'] & 1) << 395
+        | (values['quests.The Shade Army.stages.4'] & 1) << 396
+        | (values['quests.The Shade Army.done'] & 1) << 397
+        | (values['quests._unk_60.0'] & 1) << 398
+        | (values['quests.A City Reborn.started'] & 1) << 399
+        | (values['quests.A City Reborn.done'] & 1) << 400
+        | (values['quests._unk_61.0'] & 1) << 401
+        | (values['quests.Nightmares and Dust.started'] & 1) << 402
+        | (values['quests.Nightmares and Dust.stages.0'] & 1) << 403
+        | (values['quests.Nightmares and Dust.stages.1'] & 1) << 404
+        | (values['quests.Nightmares and Dust.done'] & 1) << 405
+        | (values['quests._unk_62.0'] & 1) << 406
+        | (values['quests.Disturbing the Sleep of Kings.started'] & 1) << 407
+        | (values['quests.Disturbing the Sleep of Kings.stages.0'] & 1) << 408
+        | (values['quests.Disturbing the Sleep of Kings.stages.1'] & 1) << 409
+        | (values['quests.Disturbing the Sleep of Kings.done'] & 1) << 410
+        | (values['quests._unk_63.0'] & 1) << 411
+        | (values['quests.Shadows of the Desert.started'] & 1) << 412
+        | (values['quests.Shadows of the Desert.stages.0'] & 1) << 413
+        | (values['quests.Shadows of the Desert.stages.1'] & 1) << 414
+        | (values['quests.Shadows of the Desert.stages.2'] & 1) << 415
+        | (values['quests.Shadows of the Desert.done'] & 1) << 416
+        | (values['quests._unk_64.0'] & 1) << 417
+        | (values['quests.Search for the Shade.started'] & 1) << 418
+        | (values['quests.Search for the Shade.stages.0'] & 1) << 419
+        | (values['quests.Search for the Shade.stages.1'] & 1) << 420
+        | (values['quests.Search for the Shade.stages.2'] & 1) << 421
+        | (values['quests.Search for the Shade.stages.3'] & 1) << 422
+        | (values['quests.Search for the Shade.stages.4'] & 1) << 423
+        | (values['quests.Search for the Shade.stages.5'] & 1) << 424
+        | (values['quests.Search for the Shade.stages.6'] & 1) << 425
+        | (values['quests.Search for the Shade.stages.7'] & 1) << 426
+        | (values['quests.Search for the Shade.done'] & 1) << 427
+        | (values['quests._unk_65.0'] & 1) << 428
+        | (values['quests.Freesia.started'] & 1) << 429
+        | (values['quests.Freesia.stages.0'] & 1) << 430
+        | (values['quests.Freesia.stages.1'] & 1) << 431
+        | (values['quests.Freesia.stages.2'] & 1) << 432
+        | (values['quests.Freesia.done'] & 1) << 433
+        | (values['quests._unk_66.0'] & 1) << 434
+        | (values['quests._unk_66.1'] & 1) << 435
+        | (values['quests.The Magical Stone.started'] & 1) << 436
+        | (values['quests.The Magical Stone.stages.0'] & 1) << 437
+        | (values['quests.The Magical Stone.stages.1'] & 1) << 438
+        | (values['quests.The Magical Stone.stages.2'] & 1) << 439
+        | (values['quests.The Magical Stone.stages.3'] & 1) << 440
+        | (values['quests.The Magical Stone.done'] & 1) << 441
+        | (values['quests._unk_67.0'] & 1) << 442
+        | (values['quests._unk_67.1'] & 1) << 443
+        | (values['quests._unk_67.2'] & 1) << 444
+        | (values['quests._unk_67.3'] & 1) << 445
+        | (values['quests._unk_67.4'] & 1) << 446
+        | (values['quests._unk_67.5'] & 1) << 447
+        | (values['quests._unk_67.6'] & 1) << 448
+        | (values['quests._unk_67.7'] & 1) << 449
+        | (values['quests._unk_67.8'] & 1) << 450
+        | (values['quests._unk_67.9'] & 1) << 451
+        | (values['quests._unk_67.10'] & 1) << 452
+        | (values['quests._unk_67.11'] & 1) << 453
+        | (values['quests._unk_67.12'] & 1) << 454
+        | (values['quests._unk_67.13'] & 1) << 455
+        | (values['quests._unk_67.14'] & 1) << 456
+        | (values['quests._unk_67.15'] & 1) << 457
+        | (values['quests._unk_67.16'] & 1) << 458
+        | (values['quests._unk_67.17'] & 1) << 459
+        | (values['quests._unk_67.18'] & 1) << 460
+        | (values['quests._unk_67.19'] & 1) << 461
+        | (values['quests._unk_67.20'] & 1) << 462
+        | (values['quests._unk_67.21'] & 1) << 463
+        | (values['quests._unk_67.22'] & 1) << 464
+        | (values['quests._unk_67.23'] & 1) << 465
+        | (values['quests._unk_67.24'] & 1) << 466
+        | (values['quests._unk_67.25'] & 1) << 467
+        | (values['quests._unk_67.26'] & 1) << 468
+        | (values['quests._unk_67.27'] & 1) << 469
+        | (values['quests._unk_67.28'] & 1) << 470
+        | (values['quests._unk_67.29'] & 1) << 471
+        | (values['quests._unk_67.30'] & 1) << 472
+        | (values["quests.The Postman's Request.started"] & 1) << 473
+        | (values["quests.The Postman's Request.done"] & 1) << 474
+        | (values['quests._unk_68.0'] & 1) << 475
+        | (values['quests._unk_68.1'] & 1) << 476
+        | (values["quests.The Lighthouse Lady's Wrath.started"] & 1) << 477
+        | (values["quests.The Lighthouse Lady's Wrath.stages.0"] & 1) << 478
+        | (values["quests.The Lighthouse Lady's Wrath.stages.1"] & 1) << 479
+        | (values["quests.The Lighthouse Lady's Wrath.stages.2"] & 1) << 480
+        | (values["quests.The Lighthouse Lady's Wrath.stages.3"] & 1) << 481
+        | (values["quests.The Lighthouse Lady's Wrath.stages.4"] & 1) << 482
+        | (values["quests.The Lighthouse Lady's Wrath.stages.5"] & 1) << 483
+        | (values["quests.The Lighthouse Lady's Wrath.stages.6"] & 1) << 484
+        | (values["quests.The Lighthouse Lady's Wrath.stages.7"] & 1) << 485
+        | (values["quests.The Lighthouse Lady's Wrath.stages.8"] & 1) << 486
+        | (values["quests.The Lighthouse Lady's Wrath.done"] & 1) << 487
+        | (values['quests._unk_69.0'] & 1) << 488
+        | (values['quests.Closure.started'] & 1) << 489
+        | (values['quests.Closure.done'] & 1) << 490
+        | (values['quests._unk_70.0'] & 1) << 491
+        | (values['quests._unk_70.1'] & 1) << 492
+        | (values['quests._unk_70.2'] & 1) << 493
+        | (values['quests._unk_70.3'] & 1) << 494
+        | (values['quests._unk_70.4'] & 1) << 495
+        | (values['quests._unk_70.5'] & 1) << 496
+        | (values['quests._unk_70.6'] & 1) << 497
+        | (values['quests._unk_70.7'] & 1) << 498
+        | (values['quests._unk_70.8'] & 1) << 499
+        | (values['quests._unk_70.9'] & 1) << 500
+        | (values['quests._unk_70.10'] & 1) << 501
+        | (values['quests._unk_70.11'] & 1) << 502
+        | (values['quests._unk_70.12'] & 1) << 503
+        | (values['quests.Thieves in Training (2).started'] & 1) << 504
+        | (values['quests.Thieves in Training (2).done'] & 1) << 505
+        | (values['quests._unk_71.0'] & 1) << 506
+        | (values['quests._unk_71.1'] & 1) << 507
+        | (values['quests._unk_71.2'] & 1) << 508
+        | (values['quests._unk_71.3'] & 1) << 509
+        | (values['quests._unk_71.4'] & 1) << 510
+        | (values['quests._unk_71.5'] & 1) << 511
+    ).to_bytes(64, 'little')
+    _SAVEFILE_RUN_8.pack_into(buf, 1536, *_SAVEFILE_GET_8(values))
+    buf[1816:1827] = (
+        (values['quest_viewed_states._quest_0'] & 1)
+        | (values['quest_viewed_states._quest_1'] & 1) << 1
+        | (values['quest_viewed_states._quest_2'] & 1) << 2
+        | (values['quest_viewed_states._quest_3'] & 1) << 3
+        | (values['quest_viewed_states._quest_4'] & 1) << 4
+        | (values['quest_viewed_states.Herbal Remedies'] & 1) << 5
+        | (values["quest_viewed_states.The Gatekeeper's Errand"] & 1) << 6
+        | (values['quest_viewed_states.The Lost Eggs'] & 1) << 7
+        | (values['quest_viewed_states.Old-Fashioned Home Cooking'] & 1) << 8
+        | (values['quest_viewed_states.Shopping List'] & 1) << 9
+        | (values['quest_viewed_states.Book Smarts'] & 1) << 10
+        | (values['quest_viewed_states._quest_11'] & 1) << 11
+        | (values['quest_viewed_states._quest_12'] & 1) << 12
+        | (values['quest_viewed_states._quest_13'] & 1) << 13
+        | (values["quest_viewed_states.Yonah's Cooking"] & 1) << 14
+        | (values['quest_viewed_states._quest_15'] & 1) << 15
+        | (values['quest_viewed_states._quest_16'] & 1) << 16
+        | (values['quest_viewed_states._quest_17'] & 1) << 17
+        | (values['quest_viewed_states._quest_18'] & 1) << 18
+        | (values['quest_viewed_states._quest_19'] & 1) << 19
+        | (values["quest_viewed_states.The Fisherman's Gambit"] & 1) << 20
+        | (values["quest_viewed_states.The Fisherman's Gambit, Part 2"] & 1) << 21
+        | (values['quest_viewed_states._quest_22'] & 1) << 22
+        | (values['quest_viewed_states._quest_23'] & 1) << 23
+        | (values['quest_viewed_states._quest_24'] & 1) << 24
+        | (values['quest_viewed_states._quest_25'] & 1) << 25
+        | (values['quest_viewed_states._quest_26'] & 1) << 26
+        | (values['quest_viewed_states._quest_27'] & 1) << 27
+        | (values["quest_viewed_states.The Postman's Request"] & 1) << 28
+        | (values['quest_viewed_states._quest_29'] & 1) << 29
+        | (values['quest_viewed_states.Closure'] & 1) << 30
+        | (values['quest_viewed_states._quest_31'] & 1) << 31
+        | (values['quest_viewed_states._quest_32'] & 1) << 32
+        | (values["quest_viewed_states.Yonah's Gift"] & 1) << 33
+        | (values['quest_viewed_states._quest_34'] & 1) << 34
+        | (values['quest_viewed_states.A Signature Dish'] & 1) << 35
+        | (values['quest_viewed_states._quest_36'] & 1) << 36
+        | (values['quest_viewed_states._quest_37'] & 1) << 37
+        | (values['quest_viewed_states.The Tangled Message'] & 1) << 38
+        | (values['quest_viewed_states.Item Unknown'] & 1) << 39
+        | (values['quest_viewed_states._quest_40'] & 1) << 40
+        | (values['quest_viewed_states.Apology from a Fool'] & 1) << 41
+        | (values['quest_viewed_states.The Pride of a Lover'] & 1) << 42
+        | (values['quest_viewed_states._quest_43'] & 1) << 43
+        | (values['quest_viewed_states.The Missing Girl'] & 1) << 44
+        | (values['quest_viewed_states._quest_45'] & 1) << 45
+        | (values['quest_viewed_states._quest_46'] & 1) << 46
+        | (values['quest_viewed_states._quest_47'] & 1) << 47
+        | (values['quest_viewed_states._quest_48'] & 1) << 48
+        | (values['quest_viewed_states.Thieves in Training'] & 1) << 49
+        | (values['quest_viewed_states._quest_50'] & 1) << 50
+        | (values['quest_viewed_states._quest_51'] & 1) << 51
+        | (values['quest_viewed_states._quest_52'] & 1) << 52
+        | (values["quest_viewed_states.The Fisherman's Gambit, Part 6"] & 1) << 53
+        | (values['quest_viewed_states._quest_54'] & 1) << 54
+        | (values['quest_viewed_states._quest_55'] & 1) << 55
+        | (values["quest_viewed_states.The Fisherman's Final Gambit"] & 1) << 56
+        | (values['quest_viewed_states._quest_57'] & 1) << 57
+        | (values['quest_viewed_states._quest_58'] & 1) << 58
+        | (values['quest_viewed_states._quest_59'] & 1) << 59
+        | (values['quest_viewed_states._quest_60'] & 1) << 60
+        | (values['quest_viewed_states.Bon Appetit! 2'] & 1) << 61
+        | (values['quest_viewed_states._quest_62'] & 1) << 62
+        | (values["quest_viewed_states.The King's Mask"] & 1) << 63
+        | (values['quest_viewed_states._quest_64'] & 1) << 64
+        | (values['quest_viewed_states._quest_65'] & 1) << 65
+        | (values['quest_viewed_states._quest_66'] & 1) << 66
+        | (values['quest_viewed_states.Research Project'] & 1) << 67
+        | (values['quest_viewed_states.A Tale of the Study'] & 1) << 68
+        | (values['quest_viewed_states._quest_69'] & 1) << 69
+        | (values['quest_viewed_states._quest_70'] & 1) << 70
+        | (values['quest_viewed_states._quest_71'] & 1) << 71
+        | (values['quest_viewed_states._quest_72'] & 1) << 72
+        | (values['quest_viewed_states._quest_73'] & 1) << 73
+        | (values['quest_viewed_states._quest_74'] & 1) << 74
+        | (values['quest_viewed_states.Disturbing the Sleep of Kings'] & 1) << 75
+        | (values['quest_viewed_states._quest_76'] & 1) << 76
+        | (values['quest_viewed_states._quest_77'] & 1) << 77
+        | (values['quest_viewed_states._quest_78'] & 1) << 78
+        | (values['quest_viewed_states._quest_79'] & 1) << 79
+        | (values['quest_viewed_states._quest_80'] & 1) << 80
+        | (values['quest_viewed_states._quest_81'] & 1) << 81
+        | (values['quest_viewed_states.The Promised Gift'] & 1) << 82
+        | (values['quest_viewed_states._quest_83'] & 1) << 83
+        | (values['quest_viewed_states._quest_84'] & 1) << 84
+        | (values['quest_viewed_states._quest_85'] & 1) << 85
+        | (values['quest_viewed_states._quest_86'] & 1) << 86
+        | (values['quest_viewed_states._quest_87'] & 1) << 87
+    ).to_bytes(11, 'little')
+    _SAVEFILE_RUN_10.pack_into(buf, 1827, *_SAVEFILE_GET_10(values))
+    buf[1848:1864] = (
+        (values['words.Pah'] & 1)
+        | (values['words.Paha'] & 1) << 1
+        | (values['words.Pahi'] & 1) << 2
+        | (values['words.Paho'] & 1) << 3
+        | (values['words.Pahu'] & 1) << 4
+        | (values['words.Pahal'] & 1) << 5
+        | (values['words.Pahil'] & 1) << 6
+        | (values['words.Pahol'] & 1) << 7
+        | (values['words.Pahul'] & 1) << 8
+        | (values['words.Pahuloth'] & 1) << 9
+        | (values['words.Var'] & 1) << 10
+        | (values['words.Vara'] & 1) << 11
+        | (values['words.Vari'] & 1) << 12
+        | (values['words.Varo'] & 1) << 13
+        | (values['words.Varu'] & 1) << 14
+        | (values['words.Varal'] & 1) << 15
+        | (values['words.Varil'] & 1) << 16
+        | (values['words.Varol'] & 1) << 17
+        | (values['words.Varul'] & 1) << 18
+        | (values['words.Varuloth'] & 1) << 19
+        | (values['words.Geb'] & 1) << 20
+        | (values['words.Geba'] & 1) << 21
+        | (values['words.Gebi'] & 1) << 22
+        | (values['words.Gebo'] & 1) << 23
+        | (values['words.Gebu'] & 1) << 24
+        | (values['words.Gebal'] & 1) << 25
+        | (values['words.Gebil'] & 1) << 26
+        | (values['words.Gebol'] & 1) << 27
+        | (values['words.Gebul'] & 1) << 28
+        | (values['words.Gebuloth'] & 1) << 29
+        | (values['words.Ul'] & 1) << 30
+        | (values['words.Ula'] & 1) << 31
+        | (values['words.Uli'] & 1) << 32
+        | (values['words.Ulo'] & 1) << 33
+        | (values['words.Ulu'] & 1) << 34
+        | (values['words.Ulal'] & 1) << 35
+        | (values['words.Ulil'] & 1) << 36
+        | (values['words.Ulol'] & 1) << 37
+        | (values['words.Ulul'] & 1) << 38
+        | (values['words.Ululoth'] & 1) << 39
+        | (values['words.Hod'] & 1) << 40
+        | (values['words.Hoda'] & 1) << 41
+        | (values['words.Hodi'] & 1) << 42
+        | (values['words.Hodo'] & 1) << 43
+        | (values['words.Hodu'] & 1) << 44
+        | (values['words.Hodal'] & 1) << 45
+        | (values['words.Hodil'] & 1) << 46
+        | (values['words.Hodol'] & 1) << 47
+        | (values['words.Hodul'] & 1) << 48
+        | (values['words.Hoduloth'] & 1) << 49
+        | (values['words.Bes'] & 1) << 50
+        | (values['words.Besa'] & 1) << 51
+        | (values['words.Besi'] & 1) << 52
+        | (values['words.Beso'] & 1) << 53
+        | (values['words.Besu'] & 1) << 54
+        | (values['words.Besal'] & 1) << 55
+        | (values['words.Besil'] & 1) << 56
+        | (values['words.Besol'] & 1) << 57
+        | (values['words.Besul'] & 1) << 58
+        | (values['words.Besuloth'] & 1) << 59
+        | (values['words._word_60'] & 1) << 60
+        | (values['words._word_61'] & 1) << 61
+        | (values['words._word_62'] & 1) << 62
+        | (values['words._word_63'] & 1) << 63
+        | (values['words.Lug'] & 1) << 64
+        | (values['words.Lugir'] & 1) << 65
+        | (values['words.Luges'] & 1) << 66
+        | (values['words.Lugka'] & 1) << 67
+        | (values['words.Lugza'] & 1) << 68
+        | (values['words.Lugira'] & 1) << 69
+        | (values['words.Lugesra'] & 1) << 70
+        | (values['words.Lugkarr'] & 1) << 71
+        | (values['words.Lugzarr'] & 1) << 72
+        | (values['words.Lugzarken'] & 1) << 73
+        | (values['words.Ot'] & 1) << 74
+        | (values['words.Otir'] & 1) << 75
+        | (values['words.Otes'] & 1) << 76
+        | (values['words.Otka'] & 1) << 77
+        | (values['words.Otza'] & 1) << 78
+        | (values['words.Otira'] & 1) << 79
+        | (values['words.Otesra'] & 1) << 80
+        | (values['words.Otkarr'] & 1) << 81
+        | (values['words.Otzarr'] & 1) << 82
+        | (values['words.Otzarken'] & 1) << 83
+        | (values['words.Mah'] & 1) << 84
+        | (values['words.Mahir'] & 1) << 85
+        | (values['words.Mahes'] & 1) << 86
+        | (values['words.Mahka'] & 1) << 87
+        | (values['words.Mahza'] & 1) << 88
+        | (values['words.Mahira'] & 1) << 89
+        | (values['words.Mahesra'] & 1) << 90
+        | (values['words.Mahkarr'] & 1) << 91
+        | (values['words.Mahzarr'] & 1) << 92
+        | (values['words.Mahzarken'] & 1) << 93
+        | (values['words.Ashur'] & 1) << 94
+        | (values['words.Ashurir'] & 1) << 95
+        | (values['words.Ashures'] & 1) << 96
+        | (values['words.Ashurka'] & 1) << 97
+        | (values['words.Ashurza'] & 1) << 98
+        | (values['words.Ashurira'] & 1) << 99
+        | (values['words.Ashuresra'] & 1) << 100
+        | (values['words.Ashurkarr'] & 1) << 101
+        | (values['words.Ashurzarr'] & 1) << 102
+        | (values['words.Ashurzarken'] & 1) << 103
+        | (values['words.Kon'] & 1) << 104
+        | (values['words.Konir'] & 1) << 105
+        | (values['words.Kones'] & 1) << 106
+        | (values['words.Konka'] & 1) << 107
+        | (values['words.Konza'] & 1) << 108
+        | (values['words.Konira'] & 1) << 109
+        | (values['words.Konesra'] & 1) << 110
+        | (values['words.Konkarr'] & 1) << 111
+        | (values['words.Konzarr'] & 1) << 112
+        | (values['words.Konzarken'] & 1) << 113
+        | (values['words.Sol'] & 1) << 114
+        | (values['words.Solir'] & 1) << 115
+        | (values['words.Soles'] & 1) << 116
+        | (values['words.Solka'] & 1) << 117
+        | (values['words.Solza'] & 1) << 118
+        | (values['words.Solira'] & 1) << 119
+        | (values['words.Solesra'] & 1) << 120
+        | (values['words.Solkarr'] & 1) << 121
+        | (values['words.Solzarr'] & 1) << 122
+        | (values['words.Solzarken'] & 1) << 123
+        | (values['words.Ashurfarra'] & 1) << 124
+        | (values['words._word_125'] & 1) << 125
+        | (values['words._word_126'] & 1) << 126
+        | (values['words._word_127'] & 1) << 127
+    ).to_bytes(16, 'little')
+    _SAVEFILE_RUN_12.pack_into(buf, 1864, *_SAVEFILE_GET_12(values))
+    buf[2032:2044] = (
+        (values['tutorials.Controls'] & 1)
+        | (values['tutorials.Combos'] & 1) << 1
+        | (values['tutorials.Dark Blast'] & 1) << 2
+        | (values['tutorials.Dark Phantasm'] & 1) << 3
+        | (values['tutorials.Dark Hand'] & 1) << 4
+        | (values['tutorials.Dark Lance'] & 1) << 5
+        | (values['tutorials.Dark Whirlwind'] & 1) << 6
+        | (values['tutorials.Dark Gluttony'] & 1) << 7
+        | (values['tutorials.Dark Wall'] & 1) << 8
+        | (values['tutorials.Dark Execution'] & 1) << 9
+        | (values['tutorials.Maps'] & 1) << 10
+        | (values['tutorials.Interactions'] & 1) << 11
+        | (values['tutorials.Attack Gauges'] & 1) << 12
+        | (values['tutorials.Saving'] & 1) << 13
+        | (values['tutorials.Quests'] & 1) << 14
+        | (values['tutorials.Weapon Types'] & 1) << 15
+        | (values['tutorials.Cultivating Plants'] & 1) << 16
+        | (values['tutorials.Forging Weapons'] & 1) << 17
+        | (values['tutorials.Shops'] & 1) << 18
+        | (values['tutorials.Mine Carts'] & 1) << 19
+        | (values['tutorials.Switching Magic and Abilities'] & 1) << 20
+        | (values['tutorials.Fishing'] & 1) << 21
+        | (values['tutorials.Viewing Letters'] & 1) << 22
+        | (values['tutorials.Changing Weapons'] & 1) << 23
+        | (values['tutorials.Moving Boxes'] & 1) << 24
+        | (values['tutorials._tutorial_25'] & 1) << 25
+        | (values['tutorials.Charging'] & 1) << 26
+        | (values['tutorials._tutorial_27'] & 1) << 27
+        | (values['tutorials.Skull Cracker'] & 1) << 28
+        | (values['tutorials.Deflecting'] & 1) << 29
+        | (values['tutorials._tutorial_30'] & 1) << 30
+        | (values['tutorials._tutorial_31'] & 1) << 31
+        | (values['tutorials._tutorial_32'] & 1) << 32
+        | (values['tutorials.Sidestepping'] & 1) << 33
+        | (values['tutorials.Sidestep Attacks'] & 1) << 34
+        | (values['tutorials.Combo and Magic Charging'] & 1) << 35
+        | (values['tutorials.Magic Resistance'] & 1) << 36
+        | (values['tutorials.Cancels'] & 1) << 37
+        | (values['tutorials._tutorial_38'] & 1) << 38
+        | (values['tutorials._tutorial_39'] & 1) << 39
+        | (values['tutorials.Guard Breaks'] & 1) << 40
+        | (values['tutorials.Heavy Attack Guard Breaks'] & 1) << 41
+        | (values['tutorials.Earning Money'] & 1) << 42
+        | (values['tutorials.Fishing Tip'] & 1) << 43
+        | (values['tutorials.Fishing Tip 2'] & 1) << 44
+        | (values['tutorials.Fishing Tip 3'] & 1) << 45
+        | (values['tutorials.Fishing Tip 4'] & 1) << 46
+        | (values['tutorials.Fishing Tip 5'] & 1) << 47
+        | (values['tutorials.Armored Enemies'] & 1) << 48
+        | (values['tutorials.Controlling Boars'] & 1) << 49
+        | (values['tutorials.Bombs'] & 1) << 50
+        | (values['tutorials.Breakable Boxes'] & 1) << 51
+        | (values['tutorials.Breakable Barriers'] & 1) << 52
+        | (values['tutorials.Gathering Items'] & 1) << 53
+        | (values['tutorials.Hidden Items'] & 1) << 54
+        | (values['tutorials.Words'] & 1) << 55
+        | (values['tutorials.Ordering Allies'] & 1) << 56
+        | (values['tutorials.Ordering Animals'] & 1) << 57
+        | (values['tutorials.Item and Equipment Shortcuts'] & 1) << 58
+        | (values['tutorials.Wall Kicks'] & 1) << 59
+        | (values['tutorials.Combo Basics'] & 1) << 60
+        | (values['tutorials.Deflecting Enemy Magic'] & 1) << 61
+        | (values['tutorials.Fighting Magic Resistant Enemies'] & 1) << 62
+        | (values['tutorials.Fighting Wolves'] & 1) << 63
+        | (values['tutorials.Stronger Dark Blasts'] & 1) << 64
+        | (values['tutorials.Harvests'] & 1) << 65
+        | (values['tutorials.Rare Items'] & 1) << 66
+        | (values['tutorials._tutorial_67'] & 1) << 67
+        | (values['tutorials.Collecting Materials'] & 1) << 68
+        | (values['tutorials.Absorbing Blood'] & 1) << 69
+        | (values['tutorials.Magical Collisions'] & 1) << 70
+        | (values['tutorials.Ending B'] & 1) << 71
+        | (values['tutorials.Ending C'] & 1) << 72
+        | (values['tutorials.Ending D'] & 1) << 73
+        | (values['tutorials.Evading'] & 1) << 74
+        | (values['tutorials.Double Jump'] & 1) << 75
+        | (values['tutorials._tutorial_76'] & 1) << 76
+        | (values['tutorials.Weapon Quick Switching'] & 1) << 77
+        | (values['tutorials.Finishing Blow'] & 1) << 78
+        | (values['tutorials.Magic or Ability Quick Switching'] & 1) << 79
+        | (values['tutorials.Lock On'] & 1) << 80
+        | (values['tutorials._tutorial_81'] & 1) << 81
+        | (values['tutorials._tutorial_82'] & 1) << 82
+        | (values['tutorials.Poison'] & 1) << 83
+        | (values['tutorials._tutorial_84'] & 1) << 84
+        | (values['tutorials._tutorial_85'] & 1) << 85
+        | (values['tutorials._tutorial_86'] & 1) << 86
+        | (values['tutorials._tutorial_87'] & 1) << 87
+        | (values['tutorials._tutorial_88'] & 1) << 88
+        | (values['tutorials._tutorial_89'] & 1) << 89
+        | (values['tutorials._tutorial_90'] & 1) << 90
+        | (values['tutorials._tutorial_91'] & 1) << 91
+        | (values['tutorials._tutorial_92'] & 1) << 92
+        | (values['tutorials._tutorial_93'] & 1) << 93
+        | (values['tutorials._tutorial_94'] & 1) << 94
+        | (values['tutorials._tutorial_95'] & 1) << 95
+    ).to_bytes(12, 'little')
+    _SAVEFILE_RUN_14.pack_into(buf, 2044, *_SAVEFILE_GET_14(values))
+    buf[3148:3152] = (
+        (values['quests_b._unk_0.0'] & 1)
+        | (values['quests_b._unk_0.1'] & 1) << 1
+        | (values['quests_b._unk_0.2'] & 1) << 2
+        | (values['quests_b.The Promised Gift.started'] & 1) << 3
+        | (values['quests_b.The Promised Gift.stages.0'] & 1) << 4
+        | (values['quests_b.The Promised Gift.stages.1'] & 1) << 5
+        | (values['quests_b.The Promised Gift.stages.2'] & 1) << 6
+        | (values['quests_b.The Promised Gift.stages.3'] & 1) << 7
+        | (values['quests_b.The Promised Gift.stages.4'] & 1) << 8
+        | (values['quests_b.The Promised Gift.done'] & 1) << 9
+        | (values['quests_b._unk_1.0'] & 1) << 10
+        | (values['quests_b._unk_1.1'] & 1) << 11
+        | (values['quests_b._unk_1.2'] & 1) << 12
+        | (values['quests_b._unk_1.3'] & 1) << 13
+        | (values['quests_b._unk_1.4'] & 1) << 14
+        | (values['quests_b._unk_1.5'] & 1) << 15
+        | (values['quests_b._unk_1.6'] & 1) << 16
+        | (values['quests_b._unk_1.7'] & 1) << 17
+        | (values['quests_b._unk_1.8'] & 1) << 18
+        | (values['quests_b._unk_1.9'] & 1) << 19
+        | (values['quests_b._unk_1.10'] & 1) << 20
+        | (values['quests_b._unk_1.11'] & 1) << 21
+        | (values['quests_b._unk_1.12'] & 1) << 22
+        | (values['quests_b._unk_1.13'] & 1) << 23
+        | (values['quests_b._unk_1.14'] & 1) << 24
+        | (values['quests_b._unk_1.15'] & 1) << 25
+        | (values['quests_b._unk_1.16'] & 1) << 26
+        | (values['quests_b._unk_1.17'] & 1) << 27
+        | (values['quests_b._unk_1.18'] & 1) << 28
+        | (values['quests_b._unk_1.19'] & 1) << 29
+        | (values['quests_b._unk_1.20'] & 1) << 30
+        | (values['quests_b._unk_1.21'] & 1) << 31
+    ).to_bytes(4, 'little')
+    _SAVEFILE_RUN_16.pack_into(buf, 3152, *_SAVEFILE_GET_16(values))
+    buf[37456:37460] = sum(buf[0:3104]).to_bytes(4, 'little')
+    return bytes(buf)
@@ -0,0 +1,274 @@
+"""
+Garden growth engine: growth stage, harvest-ready time, and yield for every garden plot in every save slot of any number
+of GAMEDATA files.
+
+Plot states are unpacked directly from the raw garden bytes of each slot via :func:`struct.iter_unpack` (without parsing
+any other part of the save file), and stored in flat :class:`array.array` columns indexed by (file, slot, plot), so
+questions like "when is every plot in every save ready" can be answered for thousands of saves in one call.
+
+Growth times and yields are not stored in save files, so every function that needs them requires a
+:class:`GrowthModel`, which may be loaded from a JSON or YAML file via :meth:`GrowthModel.load`.
+
+:author: Doug Skrypa
+"""
+
+import json
+import logging
+import math
+from array import array
+from datetime import datetime
+from pathlib import Path
+from struct import Struct
+from typing import TYPE_CHECKING, Union, Iterable, Optional, Any, Mapping
+
+from .compression import decompress
+from .constants import PLANTS, FERTILIZER
+from .constructs.layouts import struct_layout, struct_size
+
+if TYPE_CHECKING:
+    from .save_file import GameData
+
+__all__ = ['GrowthModel', 'GardenStates', 'garden_states', 'when_ready', 'STAGES']
+log = logging.getLogger(__name__)
+
+STAGES = ('empty', 'seed', 'sprout', 'growing', 'ready')
+EMPTY = 255  # Seed value for plots where nothing is planted
+PLOTS = 15
+SLOTS = 7
+PLOT_STRUCT = Struct('<IIIfH5Bx')  # seed, fertilizer, water, direction, time (year, month, day, hour, minute, second)
+Source = Union[str, Path, bytes, 'GameData']
+
+
+class GrowthModel:
+    """
+    Growth times and yields for each plant, fertilizer, and number of times watered.  Lookup tables indexed by seed
+    value, fertilizer value, and water count are built once, so computing values for many plots is cheap.
+
+    :param growth_hours: Mapping of {seed name: real-time hours to grow with no fertilizer}
+    :param speed_factor: Growth time multiplier when Speed Fertilizer is used
+    :param base_yield: Number of items harvested from a plot that was not watered or fertilized
+    :param water_bonus: Additional items harvested per time watered
+    :param bounty_factor: Yield multiplier when Bounty Fertilizer is used
+    :param seed_return: Expected number of seeds returned per harvest
+    :param flowering_factor: Expected seed return multiplier when Flowering Fertilizer is used
+    """
+
+    def __init__(
+        self,
+        growth_hours: Mapping[str, float],
+        speed_factor: float,
+        base_yield: int,
+        water_bonus: int,
+        bounty_factor: int,
+        seed_return: float,
+        flowering_factor: float,
+    ):
+        if bad := set(growth_hours).difference(PLANTS):
+            raise ValueError(f'Invalid growth_hours seeds: {", ".join(sorted(bad))}')
+        self.growth_hours = dict(growth_hours)
+        self.speed_factor = speed_factor
+        self.base_yield = base_yield
+        self.water_bonus = water_bonus
+        self.bounty_factor = bounty_factor
+        self.seed_return = seed_return
+        self.flowering_factor = flowering_factor
+
+        speed, bounty, flowering = (FERTILIZER.index(f'{name} Fertilizer') for name in ('Speed', 'Bounty', 'Flowering'))
+        n_fert = len(FERTILIZER)
+        self._hours = hours = array('d', [math.nan]) * (256 * n_fert)  # [seed * n_fert + fertilizer]
+        self._yields = yields = array('B', bytes(256 * n_fert * 3))  # [(seed * n_fert + fertilizer) * 3 + water]
+        self._seeds = seeds = array('d', bytes(8 * 256 * n_fert))  # [seed * n_fert + fertilizer]
+        for seed_name, base_hours in growth_hours.items():
+            seed = PLANTS.index(seed_name)
+            for fertilizer in range(n_fert):
+                i = seed * n_fert + fertilizer
+                hours[i] = base_hours * (speed_factor if fertilizer == speed else 1)
+                seeds[i] = seed_return * (flowering_factor if fertilizer == flowering else 1)
+                for water in range(3):
+                    total = base_yield + water * water_bonus
+                    yields[i * 3 + water] = total * (bounty_factor if fertilizer == bounty else 1)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'GrowthModel':
+        """
+        :param path: Path to a JSON or YAML (``.yaml`` / ``.yml``) file containing a mapping of {parameter: value} for
+          every parameter of this class
+        :return: The loaded model
+        """
+        path = Path(path).expanduser()
+        if path.suffix.lower() in {'.yaml', '.yml'}:
+            import yaml
+
+            params = yaml.safe_load(path.read_text('utf-8'))
+        else:
+            params = json.loads(path.read_text('utf-8'))
+        if not isinstance(params, dict):
+            raise ValueError(f'Invalid growth model in {path.as_posix()} - expected a mapping of parameters')
+        try:
+            return cls(**params)
+        except TypeError as e:
+            raise ValueError(f'Invalid growth model in {path.as_posix()}: {e}') from e
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[plants={len(self.growth_hours)}, speed_factor={self.speed_factor}]>'
+
+    def hours(self, seed: int, fertilizer: int) -> float:
+        """:return: The number of hours for the given seed to grow with the given fertilizer (NaN if unknown)"""
+        return math.nan if (i := _index(seed, fertilizer)) is None else self._hours[i]
+
+    def yield_of(self, seed: int, fertilizer: int, water: int) -> int:
+        """:return: The number of items harvested from the given seed with the given fertilizer and water count"""
+        return 0 if (i := _index(seed, fertilizer)) is None else self._yields[i * 3 + water]
+
+    def seeds_returned(self, seed: int, fertilizer: int) -> float:
+        """:return: The expected number of seeds returned by harvesting the given seed with the given fertilizer"""
+        return 0 if (i := _index(seed, fertilizer)) is None else self._seeds[i]
+
+    def ready_time(self, seed: int, fertilizer: int, planted: Optional[datetime]) -> Optional[datetime]:
+        """:return: The time at which the given seed will be ready to harvest, or None if it cannot be determined"""
+        if not isinstance(planted, datetime) or seed == EMPTY or math.isnan(hours := self.hours(seed, fertilizer)):
+            return None
+        return datetime.fromtimestamp(planted.timestamp() + hours * 3600)
+
+
+def _index(seed: int, fertilizer: int) -> Optional[int]:
+    """:return: The lookup table index for the given seed and fertilizer values, or None if either is out of range"""
+    return seed * len(FERTILIZER) + fertilizer if seed < 256 and fertilizer < len(FERTILIZER) else None
+
+
+class GardenStates:
+    """
+    The state of every garden plot in every save slot of one or more GAMEDATA files, stored in flat arrays.  The value
+    for plot ``p`` (0-14) in slot ``s`` (1-7) of the ``f``-th file is at index ``(f * 7 + s - 1) * 15 + p``.
+
+    Plant and ready times are stored as POSIX timestamps, with NaN for plots with nothing planted (or with an unknown
+    plant / invalid plant time).
+    """
+
+    def __init__(self, model: GrowthModel):
+        self.model = model
+        self.labels = []  # One per file, such as the file's path
+        self.seeds = array('I')
+        self.fertilizer = array('I')
+        self.water = array('B')  # Number of times watered (0-2)
+        self.planted = array('d')
+        self.ready = array('d')
+        self.yields = array('B')
+
+    def __len__(self) -> int:
+        return len(self.seeds)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[files={len(self.labels)}, plots={len(self)}]>'
+
+    @staticmethod
+    def index(file: int, slot: int, plot: int) -> int:
+        """:return: The array index for the given file index, slot number (1-7), and plot number (0-14)"""
+        return (file * SLOTS + slot - 1) * PLOTS + plot
+
+    def add(self, label: Any, data: bytes):
+        """
+        Add the garden plots from all slots in the given GAMEDATA file content.
+
+        :param label: A label for the file, such as its path
+        :param data: The full content of a GAMEDATA file
+        """
+        header_size, slot_size = struct_size('Header'), struct_size('Savefile')
+        if len(data) != header_size + slot_size * SLOTS:
+            raise ValueError(f'Invalid GAMEDATA for {label=} - expected {header_size + slot_size * SLOTS} bytes')
+        self.labels.append(label)
+        for slot in range(SLOTS):
+            self._add_slot(data, header_size + slot * slot_size)
+
+    def _add_slot(self, data: bytes, offset: int):
+        garden_offset, garden_size = struct_layout('Savefile')['garden']
+        start = offset + garden_offset
+        model = self.model
+        for seed, fertilizer, water, _, year, month, day, hour, minute, second in PLOT_STRUCT.iter_unpack(
+            data[start:start + garden_size]
+        ):
+            water = (water & 1) + (water >> 1 & 1)
+            planted = math.nan
+            if seed != EMPTY and year:
+                try:
+                    planted = datetime(year, month, day, hour, minute, second).timestamp()
+                except ValueError:
+                    pass
+
+            self.seeds.append(seed)
+            self.fertilizer.append(fertilizer)
+            self.water.append(water)
+            self.planted.append(planted)
+            if (i := _index(seed, fertilizer)) is not None:
+                self.ready.append(planted + model._hours[i] * 3600)
+                self.yields.append(model._yields[i * 3 + water])
+            else:
+                self.ready.append(math.nan)
+                self.yields.append(0)
+
+    def stages(self, now: datetime = None) -> array:
+        """
+        :param now: The time at which stages should be computed (default: now)
+        :return: Array containing the index in :data:`STAGES` of the growth stage for each plot
+        """
+        now = (now or datetime.now()).timestamp()
+        stages = array('B', bytes(len(self)))
+        for i, (seed, planted, ready) in enumerate(zip(self.seeds, self.planted, self.ready)):
+            if seed == EMPTY:
+                continue
+            elif math.isnan(ready):
+                stages[i] = 1
+            elif now >= ready:
+                stages[i] = 4
+            else:
+                stages[i] = 1 + min(2, max(0, int(3 * (now - planted) / (ready - planted))))
+        return stages
+
+    def ready_times(self) -> dict[tuple[Any, int], Optional[datetime]]:
+        """
+        :return: Mapping of {(file label, slot number): time at which every planted plot in that slot is ready}, with
+          None for slots that have nothing planted (or only plots with unknown ready times)
+        """
+        ready, results = self.ready, {}
+        for f, label in enumerate(self.labels):
+            for slot in range(1, SLOTS + 1):
+                start = self.index(f, slot, 0)
+                times = [t for t in ready[start:start + PLOTS] if not math.isnan(t)]
+                results[(label, slot)] = datetime.fromtimestamp(max(times)) if times else None
+        return results
+
+
+def garden_states(sources: Iterable[Source], model: GrowthModel) -> GardenStates:
+    """
+    :param sources: GAMEDATA file paths, directories of GAMEDATA snapshots (such as save_watcher backups), file content,
+      or :class:`GameData<.save_file.GameData>` objects (including any unsaved changes).  Compressed files are
+      decompressed transparently.
+    :param model: The :class:`GrowthModel` to use
+    :return: A :class:`GardenStates` containing every plot in every slot of every source
+    """
+    states = GardenStates(model)
+    for source in sources:
+        if isinstance(source, (str, Path)):
+            path = Path(source).expanduser()
+            if path.is_dir():
+                from .series import snapshot_paths
+
+                for snapshot in snapshot_paths(path):
+                    states.add(snapshot, decompress(snapshot.read_bytes()))
+            else:
+                states.add(path, decompress(path.read_bytes()))
+        elif isinstance(source, bytes):
+            states.add(len(states.labels), source)
+        else:
+            data = source._construct.build(source._build())  # Not _data, so unsaved changes are included
+            states.add(getattr(source, '_path', None) or len(states.labels), data)
+    return states
+
+
+def when_ready(sources: Iterable[Source], model: GrowthModel) -> dict[tuple[Any, int], Optional[datetime]]:
+    """
+    :param sources: Any sources accepted by :func:`garden_states`
+    :param model: The :class:`GrowthModel` to use
+    :return: Mapping of {(file label, slot number): time at which every planted plot in that slot is ready}
+    """
+    return garden_states(sources, model).ready_times()
@@ -0,0 +1,313 @@
+"""
+Garden schedule planner: finds the planting, fertilizer, and watering schedule for a save slot's garden plots that
+maximizes the expected harvest of a target item per real-time hour, given the seeds and fertilizer in the slot's
+inventory.
+
+Each plot is available from now (if empty) or from when its current plant is ready.  Plots whose plants are already
+ready but have not been harvested are left alone (and reported) unless replanting them is explicitly allowed, since
+planting over them would discard their harvest.  An option for a plot is a seed, fertilizer, and number of
+consecutive plantings within the planning horizon.  Watering is free and only increases yields, so plots are always
+watered twice.  The best combination of options across plots is found with a depth-first search over (plot, remaining
+inventory) states, memoized so that equivalent states are only solved once, and pruned with an upper bound based on the
+best unconstrained option for each remaining plot.  Between combinations with the same expected value, the one that
+finishes first is used, so seeds are planted in parallel in separate plots rather than one after another in one plot.
+
+Only the seeds and fertilizer that are currently in the inventory are planned for - seeds returned by harvests during
+the planning horizon are not re-planted (their expected number still counts toward seed targets).
+
+:author: Doug Skrypa
+"""
+
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import Union, Mapping, Optional, NamedTuple
+
+from .constants import PLANTS, FERTILIZER, SEED_RESULT_MAP
+from .garden import GrowthModel, EMPTY
+from .save_file import SaveFile
+
+__all__ = ['plan_garden', 'GardenPlan', 'Planting']
+log = logging.getLogger(__name__)
+
+WATER = 2
+EPSILON = 1e-9  # Tolerance for considering the expected values of two combinations of options to be equal
+
+
+class Planting(NamedTuple):
+    plot: int
+    seed: str
+    fertilizer: str
+    water: int
+    planted: datetime
+    ready: datetime
+    expected: float  # Expected number of target items (weighted) from this harvest
+
+
+class _Option(NamedTuple):
+    value: float
+    seed: Optional[int]  # None for the option to plant nothing
+    fertilizer: int
+    cycles: int
+    finish: float  # Hours from now until the last planting in this option is ready (0 for the option to plant nothing)
+
+
+class GardenPlan:
+    def __init__(
+        self,
+        target: dict[str, float],
+        horizon: float,
+        current: list[Planting],
+        plantings: list[Planting],
+        start: datetime,
+        unharvested: list[int] = (),
+    ):
+        self.target = target
+        self.horizon = horizon
+        self.current = current  # Plants that were already planted, which will be ready within the horizon
+        self.plantings = plantings  # Planned plantings
+        self.start = start
+        self.unharvested = list(unharvested)  # Plots with ready, unharvested plants that will be planted over
+
+    @property
+    def expected(self) -> float:
+        return sum(p.expected for p in self.current) + sum(p.expected for p in self.plantings)
+
+    @property
+    def rate(self) -> float:
+        """The expected number of target items per real-time hour"""
+        return self.expected / self.horizon
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[plantings={len(self.plantings)}, rate={self.rate:.3f}/h]>'
+
+    def show(self):
+        targets = ', '.join(f'{k} x{v}' if v != 1 else k for k, v in self.target.items())
+        print(f'Plan for {targets} over {self.horizon:g}h: {self.expected:.2f} expected ({self.rate:.3f}/h)')
+        for p in sorted(self.current + self.plantings, key=lambda p: (p.planted, p.plot)):
+            planted, ready = p.planted.isoformat(' ', 'minutes'), p.ready.isoformat(' ', 'minutes')
+            prefix = '*' if p in self.current else ' '
+            print(f' {prefix}plot {p.plot:>2d}: {planted} -> {ready}  {p.seed} + {p.fertilizer}, water x{p.water}')
+        if self.current:
+            print('  (* = currently planted)')
+        if self.unharvested:
+            plots = ', '.join(map(str, self.unharvested))
+            print(f'  Warning: ready plants in plots {plots} have not been harvested and will be planted over')
+
+    def initial_plantings(self) -> list[Planting]:
+        """
+        The plantings that can be made now (i.e., those in plots that are currently empty, or that have unharvested
+        plants if the plan was created with ``replant_ready=True``)
+        """
+        occupied = {p.plot for p in self.current}.difference(self.unharvested)
+        return [p for p in self.plantings if p.planted == self.start and p.plot not in occupied]
+
+    def apply(self, save_file: SaveFile):
+        """
+        Plant the seeds for :meth:`.initial_plantings` in the given save slot's garden via the :class:`Garden` setters,
+        and remove the seeds / fertilizer used from its inventory.
+        """
+        initial = self.initial_plantings()
+        if replanted := sorted({p.plot for p in initial}.intersection(self.unharvested)):
+            log.warning(f'Planting over unharvested plants in plots: {", ".join(map(str, replanted))}')
+        used = {}
+        for planting in initial:
+            used[planting.seed] = used.get(planting.seed, 0) + 1
+            if planting.fertilizer != 'None':
+                used[planting.fertilizer] = used.get(planting.fertilizer, 0) + 1
+
+        inventory = save_file.inventory
+        if missing := {name: num for name, num in used.items() if inventory[name] < num}:
+            raise ValueError(f'Unable to apply {self} to {save_file} - not enough items in inventory: {missing}')
+
+        garden = save_file.garden
+        for attr in ('seed', 'fertilizer', 'water'):
+            for value in {getattr(p, attr) for p in initial}:
+                plots = [p.plot for p in initial if getattr(p, attr) == value]
+                if attr == 'seed':
+                    garden.set_seed(value, plots)
+                elif attr == 'fertilizer':
+                    garden.set_fertilizer(value, plots=plots)
+                else:
+                    garden.set_water(value, plots=plots)
+        if initial:
+            garden.set_plant_times(self.start, plots=[p.plot for p in initial])
+        inventory.update({name: inventory[name] - num for name, num in used.items()})
+
+
+class _Planner:
+    def __init__(
+        self,
+        model: GrowthModel,
+        target: dict[str, float],
+        horizon: float,
+        seeds: dict[int, int],
+        fertilizers: dict[int, int],
+    ):
+        self.model = model
+        self.horizon = horizon
+        self.gains = _gains(model, target)
+        self.seed_keys = sorted(seed for seed in seeds if any(gain > 0 for gain in self.gains.get(seed, ())))
+        self.fert_keys = sorted(fertilizers)
+        self.resources = tuple(seeds[s] for s in self.seed_keys) + tuple(fertilizers[f] for f in self.fert_keys)
+        self._options = {}
+        self._memo = {}
+
+    def options(self, available: float) -> list[_Option]:
+        """All options for a plot that is available after the given number of hours, best first (memoized)"""
+        key = round(available * 60)  # Minute resolution
+        try:
+            return self._options[key]
+        except KeyError:
+            pass
+
+        options = [_Option(0, None, 0, 0, 0)]
+        remaining = self.horizon - available
+        for seed in self.seed_keys:
+            for fertilizer, gain in enumerate(self.gains[seed]):
+                if gain <= 0 or (fertilizer and fertilizer not in self.fert_keys):
+                    continue
+                hours = self.model.hours(seed, fertilizer)
+                max_cycles = int(remaining // hours) if hours > 0 else 0
+                options.extend(
+                    _Option(c * gain, seed, fertilizer, c, available + c * hours) for c in range(1, max_cycles + 1)
+                )
+
+        options.sort(key=lambda o: (-o.value, o.finish))
+        self._options[key] = options
+        return options
+
+    def solve(self, availability: list[float]) -> tuple[float, list[_Option]]:
+        order = sorted(range(len(availability)), key=availability.__getitem__)
+        avail = [availability[i] for i in order]
+        bounds = [0.0] * (len(avail) + 1)  # bounds[i]: max possible value for plots i+ if resources were unlimited
+        for i in range(len(avail) - 1, -1, -1):
+            bounds[i] = bounds[i + 1] + self.options(avail[i])[0].value
+
+        value, _, choices = self._solve(0, self.resources, avail, bounds)
+        by_plot = [None] * len(availability)
+        for i, choice in zip(order, choices):
+            by_plot[i] = choice
+        return value, by_plot
+
+    def _solve(self, i: int, resources: tuple[int, ...], avail: list[float], bounds: list[float]):
+        """:return: Tuple of (value, finish, choices) for the best options for plots i+, where finish is the time (in
+          hours from now) when the last of those plantings is ready; ties in value are broken by the earliest finish
+        """
+        if i == len(avail):
+            return 0.0, 0.0, []
+        key = (i, avail[i], resources)
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+
+        n_seeds = len(self.seed_keys)
+        best = (-1.0, math.inf, [])
+        for option in self.options(avail[i]):
+            if option.value + bounds[i + 1] < best[0] - EPSILON:
+                break  # Options are sorted by value, so no later option can be better (or tied) either
+            if option.seed is None:
+                remaining = resources
+            else:
+                remaining = list(resources)
+                remaining[self.seed_keys.index(option.seed)] -= option.cycles
+                if option.fertilizer:
+                    remaining[n_seeds + self.fert_keys.index(option.fertilizer)] -= option.cycles
+                if min(remaining) < 0:
+                    continue
+                remaining = tuple(remaining)
+
+            value, finish, choices = self._solve(i + 1, remaining, avail, bounds)
+            value, finish = option.value + value, max(option.finish, finish)
+            if value > best[0] + EPSILON or (value >= best[0] - EPSILON and finish < best[1]):
+                best = (value, finish, [option] + choices)
+
+        self._memo[key] = best
+        return best
+
+
+def plan_garden(
+    save_file: SaveFile,
+    target: Union[str, Mapping[str, float]],
+    model: GrowthModel,
+    horizon: float = 72,
+    now: datetime = None,
+    replant_ready: bool = False,
+) -> GardenPlan:
+    """
+    Plan plantings for the given save slot's garden using only the seeds and fertilizer in its inventory.  Seeds
+    returned by harvests during the horizon are not planted again; they only count toward seed targets.
+
+    :param save_file: The save slot whose garden and inventory should be used
+    :param target: The item to maximize (a seed, such as ``Gold Moonflower Seed``, or a harvested item, such as
+      ``Gold Moonflower``), or a mapping of {item: weight} for multiple items
+    :param model: The :class:`GrowthModel<.garden.GrowthModel>` to use
+    :param horizon: The number of real-time hours to plan for
+    :param now: The time from which to plan (default: now)
+    :param replant_ready: Allow planting over plants that are ready but were not harvested yet, which discards their
+      harvest.  By default, such plots are treated as occupied for the whole horizon.
+    :return: The best :class:`GardenPlan` that was found
+    """
+    target = {target: 1} if isinstance(target, str) else dict(target)
+    if bad := [t for t in target if t not in PLANTS and t not in SEED_RESULT_MAP.values()]:
+        raise ValueError(f'Invalid target item(s): {", ".join(bad)}')
+    now = (now or datetime.now()).replace(second=0, microsecond=0)
+
+    inventory = save_file.inventory
+    seeds = {seed: inventory[name] for seed, name in enumerate(PLANTS) if inventory[name]}
+    fertilizers = {f: inventory[name] for f, name in enumerate(FERTILIZER) if f and inventory[name]}
+    planner = _Planner(model, target, horizon, seeds, fertilizers)
+
+    current, plantings, availability, unharvested = [], [], [], []
+    gains = planner.gains
+    for i, plot in enumerate(save_file.garden):
+        seed, fertilizer = plot._enum_values()
+        if seed == EMPTY:
+            availability.append(0)
+        elif ready := plot.ready_time(model):
+            hours = max(0.0, (ready - now).total_seconds() / 3600)
+            if ready_now := hours == 0:  # Ready, but not harvested yet
+                unharvested.append(i)
+            availability.append(math.inf if ready_now and not replant_ready else hours)
+            if ready_now and replant_ready:
+                continue  # It will be planted over, so its harvest is lost
+            elif hours <= horizon and (gain := gains.get(seed, (0,) * len(FERTILIZER))[fertilizer]):
+                water = sum(1 for k, v in plot.water.items() if k != '_flagsenum' and v)
+                expected = gain * model.yield_of(seed, fertilizer, water) / model.yield_of(seed, fertilizer, WATER)
+                current.append(Planting(i, PLANTS[seed], FERTILIZER[fertilizer], water, plot.time, ready, expected))
+        else:
+            availability.append(math.inf)  # Unknown plant / plant time - leave it alone
+
+    if unharvested and not replant_ready:
+        plots = ', '.join(map(str, unharvested))
+        log.warning(f'Plots with ready plants that have not been harvested will not be planned: {plots}')
+        unharvested = []
+
+    log.debug(f'Planning for {len(seeds)} seed types / {len(fertilizers)} fertilizer types; {availability=}')
+    value, choices = planner.solve([min(a, horizon) for a in availability])
+    for i, (available, option) in enumerate(zip(availability, choices)):
+        if option.seed is None:
+            continue
+        hours = model.hours(option.seed, option.fertilizer)
+        gain = option.value / option.cycles
+        for cycle in range(option.cycles):
+            planted = now + timedelta(hours=available + cycle * hours)
+            ready = planted + timedelta(hours=hours)
+            seed, fertilizer = PLANTS[option.seed], FERTILIZER[option.fertilizer]
+            plantings.append(Planting(i, seed, fertilizer, WATER, planted, ready, gain))
+
+    return GardenPlan(target, horizon, current, plantings, now, unharvested)
+
+
+def _gains(model: GrowthModel, target: dict[str, float]) -> dict[int, tuple[float, ...]]:
+    """:return: Mapping of {seed: (expected weighted target items per harvest for each fertilizer)}"""
+    gains = {}
+    for seed, name in enumerate(PLANTS):
+        seed_weight, item_weight = target.get(name, 0), target.get(SEED_RESULT_MAP.get(name), 0)
+        if seed_weight or item_weight:
+            gains[seed] = tuple(
+                seed_weight * model.seeds_returned(seed, f) + item_weight * model.yield_of(seed, f, WATER)
+                for f in range(len(FERTILIZER))
+            )
+    return gains
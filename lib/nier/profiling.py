@@ -0,0 +1,159 @@
+"""
+Opt-in instrumentation for timing the phases of loading, parsing, diffing, rendering, and saving save files.
+
+Instrumentation points call :func:`phase` and :func:`count`, which do nothing but check a module-level variable unless a
+:class:`Profiler` is active.  Example::
+
+    >>> with Profiler() as profiler:
+    ...     GameData.load(path).slots[0].pprint()
+    >>> print(profiler.summary())
+
+:author: Doug Skrypa
+"""
+
+import sys
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Union, Optional, ContextManager
+
+if TYPE_CHECKING:
+    from pstats import Stats
+
+__all__ = ['Profiler', 'phase', 'count', 'profiled']
+
+_active: Optional['Profiler'] = None
+_null_phase = nullcontext()
+
+
+def phase(name: str) -> ContextManager:
+    """
+    :param name: The name of the phase being timed (such as read, parse, clean, render, or write).  Time spent in nested
+      phases is also included in the time for the enclosing phase.
+    :return: A context manager that records the time spent in its body if a :class:`Profiler` is active
+    """
+    return _null_phase if _active is None else _active.phase(name)
+
+
+def count(name: str, n: int = 1):
+    """Increment the counter with the given name by n if a :class:`Profiler` is active"""
+    if _active is not None:
+        _active.counts[name] += n
+
+
+class Profiler:
+    """
+    Records per-phase timings and event counts while active.  Optionally also runs :mod:`cProfile` so that full stats
+    can be viewed or saved via :mod:`pstats`.
+    """
+
+    def __init__(self, cprofile: bool = False):
+        self.timings = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.counts = defaultdict(int)
+        self.total = 0
+        if cprofile:
+            from cProfile import Profile
+
+            self._cprofile = Profile()
+        else:
+            self._cprofile = None
+        self._in_progress = set()
+        self._previous = None
+        self._start = None
+
+    def __enter__(self) -> 'Profiler':
+        global _active
+        self._previous, _active = _active, self
+        self._start = perf_counter()
+        if self._cprofile:
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _active
+        if self._cprofile:
+            self._cprofile.disable()
+        self.total += perf_counter() - self._start
+        _active = self._previous
+
+    @contextmanager
+    def phase(self, name: str):
+        if name in self._in_progress:  # Recursive calls, such as GameData.diff -> SaveFile.diff, are only timed once
+            yield
+            return
+
+        self._in_progress.add(name)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += perf_counter() - start
+            self.calls[name] += 1
+            self._in_progress.remove(name)
+
+    def as_dict(self) -> dict[str, dict[str, Union[int, float]]]:
+        phases = {name: {'seconds': secs, 'calls': self.calls[name]} for name, secs in self.timings.items()}
+        return {'total_seconds': self.total, 'phases': phases, 'counts': dict(self.counts)}
+
+    def summary(self, fmt: str = 'table') -> str:
+        """
+        :param fmt: Output format; one of ``table`` or ``json``
+        :return: Summary of the recorded timings and counts
+        """
+        if fmt == 'json':
+            import json
+
+            return json.dumps(self.as_dict(), indent=4, sort_keys=True)
+        elif fmt != 'table':
+            raise ValueError(f'Invalid summary {fmt=}')
+
+        width = max(map(len, (*self.timings, *self.counts, 'Phase')))
+        lines = [f'{"Phase":<{width}s}  {"Calls":>8s}  {"Seconds":>10s}  {"% Total":>7s}']
+        for name, secs in sorted(self.timings.items(), key=lambda kv: kv[1], reverse=True):
+            pct = secs / self.total * 100 if self.total else 0
+            lines.append(f'{name:<{width}s}  {self.calls[name]:>8,d}  {secs:>10.4f}  {pct:>7.1f}')
+        lines.append(f'{"total":<{width}s}  {"":>8s}  {self.total:>10.4f}')
+        if self.counts:
+            lines.append('')
+            lines.append(f'{"Counter":<{width}s}  {"Count":>8s}')
+            lines.extend(f'{name:<{width}s}  {num:>8,d}' for name, num in sorted(self.counts.items()))
+        return '\n'.join(lines)
+
+    @property
+    def stats(self) -> 'Stats':
+        if self._cprofile is None:
+            raise ValueError(f'cProfile was not enabled for {self}')
+
+        from pstats import Stats
+
+        return Stats(self._cprofile)
+
+    def dump_stats(self, path: Union[str, Path]):
+        """Save the cProfile stats to the given path, which can be loaded later via :class:`pstats.Stats`"""
+        self.stats.dump_stats(Path(path).expanduser().as_posix())
+
+
+@contextmanager
+def profiled(fmt: Optional[str] = 'table', stats_path: Union[str, Path, None] = None):
+    """
+    Context manager intended for use by CLI entry points.  If neither a summary format nor a stats path is provided,
+    then no profiling is performed.  The summary is printed to stderr so it does not mix with normal output.
+
+    :param fmt: Summary output format; one of ``table`` or ``json`` (default: no summary)
+    :param stats_path: Path to which cProfile stats should be saved (default: cProfile is not used)
+    """
+    if not fmt and not stats_path:
+        yield None
+        return
+
+    profiler = Profiler(bool(stats_path))
+    try:
+        with profiler:
+            yield profiler
+    finally:
+        if fmt:
+            print(profiler.summary(fmt), file=sys.stderr)
+        if stats_path:
+            profiler.dump_stats(stats_path)
@@ -0,0 +1,140 @@
+"""
+Fast summaries of the save slots in GAMEDATA files.  Only the bytes for the few fields needed for listings are read, and
+they are decoded with a single precompiled struct per slot instead of parsing the full file.
+
+:author: Doug Skrypa
+"""
+
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+from struct import Struct, calcsize
+from typing import Union, BinaryIO, NamedTuple
+
+from .compression import MAGIC_SIZE, is_compressed, decompress
+from .constants import CHARACTERS, MAP_ZONE_MAP
+from .constructs.layouts import struct_layout, struct_size
+
+__all__ = ['SlotInfo', 'quick_info']
+
+SLOT_COUNT = 7
+# Struct formats for the Savefile fields that are read; they must match the size of the corresponding construct
+FIELD_FORMATS = {
+    'corruptness': 'I',
+    'map': '32s',
+    'character': 'I',
+    'name': '32s',
+    'level': 'i',
+    'total_play_time': 'd',
+    'save_time': 'H5B',
+}
+
+
+class SlotInfo(NamedTuple):
+    num: int
+    corruptness: int
+    map: str
+    character: Union[str, int]
+    name: str
+    level: int
+    total_play_time: float
+    save_time: Union[datetime, None, dict[str, int]]
+
+    def __repr__(self) -> str:
+        time = self.save_time.isoformat(' ') if isinstance(self.save_time, datetime) else 'N/A'
+        return f'<SlotInfo#{self.num}[{time}][{self.play_time}][{self._name}, Lv.{self.level + 1} @ {self.location}]>'
+
+    @property
+    def ok(self) -> bool:
+        return self.corruptness == 200
+
+    @property
+    def is_empty(self) -> bool:
+        return self.total_play_time == 0
+
+    @property
+    def _name(self) -> str:
+        character = str(self.character)
+        return character if self.name.lower() in character.lower() else f'{self.name} (as {character})'
+
+    @property
+    def play_time(self) -> str:
+        hours, seconds = divmod(int(self.total_play_time), 3600)
+        minutes, seconds = divmod(seconds, 60)
+        return f'{hours:02d}:{minutes:02d}:{seconds:02d}'
+
+    @property
+    def location(self) -> str:
+        return MAP_ZONE_MAP.get('_'.join(self.map.split('_')[1:3]), self.map)
+
+
+def quick_info(path: Union[str, Path]) -> list[SlotInfo]:
+    """
+    :param path: Path to a GAMEDATA file, which may be compressed
+    :return: A :class:`SlotInfo` for each save slot in the given file, in slot order
+    """
+    path = Path(path).expanduser()
+    with path.open('rb') as f:
+        if is_compressed(f.read(MAGIC_SIZE)):  # Compressed backups must be fully decompressed before seeking
+            f.seek(0)
+            return _quick_info(path, BytesIO(decompress(f.read())))
+        return _quick_info(path, f)
+
+
+def _quick_info(path: Path, f: BinaryIO) -> list[SlotInfo]:
+    slot_struct, start, field_counts, header_size, slot_size = _slot_struct()
+    slots = []
+    for i in range(SLOT_COUNT):
+        f.seek(header_size + i * slot_size + start)
+        if len(data := f.read(slot_struct.size)) < slot_struct.size:
+            raise ValueError(f'Invalid GAMEDATA file={path.as_posix()} - slot {i + 1} is incomplete')
+        slots.append(_slot_info(i + 1, slot_struct.unpack_from(data), field_counts))
+    return slots
+
+
+def _slot_info(num: int, values: tuple, field_counts: dict[str, int]) -> SlotInfo:
+    fields, i = {}, 0
+    for field, count in field_counts.items():
+        fields[field] = values[i] if count == 1 else values[i: i + count]
+        i += count
+
+    fields['map'] = fields['map'].rstrip(b'\x00').decode('utf-8')
+    fields['name'] = fields['name'].rstrip(b'\x00').decode('utf-8')
+    if (character := fields['character']) < len(CHARACTERS):
+        fields['character'] = CHARACTERS[character]
+
+    year, month, day, hour, minute, second = fields['save_time']
+    try:
+        fields['save_time'] = datetime(year, month, day, hour, minute, second) if year else None
+    except ValueError:
+        fields['save_time'] = dict(year=year, month=month, day=day, hour=hour, minute=minute, second=second)
+    return SlotInfo(num, **fields)
+
+
+def _slot_struct() -> tuple[Struct, int, dict[str, int], int, int]:
+    """
+    :return: Tuple of (struct that unpacks all :data:`FIELD_FORMATS` fields in one call, offset of the first field in
+      each slot, mapping of {field: number of values unpacked for that field}, header size, slot size)
+    """
+    try:
+        return _slot_struct._cached
+    except AttributeError:
+        pass
+
+    fmt_parts, field_counts = ['<'], {}
+    start = end = None
+    for field, (offset, size) in struct_layout('Savefile').items():
+        if fmt := FIELD_FORMATS.get(field):
+            if calcsize(f'<{fmt}') != size:
+                raise ValueError(f'Invalid format={fmt!r} for {field=} with {size=}')
+            if start is None:
+                start = end = offset
+            if gap := offset - end:
+                fmt_parts.append(f'{gap}x')
+            fmt_parts.append(fmt)
+            field_counts[field] = len(Struct(f'<{fmt}').unpack(bytes(size)))
+            end = offset + size
+
+    slot_struct = Struct(''.join(fmt_parts))
+    _slot_struct._cached = cached = (slot_struct, start, field_counts, struct_size('Header'), struct_size('Savefile'))
+    return cached
@@ -0,0 +1,266 @@
+"""
+Retention policy and compaction for GAMEDATA snapshots, such as the backups saved by save_watcher.
+
+Snapshots are expected to use the ``{stem}_YYYY-MM-DD[-N]{suffix}`` names generated by
+:func:`unique_path<.utils.unique_path>`, such as ``GAMEDATA_2021-05-01-12``, optionally followed by the suffix of a
+compression codec, such as ``GAMEDATA_2021-05-01-12.xz``.  Snapshots that fall outside of the
+retention policy are moved into one compressed tar archive per date in an ``archive`` subdirectory, such as
+``archive/GAMEDATA_2021-05-01.tar.xz``, unless they are discarded.  Consecutive snapshots are nearly identical, so a
+solid archive of a day's snapshots is a small fraction of the size of a single snapshot.
+
+:author: Doug Skrypa
+"""
+
+import logging
+import os
+import re
+import tarfile
+from collections import defaultdict
+from contextlib import ExitStack, suppress
+from datetime import datetime, timedelta
+from pathlib import Path
+from secrets import token_hex
+from threading import Thread
+from typing import Union, Optional, Iterable, Iterator, NamedTuple
+
+from .compression import COMPRESSED_SUFFIXES, decompress, strip_compressed_suffix
+
+__all__ = [
+    'Snapshot', 'RetentionPolicy', 'RetentionResult', 'find_snapshots', 'apply_retention', 'next_snapshot_path',
+    'archived_snapshots', 'Compactor', 'ARCHIVE_DIR',
+]
+log = logging.getLogger(__name__)
+
+ARCHIVE_DIR = 'archive'
+ARCHIVE_SUFFIX = '.tar.xz'
+
+
+class Snapshot(NamedTuple):
+    path: Path
+    date: str  # YYYY-MM-DD
+    n: int  # 0 for the first snapshot on a given date, which does not have a number
+    mtime: datetime
+
+    @property
+    def sort_key(self) -> tuple[str, int]:
+        return self.date, self.n
+
+
+class RetentionPolicy(NamedTuple):
+    """
+    Snapshots are kept based on the age of each file (by modification time):
+
+    - Every snapshot newer than ``keep_all``
+    - The newest snapshot in each hour for snapshots newer than ``hourly``
+    - The newest snapshot on each date for snapshots newer than ``daily`` (or all of them, if ``daily`` is None)
+
+    The newest snapshot is always kept, so names for new snapshots are never re-used.
+    """
+
+    keep_all: timedelta = timedelta(hours=6)
+    hourly: timedelta = timedelta(hours=24)
+    daily: Optional[timedelta] = None
+
+    def select(self, snapshots: Iterable[Snapshot], now: datetime = None) -> tuple[list[Snapshot], list[Snapshot]]:
+        """
+        :param snapshots: The snapshots to process
+        :param now: The time from which ages should be calculated (default: now)
+        :return: Tuple of (snapshots to keep, snapshots to prune), each sorted from oldest to newest
+        """
+        now = now or datetime.now()
+        snapshots = sorted(snapshots, key=lambda s: s.sort_key)
+        keep, prune, seen_buckets = [], [], set()
+        for i, snapshot in enumerate(reversed(snapshots)):  # Newest first, so the newest in each bucket is kept
+            if (age := now - snapshot.mtime) <= self.keep_all:
+                keep.append(snapshot)
+                continue
+            elif age <= self.hourly:
+                bucket = snapshot.mtime.replace(minute=0, second=0, microsecond=0)
+            elif self.daily is None or age <= self.daily:
+                bucket = snapshot.date
+            else:
+                bucket = None
+
+            if i and (bucket is None or bucket in seen_buckets):
+                prune.append(snapshot)
+            else:
+                seen_buckets.add(bucket)
+                keep.append(snapshot)
+
+        return keep[::-1], prune[::-1]
+
+
+class RetentionResult(NamedTuple):
+    kept: list[Snapshot]
+    archived: list[Snapshot]
+    deleted: list[Snapshot]
+
+
+def _name_pattern(stem: str, suffix: str) -> re.Pattern:
+    compressed = '|'.join(map(re.escape, COMPRESSED_SUFFIXES))
+    return re.compile(rf'^{re.escape(stem)}_(\d{{4}}-\d{{2}}-\d{{2}})(?:-(\d+))?{re.escape(suffix)}(?:{compressed})?$')
+
+
+def find_snapshots(directory: Union[str, Path], stem: str = 'GAMEDATA', suffix: str = '') -> list[Snapshot]:
+    """
+    :param directory: Directory containing snapshots
+    :param stem: The stem of snapshot file names
+    :param suffix: The suffix of snapshot file names, including ``.``, if any
+    :return: The snapshots in the given directory, sorted from oldest to newest by name
+    """
+    pattern = _name_pattern(stem, suffix)
+    snapshots = []
+    with os.scandir(Path(directory).expanduser()) as entries:  # Avoids a separate stat call per file for is_file
+        for entry in entries:
+            if (m := pattern.match(entry.name)) and entry.is_file():
+                date, n = m.groups()
+                mtime = datetime.fromtimestamp(entry.stat().st_mtime)
+                snapshots.append(Snapshot(Path(entry.path), date, int(n or 0), mtime))
+    return sorted(snapshots, key=lambda s: s.sort_key)
+
+
+def next_snapshot_path(directory: Union[str, Path], stem: str = 'GAMEDATA', suffix: str = '') -> Path:
+    """
+    Unlike :func:`unique_path<.utils.unique_path>`, which uses the first unused name, the returned name is numbered
+    after the highest-numbered snapshot from today, so names of pruned snapshots are not re-used, and the directory is
+    listed once instead of checking whether each candidate name exists.
+
+    :return: The path to use for a new snapshot in the given directory
+    """
+    directory = Path(directory).expanduser()
+    today = datetime.now().strftime('%Y-%m-%d')
+    pattern = _name_pattern(stem, suffix)
+    last = -1
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if (m := pattern.match(entry.name)) and m.group(1) == today:
+                last = max(last, int(m.group(2) or 0))
+    name = f'{stem}_{today}{suffix}' if last < 0 else f'{stem}_{today}-{last + 1}{suffix}'
+    return directory.joinpath(name)
+
+
+def apply_retention(
+    directory: Union[str, Path],
+    policy: RetentionPolicy = RetentionPolicy(),
+    stem: str = 'GAMEDATA',
+    suffix: str = '',
+    discard: bool = False,
+    dry_run: bool = False,
+    now: datetime = None,
+) -> RetentionResult:
+    """
+    Apply the given retention policy to the snapshots in the given directory.
+
+    :param directory: Directory containing snapshots
+    :param policy: The :class:`RetentionPolicy` to apply
+    :param stem: The stem of snapshot file names
+    :param suffix: The suffix of snapshot file names, including ``.``, if any
+    :param discard: Delete pruned snapshots instead of moving them to archives
+    :param dry_run: Only determine which snapshots would be pruned, without modifying anything
+    :param now: The time from which snapshot ages should be calculated (default: now)
+    :return: A :class:`RetentionResult` with the snapshots that were kept, archived, and deleted
+    """
+    keep, prune = policy.select(find_snapshots(directory, stem, suffix), now)
+    if dry_run or not prune:
+        return RetentionResult(keep, [] if discard else prune, prune if discard else [])
+
+    if not discard:
+        archive_dir = Path(directory).expanduser().joinpath(ARCHIVE_DIR)
+        archive_dir.mkdir(exist_ok=True)
+        by_date = defaultdict(list)
+        for snapshot in prune:
+            by_date[snapshot.date].append(snapshot)
+        for date, snapshots in by_date.items():
+            _add_to_archive(archive_dir.joinpath(f'{stem}_{date}{suffix}{ARCHIVE_SUFFIX}'), snapshots)
+
+    for snapshot in prune:
+        snapshot.path.unlink()
+
+    log.info(f'{"Deleted" if discard else "Archived"} {len(prune)} snapshots; kept {len(keep)}')
+    return RetentionResult(keep, [] if discard else prune, prune if discard else [])
+
+
+def _add_to_archive(path: Path, snapshots: list[Snapshot]):
+    """Rewrite the given archive so that it contains its existing members and the given snapshots, in name order"""
+    tmp_path = path.with_name(f'.{path.name}.{token_hex(4)}.tmp')
+    names = {snapshot.path.name for snapshot in snapshots}
+    try:
+        with ExitStack() as stack:
+            new = stack.enter_context(tarfile.open(tmp_path, 'w:xz', preset=6))
+            members = [(new.gettarinfo(s.path, arcname=s.path.name), s.path) for s in snapshots]
+            if path.exists():
+                old = stack.enter_context(tarfile.open(path, 'r:xz'))
+                members.extend((member, old) for member in old.getmembers() if member.name not in names)
+            for member, src in sorted(members, key=lambda m: _member_sort_key(m[0].name)):
+                if isinstance(src, Path):
+                    with src.open('rb') as f:
+                        new.addfile(member, f)
+                else:
+                    new.addfile(member, src.extractfile(member))
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            tmp_path.unlink()
+        raise
+    log.debug(f'Added {len(snapshots)} snapshots to {path.as_posix()}')
+
+
+def _member_sort_key(name: str) -> list[Union[str, int]]:
+    name = strip_compressed_suffix(name)
+    return [int(part) if i % 2 else part for i, part in enumerate(re.split(r'(\d+)', name))]
+
+
+def archived_snapshots(directory: Union[str, Path], stem: str = 'GAMEDATA') -> Iterator[tuple[str, bytes]]:
+    """
+    :param directory: A directory containing snapshots (i.e., the parent of the ``archive`` directory)
+    :param stem: The stem of snapshot file names
+    :return: Generator that yields (name, decompressed content) for every archived snapshot, in date / name order
+    """
+    archive_dir = Path(directory).expanduser().joinpath(ARCHIVE_DIR)
+    paths = sorted(archive_dir.glob(f'{stem}_*{ARCHIVE_SUFFIX}'), key=lambda p: _member_sort_key(p.name))
+    for path in paths:
+        with tarfile.open(path, 'r:xz') as archive:
+            for member in archive:
+                if member.isfile():
+                    yield member.name, decompress(archive.extractfile(member).read())
+
+
+class Compactor:
+    """
+    Applies a retention policy in a background thread, at most once per ``interval``.
+
+    :param directory: Directory containing snapshots
+    :param policy: The :class:`RetentionPolicy` to apply
+    :param interval: The minimum amount of time between runs
+    :param kwargs: Keyword arguments to pass to :func:`apply_retention`
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], policy: RetentionPolicy, interval: timedelta = timedelta(hours=1), **kwargs
+    ):
+        self.directory = directory
+        self.policy = policy
+        self.interval = interval
+        self.kwargs = kwargs
+        self.last_run = None
+        self._thread = None
+
+    def maybe_run(self) -> bool:
+        """:return: True if a run was started, False if one is already running or the interval has not elapsed yet"""
+        now = datetime.now()
+        if (self._thread and self._thread.is_alive()) or (self.last_run and now - self.last_run < self.interval):
+            return False
+        self.last_run = now
+        self._thread = Thread(target=self._run, name='snapshot-compactor', daemon=True)
+        self._thread.start()
+        return True
+
+    def _run(self):
+        try:
+            apply_retention(self.directory, self.policy, **self.kwargs)
+        except Exception as e:
+            log.error(f'Error applying retention policy in {Path(self.directory).as_posix()}: {e}', exc_info=True)
+
+    def join(self):
+        if self._thread:
+            self._thread.join()
@@ -0,0 +1,300 @@
+"""
+Fixture corpus generation and property-based round-trip / checksum checks for GAMEDATA files.
+
+The corpus is made of valid GAMEDATA images that are built through the construct definitions from an empty save (with
+:data:`EMPTY_SAVE_SLOT<.constants.EMPTY_SAVE_SLOT>` in each slot) plus randomized field values.  Each property is a
+function that raises an exception if it does not hold for a given file.  Properties that make random edits use a
+random number generator that is seeded from the seed, file name, property, and iteration, so any failure can be
+reproduced by running the same property against the same file with the same seed.
+
+Files are checked in a pool of worker processes, so the full corpus can be checked at the speed of every core.
+
+:author: Doug Skrypa
+"""
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from random import Random
+from time import perf_counter
+from typing import Union, Callable, Iterable, Iterator, Collection, NamedTuple
+
+from .compression import CODECS, decompress, write_compressed
+from .constructs.layouts import struct_size
+from .save_file import GameData
+from .sparse import SparseBytes
+from .synthetic import random_game_data, mutate_save_file
+from .transplant import checksums, copy_slot, slot_offset, _mapped
+
+__all__ = ['PROPERTIES', 'Failure', 'FileResult', 'build_corpus', 'corpus_paths', 'check_file', 'run_checks']
+log = logging.getLogger(__name__)
+
+CORPUS_PREFIX = 'GAMEDATA_'
+PROPERTIES = {}
+Property = Callable[[Path, bytes, Random], None]
+
+
+class Failure(NamedTuple):
+    property: str
+    iteration: int
+    error: str
+
+
+class FileResult(NamedTuple):
+    path: Path
+    size: int
+    checks: int
+    elapsed: float
+    times: dict[str, float]  # {property: seconds}
+    failures: list[Failure]
+
+
+# region Corpus
+
+
+def build_corpus(
+    directory: Union[str, Path], count: int = 100, seed: Union[int, str] = 0, workers: int = None
+) -> list[Path]:
+    """
+    Generate GAMEDATA files in the given directory.  The first file contains only empty slots, and the others contain
+    1-7 slots with randomized values and a random number of item / unknown byte mutations.  Every other file after the
+    first one is compressed, cycling through the available codecs, so that compressed inputs are covered as well.
+    Existing files with the same names are overwritten.
+
+    :param directory: The output directory
+    :param count: The number of files to generate
+    :param seed: Seed for the random number generator, so the same corpus can be generated again
+    :param workers: Number of worker processes to use (default: cpu count)
+    :return: The paths of the generated files
+    """
+    directory = Path(directory).expanduser()
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = [directory.joinpath(f'{CORPUS_PREFIX}{i:05d}') for i in range(count)]
+    with ProcessPoolExecutor(workers or os.cpu_count() or 1) as executor:
+        paths = list(executor.map(_write_sample, paths, [seed] * count, range(count), chunksize=8))
+    for path in paths:
+        log.debug(f'Generated {path.as_posix()}')
+    log.info(f'Generated {count:,d} GAMEDATA files in {directory.as_posix()}')
+    return paths
+
+
+def _write_sample(path: Path, seed: Union[int, str], i: int) -> Path:
+    if i == 0:
+        data = GameData.empty()._data
+    else:
+        rng = Random(f'{seed}-{i}')
+        data = random_game_data(f'{seed}-{i}', rng.randint(1, 7), rng.randrange(200))._data
+    if i and i % 2 == 0:
+        codecs = list(CODECS)
+        return write_compressed(path, data, codecs[(i // 2) % len(codecs)], 'none')
+    path.write_bytes(data)
+    return path
+
+
+def corpus_paths(directory: Union[str, Path]) -> list[Path]:
+    """:return: The corpus files in the given directory, in name order"""
+    return sorted(p for p in Path(directory).expanduser().glob(f'{CORPUS_PREFIX}*') if p.is_file())
+
+
+# endregion
+
+# region Properties
+
+
+def prop(func: Property) -> Property:
+    PROPERTIES[func.__name__] = func
+    return func
+
+
+def _build(game_data: GameData) -> bytes:
+    return game_data._construct.build(game_data._build())
+
+
+def _verify_checksums(data: bytes):
+    for num, offset, name in ((0, 0, 'Header'), *((i, slot_offset(i), 'Savefile') for i in range(1, 8))):
+        if (values := checksums(data, offset, name))[0] != values[1]:
+            location = f'slot {num}' if num else 'header'
+            raise ValueError(f'Invalid {location} checksum: stored={values[0]} != calculated={values[1]}')
+
+
+def _first_diff(a: bytes, b: bytes) -> int:
+    return next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+
+
+@prop
+def parse_build(path: Path, data: bytes, rng: Random):
+    """Building the parsed file must reproduce the original content exactly"""
+    if (built := _build(GameData(data))) != data:
+        raise ValueError(f'Built data does not match the original @ offset={_first_diff(built, data)}')
+
+
+@prop
+def stored_checksums(path: Path, data: bytes, rng: Random):
+    """The stored checksum of the header and of each slot must match the calculated checksum"""
+    _verify_checksums(data)
+
+
+@prop
+def flat_codecs(path: Path, data: bytes, rng: Random):
+    """The generated flat codecs must match construct, including after randomizing unknown bytes and flags"""
+    from .codegen import load_codecs, verify_codecs
+
+    verify_codecs(load_codecs(), [data], rng.random())
+
+
+@prop
+def quick_summary(path: Path, data: bytes, rng: Random):
+    """The fast summary of each slot must match the values from a full parse"""
+    from .quick_info import quick_info
+
+    for info, slot in zip(quick_info(path), GameData(data).slots):
+        expected = (slot.name, slot.level, str(slot.character), slot.total_play_time)
+        if (actual := (info.name, info.level, str(info.character), info.total_play_time)) != expected:
+            raise ValueError(f'Quick info for slot {info.num}: {actual} != {expected}')
+
+
+@prop
+def edit_slot(path: Path, data: bytes, rng: Random):
+    """A randomly edited slot must have valid checksums and preserve the edited values after being built and parsed"""
+    game_data = GameData(data)
+    slot = game_data.slots[num := rng.randrange(7)]
+    mutate_save_file(slot, rng, rng.randrange(50))
+    expected = {key: slot[key] for key in ('name', 'level', 'money', 'total_play_time', 'save_time', 'garden')}
+
+    _verify_checksums(built := _build(game_data))
+    rebuilt = GameData(built)
+    if changed := [key for key, val in expected.items() if rebuilt.slots[num][key] != val]:
+        raise ValueError(f'Values for slot {num + 1} were not preserved for keys: {", ".join(changed)}')
+    elif (again := _build(rebuilt)) != built:
+        raise ValueError(f'Rebuilt data does not match the built data @ offset={_first_diff(again, built)}')
+
+
+@prop
+def copy_on_write(path: Path, data: bytes, rng: Random):
+    """Editing a copy-on-write copy of a slot must not modify the original slot"""
+    game_data = GameData(data)
+    slot = game_data.slots[rng.randrange(7)]
+    copy = slot.copy()
+    mutate_save_file(copy, rng, rng.randrange(50))
+    copy.inventory['Lugworm'] = rng.randrange(100)
+    if (built := _build(game_data)) != data:
+        raise ValueError(f'The original was modified by editing a copy @ offset={_first_diff(built, data)}')
+
+
+@prop
+def raw_transplant(path: Path, data: bytes, rng: Random):
+    """A slot copied as raw bytes must match the source slot and keep a valid checksum"""
+    src, dst = rng.randint(1, 7), rng.randint(1, 7)
+    buf = bytearray(data)
+    copy_slot(data, src, buf, dst)
+    _verify_checksums(buf)
+    size = struct_size('Savefile')
+    if buf[slot_offset(dst):slot_offset(dst) + size] != data[slot_offset(src):slot_offset(src) + size]:
+        raise ValueError(f'Slot {dst} does not match source slot {src}')
+    elif _build(GameData(bytes(buf))) != buf:
+        raise ValueError(f'Built data does not match the transplanted data after copying slot {src} to {dst}')
+
+
+@prop
+def file_readers(path: Path, data: bytes, rng: Random):
+    """Readers that access files directly must see the same (decompressed) content as a full load"""
+    from .constants import PLANTS
+    from .garden import GrowthModel, garden_states
+
+    with _mapped(path) as buf:
+        if bytes(buf) != data:
+            raise ValueError(f'Mapped content does not match the loaded content @ offset={_first_diff(buf, data)}')
+    model = GrowthModel({plant: rng.randint(1, 48) for plant in PLANTS}, 0.5, 1, 1, 2, 0.5, 2)  # Values do not matter
+    from_path, from_data = garden_states([path], model), garden_states([data], model)
+    if any(getattr(from_path, k).tobytes() != getattr(from_data, k).tobytes() for k in ('seeds', 'planted', 'ready')):
+        raise ValueError('Garden states from the file do not match garden states from the loaded content')
+
+
+@prop
+def sparse_fields(path: Path, data: bytes, rng: Random):
+    """Sparse representations of large fields must match the raw bytes"""
+    game_data = GameData(data)
+    for obj in (game_data.header, *game_data.slots):
+        for key, sparse in obj._sparse.items():
+            raw = obj.raw(key)
+            start = rng.randrange(len(raw))
+            end = rng.randint(start, len(raw))
+            if bytes(sparse) != raw or sparse != SparseBytes.from_bytes(raw) or sparse[start:end] != raw[start:end]:
+                raise ValueError(f'Sparse value for {obj} field={key} does not match its raw bytes')
+
+
+@prop
+def compression(path: Path, data: bytes, rng: Random):
+    """Decompressing the compressed content must reproduce the original content with every available codec"""
+    for codec in CODECS.values():
+        if decompress(codec.compress(data)) != data:
+            raise ValueError(f'The {codec.name} round trip did not reproduce the original data')
+
+
+# endregion
+
+# region Harness
+
+
+def check_file(
+    path: Union[str, Path], properties: Collection[str] = None, seed: Union[int, str] = 0, iterations: int = 1
+) -> FileResult:
+    """
+    :param path: A GAMEDATA file
+    :param properties: The names of the properties to check (default: all)
+    :param seed: Seed for the random number generators used by each property
+    :param iterations: Number of times each property should be checked, with a different random seed each time
+    :return: A :class:`FileResult` with the failures for the given file
+    """
+    path = Path(path).expanduser()
+    data = decompress(path.read_bytes())
+    checks, times, failures = 0, {}, []
+    start = perf_counter()
+    for name in properties or PROPERTIES:
+        func = PROPERTIES[name]
+        prop_start = perf_counter()
+        for i in range(iterations):
+            checks += 1
+            try:
+                func(path, data, Random(f'{seed}-{path.name}-{name}-{i}'))
+            except Exception as e:
+                log.debug(f'Property={name} failed for {path.as_posix()} in iteration={i}:', exc_info=True)
+                failures.append(Failure(name, i, f'{type(e).__name__}: {e}'))
+        times[name] = perf_counter() - prop_start
+    return FileResult(path, len(data), checks, perf_counter() - start, times, failures)
+
+
+def run_checks(
+    paths: Iterable[Union[str, Path]],
+    properties: Collection[str] = None,
+    seed: Union[int, str] = 0,
+    iterations: int = 1,
+    workers: int = None,
+) -> Iterator[FileResult]:
+    """
+    Check the given files in a pool of worker processes.  At most ``workers * 2`` files are in flight at once.
+
+    :param paths: GAMEDATA files to check
+    :param properties: The names of the properties to check (default: all)
+    :param seed: Seed for the random number generators used by each property
+    :param iterations: Number of times each property should be checked per file
+    :param workers: Number of worker processes to use (default: cpu count)
+    :return: Generator that yields a :class:`FileResult` for each file, in the same order as the given paths
+    """
+    if properties and (unknown := set(properties).difference(PROPERTIES)):
+        raise ValueError(f'Invalid properties: {", ".join(sorted(unknown))} - expected: {", ".join(PROPERTIES)}')
+    workers = workers or os.cpu_count() or 1
+    pending = deque()
+    with ProcessPoolExecutor(workers) as executor:
+        for path in paths:
+            pending.append(executor.submit(check_file, path, properties, seed, iterations))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+# endregion
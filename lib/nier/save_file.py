@@ -6,37 +6,120 @@ Higher level classes for working with NieR Replicant ver.1.22474487139... save f
 
 import gzip
 import logging
+import os
 import shutil
 import struct
+from array import array
 from base64 import b64decode
+from contextlib import suppress
 from copy import deepcopy
 from datetime import datetime, timedelta
-from functools import cached_property, reduce
+from functools import cached_property, reduce, partial
 from operator import xor
+from secrets import token_hex
 from pathlib import Path
-from typing import Union, Optional, Iterator, Collection, Any
+from typing import TYPE_CHECKING, Union, Optional, Iterator, Collection, Any
 
-from construct.lib.containers import ListContainer, Container
-
-from .constants import EMPTY_SAVE_SLOT, MAP_ZONE_MAP, SEED_RESULT_MAP
-from .constructs import Gamedata, Savefile, Plot, Header
+from . import constructs
+from .compression import get_codec, decompress, copy_compressed
+from .constants import EMPTY_SAVE_SLOT, MAP_ZONE_MAP, SEED_RESULT_MAP, PLANTS, FERTILIZER
+from .constructs.layouts import struct_layout
 from .diff import pseudo_json_diff, unified_byte_line_diff
+from .profiling import phase, count
+from .sparse import SparseBytes, SPARSE_MIN_SIZE
 from .utils import to_hex_and_str, pseudo_json, colored, cached_classproperty, unique_path, without_unknowns
 
-__all__ = ['GameData', 'SaveFile']
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from construct import Container
+    from .bitsets import FlagSet
+    from .garden import GrowthModel
+
+__all__ = ['GameData', 'SaveFile', 'Inventory']
 log = logging.getLogger(__name__)
 
+INVENTORY_SECTIONS = {  # {SaveFile field: struct name}
+    'recovery': 'Recovery',
+    'cultivation': 'Cultivation',
+    'fishing': 'Fishing',
+    'raw_materials': 'RawMaterials',
+    'key_items': 'KeyItems',
+    'documents': 'Documents',
+    'maps': 'Maps',
+    'weapons': 'Weapons',
+}
+FSYNC_MODES = ('none', 'file', 'full')  # full: also fsync the directory so that the rename is durable
+FICLONE = 0x40049409  # Linux ioctl for creating a reflink (copy-on-write clone) of a file
+ITEM_QUANTITY_LIMITS = {'recovery': 10, 'cultivation': 99, 'fishing': 99, 'raw_materials': 99}  # Editable sections
+
 
 class Constructed:
-    def __init_subclass__(cls, construct):  # noqa
-        cls._construct = construct
+    def __init_subclass__(cls, construct: str):  # noqa
+        cls._construct_name = construct  # The construct is only built when it is first needed
+
+    @cached_classproperty
+    def _construct(cls):
+        return getattr(constructs, cls._construct_name)
 
     def __init__(self, data: bytes, parsed=None):
+        self._cache = {}  # Cleaned values for top-level fields; must be set before any other attribute access
         self._data = data
-        self._parsed = parsed or self._construct.parse(data)
+        self._shared = set()  # Top-level fields whose parsed values are shared with a copy-on-write copy
+        if isinstance(parsed, TrackedParsed):  # Shared with a parent object - changes need to invalidate its cache too
+            self._raw_parsed = parsed._obj
+            self._parent_changed = parsed._changed
+        else:
+            if not parsed:
+                with phase('parse'):
+                    parsed = self._construct.parse(data)
+            self._raw_parsed = parsed
+            self._parent_changed = None
+        self._sparse = self._sparsify(self._raw_parsed)  # {key: SparseBytes} for the original values of large fields
+
+    @property
+    def _parsed(self) -> 'TrackedParsed':
+        """
+        The parsed Container, wrapped so that direct modifications to it (or to any nested value) will invalidate the
+        cached cleaned value for the affected top-level field.
+        """
+        return TrackedParsed(self._raw_parsed, self._field_changed, own=self._own)
+
+    def _own(self, key: str) -> bool:
+        """
+        Replace the parsed value for the given top-level field with a private copy if it is shared with a copy-on-write
+        copy of this object.  Must be called before any reference to a nested value that may be modified is obtained.
+
+        :return: True if the value was copied, False otherwise
+        """
+        if key not in self._shared:
+            return False
+        self._shared.discard(key)
+        count('fields_copied')
+        with phase('copy'):
+            self._raw_parsed[key] = deepcopy(self._raw_parsed[key])
+        return True
+
+    def _field_changed(self, key: Optional[str]):
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+            self._shared.discard(key)  # Nested values are owned before they are modified; top-level values are replaced
+        if self._parent_changed is not None:
+            self._parent_changed()
 
     def __getitem__(self, key: str):
-        return _clean(self._parsed[key])
+        """
+        The cleaned value is cached until the field is modified, so the returned value should not be modified in place.
+        Use :meth:`.__setitem__` or modify :attr:`._parsed` directly instead.
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            count('fields_decoded')
+            with phase('clean'):
+                self._cache[key] = value = _clean(self._raw_parsed[key])
+            return value
 
     __getattr__ = __getitem__
 
@@ -51,24 +134,46 @@ class Constructed:
 
     @cached_classproperty
     def _offsets_and_sizes(cls):
-        offsets_and_sizes = {}
-        offset = 0
-        for subcon in cls._construct.subcons:
-            size = subcon.sizeof()  # TODO: Handle arrays differently?
-            offsets_and_sizes[subcon.name] = (offset, size)
-            offset += size
-        return offsets_and_sizes
+        return struct_layout(cls._construct_name)  # Cached on disk so the struct does not need to be built for this
+
+    @cached_classproperty
+    def _sparse_candidates(cls) -> tuple[str, ...]:
+        return tuple(key for key, (_, size) in cls._offsets_and_sizes.items() if size >= SPARSE_MIN_SIZE)
+
+    @classmethod
+    def _sparsify(cls, parsed) -> dict[str, SparseBytes]:
+        """Replace large bytes values in the given parsed Container with :class:`.SparseBytes` objects"""
+        sparse = {}
+        for key in cls._sparse_candidates:
+            if type(value := parsed[key]) is bytes:
+                parsed[key] = sparse[key] = SparseBytes.from_bytes(value)
+            elif isinstance(value, SparseBytes):  # Already converted in a copy-on-write copy
+                sparse[key] = value
+        return sparse
 
     def _build(self):
-        return _build(self._parsed)
+        return _build(self._raw_parsed)
 
-    def raw(self, key: str) -> bytes:
+    def raw(self, key: str, sparse: bool = False) -> Union[bytes, SparseBytes]:
+        """
+        :param key: The top-level field to retrieve
+        :param sparse: Return a :class:`.SparseBytes` for large bytes fields, which are compared and hashed in O(1) when
+          they only contain zeros
+        :return: The original raw bytes for the given field
+        """
+        if sparse and (value := self._sparse.get(key)) is not None:
+            return value
         offset, size = self._offsets_and_sizes[key]
         return self._data[offset: offset + size]  # noqa
 
-    def raw_items(self):
+    def raw_items(self, sparse: bool = False) -> Iterator[tuple[str, Union[bytes, SparseBytes]]]:
+        """:return: Generator that yields (key, raw value) for each top-level field; see :meth:`.raw`"""
+        sparse_values = self._sparse if sparse else {}
         for key, (offset, size) in self._offsets_and_sizes.items():
-            yield key, self._data[offset: offset + size]
+            if (value := sparse_values.get(key)) is not None:
+                yield key, value
+            else:
+                yield key, self._data[offset: offset + size]
 
     def diff(
         self,
@@ -79,10 +184,17 @@ class Constructed:
         byte_diff: bool = False,
         keys: Collection[str] = None,
     ):
+        with phase('diff'):
+            self._diff(other, max_len=max_len, per_line=per_line, byte_diff=byte_diff, keys=keys)
+
+    def _diff(self, other: 'Constructed', *, max_len: Optional[int], per_line: int, byte_diff: bool, keys=None):
         row_keys = {'quests', 'quests_b'}
         found_difference = False
-        for key, own_raw in self.raw_items():
-            if (keys and key not in keys) or ((other_raw := other.raw(key)) == own_raw):
+        for key, own_raw in self.raw_items(sparse=True):
+            if keys and key not in keys:
+                continue
+            count('diff_bytes_compared', len(own_raw))
+            if (other_raw := other.raw(key, sparse=True)) == own_raw:
                 continue
             if not found_difference:
                 found_difference = True
@@ -100,6 +212,7 @@ class Constructed:
                 print(colored(f'@@ {key} @@', 6))
                 pseudo_json_diff(own_val, other[key], key in row_keys, key)
             elif max_len and isinstance(own_val, bytes) and len(own_raw) > max_len:
+                own_raw, other_raw = bytes(own_raw), bytes(other_raw)
                 unified_byte_line_diff(own_raw, other_raw, lineterm=key, struct=repr, per_line=per_line)
                 # unified_byte_diff(own_raw, other_raw, lineterm=key, struct=repr, per_line=per_line)
             else:
@@ -108,7 +221,11 @@ class Constructed:
                 print(colored(f'+ {other[key]}', 2))
 
     def view(self, key: str, per_line: int = 40, hide_empty: Union[bool, int] = 10, **kwargs):
-        data = self.raw(key)
+        with phase('render'):
+            self._view(key, per_line, hide_empty, **kwargs)
+
+    def _view(self, key: str, per_line: int, hide_empty: Union[bool, int], **kwargs):
+        data = self.raw(key, sparse=True)
         if isinstance(hide_empty, int):
             hide_empty = (len(data) / per_line) > hide_empty
 
@@ -149,6 +266,10 @@ class Constructed:
         sort_keys: bool = True,
         **kwargs,
     ):
+        with phase('render'):
+            self._pprint_all(unknowns, keys, binary, sort_keys, **kwargs)
+
+    def _pprint_all(self, unknowns: bool, keys: Optional[Collection[str]], binary: bool, sort_keys: bool, **kwargs):
         last_was_view = False
         for key in self._offsets_and_sizes:
             if (keys and key not in keys) or (not unknowns and key.startswith('_unk')):
@@ -157,17 +278,15 @@ class Constructed:
             if binary:
                 print(colored('\n{}  {}  {}'.format('=' * 30, key, '=' * 30), 14))
                 self.view(key, **kwargs)
+            elif key in self._sparse or isinstance(val := self[key], bytes):  # Avoids materializing large bytes values
+                print(colored('\n{}  {}  {}'.format('=' * 30, key, '=' * 30), 14))
+                self.view(key, **kwargs)
+                last_was_view = True
             else:
-                val = self[key]
-                if isinstance(val, bytes):
-                    print(colored('\n{}  {}  {}'.format('=' * 30, key, '=' * 30), 14))
-                    self.view(key, **kwargs)
-                    last_was_view = True
-                else:
-                    if last_was_view:
-                        print()
-                    self._pprint(key, val, sort_keys=sort_keys, unknowns=unknowns)
-                    last_was_view = False
+                if last_was_view:
+                    print()
+                self._pprint(key, val, sort_keys=sort_keys, unknowns=unknowns)
+                last_was_view = False
 
     def find_number(self, value: Union[int, float], unknowns_only: bool = True):
         formats = {
@@ -184,14 +303,14 @@ class Constructed:
                 else:
                     # log.debug(f'Searching for {byte_val=}')
                     print(f'Searching for {byte_val=}')
-                    for key, data in self.raw_items():
+                    for key, data in self.raw_items(sparse=True):
                         if byte_val in data:
                         # if (not unknowns_only or key.startswith('_unk')) and byte_val in data:
                             # log.info(f'Found {value=} in {key=} as {name} with {byte_val=}')
                             print(f'Found {value=} in {key=} as {name} with {byte_val=}')
 
 
-class GameData(Constructed, construct=Gamedata):
+class GameData(Constructed, construct='Gamedata'):
     """Represents the full GAMEDATA file, including all save slots."""
 
     def __init__(self, data: bytes, path: Path = None):
@@ -204,29 +323,56 @@ class GameData(Constructed, construct=Gamedata):
     def load(cls, path: Union[str, Path]) -> 'GameData':
         path = Path(path).expanduser()
         log.debug(f'Loading game data from path={path.as_posix()}')
-        return cls(path.read_bytes(), path)
+        return cls(_read_bytes(path), path)
+
+    @classmethod
+    async def aload(cls, path: Union[str, Path], executor: 'Executor' = None) -> 'GameData':
+        """Load the given file without blocking the event loop; see :func:`aload<.aio.aload>`"""
+        from .aio import aload
+
+        return await aload(path, cls, executor)
 
-    def save(self, path: Union[str, Path] = None, backup: bool = True):
+    async def asave(self, *args, executor: 'Executor' = None, **kwargs):
+        """Call :meth:`.save` without blocking the event loop"""
+        from .aio import asave
+
+        await asave(self, *args, executor=executor, **kwargs)
+
+    def save(
+        self, path: Union[str, Path] = None, backup: bool = True, fsync: str = 'file', backup_codec: str = None
+    ):
         """
-        Save changes.
+        Save changes.  The new content is written to a temp file in the same directory, which then replaces the original
+        file, so the original file is never left partially written.
 
         :param path: Location where save file should be written (defaults to the path from which this save file was read
           if :meth:`.load` was used or an explicit path was provided)
-        :param backup: Whether a backup copy of the original save file should be saved
+        :param backup: Whether a backup copy of the original save file should be saved.  Since the original file is
+          replaced rather than modified, the backup is a hard link (or reflink) to it when the filesystem supports it.
+        :param fsync: One of ``none``, ``file`` (fsync the new file before replacing the original), or ``full`` (also
+          fsync the directory after replacing the original)
+        :param backup_codec: A codec name (such as ``gzip``, ``lzma``, or ``auto``; see :mod:`.compression`) to use to
+          store a compressed backup instead of linking to the original file
         """
         path = Path(path).expanduser() if path else self._path
         if not path:
             raise ValueError(f'A path is required to save {self}')
+        elif fsync not in FSYNC_MODES:
+            raise ValueError(f'Invalid {fsync=} - expected one of {FSYNC_MODES}')
 
-        data = self._construct.build(self._build())  # Prevent creating an empty file if an exception is raised
+        with phase('build'):
+            data = self._construct.build(self._build())  # Prevent creating an empty file if an exception is raised
 
         if backup and path.exists():
-            bkp_path = unique_path(path.parent, path.name, '.bkp')
-            log.info(f'Creating backup: {bkp_path.as_posix()}')
-            shutil.copy(path, bkp_path)
+            _backup_file(path, codec=backup_codec)
 
         log.info(f'Saving {path.as_posix()}')
-        Path(path).expanduser().write_bytes(data)
+        _write_bytes(path, data, fsync)
+
+    @classmethod
+    def empty(cls) -> 'GameData':
+        """Creates a :class:`GameData` with an empty header and 7 empty save slots"""
+        return cls(GameDataHeader.empty()._data + SaveFile.empty()._data * 7)
 
     def __repr__(self) -> str:
         return '<GameData[\n    {!r},\n{}\n]>'.format(self.header, ',\n'.join(map('    {!r}'.format, self.slots)))
@@ -246,7 +392,7 @@ class GameData(Constructed, construct=Gamedata):
         if isinstance(slot_or_key, int):
             return self.slots[slot_or_key]
         else:
-            return _clean(self._parsed[slot_or_key])
+            return super().__getitem__(slot_or_key)
 
     def __getattr__(self, key: str):
         try:
@@ -257,8 +403,8 @@ class GameData(Constructed, construct=Gamedata):
     def __setitem__(self, slot: int, value: 'SaveFile'):
         """
         Overwrite a save slot with a different :class:`SaveFile`.  If the save file originated from a :class:`GameData`
-        object (i.e., if its :attr:`SaveFile._parent` attribute was set), then a deep copy of the :class:`SaveFile` will
-        be stored in this one.  That means that any subsequent changes to the original :class:`SaveFile` will not be
+        object (i.e., if its :attr:`SaveFile._parent` attribute was set), then a copy (see :meth:`SaveFile.copy`) of the
+        :class:`SaveFile` will be stored in this one.  That means that any subsequent changes to the original :class:`SaveFile` will not be
         reflected when saving this game data, so a new reference to the slot must be obtained to make further changes.
 
         :param slot: The slot to overwrite
@@ -271,7 +417,8 @@ class GameData(Constructed, construct=Gamedata):
         if value._parent:
             value = value.copy()
         value._parent = self
-        self._parsed.slots[slot] = {'data': value._data, 'value': value._parsed}
+        value._parent_changed = partial(self._field_changed, 'slots')
+        self._parsed.slots[slot] = {'data': value._data, 'value': value._raw_parsed}
         self.slots[slot] = value
         value._num = slot + 1
 
@@ -289,29 +436,39 @@ class GameData(Constructed, construct=Gamedata):
         return max(self.slots).save_time
 
 
-class GameDataHeader(Constructed, construct=Header):
-    def __init__(self, data: Union[Container, bytes], parent: GameData = None):
+class GameDataHeader(Constructed, construct='Header'):
+    def __init__(self, data: Union['Container', bytes], parent: GameData = None):
         self._parent = parent
         if isinstance(data, bytes):
             super().__init__(data)
         else:
             super().__init__(data['data'], data['value'])  # raw bytes data / parsed value from RawCopy
 
+    @classmethod
+    def empty(cls) -> 'GameDataHeader':
+        """Creates an empty :class:`GameDataHeader`"""
+        header = cls(bytes(cls._construct.sizeof()))
+        header['_unk1'] = b'n\x00\x00\x00'  # The first byte is always 0x6E
+        return cls(cls._construct.build(header._build()))
+
     def __repr__(self) -> str:
         endings = ''.join(k if v else 'x' for i, (k, v) in enumerate(self.endings.items()) if i < 5)
         return f'<GameDataHeader[endings={endings}]>'
 
 
-class SaveFile(Constructed, construct=Savefile):
+class SaveFile(Constructed, construct='Savefile'):
     """Represents one save slot."""
 
-    def __init__(self, slot: Union[Container, bytes], num: int, parent: GameData = None):
+    def __init__(self, slot: Union['Container', bytes], num: int, parent: GameData = None):
         self._parent = parent
         if isinstance(slot, bytes):
             super().__init__(slot)  # Loaded directly from file
         else:
             super().__init__(slot['data'], slot['value'])  # raw bytes data / parsed value from RawCopy
         self._num = num
+        self._flag_values = {}  # {field: int} for bit flag fields; see :meth:`.flags`
+        self._stale_fields = set()  # Fields that were modified, so their raw bytes in _data are outdated
+        count('slots_parsed')
 
     def __repr__(self) -> str:
         time = self.save_time.isoformat(' ') if isinstance(self.save_time, datetime) else 'N/A'
@@ -341,7 +498,49 @@ class SaveFile(Constructed, construct=Savefile):
 
     @cached_property
     def known_words(self) -> list[str]:
-        return [w for w, v in self.words.items() if v]
+        return list(self.flags('words'))
+
+    def flags(self, key: str) -> 'FlagSet':
+        """
+        :param key: A bit flag field in :data:`FLAG_FIELDS<.bitsets.FLAG_FIELDS>`, such as ``words`` or ``tutorials``
+        :return: An integer-backed :class:`FlagSet<.bitsets.FlagSet>` for the given field.  Modifying it does not modify
+          this save file - use :meth:`.set_flags` to store changes.
+        """
+        from .bitsets import FLAG_FIELDS, FlagSet
+
+        try:
+            labels = FLAG_FIELDS[key]
+        except KeyError:
+            raise ValueError(f'Invalid flag field {key=} - expected one of {", ".join(FLAG_FIELDS)}') from None
+        try:
+            value = self._flag_values[key]
+        except KeyError:
+            if key in self._stale_fields:
+                data = self._field_construct(key).build(self._raw_parsed[key])
+            else:
+                data = self.raw(key)
+            value = self._flag_values[key] = int.from_bytes(data, 'little')
+        return FlagSet(labels, value)
+
+    def set_flags(self, key: str, flags: Union['FlagSet', Collection[str], int]):
+        """
+        :param key: A bit flag field in :data:`FLAG_FIELDS<.bitsets.FLAG_FIELDS>`, such as ``words`` or ``tutorials``
+        :param flags: A :class:`FlagSet<.bitsets.FlagSet>`, an int, or the names of all flags that should be set
+        """
+        from .bitsets import FlagSet
+
+        flags = FlagSet(self.flags(key).labels, flags)
+        self._parsed[key] = self._field_construct(key).parse(flags.to_bytes())
+        self._flag_values[key] = flags.value
+        if key == 'words':
+            self.__dict__.pop('known_words', None)
+
+    @cached_classproperty
+    def _field_constructs(cls):
+        return {subcon.name: subcon for subcon in cls._construct.subcons}
+
+    def _field_construct(self, key: str):
+        return self._field_constructs[key]
 
     @cached_property
     def location(self) -> str:
@@ -352,6 +551,23 @@ class SaveFile(Constructed, construct=Savefile):
     def garden(self) -> 'Garden':
         return Garden(self)
 
+    @cached_property
+    def inventory(self) -> 'Inventory':
+        return Inventory(self)
+
+    def _field_changed(self, key: Optional[str]):
+        if key is None or key in INVENTORY_SECTIONS:
+            inventory = self.__dict__.get('inventory')
+            if inventory is not None and not inventory._updating:  # Changes made via the inventory are reflected in it
+                del self.__dict__['inventory']
+        if key is None:
+            self._flag_values.clear()
+            self._stale_fields.update(self._offsets_and_sizes)
+        else:
+            self._flag_values.pop(key, None)
+            self._stale_fields.add(key)
+        super()._field_changed(key)
+
     def _pprint(self, key: str, val, sort_keys: bool = True, unknowns: bool = False):
         if key == 'garden':
             print(f'{colored(key, 14)}:')
@@ -366,11 +582,12 @@ class SaveFile(Constructed, construct=Savefile):
     def update_quest(self, name: str, started: bool, done: bool, **kwargs):
         self._parsed['quests'][name] = {'started': started, 'done': done, **kwargs}
 
-    def save(self, path: Union[str, Path]):
+    def save(self, path: Union[str, Path], fsync: str = 'file'):
         """
         Save this save file/slot to a separate file.
 
         :param path: Location where the file should be written
+        :param fsync: The fsync mode to use; see :meth:`GameData.save`
         :raises: :class:`ValueError` if the specified path already exists.
         """
         path = Path(path).expanduser()
@@ -381,19 +598,44 @@ class SaveFile(Constructed, construct=Savefile):
         elif not path.parent.exists():
             path.parent.mkdir(parents=True)
 
-        data = self._construct.build(self._build())  # Prevent creating an empty file if an exception is raised
+        with phase('build'):
+            data = self._construct.build(self._build())  # Prevent creating an empty file if an exception is raised
         log.info(f'Saving {path.as_posix()}')
-        Path(path).expanduser().write_bytes(data)
+        _write_bytes(path, data, fsync)
 
     @classmethod
     def load(cls, path: Union[str, Path]) -> 'SaveFile':
         path = Path(path).expanduser()
         log.debug(f'Loading save slot from path={path.as_posix()}')
-        return cls(path.read_bytes(), -1)
+        return cls(_read_bytes(path), -1)
+
+    @classmethod
+    async def aload(cls, path: Union[str, Path], executor: 'Executor' = None) -> 'SaveFile':
+        """Load the given file without blocking the event loop; see :func:`aload<.aio.aload>`"""
+        from .aio import aload
+
+        return await aload(path, cls, executor)
 
     def copy(self) -> 'SaveFile':
-        """Create a deep copy of this :class:`SaveFile` with no :class:`GameData` parent."""
-        return self.__class__({'data': self._data, 'value': deepcopy(self._parsed)}, self._num)
+        """
+        Create a copy-on-write copy of this :class:`SaveFile` with no :class:`GameData` parent.  The copy shares raw data
+        and parsed values with this save file, and each top-level field is only copied (by whichever of the two save
+        files accesses it for modification first) when it is modified.  Views obtained from this save file before
+        copying, such as :attr:`.garden` or values from :attr:`._parsed`, should not be used for modifications after
+        copying.
+        """
+        count('slots_copied')
+        parsed = self._raw_parsed.copy()  # Shallow - top-level field values are shared until they are modified
+        copy = self.__class__({'data': self._data, 'value': parsed}, self._num)
+        shared = {key for key, val in parsed.items() if isinstance(val, (dict, list)) and key != '_io'}
+        self._shared.update(shared)
+        copy._shared.update(shared)
+        copy._cache.update(self._cache)  # Cleaned values are not modified in place, so they can be shared
+        copy._sparse = self._sparse.copy()  # Reflects _data, even if this save file's parsed values were modified
+        copy._flag_values.update(self._flag_values)
+        copy._stale_fields.update(self._stale_fields)
+        self.__dict__.pop('garden', None)  # Its plots reference values that are now shared
+        return copy
 
     @classmethod
     def empty(cls) -> 'SaveFile':
@@ -480,6 +722,17 @@ class Garden:
             elif not plots or i in plots:
                 plot._parsed.fertilizer = fertilizer
 
+    def set_seed(self, seed: Union[str, int], plots: Collection[int] = None):
+        """
+        Sets the seed planted in garden plots.  Use :meth:`.set_plant_times` to set the time that they were planted.
+
+        :param seed: A seed name (see :data:`PLANTS<.constants.PLANTS>`), or 255 to clear plots
+        :param plots: Specific plots in which the seed should be planted (default: all)
+        """
+        for i, plot in enumerate(self):
+            if not plots or i in plots:
+                plot._parsed.seed = seed
+
     def set_water(self, water: int, plots: Collection[int] = None):
         kwargs = {'first': water >= 1, 'second': water >= 2}
         for i, plot in enumerate(self):
@@ -488,12 +741,155 @@ class Garden:
                     setattr(plot._parsed.water, key, val)
 
 
-class GardenPlot(Constructed, construct=Plot):
-    def __init__(self, plot: Container, row: int, num: int):
+class Inventory:
+    """
+    Item quantities (and weapon levels) for a save slot, stored in an array that covers the item sections of the slot,
+    with a precomputed index of {item name: (section, offset)} across all sections.  Lookups and updates are O(1) per
+    item, and do not require cleaning (rebuilding) any of the section dicts.
+
+    Values are raw bytes, so weapon levels are 0-3, and 255 indicates that a weapon is not owned.
+    """
+
+    def __init__(self, save_file: SaveFile):
+        self.save_file = save_file
+        self._updating = False  # True while this inventory is updating the parsed section values; see __setitem__
+        index, start, end = _inventory_index()
+        self._start = start
+        self._values = values = array('B', bytes(end - start))
+        for section in INVENTORY_SECTIONS:
+            parsed = save_file._raw_parsed[section]
+            for name in _section_items(section):
+                values[index[name][1] - start] = _item_value(parsed[name])
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[{self.save_file}]>'
+
+    def __getitem__(self, name: str) -> int:
+        return self._values[self._index(name)[1] - self._start]
+
+    def __setitem__(self, name: str, value: int):
+        section, offset = self._index(name)
+        self._values[offset - self._start] = value  # Raises OverflowError for values outside of 0-255
+        self._updating = True  # So SaveFile._field_changed does not discard this inventory
+        try:
+            self.save_file._parsed[section][name] = value
+        finally:
+            self._updating = False
+
+    def __contains__(self, name: str) -> bool:
+        return name in _inventory_index()[0]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _inventory_index()[0]
+
+    def __len__(self) -> int:
+        return len(_inventory_index()[0])
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        start, values = self._start, self._values
+        for name, (section, offset) in _inventory_index()[0].items():
+            yield name, values[offset - start]
+
+    def section(self, name: str) -> str:
+        """:return: The name of the section that contains the item with the given name"""
+        return self._index(name)[0]
+
+    def update(self, name_value_map: dict[str, int]):
+        """
+        Update the values for multiple items.  All names are validated before any changes are made.
+
+        :param name_value_map: Mapping of {item name: value}
+        """
+        for name in name_value_map:
+            self._index(name)
+        for name, value in name_value_map.items():
+            self[name] = value
+
+    def set_quantities(self, name_quantity_map: dict[str, int]):
+        """
+        Set the quantities for multiple items after validating them via :meth:`.validate_quantities`.
+
+        :param name_quantity_map: Mapping of {item name: quantity}
+        """
+        self.validate_quantities(name_quantity_map)
+        for name, quantity in name_quantity_map.items():
+            log.info(f'Setting quantity for item={name} {self[name]} => {quantity}')
+        self.update(name_quantity_map)
+
+    @classmethod
+    def validate_quantities(cls, name_quantity_map: dict[str, int]):
+        """
+        :param name_quantity_map: Mapping of {item name: quantity}
+        :raises: :class:`ValueError` if any item is not in one of the :data:`ITEM_QUANTITY_LIMITS` sections, or if any
+          quantity is outside of the allowed range for its section
+        """
+        index = _inventory_index()[0]
+        for name, quantity in name_quantity_map.items():
+            if (section := index.get(name, (None,))[0]) not in ITEM_QUANTITY_LIMITS:
+                raise ValueError(f'Could not find item={name!r} in sections={tuple(ITEM_QUANTITY_LIMITS)}')
+            max_quantity = ITEM_QUANTITY_LIMITS[section]
+            if not isinstance(quantity, int) or not 0 <= quantity <= max_quantity:
+                raise ValueError(f'Invalid {quantity=} for item={name!r} - must be between 0 and {max_quantity}')
+
+    @staticmethod
+    def _index(name: str) -> tuple[str, int]:
+        try:
+            return _inventory_index()[0][name]
+        except KeyError:
+            raise ValueError(f'Invalid item {name=}') from None
+
+
+def _inventory_index() -> tuple[dict[str, tuple[str, int]], int, int]:
+    """:return: Tuple of ({item name: (section, offset in save slot)}, start offset, end offset)"""
+    try:
+        return _inventory_index._cached  # noqa
+    except AttributeError:
+        pass
+
+    slot_layout = struct_layout('Savefile')
+    index = {}
+    for section, struct_name in INVENTORY_SECTIONS.items():
+        section_offset = slot_layout[section][0]
+        layout = struct_layout(struct_name)
+        index.update((name, (section, section_offset + layout[name][0])) for name in _section_items(section))
+
+    sections = [slot_layout[section] for section in INVENTORY_SECTIONS]
+    start, end = min(offset for offset, _ in sections), max(offset + size for offset, size in sections)
+    _inventory_index._cached = cached = (index, start, end)  # noqa
+    return cached
+
+
+def _section_items(section: str) -> list[str]:
+    return [name for name in struct_layout(INVENTORY_SECTIONS[section]) if not name.startswith('_')]
+
+
+def _item_value(value) -> int:
+    try:
+        return value.intvalue  # Weapon levels, and other enum values
+    except AttributeError:
+        return value
+
+
+class GardenPlot(Constructed, construct='Plot'):
+    def __init__(self, plot: 'Container', row: int, num: int):
         super().__init__(plot.data, plot.value)  # data/value are set by RawCopy for the raw bytes and parsed value
         self._row = row
         self._num = num
 
+    def ready_time(self, model: 'GrowthModel') -> Optional[datetime]:
+        """
+        :param model: The :class:`GrowthModel<.garden.GrowthModel>` to use
+        :return: The time at which this plot will be ready to harvest, or None if nothing is planted / it is unknown
+        """
+        return model.ready_time(*self._enum_values(), self.time)
+
+    def _enum_values(self) -> tuple[int, int]:
+        """:return: The (seed, fertilizer) enum values for this plot, including for values that were set by name"""
+        seed, fertilizer = (_item_value(self._raw_parsed[key]) for key in ('seed', 'fertilizer'))
+        seed = PLANTS.index(seed) if isinstance(seed, str) else seed
+        fertilizer = FERTILIZER.index(fertilizer) if isinstance(fertilizer, str) else fertilizer
+        return seed, fertilizer
+
     @property
     def watered(self) -> str:
         return ''.join('\u25cb' if v else '\u2715' for k, v in self.water.items() if k != '_flagsenum')
@@ -512,23 +908,210 @@ class GardenPlot(Constructed, construct=Plot):
         return f'<GardenPlot[{plot} @ {planted}, {seed} + {self.fertilizer}, water:{water}, dir: {direction}]>'
 
 
+def _read_bytes(path: Path) -> bytes:
+    with phase('read'):
+        data = path.read_bytes()
+    count('bytes_read', len(data))
+    if (decompressed := decompress(data)) is not data:  # Compressed backups are loaded transparently
+        count('bytes_decompressed', len(decompressed))
+    return decompressed
+
+
+def _write_bytes(path: Path, data: bytes, fsync: str = 'file'):
+    """Atomically replace the content of the given path (or create it) by writing a temp file and renaming it"""
+    with phase('write'):
+        tmp_path = _stage_bytes(path, data, fsync)
+        try:
+            os.replace(tmp_path, path)
+        except BaseException:
+            with suppress(OSError):
+                tmp_path.unlink()
+            raise
+        if fsync == 'full':
+            _fsync_dir(path.parent)
+
+
+def _stage_bytes(path: Path, data: bytes, fsync: str = 'file') -> Path:
+    """
+    :param path: The path that will be replaced
+    :param data: The new content for that path
+    :param fsync: The fsync mode; see :meth:`GameData.save`
+    :return: The path of a temp file in the same directory as the given path containing the given data, which should
+      be renamed to replace that path
+    """
+    tmp_path = path.with_name(f'.{path.name}.{token_hex(4)}.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with open(fd, 'wb') as f:
+            f.write(data)
+            if fsync != 'none':
+                f.flush()
+                os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+    except BaseException:
+        with suppress(OSError):
+            tmp_path.unlink()
+        raise
+    count('bytes_written', len(data))
+    return tmp_path
+
+
+def _fsync_dir(path: Path):
+    if os.name == 'nt':  # Directories cannot be opened for fsync on Windows
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _backup_file(path: Path, link: bool = True, codec: str = None) -> Path:
+    """
+    Create a backup of the given file.  A hard link is used if possible, then a reflink, and a full copy only if neither
+    is supported.
+
+    :param path: The file to back up.  If ``link`` is True, then it must be replaced (not modified in place) afterwards.
+    :param link: Whether a hard link may be used.  Use False if the file will be modified in place.
+    :param codec: A codec name to use to store a compressed copy instead (see :func:`get_codec<.compression.get_codec>`)
+    """
+    if codec:
+        codec = get_codec(codec)
+    bkp_path = unique_path(path.parent, path.name, '.bkp' + (codec.suffix if codec else ''))
+    log.info(f'Creating backup: {bkp_path.as_posix()}')
+    with phase('backup'):
+        if codec:
+            count('backup_bytes_copied', path.stat().st_size)
+            return copy_compressed(path, bkp_path, codec)
+        try:
+            if not link:
+                raise OSError('hard links were disabled')
+            os.link(path, bkp_path)
+        except OSError:
+            if not _reflink(path, bkp_path):
+                count('backup_bytes_copied', path.stat().st_size)
+                shutil.copy2(path, bkp_path)
+    return bkp_path
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        return False
+
+    try:
+        with src.open('rb') as src_file, dst.open('xb') as dst_file:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+    except OSError:
+        with suppress(OSError):
+            dst.unlink()
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
 def _build(obj):
-    if isinstance(obj, ListContainer):
+    if isinstance(obj, list):  # ListContainer
         return [_build(li) for li in obj]
-    elif isinstance(obj, Container):
-        if set(obj) == {'offset1', 'length', 'offset2', 'data', 'value'}:  # RawCopy
-            return {'value': _build(obj.value)}
+    elif isinstance(obj, dict):  # Container
+        if 'data' in obj and 'value' in obj:  # RawCopy, or a slot set via GameData.__setitem__
+            return {'value': _build(obj['value'])}
         return {key: _build(val) for key, val in obj.items() if key != '_io'}
+    elif isinstance(obj, SparseBytes):
+        return bytes(obj)
     else:
         return obj
 
 
 def _clean(obj):
-    if isinstance(obj, ListContainer):
+    if isinstance(obj, list):  # ListContainer
         return [_clean(li) for li in obj]
-    elif isinstance(obj, Container):
+    elif isinstance(obj, dict):  # Container
         if set(obj) == {'offset1', 'length', 'offset2', 'data', 'value'}:  # RawCopy
             return _clean(obj.value)
         return {key: _clean(val) for key, val in obj.items() if key not in ('_io', '_flagsenum')}
+    elif isinstance(obj, SparseBytes):
+        return bytes(obj)
     else:
         return obj
+
+
+class TrackedParsed:
+    """
+    Wraps a parsed :class:`Container` / :class:`ListContainer` (or dict / list) so that any modification to it, or to
+    any value nested within it, is reported to the :class:`Constructed` object that it belongs to.  Values retrieved
+    from it are wrapped the same way, and are associated with the top-level field that contains them.
+    """
+
+    __slots__ = ('_obj', '_on_change', '_key', '_own')
+    _mutators = frozenset({
+        'append', 'extend', 'insert', 'remove', 'sort', 'reverse',  # list
+        'pop', 'popitem', 'clear', 'update', 'setdefault', 'move_to_end',  # dict
+    })
+
+    def __init__(self, obj, on_change, key: str = None, own=None):
+        object.__setattr__(self, '_obj', obj._obj if isinstance(obj, TrackedParsed) else obj)
+        object.__setattr__(self, '_on_change', on_change)
+        object.__setattr__(self, '_key', key)  # The top-level field that contains obj; None for the root Container
+        object.__setattr__(self, '_own', own)  # Called before wrapping a top-level value; see Constructed._own
+
+    def _changed(self, key: str = None):
+        self._on_change(key if self._key is None else self._key)
+
+    def _wrap(self, value, key):
+        if isinstance(value, (dict, list)):  # Includes Container / ListContainer, and dicts from adapters like Quests
+            if self._key is None and self._own is not None and self._own(key):
+                value = self._obj[key]  # It was replaced with a private copy
+            return TrackedParsed(value, self._on_change, key if self._key is None else self._key)
+        return value
+
+    def __getitem__(self, key):
+        return self._wrap(self._obj[key], key)
+
+    def __getattr__(self, key: str):
+        if key in self._mutators:
+            self._changed()
+        return self._wrap(getattr(self._obj, key), key)
+
+    def __setitem__(self, key, value):
+        self._changed(key)
+        self._obj[key] = value._obj if isinstance(value, TrackedParsed) else value
+
+    def __setattr__(self, key: str, value):
+        self._changed(key)
+        setattr(self._obj, key, value._obj if isinstance(value, TrackedParsed) else value)
+
+    def __delitem__(self, key):
+        self._changed(key)
+        del self._obj[key]
+
+    __delattr__ = __delitem__
+
+    def __iter__(self):
+        if isinstance(self._obj, list):
+            for i, value in enumerate(self._obj):
+                yield self._wrap(value, i)
+        else:
+            yield from self._obj
+
+    def __len__(self) -> int:
+        return len(self._obj)
+
+    def __contains__(self, key) -> bool:
+        return key in self._obj
+
+    def __eq__(self, other) -> bool:
+        return self._obj == (other._obj if isinstance(other, TrackedParsed) else other)
+
+    def items(self):
+        for key, value in self._obj.items():
+            yield key, self._wrap(value, key)
+
+    def values(self):
+        for key, value in self._obj.items():
+            yield self._wrap(value, key)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[{self._obj!r}]>'
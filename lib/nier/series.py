@@ -0,0 +1,76 @@
+"""
+Utilities for processing a series of GAMEDATA snapshots, such as the backups saved by save_watcher.
+
+:author: Doug Skrypa
+"""
+
+import logging
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from typing import Union, Iterator, Iterable, Optional, Any
+
+from .compression import strip_compressed_suffix
+from .save_file import GameData
+
+__all__ = ['snapshot_paths', 'diff_series']
+log = logging.getLogger(__name__)
+
+
+def snapshot_paths(directory: Union[str, Path], pattern: str = 'GAMEDATA*') -> list[Path]:
+    """
+    :param directory: Directory containing GAMEDATA snapshots
+    :param pattern: Glob pattern that snapshot file names must match
+    :return: List of matching files, sorted so that numbered names (such as those generated by
+      :func:`unique_path<.utils.unique_path>`) are in numeric order
+    """
+    directory = Path(directory).expanduser()
+    return sorted((p for p in directory.glob(pattern) if p.is_file()), key=_natural_sort_key)
+
+
+def _natural_sort_key(path: Path) -> list[Union[str, int]]:
+    name = strip_compressed_suffix(path.name)  # So that compressed snapshots sort the same way as uncompressed ones
+    return [int(part) if i % 2 else part for i, part in enumerate(re.split(r'(\d+)', name))]
+
+
+def diff_series(
+    paths: Iterable[Path], slot: int = None, workers: int = None, **kwargs
+) -> Iterator[tuple[Path, Path, str]]:
+    """
+    Diffs each consecutive pair of the given snapshots in a pool of worker processes.  Each worker only loads the 2
+    snapshots that it is comparing, and at most ``workers * 2`` pairs are in flight at once, so memory use does not grow
+    with the number of snapshots.
+
+    :param paths: The snapshot paths, in order
+    :param slot: A specific save slot (1-7) to compare (default: compare full files)
+    :param workers: Number of worker processes to use (default: cpu count)
+    :param kwargs: Keyword arguments to pass to :meth:`Constructed.diff<.save_file.Constructed.diff>`
+    :return: Generator that yields (path_a, path_b, diff output) tuples in the same order as the given paths
+    """
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    pending = deque()
+    with ProcessPoolExecutor(workers) as executor:
+        for path_a, path_b in zip(paths, paths[1:]):
+            pending.append((path_a, path_b, executor.submit(_diff_pair, path_a, path_b, slot, kwargs)))
+            if len(pending) >= workers * 2:
+                path_a, path_b, future = pending.popleft()
+                yield path_a, path_b, future.result()
+
+        while pending:
+            path_a, path_b, future = pending.popleft()
+            yield path_a, path_b, future.result()
+
+
+def _diff_pair(path_a: Path, path_b: Path, slot: Optional[int], kwargs: dict[str, Any]) -> str:
+    log.debug(f'Comparing {path_a.name} to {path_b.name}')
+    obj_a, obj_b = GameData.load(path_a), GameData.load(path_b)
+    if slot:
+        obj_a, obj_b = obj_a[slot - 1], obj_b[slot - 1]
+    with redirect_stdout(StringIO()) as sio:
+        obj_a.diff(obj_b, **kwargs)
+    return sio.getvalue()
@@ -0,0 +1,122 @@
+"""
+Sparse representation of large, mostly-zero byte fields, such as ``_unk6`` in the header and ``_unk18b2`` in each slot.
+
+A :class:`SparseBytes` only stores its size and the segments that contain non-zero bytes, so an all-zero field uses a
+few dozen bytes instead of tens of KB, and comparing or hashing it is O(1).  The full content is only materialized when
+it is needed, via ``bytes(value)``.
+
+:author: Doug Skrypa
+"""
+
+import re
+from bisect import bisect_right
+from typing import Union, Iterator
+
+__all__ = ['SparseBytes', 'SPARSE_MIN_SIZE']
+
+SPARSE_MIN_SIZE = 128  # Bytes fields smaller than this are not worth representing sparsely
+MERGE_GAP = 16  # Non-zero segments separated by fewer zero bytes than this are stored as a single segment
+_SEGMENT = re.compile(rb'[^\x00](?:\x00{0,%d}[^\x00])*' % (MERGE_GAP - 1))
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class SparseBytes:
+    """
+    An immutable bytes value that only stores its non-zero segments.  Use :meth:`.from_bytes` to create one.
+
+    Equality with other SparseBytes objects only compares sizes and segments, and equality with bytes objects compares
+    the materialized content.  Hashes are based on segments, so they do not match the hash of the equivalent bytes;
+    SparseBytes and bytes keys should not be mixed in the same dict / set.
+    """
+
+    __slots__ = ('size', 'segments', '_offsets')
+
+    def __init__(self, size: int, segments: tuple[tuple[int, bytes], ...] = ()):
+        self.size = size
+        self.segments = segments  # ((offset, data), ...) in offset order, where data starts/ends with non-zero bytes
+        self._offsets = [offset for offset, _ in segments]
+
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> 'SparseBytes':
+        if data.count(0) == len(data):  # All zeros; avoids scanning for segments in the most common case
+            return cls(len(data))
+        return cls(len(data), tuple((m.start(), m.group()) for m in _SEGMENT.finditer(data)))
+
+    def __bytes__(self) -> bytes:
+        if not self.segments:
+            return bytes(self.size)
+        buf = bytearray(self.size)
+        for offset, data in self.segments:
+            buf[offset:offset + len(data)] = data
+        return bytes(buf)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        nonzero = sum(len(data) for _, data in self.segments)
+        return f'<{self.__class__.__name__}[size={self.size}, segments={len(self.segments)}, {nonzero=}]>'
+
+    @property
+    def is_zero(self) -> bool:
+        return not self.segments
+
+    def _overlapping(self, start: int, end: int) -> Iterator[tuple[int, bytes]]:
+        index = max(bisect_right(self._offsets, start) - 1, 0)
+        for offset, data in self.segments[index:]:
+            if offset >= end:
+                break
+            elif offset + len(data) > start:
+                yield offset, data
+
+    def is_zero_range(self, start: int, end: int) -> bool:
+        """:return: True if every byte in ``self[start:end]`` is zero"""
+        return next(self._overlapping(start, end), None) is None
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[int, bytes]:
+        if isinstance(item, int):
+            if item < 0:
+                item += self.size
+            if not 0 <= item < self.size:
+                raise IndexError('index out of range')
+            return self[item:item + 1][0]
+
+        start, end, step = item.indices(self.size)
+        if step != 1:
+            return bytes(self)[item]
+        buf = bytearray(max(end - start, 0))
+        for offset, data in self._overlapping(start, end):
+            seg_start, seg_end = max(offset, start), min(offset + len(data), end)
+            buf[seg_start - start:seg_end - start] = data[seg_start - offset:seg_end - offset]
+        return bytes(buf)
+
+    def __contains__(self, sub: Buffer) -> bool:
+        if len(sub) >= MERGE_GAP or not any(sub):  # A match could span multiple segments, or none
+            return bytes(sub) in bytes(self)
+        pad = len(sub) - 1  # Any match that includes a non-zero byte overlaps exactly one segment
+        for offset, data in self.segments:
+            if sub in self[max(offset - pad, 0):offset + len(data) + pad]:
+                return True
+        return False
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SparseBytes):
+            return self.size == other.size and self.segments == other.segments
+        elif isinstance(other, (bytes, bytearray, memoryview)):
+            return len(other) == self.size and bytes(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.size, self.segments))
+
+    def __copy__(self) -> 'SparseBytes':
+        return self
+
+    def __deepcopy__(self, memo) -> 'SparseBytes':
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (self.size, self.segments)
+
+    def hex(self, *args) -> str:
+        return bytes(self).hex(*args)
@@ -0,0 +1,81 @@
+"""
+Synthetic save data with randomized field values, for benchmarks and round-trip checks.
+
+:author: Doug Skrypa
+"""
+
+import string
+from datetime import datetime, timedelta
+from random import Random
+from typing import Union
+
+from .constants import CHARACTERS, MAP_ZONES, PLANTS, FERTILIZER, LEVEL_TO_EXP
+from .save_file import GameData, SaveFile
+from .sparse import SparseBytes
+
+__all__ = ['random_game_data', 'mutate_save_file']
+
+ITEM_SECTIONS = ('recovery', 'cultivation', 'fishing', 'raw_materials', 'key_items', 'documents', 'maps')
+
+
+def random_game_data(seed: Union[int, str, None] = None, slots: int = 3, mutations: int = 50) -> GameData:
+    """
+    :param seed: Seed for the random number generator, so the same data can be generated again
+    :param slots: Number of save slots (starting from the first one) that should be populated with random values
+    :param mutations: Number of random item / unknown byte changes to make in each populated slot
+    :return: A :class:`GameData` that was re-parsed after building it from the randomized values
+    """
+    rng = Random(seed)
+    game_data = GameData.empty()
+    for slot in game_data.slots[:slots]:
+        mutate_save_file(slot, rng, mutations)
+    return GameData(game_data._construct.build(game_data._build()))
+
+
+def mutate_save_file(slot: SaveFile, rng: Random, mutations: int = 50):
+    """
+    Set random (but valid) values for the known summary, garden, and quest fields in the given save slot, and make
+    ``mutations`` random changes to item quantities and unknown bytes.  The changes are made in place; the slot must be
+    built again for the changes to be reflected in its raw data.
+    """
+    level = rng.randrange(len(LEVEL_TO_EXP))
+    slot['map'] = rng.choice(MAP_ZONES)
+    slot['character'] = rng.choice(CHARACTERS)
+    slot['name'] = ''.join(rng.choices(string.ascii_letters, k=rng.randint(1, 10)))
+    slot['level'] = level
+    slot['xp'] = LEVEL_TO_EXP[level]
+    slot['money'] = rng.randrange(10_000_000)
+    slot['total_play_time'] = rng.uniform(1, 360_000)
+    slot['save_time'] = _random_datetime(rng)
+
+    parsed = slot._parsed
+    for row in parsed.garden:
+        for plot in row:
+            plot = plot.value
+            plot.seed = rng.choice(PLANTS + ['None'])
+            plot.fertilizer = rng.choice(FERTILIZER)
+            plot.time = None if plot.seed == 'None' else _random_datetime(rng)
+            plot.water.first, plot.water.second = rng.random() < 0.5, rng.random() < 0.5
+
+    for key in ('quests', 'words'):
+        for name, value in parsed[key].items():
+            if isinstance(value, bool):
+                parsed[key][name] = rng.random() < 0.5
+            elif not name.startswith('_'):
+                value['started'], value['done'] = rng.random() < 0.5, rng.random() < 0.25
+
+    unknowns = [key for key, val in parsed.items() if key.startswith('_unk') and isinstance(val, (bytes, SparseBytes))]
+    for _ in range(mutations):
+        if rng.random() < 0.5:
+            section = parsed[rng.choice(ITEM_SECTIONS)]
+            name = rng.choice([k for k in section if not k.startswith('_')])
+            section[name] = rng.randint(0, 99)
+        else:
+            key = rng.choice(unknowns)
+            data = bytearray(bytes(parsed[key]))
+            data[rng.randrange(len(data))] = rng.randrange(256)
+            parsed[key] = bytes(data)
+
+
+def _random_datetime(rng: Random) -> datetime:
+    return datetime(2021, 4, 23) + timedelta(seconds=rng.randrange(365 * 86400))
@@ -0,0 +1,253 @@
+"""
+Raw save slot transplants between GAMEDATA files.
+
+Slots are copied as raw bytes at their fixed offsets, without parsing or rebuilding either file.  Each slot's checksum
+only covers bytes within that slot, so only the checksum of each destination slot (and of the header, if any header
+fields are modified) is re-calculated.  Source files are memory-mapped, and destination files may be modified in place
+via a writable memory map, so moving slots between many files runs at roughly the speed of the disk.
+
+:author: Doug Skrypa
+"""
+
+import logging
+import mmap
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Union, Iterable, Iterator, Optional, Mapping, Any, NamedTuple
+
+from .compression import MAGIC_SIZE, is_compressed, decompress
+from .constructs.layouts import struct_layout, struct_size, struct_checksum
+from .save_file import FSYNC_MODES, _backup_file, _write_bytes
+
+__all__ = ['Move', 'transplant', 'transplant_many', 'copy_slot', 'checksums', 'fix_checksum', 'update_header']
+log = logging.getLogger(__name__)
+
+SLOTS = range(1, 8)
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+WritableBuffer = Union[bytearray, memoryview, mmap.mmap]
+
+
+class Move(NamedTuple):
+    src: Path
+    src_slot: int
+    dst: Path
+    dst_slot: int
+
+
+# region Buffer Operations
+
+
+def slot_offset(slot: int) -> int:
+    """:return: The offset of the given slot (1-7) in a GAMEDATA file"""
+    if slot not in SLOTS:
+        raise ValueError(f'Invalid {slot=} - slots must be between 1 and 7')
+    return struct_size('Header') + (slot - 1) * struct_size('Savefile')
+
+
+def checksums(buf: Buffer, offset: int = 0, name: str = 'Savefile') -> tuple[int, int]:
+    """
+    :param buf: A buffer containing the struct
+    :param offset: The offset of the struct in the buffer
+    :param name: The name of the struct (``Savefile`` or ``Header``)
+    :return: Tuple of (stored checksum, calculated checksum)
+    """
+    seek, read = struct_checksum(name)
+    pos = offset + struct_layout(name)['checksum'][0]
+    start = pos - seek
+    return struct.unpack_from('<I', buf, pos)[0], sum(memoryview(buf)[start:start + read])
+
+
+def fix_checksum(buf: WritableBuffer, offset: int = 0, name: str = 'Savefile') -> bool:
+    """
+    Re-calculate and store the checksum for the struct at the given offset.
+
+    :return: True if the stored checksum was changed, False if it was already correct
+    """
+    stored, calculated = checksums(buf, offset, name)
+    if stored == calculated:
+        return False
+    struct.pack_into('<I', buf, offset + struct_layout(name)['checksum'][0], calculated)
+    return True
+
+
+def copy_slot(src: Buffer, src_slot: int, dst: WritableBuffer, dst_slot: int, verify: bool = True):
+    """
+    Copy the raw bytes of a slot from one GAMEDATA buffer to another (or to a different slot in the same buffer).
+
+    :param src: The source GAMEDATA content
+    :param src_slot: The slot (1-7) to copy from the source
+    :param dst: The destination GAMEDATA buffer
+    :param dst_slot: The slot (1-7) to overwrite in the destination
+    :param verify: Whether the source slot's checksum should be verified before copying
+    """
+    src_offset, dst_offset, size = slot_offset(src_slot), slot_offset(dst_slot), struct_size('Savefile')
+    if verify and (values := checksums(src, src_offset))[0] != values[1]:
+        raise ValueError(f'Invalid source slot={src_slot} - stored checksum={values[0]} != calculated={values[1]}')
+    dst[dst_offset:dst_offset + size] = src[src_offset:src_offset + size]
+    fix_checksum(dst, dst_offset)
+
+
+def update_header(buf: WritableBuffer, fields: Mapping[str, Any]):
+    """
+    Update header fields in the given GAMEDATA buffer, and re-calculate the header checksum.
+
+    :param buf: The GAMEDATA buffer to modify
+    :param fields: Mapping of {field: value} using the flat field names from
+      :func:`decode_header<.flat_codecs.decode_header>`, such as ``d_name`` or ``endings.A``.  Str values for bytes
+      fields are encoded as UTF-8 and padded with nulls.
+    """
+    from .flat_codecs import encode_header
+
+    header = encode_header(_header_values(buf, fields))
+    buf[:len(header)] = header
+
+
+def _header_values(buf: Buffer, fields: Mapping[str, Any]) -> dict[str, Any]:
+    from .flat_codecs import decode_header
+
+    values = decode_header(buf)
+    for key, value in fields.items():
+        if key not in values or key == 'checksum':
+            raise ValueError(f'Invalid header field={key!r}')
+        elif isinstance(values[key], bytes) and isinstance(value, str):
+            if len(value := value.encode('utf-8')) > (size := len(values[key])):
+                raise ValueError(f'Invalid value for header field={key!r} - it must be at most {size} bytes')
+            value = value.ljust(size, b'\x00')
+        values[key] = value
+    return values
+
+
+# endregion
+
+# region File Operations
+
+
+def transplant(
+    src: Union[str, Path],
+    src_slot: int,
+    dst: Union[str, Path],
+    dst_slot: int,
+    header: Mapping[str, Any] = None,
+    **kwargs,
+) -> Optional[Path]:
+    """
+    Copy one slot from one GAMEDATA file to another.  See :func:`transplant_many` for supported keyword arguments.
+
+    :return: The path of the destination file's backup, if one was saved
+    """
+    moves = [Move(Path(src), src_slot, Path(dst), dst_slot)]
+    return transplant_many(moves, {dst: header} if header else None, **kwargs)[Path(dst).expanduser().resolve()]
+
+
+def transplant_many(
+    moves: Iterable[Move],
+    headers: Mapping[Union[str, Path], Mapping[str, Any]] = None,
+    *,
+    in_place: bool = False,
+    backup: bool = True,
+    fsync: str = 'file',
+    verify: bool = True,
+) -> dict[Path, Optional[Path]]:
+    """
+    Copy any number of slots between GAMEDATA files.  Moves are grouped by destination file, and moves for the same
+    destination are applied in the given order.  Sources are read from the files on disk; when a file is both a source
+    and a destination, moves that read from it see the original content unless ``in_place`` is True.  All sources,
+    destinations, and header fields are validated before any backups are saved or any files are modified.
+
+    :param moves: The :class:`Move` entries to apply
+    :param headers: Mapping of {destination path: header fields to update}; see :func:`update_header`
+    :param in_place: Modify destination files in place via a writable memory map instead of writing each destination
+      to a temp file that replaces the original.  Faster, but a destination file may be left partially modified if an
+      error occurs while writing it.
+    :param backup: Whether a backup of each destination file should be saved before it is modified
+    :param fsync: The fsync mode to use; see :meth:`GameData.save<.save_file.GameData.save>`
+    :param verify: Whether source slot checksums should be verified before copying
+    :return: Mapping of {destination path: backup path (or None)}
+    """
+    if fsync not in FSYNC_MODES:
+        raise ValueError(f'Invalid {fsync=} - expected one of {FSYNC_MODES}')
+    headers = {Path(path).expanduser().resolve(): fields for path, fields in (headers or {}).items()}
+    by_dst = {}
+    for src, src_slot, dst, dst_slot in moves:
+        slot_offset(src_slot), slot_offset(dst_slot)  # Validate before modifying anything
+        dst = Path(dst).expanduser().resolve()
+        by_dst.setdefault(dst, []).append(Move(Path(src).expanduser().resolve(), src_slot, dst, dst_slot))
+    if bad := set(headers).difference(by_dst):
+        raise ValueError(f'Header fields were provided for paths without any moves: {", ".join(map(str, sorted(bad)))}')
+
+    _validate(by_dst, headers, in_place, verify)  # Before any backups are saved or any files are modified
+    results = {}
+    for dst, dst_moves in by_dst.items():
+        results[dst] = bkp_path = _backup_file(dst, link=not in_place) if backup else None
+        log.info(f'Copying {len(dst_moves)} slot(s) to {dst.as_posix()}')
+        if in_place:
+            with _mapped(dst, True) as dst_buf:
+                _apply_moves(dst_buf, dst, dst_moves, headers.get(dst), dst_buf)
+                if fsync != 'none':
+                    dst_buf.flush()
+        else:
+            with _mapped(dst) as orig:
+                dst_buf = bytearray(orig)
+                _apply_moves(dst_buf, dst, dst_moves, headers.get(dst), orig)
+            _write_bytes(dst, dst_buf, fsync)
+        if bkp_path:
+            log.debug(f'Saved backup: {bkp_path.as_posix()}')
+
+    return results
+
+
+def _validate(
+    by_dst: dict[Path, list[Move]], headers: dict[Path, Mapping[str, Any]], in_place: bool, verify: bool
+):
+    by_src = {}
+    for move in (move for dst_moves in by_dst.values() for move in dst_moves):
+        by_src.setdefault(move.src, set()).add(move.src_slot)
+    for src, src_slots in by_src.items():
+        with _mapped(src) as src_buf:
+            for slot in sorted(src_slots) if verify else ():
+                if (values := checksums(src_buf, slot_offset(slot)))[0] != values[1]:
+                    raise ValueError(
+                        f'Invalid source slot={slot} in {src.as_posix()}'
+                        f' - stored checksum={values[0]} != calculated={values[1]}'
+                    )
+    for dst in by_dst:
+        with _mapped(dst, in_place) as dst_buf:
+            if header := headers.get(dst):
+                _header_values(dst_buf, header)
+
+
+def _apply_moves(
+    dst_buf: WritableBuffer, dst: Path, moves: list[Move], header: Optional[Mapping[str, Any]], orig: Buffer
+):
+    # Source checksums and header fields were already checked by _validate
+    for src, src_slot, _, dst_slot in moves:
+        if src == dst:
+            copy_slot(orig, src_slot, dst_buf, dst_slot, False)
+        else:
+            with _mapped(src) as src_buf:
+                copy_slot(src_buf, src_slot, dst_buf, dst_slot, False)
+    if header:
+        update_header(dst_buf, header)
+
+
+@contextmanager
+def _mapped(path: Path, writable: bool = False) -> Iterator[Buffer]:
+    """
+    Memory-map the given file.  Compressed files (such as compressed backups) are decompressed into memory instead,
+    which is only supported for read-only access.
+    """
+    expected = struct_size('Header') + struct_size('Savefile') * len(SLOTS)
+    with path.open('r+b' if writable else 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ) as mapped:
+            buf = mapped
+            if is_compressed(mapped[:MAGIC_SIZE]):
+                if writable:
+                    raise ValueError(f'Unable to modify compressed GAMEDATA file={path.as_posix()} in place')
+                buf = decompress(mapped[:])
+            if (size := len(buf)) != expected:
+                raise ValueError(f'Invalid GAMEDATA file={path.as_posix()} - expected {expected} bytes, found {size}')
+            yield buf
+
+
+# endregion
@@ -1,24 +1,31 @@
-import json
 import re
 import sys
 from collections.abc import Mapping, KeysView, ValuesView, Callable
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from struct import calcsize, unpack_from, error as StructError
-from traceback import format_tb
 from types import TracebackType
 from typing import Union, Iterator, Iterable
 from unicodedata import category
 
-from colored import stylize, fg as _fg, bg as _bg
+
+def __getattr__(name: str):
+    if name == 'PseudoJsonEncoder':
+        return _pseudo_json_encoder()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 def colored(text, fg=None, do_color: bool = True, bg=None):
+    if not do_color or (fg is None and bg is None):
+        return text
+
+    from colored import stylize, fg as _fg, bg as _bg
+
     if fg is not None and bg is not None:
         colors = (_fg(fg), _bg(bg))
     else:
-        colors = _fg(fg) if fg is not None else _bg(bg) if bg is not None else ()
-    return stylize(text, colors) if do_color and colors else text
+        colors = _fg(fg) if fg is not None else _bg(bg)
+    return stylize(text, colors)
 
 
 def to_hex_and_str(
@@ -82,49 +89,67 @@ def to_bin_str(data: bytes, sep: str = ' '):
     return sep.join(map('{:08b}'.format, data))
 
 
-class PseudoJsonEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, (set, KeysView)):
-            return sorted(o)
-        elif isinstance(o, ValuesView):
-            return list(o)
-        elif isinstance(o, Mapping):
-            return dict(o)
-        elif isinstance(o, bytes):
+def _pseudo_json_encoder() -> type:
+    """The encoder class is defined on first use so that json is only imported when it is needed"""
+    try:
+        return _pseudo_json_encoder._cls
+    except AttributeError:
+        pass
+
+    import json
+    from traceback import format_tb
+
+    class PseudoJsonEncoder(json.JSONEncoder):
+        def default(self, o):
+            if isinstance(o, (set, KeysView)):
+                return sorted(o)
+            elif isinstance(o, ValuesView):
+                return list(o)
+            elif isinstance(o, Mapping):
+                return dict(o)
+            elif isinstance(o, bytes):
+                try:
+                    return o.decode('utf-8')
+                except UnicodeDecodeError:
+                    return o.hex(' ', -4)
+            elif isinstance(o, datetime):
+                return o.strftime('%Y-%m-%d %H:%M:%S %Z')
+            elif isinstance(o, date):
+                return o.strftime('%Y-%m-%d')
+            elif isinstance(o, (type, timedelta)):
+                return str(o)
+            elif isinstance(o, TracebackType):
+                return ''.join(format_tb(o)).splitlines()
+            elif hasattr(o, '__to_json__'):
+                return o.__to_json__()
+            elif hasattr(o, '__serializable__'):
+                return o.__serializable__()
             try:
-                return o.decode('utf-8')
+                return super().default(o)
+            except TypeError:
+                return repr(o)
             except UnicodeDecodeError:
-                return o.hex(' ', -4)
-        elif isinstance(o, datetime):
-            return o.strftime('%Y-%m-%d %H:%M:%S %Z')
-        elif isinstance(o, date):
-            return o.strftime('%Y-%m-%d')
-        elif isinstance(o, (type, timedelta)):
-            return str(o)
-        elif isinstance(o, TracebackType):
-            return ''.join(format_tb(o)).splitlines()
-        elif hasattr(o, '__to_json__'):
-            return o.__to_json__()
-        elif hasattr(o, '__serializable__'):
-            return o.__serializable__()
-        try:
-            return super().default(o)
-        except TypeError:
-            return repr(o)
-        except UnicodeDecodeError:
-            return o.decode('utf-8', 'replace')
+                return o.decode('utf-8', 'replace')
+
+    _pseudo_json_encoder._cls = PseudoJsonEncoder
+    return PseudoJsonEncoder
 
 
 def pseudo_json(data, sort_keys: bool = True) -> str:
-    return json.dumps(data, cls=PseudoJsonEncoder, sort_keys=sort_keys, indent=4, ensure_ascii=False)
+    import json
+
+    return json.dumps(data, cls=_pseudo_json_encoder(), sort_keys=sort_keys, indent=4, ensure_ascii=False)
 
 
 def pseudo_json_rows(data, sort_keys: bool = True) -> str:
+    import json
+
+    encoder = _pseudo_json_encoder()
     last = len(data) - 1
     rows = '\n'.join(
         '    {}: {}{}'.format(
             json.dumps(key, ensure_ascii=False),
-            json.dumps(val, cls=PseudoJsonEncoder, sort_keys=sort_keys, ensure_ascii=False),
+            json.dumps(val, cls=encoder, sort_keys=sort_keys, ensure_ascii=False),
             ',' if i != last else ''
         )
         for i, (key, val) in enumerate(data.items())
@@ -20,6 +20,7 @@ optional_dependencies = {
         'pre-commit',                                   # run `pre-commit install` to install hooks
     ],
     'watcher': ['watchdog'],
+    'daemon': ['watchdog'],                             # Optional; evicts cached files as soon as they are modified
 }
 optional_dependencies['ALL'] = sorted(set(chain.from_iterable(optional_dependencies.values())))
 